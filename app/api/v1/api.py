@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import decisions_v2, search_v2
+from app.api.v1.endpoints import decisions_v2, search_v2, export_v2, analytics_v2, ingest_v2
 
 # API 라우터 생성
 api_router = APIRouter()
@@ -9,4 +9,7 @@ api_router = APIRouter()
 
 # V2 엔드포인트만 활성화
 api_router.include_router(decisions_v2.router, prefix="/v2/decisions", tags=["decisions_v2"])
-api_router.include_router(search_v2.router, prefix="/v2/search", tags=["search_v2"])
\ No newline at end of file
+api_router.include_router(search_v2.router, prefix="/v2/search", tags=["search_v2"])
+api_router.include_router(export_v2.router, prefix="/v2/export", tags=["export_v2"])
+api_router.include_router(analytics_v2.router, prefix="/v2/analytics", tags=["analytics_v2"])
+api_router.include_router(ingest_v2.router, prefix="/v2/ingest", tags=["ingest_v2"])
\ No newline at end of file
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Query
+from typing import Optional
+from app.services.fine_analytics_service import get_fine_analytics_index
+
+router = APIRouter()
+
+
+@router.get("/fines", summary="V2 과징금/과태료 금액 분포 분석")
+def get_fine_analytics(
+    decision_year: Optional[int] = None,
+    industry_sector: Optional[str] = None,
+    action_type: Optional[str] = None,
+    bins: int = Query(10, ge=1, le=50, description="로그 스케일 히스토그램 구간 수")
+):
+    """
+    조치별 과징금/과태료 금액의 백분위수, 로그 스케일 히스토그램,
+    산정근거 대비 비율, 연도별 증감을 조회합니다.
+    """
+    index = get_fine_analytics_index()
+    return index.analyze(
+        decision_year=decision_year,
+        industry_sector=industry_sector,
+        action_type=action_type,
+        bins=bins
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -7,6 +7,7 @@ import os
 from app.core.database import get_db
 from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2
 from app.services.decision_service_v2 import DecisionServiceV2
+from app.services.similarity_service import get_similarity_index
 from app.core.config import settings
 
 router = APIRouter()
@@ -47,10 +48,15 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
     """V2 대시보드용 종합 통계를 조회합니다."""
     service = DecisionServiceV2(db)
     
-    # 기본 통계
-    total_decisions = db.query(DecisionV2).count()
-    total_actions = db.query(ActionV2).count()
-    total_laws = db.query(LawV2).count()
+    # 기본 통계 (총 과징금/과태료 금액 포함)
+    total_decisions, total_actions, total_laws, total_fine_amount = service.fetch_aggregate(
+        db.query(
+            db.query(func.count(DecisionV2.decision_pk)).scalar_subquery(),
+            db.query(func.count(ActionV2.action_id)).scalar_subquery(),
+            db.query(func.count(LawV2.law_id)).scalar_subquery(),
+            db.query(func.sum(ActionV2.fine_amount)).scalar_subquery()
+        )
+    )[0]
     
     # 최근 의결서 (상위 5개)
     recent_decisions = (
@@ -63,11 +69,8 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
         .all()
     )
     
-    # 총 과징금/과태료 금액
-    total_fine_amount = db.query(func.sum(ActionV2.fine_amount)).scalar() or 0
-    
     # 월별 의결서 수 (최근 12개월)
-    monthly_stats = (
+    monthly_stats = service.fetch_aggregate(
         db.query(
             DecisionV2.decision_year,
             DecisionV2.decision_month,
@@ -76,7 +79,6 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
         .group_by(DecisionV2.decision_year, DecisionV2.decision_month)
         .order_by(DecisionV2.decision_year.desc(), DecisionV2.decision_month.desc())
         .limit(12)
-        .all()
     )
     
     # 카테고리별 통계
@@ -87,7 +89,7 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
             "total_decisions": total_decisions,
             "total_actions": total_actions,
             "total_laws": total_laws,
-            "total_fine_amount": total_fine_amount
+            "total_fine_amount": total_fine_amount or 0
         },
         "recent_decisions": [
             {
@@ -125,6 +127,42 @@ async def get_decision_by_pk(decision_pk: int, db: Session = Depends(get_db)):
     return decision
 
 
+@router.get("/{decision_pk}/similar", summary="V2 유사 의결서 추천")
+def get_similar_decisions(
+    decision_pk: int,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """위반 내용과 목적 텍스트의 TF-IDF 유사도로 비슷한 의결서를 추천합니다."""
+    try:
+        similar = get_similarity_index().similar(decision_pk, limit=limit)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    if similar is None:
+        raise HTTPException(status_code=404, detail="유사도 인덱스에 없는 의결서입니다.")
+    
+    scores = dict(similar)
+    decisions = {
+        d.decision_pk: d
+        for d in db.query(DecisionV2).filter(DecisionV2.decision_pk.in_(scores)).all()
+    }
+    
+    return [
+        {
+            "decision_pk": pk,
+            "decision_year": decisions[pk].decision_year,
+            "decision_id": decisions[pk].decision_id,
+            "title": decisions[pk].title,
+            "category_1": decisions[pk].category_1,
+            "category_2": decisions[pk].category_2,
+            "score": score
+        }
+        for pk, score in similar
+        if pk in decisions
+    ]
+
+
 @router.get("/{decision_year}/{decision_id}", summary="V2 의결서 상세 조회 (연도/번호)")
 async def get_decision(decision_year: int, decision_id: int, db: Session = Depends(get_db)):
     """V2 특정 의결서의 상세 정보를 연도/번호로 조회합니다."""
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import datetime
+from app.services.export_service_v2 import ExportServiceV2, EXPORT_FORMATS, is_format_available
+
+router = APIRouter()
+
+
+@router.get("/decisions", summary="V2 의결서·조치·법률 일괄 내보내기")
+def export_decisions(
+    fmt: str = Query("ndjson", alias="format", description="ndjson / csv / parquet"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    include_full_text: bool = Query(False, description="의결서 전문 포함 여부"),
+    keyword: Optional[str] = None,
+    decision_year: Optional[int] = None,
+    category_1: Optional[str] = None,
+    category_2: Optional[str] = None,
+    industry_sector: Optional[str] = None,
+    action_type: Optional[str] = None,
+    min_fine_amount: Optional[int] = None,
+    max_fine_amount: Optional[int] = None
+):
+    """
+    의결서와 조치, 관련 법률을 조인하여 스트리밍으로 내보냅니다.
+    고급 검색과 동일한 필터를 지원하며, 전체 데이터도 메모리 적재 없이 내려받을 수 있습니다.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 포맷입니다: {fmt}")
+    
+    if not is_format_available(fmt):
+        raise HTTPException(status_code=501, detail="Parquet 내보내기를 위해 pyarrow 설치가 필요합니다.")
+    
+    criteria = {
+        'keyword': keyword,
+        'decision_year': decision_year,
+        'category_1': category_1,
+        'category_2': category_2,
+        'industry_sector': industry_sector,
+        'action_type': action_type,
+        'min_fine_amount': min_fine_amount,
+        'max_fine_amount': max_fine_amount
+    }
+    criteria = {key: value for key, value in criteria.items() if value is not None}
+    
+    media_type, extension = EXPORT_FORMATS[fmt]
+    filename = f"fss_decisions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    if gzip:
+        media_type = "application/gzip"
+        filename += ".gz"
+    
+    service = ExportServiceV2()
+    return StreamingResponse(
+        service.stream(criteria, fmt=fmt, compress=gzip, include_full_text=include_full_text),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
\ No newline at end of file
@@ -0,0 +1,107 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.services.ingest_job_manager import TERMINAL_STATUSES, get_ingest_job_manager, resolve_job_directory
+
+router = APIRouter()
+
+
+class IngestJobRequest(BaseModel):
+    """수집 작업 요청 모델"""
+    job_type: str = "crawl"  # crawl: 기간 크롤링 후 처리 / directory: 디렉토리 PDF 처리
+    start_date: Optional[str] = None  # YYYY-MM-DD (crawl)
+    end_date: Optional[str] = None  # YYYY-MM-DD (crawl)
+    full: bool = False  # 증분 상태를 무시하고 기간 전체 재조회 (crawl)
+    directory: Optional[str] = None  # PDF 디렉토리 (directory, PROCESSED_PDF_DIR 하위만, 하위 포함)
+    fsc_only: bool = True  # 금융위 의결서 형식만 처리
+
+
+@router.post("/jobs", status_code=202, summary="V2 수집 작업 등록")
+def submit_job(request: IngestJobRequest):
+    """기간 크롤링 또는 디렉토리 처리 작업을 등록합니다. 작업은 백그라운드에서 순서대로 실행됩니다."""
+    if request.job_type == "crawl":
+        try:
+            start_date = datetime.strptime(request.start_date or "", "%Y-%m-%d")
+            end_date = datetime.strptime(request.end_date or "", "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="crawl 작업은 start_date, end_date(YYYY-MM-DD)가 필요합니다.")
+        if start_date > end_date:
+            raise HTTPException(status_code=400, detail="start_date가 end_date보다 늦습니다.")
+        params = {
+            "start_date": request.start_date,
+            "end_date": request.end_date,
+            "full": request.full,
+            "fsc_only": request.fsc_only
+        }
+    elif request.job_type == "directory":
+        try:
+            directory = resolve_job_directory(request.directory)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not os.path.isdir(directory):
+            raise HTTPException(status_code=400, detail=f"디렉토리를 찾을 수 없습니다: {request.directory}")
+        params = {"directory": directory, "fsc_only": request.fsc_only}
+    else:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 작업 종류입니다: {request.job_type}")
+    
+    return get_ingest_job_manager().submit(request.job_type, params)
+
+
+@router.get("/jobs", summary="V2 수집 작업 목록")
+def list_jobs(
+    limit: int = Query(20, ge=1, le=200),
+    status: Optional[str] = Query(None, description="queued / running / cancelling / cancelled / completed / failed")
+):
+    """최근 등록된 수집 작업 목록을 반환합니다."""
+    return {"jobs": get_ingest_job_manager().list_jobs(limit=limit, status=status)}
+
+
+@router.get("/jobs/{job_id}", summary="V2 수집 작업 상태 조회")
+def get_job(job_id: str):
+    """작업 상태와 단계별 진행 건수, 처리량, 예상 남은 시간, LLM 대기 시간을 반환합니다."""
+    job = get_ingest_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="수집 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/jobs/{job_id}/events", summary="V2 수집 작업 진행 상태 스트림 (SSE)")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    진행 상태가 바뀔 때마다 `progress` 이벤트를 보내고, 작업이 끝나면 `end` 이벤트 후 연결을 닫습니다.
+    """
+    manager = get_ingest_job_manager()
+    if manager.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="수집 작업을 찾을 수 없습니다.")
+    
+    async def event_stream():
+        async for job in manager.stream(job_id):
+            if await request.is_disconnected():
+                return
+            event = "end" if job["status"] in TERMINAL_STATUSES else "progress"
+            # 파일 목록은 크므로 제외 (GET /jobs/{job_id}로 조회)
+            payload = {key: value for key, value in job.items() if key not in ("files", "processed_files")}
+            yield f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/jobs/{job_id}/cancel", status_code=202, summary="V2 수집 작업 취소")
+def cancel_job(job_id: str):
+    """대기 중인 작업은 즉시 취소하고, 실행 중인 작업은 처리 중인 문서를 마친 뒤 중단합니다."""
+    job = get_ingest_job_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="수집 작업을 찾을 수 없습니다.")
+    if job["status"] in ("completed", "failed"):
+        raise HTTPException(status_code=409, detail=f"이미 종료된 작업입니다: {job['status']}")
+    return job
\ No newline at end of file
@@ -4,6 +4,8 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from app.core.database import get_db
 from app.services.search_service_v2 import SearchServiceV2
+from app.services.autocomplete_service import get_autocomplete_index, AUTOCOMPLETE_CATEGORIES
+from app.services.facet_index import get_facet_index
 
 router = APIRouter()
 
@@ -80,6 +82,31 @@ async def advanced_search(
         raise HTTPException(status_code=500, detail=f"고급 검색 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.get("/facets", summary="V2 고급 검색 패싯 건수")
+def get_search_facets(
+    decision_year: Optional[int] = None,
+    category_1: Optional[str] = None,
+    category_2: Optional[str] = None,
+    industry_sector: Optional[str] = None,
+    action_type: Optional[str] = None,
+    min_fine_amount: Optional[int] = None,
+    max_fine_amount: Optional[int] = None
+):
+    """현재 필터 조건에서 연도/카테고리/업권/조치유형/과징금 구간별 의결서 수를 반환합니다."""
+    criteria = {
+        'decision_year': decision_year,
+        'category_1': category_1,
+        'category_2': category_2,
+        'industry_sector': industry_sector,
+        'action_type': action_type,
+        'min_fine_amount': min_fine_amount,
+        'max_fine_amount': max_fine_amount
+    }
+    criteria = {key: value for key, value in criteria.items() if value is not None}
+    
+    return get_facet_index().facets(criteria)
+
+
 @router.get("/suggestions", summary="V2 검색 제안")
 async def get_search_suggestions(db: Session = Depends(get_db)):
     """V2 검색 제안 목록을 반환합니다."""
@@ -91,6 +118,19 @@ async def get_search_suggestions(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"검색 제안 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.get("/autocomplete", summary="V2 검색어 자동완성")
+def autocomplete(
+    q: str = Query(..., min_length=1, description="입력 중인 검색어"),
+    category: Optional[str] = Query(None, description="entity / law / sector / action_type"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """기관명, 법률명(약칭 포함), 업권, 조치유형을 접두어로 검색하여 빈도순으로 반환합니다."""
+    if category is not None and category not in AUTOCOMPLETE_CATEGORIES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 카테고리입니다: {category}")
+    
+    return get_autocomplete_index().suggest(q, category=category, limit=limit)
+
+
 @router.get("/stats", summary="V2 검색 관련 통계")
 async def get_search_stats(db: Session = Depends(get_db)):
     """V2 검색과 관련된 통계 정보를 반환합니다."""
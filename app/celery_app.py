@@ -0,0 +1,279 @@
+"""
+Celery 수집 워커
+크롤링부터 DB 저장까지 수집 파이프라인을 단계별 작업으로 나누어 여러 워커 프로세스로 수평 확장
+- 단계별 큐: crawl → extract → preprocess → llm → persist (이전 단계 작업이 다음 단계 작업을 발행)
+- Rule-based 완전성이 충분한 문서는 llm 큐를 거치지 않고 바로 persist
+- LLM 추출 작업은 워커별 속도 제한(CELERY_LLM_RATE_LIMIT), 네트워크/DB 오류는 지수 백오프 재시도
+  (LLM 추출은 호출 한도 초과/네트워크/서버 일시 오류만 재시도, 응답 검증 실패는 extract_with_retry가 이미 재시도하므로 바로 실패)
+- 브로커: 기본 REDIS_URL, 로컬/테스트는 memory:// 또는 filesystem://
+
+실행 예:
+    celery -A app.celery_app worker --loglevel=info            # 모든 단계 큐
+    celery -A app.celery_app worker -Q llm -n llm@%h            # 단계별 워커 (동시성 CELERY_CONCURRENCY_LLM)
+"""
+import asyncio
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+from celery import Celery
+from celery.signals import celeryd_init, worker_init, worker_process_init
+from kombu import Queue
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.models.pydantic_models import Decision
+from app.services.adaptive_concurrency import is_transient_error
+from app.services.fsc_crawler import FSCCrawler, is_fsc_document
+from app.services.pdf_backends import mark_worker_process
+
+logger = logging.getLogger(__name__)
+
+# 단계별 큐 (파이프라인 순서)
+STAGE_QUEUES = ('crawl', 'extract', 'preprocess', 'llm', 'persist')
+
+TASK_CRAWL = 'fsc.crawl'
+TASK_EXTRACT_ZIP = 'fsc.extract_zip'
+TASK_PREPROCESS = 'fsc.preprocess'
+TASK_LLM_EXTRACT = 'fsc.llm_extract'
+TASK_PERSIST = 'fsc.persist'
+
+
+def _broker_transport_options(broker_url: str) -> Dict[str, Any]:
+    """filesystem:// 브로커는 메시지 폴더가 필요 (송수신 폴더를 같게 두어 단일 호스트에서 사용)"""
+    if not broker_url.startswith('filesystem://'):
+        return {}
+    folder = Path(settings.CELERY_FILESYSTEM_BROKER_DIR)
+    (folder / 'processed').mkdir(parents=True, exist_ok=True)
+    return {
+        'data_folder_in': str(folder),
+        'data_folder_out': str(folder),
+        'processed_folder': str(folder / 'processed'),
+        'store_processed': False
+    }
+
+
+broker_url = settings.CELERY_BROKER_URL or settings.REDIS_URL
+
+celery_app = Celery(
+    'fss_ingest',
+    broker=broker_url,
+    backend=settings.CELERY_RESULT_BACKEND or settings.REDIS_URL
+)
+celery_app.conf.update(
+    task_serializer='json',
+    result_serializer='json',
+    accept_content=['json'],
+    timezone='Asia/Seoul',
+    broker_transport_options=_broker_transport_options(broker_url),
+    task_queues=[Queue(name) for name in STAGE_QUEUES],
+    task_default_queue='preprocess',
+    task_routes={
+        TASK_CRAWL: {'queue': 'crawl'},
+        TASK_EXTRACT_ZIP: {'queue': 'extract'},
+        TASK_PREPROCESS: {'queue': 'preprocess'},
+        TASK_LLM_EXTRACT: {'queue': 'llm'},
+        TASK_PERSIST: {'queue': 'persist'},
+    },
+    # 작업 완료 후 확인 (워커 비정상 종료 시 다른 워커가 재처리), 긴 작업을 미리 가져가지 않음
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    result_expires=24 * 3600,
+)
+
+class TransientLLMError(Exception):
+    """재시도할 LLM 추출 오류 (호출 한도 초과, 네트워크/서버 일시 오류)"""
+
+
+# 재시도 정책 (지수 백오프 + 지터)
+RETRY_POLICY = {
+    'retry_backoff': True,
+    'retry_backoff_max': settings.CELERY_RETRY_BACKOFF_MAX,
+    'retry_jitter': True,
+    'max_retries': settings.CELERY_TASK_MAX_RETRIES,
+}
+
+
+@celeryd_init.connect
+def configure_stage_concurrency(sender=None, conf=None, options=None, **kwargs):
+    """단일 단계 큐만 소비하는 워커는 -c 미지정 시 단계별 동시성 설정 사용"""
+    options = options or {}
+    queues = options.get('queues') or []
+    if isinstance(queues, str):
+        queues = queues.split(',')
+    if options.get('concurrency') or len(queues) != 1 or queues[0] not in STAGE_QUEUES:
+        return
+    
+    concurrency = getattr(settings, f"CELERY_CONCURRENCY_{queues[0].upper()}")
+    conf.worker_concurrency = concurrency or os.cpu_count()
+    logger.info(f"{queues[0]} 단계 워커 동시성: {conf.worker_concurrency}")
+
+
+@worker_init.connect
+@worker_process_init.connect
+def disable_page_pool_in_worker(**kwargs):
+    """작업 단위로 이미 병렬이므로 워커 안에서는 문서 내 페이지 병렬 추출 풀을 만들지 않음 (PDF_PAGE_WORKERS=0일 때)"""
+    mark_worker_process()
+
+
+# 싱글톤 인스턴스 (워커 프로세스별 DB 엔진, Gemini 클라이언트 재사용)
+_processor = None
+_loops = threading.local()
+
+
+def get_processor():
+    """워커 프로세스별 PDFProcessorV2 인스턴스"""
+    global _processor
+    if _processor is None:
+        from app.services.pdf_processor_v2 import PDFProcessorV2
+        _processor = PDFProcessorV2()
+    return _processor
+
+
+def _run(coro):
+    """코루틴 실행 (스레드별 이벤트 루프 재사용: 루프에 묶인 비동기 클라이언트 유지)"""
+    loop = getattr(_loops, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(
+    name=TASK_CRAWL,
+    autoretry_for=(requests.RequestException,),
+    **RETRY_POLICY
+)
+def crawl(start_date: str, end_date: str, full: bool = False) -> Dict[str, Any]:
+    """의결서 목록 조회 및 ZIP 다운로드 → ZIP별 extract 작업 발행 (날짜: YYYY-MM-DD)"""
+    crawler = FSCCrawler(incremental=not full)
+    results = crawler.crawl_decisions(
+        datetime.strptime(start_date, '%Y-%m-%d'),
+        datetime.strptime(end_date, '%Y-%m-%d'),
+        extract=False
+    )
+    downloaded_files = results['downloaded_files']
+    enqueue_zip_files(downloaded_files)
+    
+    return {
+        'decisions': len(results['decisions']),
+        'downloaded_files': downloaded_files,
+        'failed_downloads': crawler.failed_downloads,
+        'stats': crawler.stats
+    }
+
+
+@celery_app.task(
+    name=TASK_EXTRACT_ZIP,
+    autoretry_for=(OSError,),
+    **RETRY_POLICY
+)
+def extract_zip(zip_file: str) -> Dict[str, Any]:
+    """ZIP 압축 해제 (원장 기준 1회) → 의결서 본문별 preprocess 작업 발행"""
+    crawler = FSCCrawler()
+    extracted_files = crawler.extract_zip_files([zip_file])
+    
+    queued = []
+    for relative_path in extracted_files:
+        if is_fsc_document(relative_path):
+            pdf_path = os.path.join(crawler.processed_pdf_dir, relative_path)
+            preprocess.delay(pdf_path)
+            queued.append(pdf_path)
+    
+    return {'zip_file': zip_file, 'extracted_files': extracted_files, 'queued': queued}
+
+
+@celery_app.task(name=TASK_PREPROCESS)
+def preprocess(pdf_path: str) -> Dict[str, Any]:
+    """PDF 전처리 및 Rule-based 완전성 평가 → persist 또는 llm 작업 발행"""
+    processor = get_processor()
+    preprocessed = processor.preprocessor.preprocess_pdf(pdf_path)
+    
+    if not settings.HYBRID_ROUTING_ENABLED:
+        llm_extract.delay(pdf_path, preprocessed, None)
+        return {'pdf_path': pdf_path, 'next': 'llm'}
+    
+    evaluation = processor.router.evaluate(
+        preprocessed['raw_text'],
+        preprocessed['metadata'],
+        os.path.basename(pdf_path)
+    )
+    if not evaluation['llm_required']:
+        decision, routing = processor.router.complete(evaluation)
+        persist.delay(pdf_path, decision.model_dump(mode='json'), routing)
+        return {'pdf_path': pdf_path, 'next': 'persist', 'routing': routing}
+    
+    llm_extract.delay(pdf_path, preprocessed, _dump_evaluation(evaluation))
+    return {'pdf_path': pdf_path, 'next': 'llm', 'score': evaluation['score'], 'missing': evaluation['missing']}
+
+
+@celery_app.task(
+    name=TASK_LLM_EXTRACT,
+    rate_limit=settings.CELERY_LLM_RATE_LIMIT,
+    autoretry_for=(TransientLLMError,),
+    **RETRY_POLICY
+)
+def llm_extract(
+    pdf_path: str,
+    preprocessed: Dict[str, Any],
+    evaluation: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Gemini 추출 (관련 섹션만) 후 Rule-based 결과와 병합 → persist 작업 발행"""
+    processor = get_processor()
+    try:
+        llm_decision, llm_context = _run(processor._extract_with_llm(preprocessed, pdf_path))
+    except Exception as e:
+        if is_transient_error(e):
+            raise TransientLLMError(f"{type(e).__name__}: {e}") from e
+        raise
+    if not llm_decision:
+        raise Exception("데이터 추출 실패")
+    
+    if evaluation is None:
+        decision = llm_decision
+        routing = {'route': 'llm_only', 'score': 0.0, 'missing': [], 'llm_called': True}
+    else:
+        decision, routing = processor.router.complete(_load_evaluation(evaluation), llm_decision)
+    
+    persist.delay(pdf_path, decision.model_dump(mode='json'), routing)
+    return {'pdf_path': pdf_path, 'routing': routing, 'llm_context': llm_context}
+
+
+@celery_app.task(
+    name=TASK_PERSIST,
+    autoretry_for=(OperationalError,),
+    **RETRY_POLICY
+)
+def persist(pdf_path: str, decision_data: Dict[str, Any], routing: Dict[str, Any]) -> Dict[str, Any]:
+    """DB 저장 및 실제 날짜 갱신 (같은 의결서가 이미 있으면 저장하지 않음)"""
+    processor = get_processor()
+    db_result = _run(processor.persist_decision(Decision.model_validate(decision_data), pdf_path, routing['route']))
+    return {
+        'pdf_path': pdf_path,
+        'success': db_result.get('success', False),
+        'error': db_result.get('error'),
+        'decision_year': decision_data['decision_year'],
+        'decision_id': decision_data['decision_id'],
+        'actions_saved': db_result.get('actions_saved', []),
+        'routing': routing
+    }
+
+
+def _dump_evaluation(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Rule-based 평가 결과 → JSON 메시지"""
+    decision = evaluation['decision']
+    return {**evaluation, 'decision': decision.model_dump(mode='json') if decision else None}
+
+
+def _load_evaluation(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    decision = evaluation['decision']
+    return {**evaluation, 'decision': Decision.model_validate(decision) if decision else None}
+
+
+def enqueue_zip_files(zip_files: List[str]) -> List[str]:
+    """이미 받은 ZIP 파일들을 extract 큐에 넣고 작업 ID 반환"""
+    return [extract_zip.delay(zip_file).id for zip_file in zip_files]
\ No newline at end of file
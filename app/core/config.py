@@ -42,6 +42,101 @@ class Settings(BaseSettings):
     # Redis 설정
     REDIS_URL: str = "redis://localhost:6379/0"
     
+    # 데이터 내보내기 설정
+    EXPORT_BATCH_SIZE: int = 1000  # 서버 사이드 커서 fetch 단위 (행)
+    
+    # 분석 엔진 설정 (통계 쿼리)
+    ANALYTICS_BACKEND: str = "sqlite"  # sqlite / duckdb
+    ANALYTICS_SOURCE: str = "attach"  # attach: SQLite 직접 연결 / parquet: 스냅샷
+    ANALYTICS_SNAPSHOT_DIR: str = "./data/analytics"
+    ANALYTICS_SNAPSHOT_TTL: int = 600  # Parquet 스냅샷 갱신 주기 (초)
+    
+    # 유사 의결서 인덱스 설정
+    SIMILARITY_INDEX_DIR: str = "./data/similarity_index"
+    SIMILARITY_SVD_COMPONENTS: int = 0  # 0이면 희소 TF-IDF만 사용
+    
+    # 고급 검색 패싯 인덱스 설정 (조회마다 DB 변경 여부 확인 후 갱신)
+    FACET_INDEX_MAX_AGE: int = 300  # 변경이 감지되지 않아도 이 시간(초)이 지나면 전체 재적재
+    
+    # PDF 텍스트 추출 설정
+    PDF_TEXT_BACKEND: str = "pypdf2"  # pypdf2 / pdfminer / pypdfium2
+    PDF_PAGE_WORKERS: int = 0  # 페이지 병렬 추출 프로세스 수 (0이면 자동: 워커 프로세스 안에서는 순차, 그 외 최대 4, 1이면 순차)
+    PDF_PARALLEL_MIN_PAGES: int = 8  # 이 페이지 수 이상일 때만 병렬 추출
+    
+    # 스캔 PDF OCR 폴백 설정 (pdf2image/poppler, pytesseract/tesseract 필요)
+    OCR_ENABLED: bool = True
+    OCR_MIN_PAGE_CHARS: int = 20  # 의미 있는 문자(한글/영문/숫자)가 이보다 적은 페이지만 OCR
+    OCR_LANG: str = "kor+eng"
+    OCR_DPI: int = 300
+    OCR_WORKERS: int = 0  # OCR 프로세스 수 (0이면 CPU 수, 1이면 순차)
+    OCR_CACHE_DIR: str = "./data/ocr_cache"  # 페이지 지문별 OCR 결과 캐시
+    
+    # LLM 입력 컨텍스트 설정 (관련 섹션만 선별)
+    LLM_CONTEXT_ENABLED: bool = True
+    LLM_CONTEXT_TOKEN_BUDGET: int = 6000  # 문서당 입력 텍스트 토큰 예산 (추정치)
+    LLM_CONTEXT_HEADER_CHARS: int = 800  # 항상 포함할 문서 머리 길이 (의안번호, 제목, 조치대상자)
+    
+    # 하이브리드 추출 라우팅 설정 (Rule-based 완전성 점수가 임계값 이상이면 LLM 호출 생략)
+    HYBRID_ROUTING_ENABLED: bool = True
+    HYBRID_CONFIDENCE_THRESHOLD: float = 1.0  # 0~1, 의결번호/대상자/금액/법규/조치유형/조치 수 충족 비율
+    
+    # 비동기 크롤러 설정 (AsyncFSCCrawler)
+    CRAWLER_LISTING_CONCURRENCY: int = 4  # 동시에 요청할 목록 페이지 수
+    CRAWLER_DOWNLOAD_CONCURRENCY: int = 4  # 동시 ZIP 다운로드 수
+    CRAWLER_RATE_PER_HOST: float = 2.0  # 호스트당 초당 요청 수 (0이면 제한 없음)
+    CRAWLER_BURST: int = 2  # 호스트당 연속 허용 요청 수
+    CRAWLER_TIMEOUT: float = 30.0  # 읽기/쓰기 타임아웃 (초)
+    CRAWLER_CONNECT_TIMEOUT: float = 10.0
+    CRAWLER_RETRY_BACKOFF: float = 1.0  # 재시도 기본 대기 (초, 시도마다 2배)
+    
+    # 증분 크롤링 설정 (게시물 번호 상한 + 조건부 GET)
+    CRAWLER_INCREMENTAL: bool = True  # 이미 수집한 게시물에 도달하면 목록 조회 중단
+    CRAWL_STATE_PATH: str = "./data/crawl_state.json"
+    
+    # 콘텐츠 주소 저장소 (ZIP/PDF SHA-256 중복 제거, processed_pdf는 하드링크)
+    CONTENT_STORE_DIR: str = "./data/content_store"
+    
+    # ZIP 스트리밍 수집 설정 (압축 해제 없이 메모리에서 전처리)
+    ZIP_STREAM_ARCHIVE_ASYNC: bool = True  # 보관용 PDF 기록을 문서 처리와 동시에 수행
+    
+    # Celery 수집 작업 큐 설정 (단계별 큐: crawl / extract / preprocess / llm / persist)
+    CELERY_BROKER_URL: str = ""  # 비우면 REDIS_URL (로컬/테스트: memory:// 또는 filesystem://)
+    CELERY_RESULT_BACKEND: str = ""  # 비우면 REDIS_URL
+    CELERY_FILESYSTEM_BROKER_DIR: str = "./data/celery_broker"  # filesystem:// 브로커 메시지 폴더
+    CELERY_LLM_RATE_LIMIT: str = "10/m"  # 워커별 LLM 추출 작업 속도 제한 (Celery rate_limit 형식)
+    CELERY_TASK_MAX_RETRIES: int = 3
+    CELERY_RETRY_BACKOFF_MAX: int = 600  # 재시도 지수 백오프 최대 대기 (초)
+    CELERY_CONCURRENCY_CRAWL: int = 1  # 단일 단계 큐만 소비하는 워커의 기본 동시성 (-c 미지정 시)
+    CELERY_CONCURRENCY_EXTRACT: int = 2
+    CELERY_CONCURRENCY_PREPROCESS: int = 0  # 0이면 CPU 수
+    CELERY_CONCURRENCY_LLM: int = 2
+    CELERY_CONCURRENCY_PERSIST: int = 1  # SQLite 쓰기 잠금 경합 방지
+    
+    # 수집 작업 API 설정 (/v2/ingest/jobs)
+    INGEST_JOBS_RESUME_ON_STARTUP: bool = True  # 서버 시작 시 미완료 작업 재개
+    INGEST_JOB_EVENT_INTERVAL: float = 1.0  # SSE 진행 상태 확인 주기 (초)
+    INGEST_JOB_HEARTBEAT_SECONDS: float = 15.0  # 실행 중 작업 행 갱신 및 대기 작업 확인 주기 (초)
+    INGEST_JOB_STALE_SECONDS: float = 120.0  # 이 시간 동안 갱신이 없는 실행 중 작업은 중단된 것으로 보고 재개 (초)
+    
+    # 핫 폴더 감시 설정 (raw_zip/, processed_pdf/<연도>/에 들어온 파일 자동 수집)
+    WATCHER_ENABLED: bool = False  # API 서버 시작 시 감시 스레드 실행
+    WATCHER_DEBOUNCE_SECONDS: float = 2.0  # 마지막 이벤트 후 이 시간 동안 변화가 없으면 처리
+    WATCHER_QUEUE_SIZE: int = 100  # 처리 대기열 크기 (가득 차면 이벤트 전달 대기)
+    WATCHER_POLL_INTERVAL: float = 5.0  # inotify를 쓸 수 없을 때 폴링 주기 (초)
+    WATCHER_STATE_PATH: str = "./data/watcher_state.json"  # PDF별 마지막 처리 해시
+    
+    # 배치 처리 보고서 (process_batch 상세 결과 JSONL)
+    BATCH_REPORT_DIR: str = "./data/batch_reports"
+    BATCH_CONCURRENCY: int = 4  # process_batch/iter_batch 동시 처리 문서 수 (LLM 동시 호출은 AIMD 한도로 제한)
+    
+    # LLM 호출 적응형 동시성 (AIMD: 성공 시 가산 증가, 429/할당량 초과 시 절반 감소)
+    LLM_AIMD_INITIAL_LIMIT: int = 2
+    LLM_AIMD_MIN_LIMIT: int = 1
+    LLM_AIMD_MAX_LIMIT: int = 16
+    LLM_AIMD_DECREASE_FACTOR: float = 0.5
+    LLM_AIMD_DEFAULT_BACKOFF: float = 6.0  # Retry-After 힌트가 없는 429 후 새 호출 대기 (초)
+    LLM_MAX_RETRIES: int = 5  # 429/할당량 초과 재시도 횟수
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -34,6 +34,19 @@ def get_db():
         db.close()
 
 
+def run_in_session(bind, func, *args):
+    """전용 세션을 열어 func(db, *args) 실행 후 닫음
+
+    병합된 검색처럼 요청 세션보다 오래 살 수 있는 스레드 작업용
+    (첫 요청이 끊겨 get_db가 세션을 닫아도 작업 중인 스레드에 영향 없음)
+    """
+    db = SessionLocal(bind=bind)
+    try:
+        return func(db, *args)
+    finally:
+        db.close()
+
+
 def init_db():
     """데이터베이스 초기화"""
     Base.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+애플리케이션 메트릭
+기동 단계 소요 시간, 현재 상태 게이지 등 프로세스 내 지표 수집 (외부 의존성 없음)
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+_startup_metrics: Dict[str, Any] = {}
+_gauges: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def record_startup_metric(name: str, value: Any):
+    """기동 관련 지표 기록 (같은 이름은 덮어씀)"""
+    with _lock:
+        _startup_metrics[name] = value
+
+
+def get_startup_metrics() -> Dict[str, Any]:
+    """기록된 기동 지표 사본 반환"""
+    with _lock:
+        return dict(_startup_metrics)
+
+
+def set_gauge(name: str, value: Any):
+    """현재 값 지표 기록 (LLM 동시성 한도 등, 같은 이름은 덮어씀)"""
+    with _lock:
+        _gauges[name] = value
+
+
+def get_gauges() -> Dict[str, Any]:
+    """게이지 지표 사본 반환"""
+    with _lock:
+        return dict(_gauges)
+
+
+@contextmanager
+def startup_timer(name: str):
+    """블록 실행 시간을 `<name>_ms` 지표로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_startup_metric(f"{name}_ms", round((time.perf_counter() - start) * 1000, 3))
\ No newline at end of file
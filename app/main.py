@@ -3,6 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.database import init_db
 from app.api.v1.api import api_router
+from app.core.metrics import get_gauges, get_startup_metrics
+from app.services.ingest_job_manager import get_ingest_job_manager
+from app.services.hot_folder_watcher import get_hot_folder_watcher
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -32,12 +35,23 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     init_db()
+    
+    # 서버 재시작 전 미완료 수집 작업 재개
+    if settings.INGEST_JOBS_RESUME_ON_STARTUP:
+        get_ingest_job_manager().resume_pending()
+    
+    # raw_zip/, processed_pdf/ 새 파일 자동 수집
+    if settings.WATCHER_ENABLED:
+        get_hot_folder_watcher().start_in_thread()
+    
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} 서버가 시작되었습니다! (V2 API 활성화)")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    if settings.WATCHER_ENABLED:
+        get_hot_folder_watcher().stop()
     print("👋 서버가 종료되었습니다.")
 
 
@@ -57,6 +71,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """프로세스 내 지표 (기동 단계 소요 시간, LLM 동시성 한도 등)"""
+    return {"startup": get_startup_metrics(), "gauges": get_gauges()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -142,4 +142,26 @@ class ActionLawMapV2(Base):
     # 복합 인덱스 (조회 성능 향상)
     __table_args__ = (
         Index('idx_action_law', 'action_id', 'law_id'),
-    )
\ No newline at end of file
+    )
+
+
+class IngestJobV2(Base):
+    """수집 작업 테이블 V2 (재시작 시 미완료 작업 재개)"""
+    __tablename__ = "ingest_jobs_v2"
+    
+    job_id = Column(String(32), primary_key=True)  # uuid4 hex
+    job_type = Column(String(20), nullable=False)  # crawl: 기간 크롤링 후 처리 / directory: 디렉토리 PDF 처리
+    status = Column(String(20), nullable=False, index=True)  # queued / running / cancelling / cancelled / completed / failed
+    params = Column(JSON, nullable=False)  # start_date, end_date, full, directory, fsc_only
+    
+    # 진행 상태 (재개용)
+    files = Column(JSON, nullable=True)  # 처리 대상 PDF 목록 (크롤링 단계 완료 후 확정)
+    processed_files = Column(JSON, nullable=True)  # 처리를 마친 PDF 목록
+    progress = Column(JSON, nullable=True)  # 단계별 건수, 처리량, 예상 남은 시간, LLM 대기 시간
+    error = Column(Text, nullable=True)
+    
+    # 메타데이터
+    created_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+LLM 호출 적응형 동시성 제어 (AIMD)
+고정 간격/고정 백오프 대신 실제 할당량 응답(429)에 맞춰 동시 호출 수를 조절
+- 호출이 성공하면 동시성 한도를 가산 증가 (한도만큼 성공할 때마다 +1)
+- 429/할당량 초과 응답이면 한도를 절반으로 줄이고 Retry-After 힌트만큼 새 호출을 멈춤
+- 한 번의 초과에 대해 이미 진행 중이던 호출들의 429로 여러 번 줄이지 않음 (감소 이후 시작한 호출만 반영)
+- 현재 한도/진행 중 호출 수는 app.core.metrics 게이지로 공개
+- API 서버, 수집 작업 스레드, 핫 폴더 감시 스레드의 이벤트 루프가 한 인스턴스를 공유 (상태는 스레드 잠금으로 보호)
+"""
+import asyncio
+import logging
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import set_gauge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+OUTCOME_SUCCESS = 'success'
+OUTCOME_THROTTLED = 'throttled'
+OUTCOME_ERROR = 'error'
+
+THROTTLE_MARKERS = ('429', 'quota', 'rate limit', 'resource exhausted', 'resource_exhausted', 'too many requests')
+# 재시도하면 성공할 수 있는 오류 (네트워크/타임아웃, 서버 일시 오류: requests, google.api_core 예외 포함)
+TRANSIENT_ERROR_NAMES = (
+    'ConnectionError', 'TimeoutError', 'Timeout', 'ServiceUnavailable', 'DeadlineExceeded',
+    'InternalServerError', 'BadGateway', 'GatewayTimeout',
+)
+TRANSIENT_STATUS_CODES = (408, 500, 502, 503, 504)
+RETRY_AFTER_PATTERNS = (
+    re.compile(r'retry in ([\d.]+)\s*s', re.IGNORECASE),  # "Please retry in 17.3s."
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)'),  # gRPC RetryInfo
+)
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """429/할당량 초과 오류인지"""
+    if getattr(error, 'code', None) == 429 or type(error).__name__ in ('ResourceExhausted', 'TooManyRequests'):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """일시적 오류인지 (호출 한도 초과, 네트워크/타임아웃, 5xx) - 응답 검증 실패 등은 재시도해도 같으므로 제외"""
+    if is_throttle_error(error) or getattr(error, 'code', None) in TRANSIENT_STATUS_CODES:
+        return True
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """오류에 담긴 재시도 대기 힌트 (Retry-After 헤더, RetryInfo, 메시지 순)"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass  # HTTP 날짜 형식은 무시하고 메시지에서 찾음
+    
+    message = str(error)
+    for pattern in RETRY_AFTER_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시성 제한기 (여러 스레드/이벤트 루프에서 공유 가능)"""
+    
+    def __init__(
+        self,
+        name: str = 'llm',
+        initial_limit: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        decrease_factor: Optional[float] = None,
+        default_backoff: Optional[float] = None
+    ):
+        self.name = name
+        self.min_limit = min_limit or settings.LLM_AIMD_MIN_LIMIT
+        self.max_limit = max_limit or settings.LLM_AIMD_MAX_LIMIT
+        self.limit = float(min(max(initial_limit or settings.LLM_AIMD_INITIAL_LIMIT, self.min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor or settings.LLM_AIMD_DECREASE_FACTOR
+        self.default_backoff = settings.LLM_AIMD_DEFAULT_BACKOFF if default_backoff is None else default_backoff
+        
+        self.in_flight = 0
+        self._cooldown_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.stats = {'calls': 0, 'successes': 0, 'throttled': 0, 'decreases': 0, 'wait_seconds': 0.0}
+        self._publish()
+    
+    def _wake_waiters(self):
+        """대기 중인 acquire를 모두 깨움 (각자 한도를 다시 확인)"""
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # 이미 닫힌 루프
+    
+    def _publish(self):
+        set_gauge(f'{self.name}_concurrency_limit', round(self.limit, 2))
+        set_gauge(f'{self.name}_in_flight', self.in_flight)
+        set_gauge(f'{self.name}_throttled_total', self.stats['throttled'])
+    
+    async def acquire(self) -> float:
+        """호출 슬롯 확보 → 시작 시각 (대기 중 한도 감소/쿨다운을 반영)"""
+        loop = asyncio.get_running_loop()
+        requested = time.monotonic()
+        while True:
+            with self._lock:
+                cooldown = self._cooldown_until - time.monotonic()
+                if cooldown <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    break
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            try:
+                await asyncio.wait_for(future, timeout=cooldown if cooldown > 0 else None)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    if (loop, future) in self._waiters:
+                        self._waiters.remove((loop, future))
+        
+        started = time.monotonic()
+        self.stats['calls'] += 1
+        self.stats['wait_seconds'] += started - requested
+        self._publish()
+        return started
+    
+    def release(self, started: float, outcome: str = OUTCOME_SUCCESS, retry_after: Optional[float] = None):
+        """호출 종료 반영 (성공: 가산 증가, 429: 절반 감소 + 대기, 그 외 오류/취소: 한도 유지)"""
+        throttled = outcome == OUTCOME_THROTTLED
+        with self._lock:
+            now = time.monotonic()
+            self.in_flight -= 1
+            if throttled:
+                self.stats['throttled'] += 1
+                backoff = self.default_backoff if retry_after is None else retry_after
+                self._cooldown_until = max(self._cooldown_until, now + backoff)
+                # 직전 감소 이후 시작한 호출의 429만 반영 (동시에 실패한 호출들로 여러 번 줄이지 않음)
+                decreased = started > self._last_decrease
+                if decreased:
+                    self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self.stats['decreases'] += 1
+            elif outcome == OUTCOME_SUCCESS:
+                self.stats['successes'] += 1
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        
+        if throttled and decreased:
+            logger.warning(f"{self.name} 호출 한도 초과: 동시성 {self.limit:.2f}로 감소, {backoff:.1f}초 대기")
+        self._publish()
+        self._wake_waiters()
+    
+    async def run(
+        self,
+        make_call: Callable[[], Awaitable[T]],
+        max_retries: Optional[int] = None,
+        on_wait: Optional[Callable[[float], None]] = None
+    ) -> T:
+        """make_call() 실행 (429/할당량 초과는 한도 조절 후 재시도, 그 외 오류는 그대로 발생)
+
+        on_wait: 슬롯/쿨다운 대기 시간을 호출별로 받을 콜백 (진행 상태 보고용)
+        """
+        max_retries = settings.LLM_MAX_RETRIES if max_retries is None else max_retries
+        attempt = 0
+        while True:
+            requested = time.monotonic()
+            started = await self.acquire()
+            if on_wait:
+                on_wait(started - requested)
+            try:
+                result = await make_call()
+            except Exception as e:
+                if not is_throttle_error(e):
+                    self.release(started, OUTCOME_ERROR)
+                    raise
+                self.release(started, OUTCOME_THROTTLED, retry_after_seconds(e))
+                if attempt >= max_retries:
+                    logger.error(f"{self.name} 호출 한도 초과 재시도 횟수 초과 ({max_retries}회): {e}")
+                    raise
+                attempt += 1
+                logger.info(f"{self.name} 호출 한도 초과, 재시도 ({attempt}/{max_retries})")
+                continue
+            except BaseException:
+                self.release(started, OUTCOME_ERROR)  # 취소
+                raise
+            
+            self.release(started)
+            return result
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'limit': round(self.limit, 2),
+            'in_flight': self.in_flight,
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'cooldown_seconds': round(max(self._cooldown_until - time.monotonic(), 0.0), 3),
+            **self.stats
+        }
+
+
+# 싱글톤 인스턴스 (같은 API 키/할당량을 쓰는 모든 Gemini 호출이 공유)
+_llm_limiter_instance = None
+
+
+def get_llm_limiter() -> AdaptiveConcurrencyLimiter:
+    global _llm_limiter_instance
+    if _llm_limiter_instance is None:
+        _llm_limiter_instance = AdaptiveConcurrencyLimiter('llm')
+    return _llm_limiter_instance
\ No newline at end of file
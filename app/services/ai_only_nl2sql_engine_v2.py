@@ -2,17 +2,24 @@
 AI 전용 NL2SQL 엔진 V2
 V2 테이블 스키마를 사용하는 자연어 쿼리 처리 엔진
 """
+import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from app.core.database import run_in_session
 from app.services.gemini_service import GeminiService
+from app.services.singleflight import SingleFlight, normalize_query
 from app.models.fsc_models_v2 import LawV2, ActionLawMapV2
 import json
 import re
 
 logger = logging.getLogger(__name__)
 
+# 동시에 들어온 같은 질의는 Gemini 변환 1회, 같은 SQL은 실행 1회로 병합
+_translation_flight = SingleFlight('nl2sql_translation')
+_execution_flight = SingleFlight('nl2sql_execution')
+
 
 class AIOnlyNL2SQLEngineV2:
     """AI 전용 NL2SQL 엔진 V2"""
@@ -112,10 +119,13 @@ class AIOnlyNL2SQLEngineV2:
     async def process_natural_query(self, query: str, limit: int = 50) -> Dict[str, Any]:
         """자연어 쿼리를 SQL로 변환하고 실행"""
         try:
-            # 1. AI를 통한 SQL 생성
+            # 1. AI를 통한 SQL 생성 (정규화한 질의가 같은 요청은 진행 중인 호출 공유)
             prompt = self.create_nl2sql_prompt(query)
             # 직접 API 호출 (V2 테이블용)
-            ai_response = await self.gemini_service._make_api_request_with_rate_limit(prompt)
+            ai_response = await _translation_flight.do(
+                normalize_query(query),
+                lambda: self.gemini_service._make_api_request_with_rate_limit(prompt)
+            )
             
             # 2. 응답 파싱
             parsed_response = self.parse_ai_response(ai_response)
@@ -137,16 +147,20 @@ class AIOnlyNL2SQLEngineV2:
             
             logger.info(f"생성된 SQL (V2): {sql_query}")
             
-            # 4. 쿼리 실행
-            result = self.db.execute(text(sql_query))
-            rows = result.fetchall()
-            
-            # 5. 결과 포맷팅
-            formatted_results = self.format_results(rows, result.keys())
+            # 4~5. 쿼리 실행 및 결과 포맷팅
+            # 생성된 SQL은 SQLite 문법이므로 분석 엔진(DuckDB)이 아닌 SQLite에서 실행
+            # (정수 나눗셈, AVG 타입, 정렬 순서가 DuckDB와 다르고 Parquet 스냅샷은 최신이 아닐 수 있음)
+            # 이벤트 루프를 막지 않도록 스레드에서 실행하며, 같은 SQL은 진행 중인 실행 공유
+            # (공유 작업은 첫 호출자의 요청 세션 대신 전용 세션 사용)
+            query_type = parsed_response.get('query_type', 'unknown')
+            formatted_results = await _execution_flight.do(
+                sql_query,
+                lambda: asyncio.to_thread(run_in_session, self.db.get_bind(), self._execute_and_format, sql_query)
+            )
             
             return {
                 'success': True,
-                'query_type': parsed_response.get('query_type', 'unknown'),
+                'query_type': query_type,
                 'sql_query': sql_query,
                 'results': formatted_results,
                 'metadata': {
@@ -162,6 +176,17 @@ class AIOnlyNL2SQLEngineV2:
                 'error': str(e)
             }
     
+    def _execute_and_format(self, db: Session, sql_query: str) -> List[Dict[str, Any]]:
+        """SQL 실행 후 포맷팅된 결과 반환"""
+        rows, columns = self.execute_sql(sql_query, db)
+        return self.format_results(rows, columns, db)
+    
+    def execute_sql(self, sql_query: str, db: Session = None) -> Tuple[List, List[str]]:
+        """SQL 실행 후 (행 목록, 컬럼명 목록) 반환"""
+        result = (db or self.db).execute(text(sql_query))
+        rows = result.fetchall()
+        return rows, list(result.keys())
+    
     def parse_ai_response(self, response: str) -> Dict[str, Any]:
         """AI 응답 파싱"""
         try:
@@ -185,7 +210,7 @@ class AIOnlyNL2SQLEngineV2:
             logger.error(f"AI 응답 파싱 오류: {e}")
             return None
     
-    def format_results(self, rows: List, columns: List[str]) -> List[Dict[str, Any]]:
+    def format_results(self, rows: List, columns: List[str], db: Session = None) -> List[Dict[str, Any]]:
         """쿼리 결과를 딕셔너리 리스트로 포맷팅"""
         formatted = []
         
@@ -213,7 +238,7 @@ class AIOnlyNL2SQLEngineV2:
             # 법률 정보 추가 (action_id가 있는 경우)
             if 'action_id' in result_dict and result_dict['action_id']:
                 action_id = result_dict['action_id']
-                laws = self.db.query(
+                laws = (db or self.db).query(
                     LawV2.law_name, 
                     ActionLawMapV2.article_details
                 ).join(
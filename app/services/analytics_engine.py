@@ -0,0 +1,263 @@
+"""
+분석 엔진 (DuckDB)
+통계성 집계 쿼리를 임베디드 DuckDB의 벡터화 실행으로 처리
+- attach 모드: SQLite DB 파일을 DuckDB에 직접 연결 (실시간 데이터)
+- parquet 모드: 주기적으로 생성하는 Parquet 스냅샷을 조회 (TTL 단위 갱신, 같은 프로세스의 의결서 저장 시 즉시 갱신)
+- DuckDB 미설치 또는 오류 시 호출 측에서 SQLite로 폴백
+- ORM으로 작성된 고정 집계 쿼리 전용 (LLM이 생성한 SQLite SQL은 SQLite에서 실행)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import NullPool
+from sqlalchemy.types import BigInteger, Date, DateTime, Float, Integer, JSON, Numeric
+
+from app.core.config import settings
+from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2, ActionLawMapV2
+from app.services import ingest_events
+
+try:
+    import duckdb
+except ImportError:  # 분석 엔진은 duckdb 설치 시에만 활성화
+    duckdb = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+# 분석 대상 테이블 (NL2SQL이 생성하는 SQL과 동일한 테이블명으로 뷰 생성)
+ANALYTICS_TABLES = [
+    DecisionV2.__table__,
+    ActionV2.__table__,
+    LawV2.__table__,
+    ActionLawMapV2.__table__,
+]
+
+
+class AnalyticsEngine:
+    """DuckDB 기반 통계 쿼리 엔진"""
+    
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        source: Optional[str] = None,
+        snapshot_dir: Optional[str] = None,
+        snapshot_ttl: Optional[int] = None
+    ):
+        self.database_url = database_url or settings.DATABASE_URL
+        self.source = source or settings.ANALYTICS_SOURCE
+        self.snapshot_dir = snapshot_dir or settings.ANALYTICS_SNAPSHOT_DIR
+        self.snapshot_ttl = settings.ANALYTICS_SNAPSHOT_TTL if snapshot_ttl is None else snapshot_ttl
+        
+        self._conn = None
+        self._mode = None
+        self._snapshot_time = 0.0
+        self._stale = False
+        self._lock = threading.Lock()
+        
+        ingest_events.subscribe(ingest_events.DECISION_INGESTED, self._on_decision_ingested)
+    
+    @property
+    def enabled(self) -> bool:
+        """분석 엔진 사용 가능 여부"""
+        return settings.ANALYTICS_BACKEND == 'duckdb' and duckdb is not None
+    
+    @property
+    def mode(self) -> Optional[str]:
+        """현재 연결 모드 (attach / parquet)"""
+        return self._mode
+    
+    def execute(self, sql: str) -> Tuple[List[str], List[tuple]]:
+        """SQL 실행 후 (컬럼명 목록, 행 목록) 반환"""
+        conn = self._ensure_connection()
+        
+        # 커넥션 공유 시 스레드 안전성을 위해 쿼리마다 커서 분리
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql)
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        
+        return columns, rows
+    
+    def execute_query(self, query) -> List[tuple]:
+        """SQLAlchemy ORM 쿼리를 DuckDB에서 실행"""
+        statement = query.statement.compile(
+            dialect=sqlite.dialect(),
+            compile_kwargs={"literal_binds": True}
+        )
+        _, rows = self.execute(str(statement))
+        return rows
+    
+    def refresh(self):
+        """연결 및 스냅샷 강제 갱신"""
+        with self._lock:
+            self._close()
+            self._connect()
+    
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._close()
+    
+    def _ensure_connection(self):
+        """연결 확인 (parquet 모드는 TTL 만료 또는 신규 의결서 저장 시 스냅샷 재생성)"""
+        if not self.enabled:
+            raise RuntimeError("분석 엔진이 비활성화되어 있습니다 (ANALYTICS_BACKEND=duckdb 및 duckdb 설치 필요)")
+        
+        with self._lock:
+            expired = (
+                self._mode == 'parquet'
+                and (self._stale or time.time() - self._snapshot_time > self.snapshot_ttl)
+            )
+            if self._conn is None or expired:
+                self._close()
+                self._connect()
+            return self._conn
+    
+    def _connect(self):
+        """DuckDB 연결 생성 및 테이블 뷰 등록"""
+        conn = duckdb.connect(database=':memory:')
+        
+        if self.source == 'attach' and self.database_url.startswith('sqlite'):
+            try:
+                self._attach_sqlite(conn)
+                self._conn = conn
+                self._mode = 'attach'
+                logger.info("분석 엔진: SQLite 직접 연결 모드")
+                return
+            except Exception as e:
+                # sqlite 확장 미설치(오프라인 환경 등) 시 스냅샷 모드로 전환
+                logger.warning(f"SQLite 연결 실패, Parquet 스냅샷으로 전환: {e}")
+        
+        self._build_snapshots()
+        self._register_snapshots(conn)
+        self._conn = conn
+        self._mode = 'parquet'
+        self._snapshot_time = time.time()
+        self._stale = False
+        logger.info(f"분석 엔진: Parquet 스냅샷 모드 ({self.snapshot_dir})")
+    
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._mode = None
+    
+    def _attach_sqlite(self, conn):
+        """SQLite DB 파일을 읽기 전용으로 연결"""
+        db_path = os.path.abspath(self.database_url.replace("sqlite:///", ""))
+        escaped_path = db_path.replace("'", "''")
+        conn.execute(f"ATTACH '{escaped_path}' AS fss (TYPE SQLITE, READ_ONLY)")
+        
+        for table in ANALYTICS_TABLES:
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {table.name} AS SELECT * FROM fss.{table.name}"
+            )
+    
+    def _build_snapshots(self):
+        """운영 DB 테이블을 Parquet 스냅샷으로 저장"""
+        if pa is None:
+            raise RuntimeError("Parquet 스냅샷 생성을 위해 pyarrow 설치가 필요합니다.")
+        
+        from app.core.database import engine
+        
+        if self.database_url != settings.DATABASE_URL:
+            engine = create_engine(self.database_url, poolclass=NullPool)  # 스냅샷 생성 시에만 사용
+        
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        
+        with engine.connect() as connection:
+            for table in ANALYTICS_TABLES:
+                schema = self._arrow_schema(table)
+                target = self._snapshot_path(table.name)
+                temp_path = f"{target}.tmp"
+                
+                result = connection.execution_options(stream_results=True).execute(select(table))
+                writer = pq.ParquetWriter(temp_path, schema, compression='zstd')
+                try:
+                    while True:
+                        rows = result.fetchmany(settings.EXPORT_BATCH_SIZE)
+                        if not rows:
+                            break
+                        batch = [self._snapshot_row(table, row) for row in rows]
+                        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                finally:
+                    writer.close()
+                
+                # 조회 중인 스냅샷과 충돌하지 않도록 원자적 교체
+                os.replace(temp_path, target)
+    
+    def _register_snapshots(self, conn):
+        """Parquet 스냅샷을 테이블명과 동일한 뷰로 등록"""
+        for table in ANALYTICS_TABLES:
+            escaped_path = self._snapshot_path(table.name).replace("'", "''")
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {table.name} AS SELECT * FROM read_parquet('{escaped_path}')"
+            )
+    
+    def _on_decision_ingested(self, **payload):
+        """신규 의결서 저장 시 다음 조회에서 스냅샷 재생성 (attach 모드는 항상 최신)"""
+        self._stale = True
+    
+    def _snapshot_path(self, table_name: str) -> str:
+        return os.path.abspath(os.path.join(self.snapshot_dir, f"{table_name}.parquet"))
+    
+    @staticmethod
+    def _arrow_schema(table):
+        """SQLAlchemy 컬럼 타입을 Arrow 타입으로 변환"""
+        fields = []
+        for column in table.columns:
+            column_type = column.type
+            if isinstance(column_type, (Integer, BigInteger)):
+                arrow_type = pa.int64()
+            elif isinstance(column_type, (Float, Numeric)):
+                arrow_type = pa.float64()
+            elif isinstance(column_type, DateTime):
+                arrow_type = pa.timestamp('us')
+            elif isinstance(column_type, Date):
+                arrow_type = pa.date32()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+        return pa.schema(fields)
+    
+    @staticmethod
+    def _snapshot_row(table, row) -> dict:
+        """스냅샷 저장용 행 변환 (JSON 컬럼은 문자열로 저장)"""
+        record = {}
+        for column, value in zip(table.columns, row):
+            if isinstance(column.type, JSON) and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            elif isinstance(value, datetime) and not isinstance(column.type, DateTime):
+                value = value.date() if isinstance(column.type, Date) else value.isoformat()
+            elif isinstance(value, date) and not isinstance(column.type, (Date, DateTime)):
+                value = value.isoformat()
+            record[column.name] = value
+        return record
+
+
+# 싱글톤 인스턴스
+_analytics_engine_instance = None
+
+def get_analytics_engine() -> AnalyticsEngine:
+    """분석 엔진 싱글톤 인스턴스 반환"""
+    global _analytics_engine_instance
+    if _analytics_engine_instance is None:
+        _analytics_engine_instance = AnalyticsEngine()
+    return _analytics_engine_instance
\ No newline at end of file
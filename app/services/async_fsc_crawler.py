@@ -0,0 +1,321 @@
+"""
+FSC 비동기 크롤러
+동기 FSCCrawler(고정 지연, 순차 처리, 타임아웃 없음)를 asyncio 기반으로 대체
+- httpx.AsyncClient 연결 풀 재사용 (keep-alive)
+- 호스트별 토큰 버킷으로 요청 간격 제한 (politeness)
+- 목록 페이지/ZIP 다운로드를 동시성 제한 내에서 병렬 처리
+- 연결/읽기 타임아웃, 지터를 섞은 지수 백오프 재시도
+- 게시물 파싱, 의결서 판별, 증분 상태(CrawlState), ZIP 압축 해제는 FSCCrawler 로직 재사용
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+from app.services.fsc_crawler import FSCCrawler
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 burst개 누적)"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (대기 순서대로 발급)"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 (같은 호스트 요청만 서로 제한)"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+    
+    async def wait(self, url: str):
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        await bucket.acquire()
+
+
+class AsyncFSCCrawler(FSCCrawler):
+    """금융위원회 웹사이트 비동기 크롤러"""
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        raw_zip_dir: Optional[str] = None,
+        processed_pdf_dir: Optional[str] = None,
+        state_path: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        store_dir: Optional[str] = None,
+        listing_concurrency: Optional[int] = None,
+        download_concurrency: Optional[int] = None,
+        rate_per_host: Optional[float] = None,
+        burst: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None
+    ):
+        super().__init__(base_url, raw_zip_dir, processed_pdf_dir, state_path, incremental, store_dir)
+        self.listing_concurrency = max(1, listing_concurrency or settings.CRAWLER_LISTING_CONCURRENCY)
+        self.download_concurrency = max(1, download_concurrency or settings.CRAWLER_DOWNLOAD_CONCURRENCY)
+        self.max_retries = settings.MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = settings.CRAWLER_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.timeout = httpx.Timeout(timeout or settings.CRAWLER_TIMEOUT, connect=settings.CRAWLER_CONNECT_TIMEOUT)
+        self.limiter = HostRateLimiter(
+            settings.CRAWLER_RATE_PER_HOST if rate_per_host is None else rate_per_host,
+            burst or settings.CRAWLER_BURST
+        )
+        self.stats.update({'requests': 0, 'retries': 0, 'failed_requests': 0, 'bytes_downloaded': 0})
+        self._client: Optional[httpx.AsyncClient] = None
+        self._reserved_paths = set()
+    
+    async def __aenter__(self):
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """연결 풀 클라이언트 (첫 요청 시 생성, 목록/다운로드가 공유)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.listing_concurrency + self.download_concurrency,
+                    max_keepalive_connections=max(self.listing_concurrency, self.download_concurrency)
+                ),
+                follow_redirects=True
+            )
+        return self._client
+    
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """일시적 오류 여부 (타임아웃/연결 오류, 429/5xx)"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRY_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+    
+    async def _with_retries(self, url: str, operation: Callable[[httpx.AsyncClient], Awaitable[Any]]) -> Any:
+        """호스트별 속도 제한을 지키며 요청 실행, 일시적 오류는 지수 백오프 + 지터로 재시도"""
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.wait(url)
+            self.stats['requests'] += 1
+            try:
+                return await operation(self._get_client())
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    self.stats['failed_requests'] += 1
+                    raise
+                # 절반은 고정, 절반은 무작위 (동시에 실패한 요청이 같은 시점에 몰리지 않도록)
+                backoff = self.retry_backoff * (2 ** attempt)
+                delay = backoff / 2 + random.uniform(0, backoff / 2)
+                self.stats['retries'] += 1
+                logger.warning(f"요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.2f}초 후): {url} - {e}")
+                await asyncio.sleep(delay)
+    
+    async def _get(self, url: str, params: Optional[Dict] = None) -> httpx.Response:
+        async def fetch(client: httpx.AsyncClient) -> httpx.Response:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response
+        
+        return await self._with_retries(url, fetch)
+    
+    async def search_decisions(self, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """지정된 기간의 의결서 목록을 검색합니다.
+
+        다음 페이지 존재 여부는 받아봐야 알 수 있으므로 listing_concurrency개 페이지씩 묶어 동시에 요청하고,
+        마지막 페이지가 확인되면 그 뒤 페이지 결과는 버립니다.
+        """
+        decisions = []
+        search_url = f"{self.base_url}/no020101"
+        params = self._search_params(start_date, end_date)
+        self._begin_listing(start_date, end_date)
+        
+        try:
+            first_page = 1
+            while True:
+                pages = range(first_page, first_page + self.listing_concurrency)
+                results = await asyncio.gather(
+                    *(self._fetch_listing_page(search_url, params, page) for page in pages),
+                    return_exceptions=True
+                )
+                
+                # 마지막 페이지 이후에 요청한 페이지의 오류는 무시
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+                    page_decisions, has_next = result
+                    decisions.extend(page_decisions)
+                    if not has_next:
+                        self._listing_complete = True
+                        return decisions
+                
+                first_page += self.listing_concurrency
+        
+        except Exception as e:
+            logger.error(f"의결서 검색 중 오류 발생: {str(e)}")
+        
+        return decisions
+    
+    async def _fetch_listing_page(self, search_url: str, params: Dict, page: int) -> Tuple[List[Dict], bool]:
+        """목록 페이지 1개 → (의결서 목록, 다음 페이지 존재 여부)"""
+        response = await self._get(search_url, params={**params, 'curPage': page})
+        return self._parse_listing_page(response.content)
+    
+    async def download_decision_files(self, decisions: List[Dict]) -> List[str]:
+        """의결서 ZIP 파일들을 동시에 다운로드합니다. (최대 download_concurrency개)"""
+        semaphore = asyncio.Semaphore(self.download_concurrency)
+        downloads = []
+        
+        for decision in decisions:
+            for file_info in decision.get('files', []):
+                file_name = file_info.get('name', '')
+                file_url = file_info.get('url', '')
+                
+                # 의결서 ZIP 파일만 다운로드
+                if '의결서' in file_name and '.zip' in file_name:
+                    full_url = self._absolute_url(file_url)
+                    downloads.append(self._download_file_async(semaphore, full_url, decision['title'], file_name))
+        
+        results = await asyncio.gather(*downloads)
+        return [filename for filename in results if filename]
+    
+    def _reserve_path(self, filename: str) -> str:
+        """동시 다운로드끼리 같은 파일명을 쓰지 않도록 저장 경로 예약"""
+        name, ext = os.path.splitext(filename)
+        filepath = os.path.join(self.raw_zip_dir, filename)
+        suffix = 1
+        while filepath in self._reserved_paths or os.path.exists(filepath):
+            filepath = os.path.join(self.raw_zip_dir, f"{name}_{suffix}{ext}")
+            suffix += 1
+        self._reserved_paths.add(filepath)
+        return filepath
+    
+    async def _download_file_async(
+        self,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        decision_title: str,
+        original_filename: str = None
+    ) -> Optional[str]:
+        """파일을 스트리밍으로 다운로드합니다. (조건부 GET, 완료 후 원자적 이름 변경)"""
+        async with semaphore:
+            filepath = self._reserve_path(self._build_filename(decision_title, original_filename))
+            tmp_path = f"{filepath}.part"
+            conditional_headers = self._conditional_headers(url)
+            
+            async def stream(client: httpx.AsyncClient) -> Tuple[Optional[str], int, httpx.Headers]:
+                async with client.stream('GET', url, headers=conditional_headers) as response:
+                    if response.status_code == 304:
+                        return None, 0, response.headers
+                    response.raise_for_status()
+                    digest = hashlib.sha256()
+                    size = 0
+                    with open(tmp_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
+                            size += len(chunk)
+                    return digest.hexdigest(), size, response.headers
+            
+            try:
+                sha256, size, headers = await self._with_retries(url, stream)
+                if sha256 is None:
+                    self._mark_not_modified(url, headers)
+                    return None
+                os.replace(tmp_path, filepath)
+                self.stats['bytes_downloaded'] += size
+                return self._finish_download(url, filepath, sha256, size, headers)
+            
+            except Exception as e:
+                logger.error(f"파일 다운로드 실패: {url} - {str(e)}")
+                self.failed_downloads.append(url)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return None
+            
+            finally:
+                self._reserved_paths.discard(filepath)
+    
+    async def crawl_decisions(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """의결서 크롤링 전체 프로세스를 실행합니다."""
+        logger.info(f"의결서 비동기 크롤링 시작: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        started = time.perf_counter()
+        owns_client = self._client is None
+        self.failed_downloads = []
+        
+        try:
+            # 1. 의결서 목록 검색
+            decisions = await self.search_decisions(start_date, end_date)
+            logger.info(f"검색된 의결서 수: {len(decisions)}")
+            
+            # 2. 파일 다운로드
+            downloaded_files = await self.download_decision_files(decisions)
+            logger.info(
+                f"다운로드된 파일 수: {len(downloaded_files)} "
+                f"(304 생략 {self.stats['not_modified']}, 내용 동일 {self.stats['unchanged_files']})"
+            )
+        finally:
+            if owns_client:
+                await self.aclose()
+        self._update_state(decisions)
+        
+        # 3. 이번에 받은 ZIP 파일만 압축 해제 (디스크 작업이므로 스레드에서 실행)
+        extracted_files = await asyncio.to_thread(self.extract_zip_files, downloaded_files)
+        logger.info(f"추출된 PDF 파일 수: {len(extracted_files)}")
+        
+        stats = dict(self.stats, elapsed_seconds=round(time.perf_counter() - started, 2))
+        logger.info(
+            f"크롤링 통계: 요청 {stats['requests']}건, 재시도 {stats['retries']}건, "
+            f"실패 {stats['failed_requests']}건, {stats['bytes_downloaded']}바이트, {stats['elapsed_seconds']}초"
+        )
+        
+        return {
+            'decisions': decisions,
+            'downloaded_files': downloaded_files,
+            'extracted_files': extracted_files,
+            'stats': stats
+        }
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""
+검색어 자동완성 서비스
+기관명, 법률명(약칭 포함), 업권, 조치유형에 대한 접두어 검색
+- 정렬된 키 배열 + 이진 탐색(bisect)으로 접두어 범위 조회
+- 어절 시작 위치도 키로 등록하여 중간 단어 접두어 검색 지원
+- 빈도(조치 건수) 순 정렬, 조회 전 DB 서명(건수, 최대 키, 최종 수정 시각)이 바뀌었으면 재구축
+  (다른 프로세스의 저장도 반영)
+"""
+import heapq
+import logging
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from app.models.fsc_models_v2 import ActionV2, LawV2, ActionLawMapV2
+from utils.law_normalizer import get_law_normalizer
+
+logger = logging.getLogger(__name__)
+
+
+# 자동완성 카테고리
+AUTOCOMPLETE_CATEGORIES = ('entity', 'law', 'sector', 'action_type')
+
+
+def normalize_key(text: str) -> str:
+    """비교용 키 (소문자, 공백 제거)"""
+    return ''.join(text.lower().split())
+
+
+class AutocompleteIndex:
+    """정렬 배열 기반 접두어 자동완성 인덱스"""
+    
+    def __init__(self, session_factory=None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        
+        # 항목: (표시값, 카테고리, 빈도, 정식 명칭)
+        self._entries: List[Tuple[str, str, int, Optional[str]]] = []
+        self._keys: List[str] = []
+        self._entry_ids: List[int] = []
+        
+        self._loaded = False
+        self._signature: Optional[Tuple] = None  # 구축 시점의 DB 서명
+        self._lock = threading.Lock()
+    
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+    
+    def refresh(self, signature: Optional[Tuple] = None):
+        """DB 및 법률 약칭 데이터로 인덱스 재구축"""
+        self._signature = signature if signature is not None else self._db_signature()
+        entries = self._collect_entries()
+        
+        keyed = []
+        for entry_id, (value, _, _, _) in enumerate(entries):
+            for key in self._entry_keys(value):
+                keyed.append((key, entry_id))
+        keyed.sort()
+        
+        self._entries = entries
+        self._keys = [key for key, _ in keyed]
+        self._entry_ids = [entry_id for _, entry_id in keyed]
+        self._loaded = True
+        
+        logger.info(f"자동완성 인덱스 구축: 항목 {len(entries)}개, 키 {len(keyed)}개")
+    
+    def suggest(self, prefix: str, category: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """접두어에 해당하는 항목을 빈도순으로 반환 (조회 전 DB 변경 확인)"""
+        key = normalize_key(prefix)
+        if not key:
+            return []
+        
+        with self._lock:
+            signature = self._db_signature()
+            if not self._loaded or signature != self._signature:
+                self.refresh(signature)
+            
+            start = bisect_left(self._keys, key)
+            end = bisect_left(self._keys, key + '\uffff', lo=start)
+            
+            entry_ids = {
+                self._entry_ids[i]
+                for i in range(start, end)
+                if category is None or self._entries[self._entry_ids[i]][1] == category
+            }
+            top = heapq.nlargest(
+                limit,
+                entry_ids,
+                key=lambda entry_id: (self._entries[entry_id][2], -len(self._entries[entry_id][0]))
+            )
+            
+            return [
+                {
+                    'value': self._entries[entry_id][0],
+                    'category': self._entries[entry_id][1],
+                    'count': self._entries[entry_id][2],
+                    'canonical': self._entries[entry_id][3]
+                }
+                for entry_id in top
+            ]
+    
+    @staticmethod
+    def _entry_keys(value: str) -> List[str]:
+        """전체 문자열 및 각 어절 시작 위치의 키"""
+        words = value.split()
+        return [normalize_key(' '.join(words[i:])) for i in range(len(words))] or [normalize_key(value)]
+    
+    def _db_signature(self) -> Tuple:
+        """조치/법률/조치-법률 매핑 테이블 서명 (건수, 최대 키, 최종 수정 시각)"""
+        session = self.session_factory()
+        
+        try:
+            signature = ()
+            for model, key in (
+                (ActionV2, ActionV2.action_id),
+                (LawV2, LawV2.law_id),
+                (ActionLawMapV2, ActionLawMapV2.map_id)
+            ):
+                signature += tuple(session.query(func.count(key), func.max(key), func.max(model.updated_at)).one())
+            return signature
+        finally:
+            session.close()
+    
+    def _collect_entries(self) -> List[Tuple[str, str, int, Optional[str]]]:
+        session = self.session_factory()
+        
+        try:
+            entity_counts = session.query(
+                ActionV2.entity_name,
+                func.count(ActionV2.action_id)
+            ).group_by(ActionV2.entity_name).all()
+            
+            sector_counts = session.query(
+                ActionV2.industry_sector,
+                func.count(ActionV2.action_id)
+            ).filter(ActionV2.industry_sector.isnot(None)).group_by(ActionV2.industry_sector).all()
+            
+            # 조치유형은 쉼표로 여러 개가 기재될 수 있음
+            action_type_counts = Counter()
+            for action_type, count in session.query(
+                ActionV2.action_type,
+                func.count(ActionV2.action_id)
+            ).group_by(ActionV2.action_type):
+                for name in (action_type or '').split(','):
+                    if name.strip():
+                        action_type_counts[name.strip()] += count
+            
+            law_counts = session.query(
+                LawV2.law_name,
+                LawV2.law_short_name,
+                func.count(ActionLawMapV2.map_id)
+            ).outerjoin(
+                ActionLawMapV2, ActionLawMapV2.law_id == LawV2.law_id
+            ).group_by(LawV2.law_id).all()
+        finally:
+            session.close()
+        
+        entries = {}
+        
+        def add(value, category, count, canonical=None):
+            if not value or not value.strip():
+                return
+            key = (value.strip(), category)
+            previous = entries.get(key)
+            if previous is None or previous[2] < count:
+                entries[key] = (value.strip(), category, count, canonical)
+        
+        for name, count in entity_counts:
+            add(name, 'entity', count)
+        for name, count in sector_counts:
+            add(name, 'sector', count)
+        for name, count in action_type_counts.items():
+            add(name, 'action_type', count)
+        
+        law_frequency = {}
+        for law_name, short_name, count in law_counts:
+            law_frequency[law_name] = count
+            add(law_name, 'law', count)
+            if short_name and short_name != law_name:
+                add(short_name, 'law', count, law_name)
+        
+        # 법률 약칭 사전 (DB에 없는 법률도 포함)
+        for abbreviation, law_name in get_law_normalizer().abbr_to_name.items():
+            count = law_frequency.get(law_name, 0)
+            add(law_name, 'law', count)
+            add(abbreviation, 'law', count, law_name)
+        
+        return list(entries.values())
+    
+
+# 싱글톤 인스턴스
+_autocomplete_instance = None
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """자동완성 인덱스 싱글톤 인스턴스 반환"""
+    global _autocomplete_instance
+    if _autocomplete_instance is None:
+        _autocomplete_instance = AutocompleteIndex()
+    return _autocomplete_instance
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+콘텐츠 주소 저장소 (ZIP/PDF)
+다운로드한 ZIP과 압축 해제한 PDF를 SHA-256 기준으로 한 번만 저장하고 하드링크로 배치
+- objects/<해시 앞 2자리>/<해시><확장자> 구조
+- raw_zip/, processed_pdf/<연도>/ 파일은 저장소 객체의 하드링크 (하드링크 불가 시 복사)
+- 압축 해제 원장: ZIP 해시별로 추출한 PDF를 기록하여 같은 ZIP은 한 번만 압축 해제
+  (원장은 여러 크롤러 인스턴스가 함께 쓰므로 압축 해제 전에 다시 읽고, 저장 시 파일의 기록과 병합)
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.json_state import update_json
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 원장 파일 형식 버전
+LEDGER_VERSION = 1
+
+# 저장소 루트 아래 원장 파일명
+LEDGER_FILENAME = 'extraction_ledger.json'
+
+
+def file_sha256(path) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """SHA-256 콘텐츠 주소 저장소"""
+    
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or settings.CONTENT_STORE_DIR)
+        self.objects_dir = self.root / 'objects'
+        self.tmp_dir = self.root / 'tmp'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._warned_copy_fallback = False
+    
+    def object_path(self, sha256: str, suffix: str = '') -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}{suffix}"
+    
+    def contains(self, sha256: str, suffix: str = '') -> bool:
+        return self.object_path(sha256, suffix).exists()
+    
+    def put_file(self, path, suffix: Optional[str] = None, sha256: Optional[str] = None) -> Tuple[str, Path, bool]:
+        """기존 파일을 저장소에 등록 (원본은 그대로 두고 하드링크) → (해시, 객체 경로, 새 객체 여부)"""
+        path = Path(path)
+        suffix = path.suffix.lower() if suffix is None else suffix
+        sha256 = sha256 or file_sha256(path)
+        object_path = self.object_path(sha256, suffix)
+        if object_path.exists():
+            return sha256, object_path, False
+        
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.tmp_dir / f"{uuid.uuid4().hex}{suffix}"
+        self._link_or_copy(path, tmp_path)
+        return sha256, object_path, self._commit(tmp_path, object_path)
+    
+    def put_stream(self, stream: BinaryIO, suffix: str = '') -> Tuple[str, Path, bool]:
+        """스트림 내용을 해시하며 임시 파일에 기록 후 등록 → (해시, 객체 경로, 새 객체 여부)"""
+        digest = hashlib.sha256()
+        tmp_path = self.tmp_dir / f"{uuid.uuid4().hex}{suffix}"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b''):
+                    f.write(chunk)
+                    digest.update(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        sha256 = digest.hexdigest()
+        object_path = self.object_path(sha256, suffix)
+        if object_path.exists():
+            tmp_path.unlink()
+            return sha256, object_path, False
+        
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        return sha256, object_path, self._commit(tmp_path, object_path)
+    
+    @staticmethod
+    def _commit(tmp_path: Path, object_path: Path) -> bool:
+        """임시 파일을 객체 경로로 이동 (동시에 같은 객체가 먼저 생기면 False)"""
+        try:
+            os.link(tmp_path, object_path)
+            return True
+        except FileExistsError:
+            return False
+        except OSError:
+            # 하드링크를 지원하지 않는 파일시스템
+            if object_path.exists():
+                return False
+            os.replace(tmp_path, object_path)
+            return True
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    def link(self, sha256: str, suffix: str, dest) -> bool:
+        """객체를 dest 경로에 배치 (같은 이름의 기존 파일은 교체, 이미 같은 객체면 False)"""
+        object_path = self.object_path(sha256, suffix)
+        dest = Path(dest)
+        if dest.exists() and os.path.samefile(dest, object_path):
+            return False
+        
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+        self._link_or_copy(object_path, tmp_path)
+        os.replace(tmp_path, dest)
+        return True
+    
+    def _link_or_copy(self, src: Path, dst: Path):
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if not self._warned_copy_fallback:
+                logger.warning(f"하드링크를 만들 수 없어 복사로 대체 (저장 공간 중복 발생): {dst} - {e}")
+                self._warned_copy_fallback = True
+            shutil.copy2(src, dst)
+
+
+class ExtractionLedger:
+    """ZIP 압축 해제 원장 (ZIP 해시 → 추출한 PDF 목록)"""
+    
+    def __init__(self, path=None):
+        self.path = Path(path or Path(settings.CONTENT_STORE_DIR) / LEDGER_FILENAME)
+        self.zips: Dict[str, Dict[str, Any]] = {}
+        self.load()
+    
+    def load(self):
+        """원장 읽기 (메모리에 없는 기록만 추가하므로 다른 인스턴스가 기록한 ZIP을 반영할 때도 사용)"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"압축 해제 원장을 읽을 수 없어 새로 시작: {self.path} - {e}")
+            return
+        
+        if data.get('version') == LEDGER_VERSION:
+            self.zips = {**(data.get('zips') or {}), **self.zips}
+    
+    def save(self):
+        """원장 저장 (잠금 안에서 그 사이 다른 인스턴스가 기록한 ZIP과 병합 후 교체)"""
+        def merge(current: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            if current and current.get('version') == LEDGER_VERSION:
+                self.zips = {**(current.get('zips') or {}), **self.zips}
+            return {'version': LEDGER_VERSION, 'zips': self.zips}
+        
+        try:
+            update_json(self.path, merge)
+        except OSError as e:
+            logger.error(f"압축 해제 원장 저장 실패: {self.path} - {e}")
+    
+    def is_extracted(self, zip_sha256: str) -> bool:
+        return zip_sha256 in self.zips
+    
+    def contains_pdf(self, pdf_sha256: str) -> bool:
+        """ZIP 압축 해제로 배치된 PDF 내용인지"""
+        return any(pdf.get('sha256') == pdf_sha256 for entry in self.zips.values() for pdf in entry.get('pdfs', []))
+    
+    def record(self, zip_sha256: str, zip_name: str, pdfs: List[Dict[str, Any]]):
+        """ZIP 압축 해제 기록 (pdfs: sha256, name, path)"""
+        self.zips[zip_sha256] = {
+            'zip_name': zip_name,
+            'extracted_at': datetime.now().isoformat(timespec='seconds'),
+            'pdfs': pdfs
+        }
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+증분 크롤링 상태 저장소
+매 실행마다 전체 기간을 다시 훑지 않도록 크롤링 상태를 JSON 파일로 유지
+- 게시물 번호 상한과 그 상한이 보장하는 게시일 범위 (요청 기간이 이 범위에서 이어질 때만 수집한 게시물에 도달하면 목록 조회 중단)
+- 파일 URL별 ETag/Last-Modified (조건부 GET) 및 내용 해시 (내용이 같으면 저장 생략)
+- 저장 시 다른 크롤러 인스턴스(수집 작업, 핫 폴더 감시, 스크립트)가 그 사이 저장한 내용과 병합
+"""
+import json
+import logging
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.config import settings
+from app.services.json_state import update_json
+
+logger = logging.getLogger(__name__)
+
+# 상태 파일 형식 버전
+CRAWL_STATE_VERSION = 1
+
+POST_NO_PATTERN = re.compile(r'\d+')
+
+
+def parse_post_no(value: Any) -> Optional[int]:
+    """게시물 번호 문자열 → 정수 (공지 등 번호가 없으면 None)"""
+    match = POST_NO_PATTERN.search(str(value or ''))
+    return int(match.group()) if match else None
+
+
+def _as_date(value: Any) -> Optional[date]:
+    """datetime/date/ISO 문자열 → date"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _checked_at(entry: Dict[str, Any]) -> str:
+    """파일 기록의 마지막 확인 시각 (ISO 문자열, 병합 시 최신 기록 선택용)"""
+    return entry.get('checked_at') or entry.get('downloaded_at') or ''
+
+
+class CrawlState:
+    """크롤링 상태 (게시물 번호 상한과 보장 범위, 파일별 검증자/해시)
+
+    high_water_post_no 이하 게시물 중 게시일이 [covered_from, covered_to]인 것은 모두 수집됨
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or settings.CRAWL_STATE_PATH)
+        self.high_water_post_no = 0
+        self.covered_from: Optional[date] = None
+        self.covered_to: Optional[date] = None
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._loaded_mark = self._mark()
+        self.load()
+    
+    def load(self):
+        """상태 파일 읽기 (없거나 손상되었으면 빈 상태로 시작)"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"크롤링 상태 파일을 읽을 수 없어 전체 크롤링으로 시작: {self.path} - {e}")
+            return
+        
+        if data.get('version') != CRAWL_STATE_VERSION:
+            logger.warning(f"크롤링 상태 파일 버전 불일치, 무시: {self.path}")
+            return
+        self._set_mark(data)
+        self._loaded_mark = self._mark()
+        self.files = data.get('files') or {}
+    
+    def _mark(self):
+        return self.high_water_post_no, self.covered_from, self.covered_to
+    
+    def _set_mark(self, data: Dict[str, Any]):
+        """상태 파일 내용의 게시물 번호 상한과 보장 범위 반영"""
+        self.high_water_post_no = data.get('high_water_post_no') or 0
+        try:
+            self.covered_from = _as_date(data.get('covered_from'))
+            self.covered_to = _as_date(data.get('covered_to'))
+        except ValueError:
+            self.covered_from = self.covered_to = None
+    
+    def save(self):
+        """상태 파일 저장 (잠금 안에서 그 사이 다른 인스턴스가 저장한 내용과 병합 후 교체)
+
+        - 파일별 기록: 마지막 확인 시각이 더 최근인 쪽
+        - 게시물 번호 상한/보장 범위: 이 인스턴스가 읽은 뒤 갱신했으면 이쪽, 아니면 파일의 값
+        """
+        def merge(current: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            if current and current.get('version') == CRAWL_STATE_VERSION:
+                for url, entry in (current.get('files') or {}).items():
+                    mine = self.files.get(url)
+                    if mine is None or _checked_at(entry) > _checked_at(mine):
+                        self.files[url] = entry
+                if self._mark() == self._loaded_mark:
+                    self._set_mark(current)
+            self._loaded_mark = self._mark()
+            return {
+                'version': CRAWL_STATE_VERSION,
+                'high_water_post_no': self.high_water_post_no,
+                'covered_from': self.covered_from.isoformat() if self.covered_from else None,
+                'covered_to': self.covered_to.isoformat() if self.covered_to else None,
+                'files': self.files,
+                'updated_at': datetime.now().isoformat(timespec='seconds')
+            }
+        
+        try:
+            update_json(self.path, merge)
+        except OSError as e:
+            logger.error(f"크롤링 상태 저장 실패: {self.path} - {e}")
+    
+    def cutoff_for(self, start_date: Any) -> int:
+        """요청 기간에서 목록 조회를 멈출 게시물 번호 (적용할 수 없으면 0)
+
+        게시판은 최신 게시물부터 나열되므로, 요청 시작일이 보장 범위 안(또는 바로 다음 날)이면
+        상한 이하 게시물은 모두 보장 범위에 속해 수집된 것. 보장 범위보다 이전 기간(백필)이나
+        범위를 모르는 이전 형식 상태에서는 적용하지 않음
+        """
+        start = _as_date(start_date)
+        if not self.high_water_post_no or self.covered_from is None or self.covered_to is None:
+            return 0
+        if self.covered_from <= start <= self.covered_to + timedelta(days=1):
+            return self.high_water_post_no
+        return 0
+    
+    def is_known_post(self, post_no: Any, start_date: Any) -> bool:
+        """요청 기간 기준으로 이미 수집한 게시물 번호인지"""
+        number = parse_post_no(post_no)
+        cutoff = self.cutoff_for(start_date)
+        return number is not None and number <= cutoff
+    
+    def advance(self, max_post_no: int, failed_post_nos: Iterable[int] = (), start_date: Any = None, end_date: Any = None):
+        """목록을 끝까지 본 기간 [start_date, end_date]를 반영해 상한과 보장 범위 갱신
+
+        - 다운로드에 실패한 게시물은 다음 실행에서 다시 보도록 상한을 그 아래까지만 올림
+        - 기존 보장 범위와 겹치거나 이어지는 기간이면 범위를 합치고, 떨어진 기간이면 상태 유지
+        """
+        failed_post_nos = list(failed_post_nos)
+        if failed_post_nos:
+            max_post_no = min(max_post_no, min(failed_post_nos) - 1)
+        start = _as_date(start_date)
+        end = min(_as_date(end_date), date.today())
+        
+        if not self.high_water_post_no or self.covered_from is None or self.covered_to is None:
+            if max_post_no > 0:
+                self.high_water_post_no = max_post_no
+                self.covered_from, self.covered_to = start, end
+            return
+        
+        adjoins = start <= self.covered_to + timedelta(days=1) and end >= self.covered_from - timedelta(days=1)
+        if not adjoins:
+            logger.info(f"보장 범위({self.covered_from}~{self.covered_to})와 떨어진 기간이라 게시물 번호 상한 유지: {start}~{end}")
+            return
+        if failed_post_nos and min(failed_post_nos) <= self.high_water_post_no:
+            # 상한 이하 게시물이 실패했으므로 범위를 넓히면 다음 실행에서 건너뜀
+            logger.info(f"상한 이하 게시물 다운로드 실패로 보장 범위 유지: {sorted(failed_post_nos)}")
+            return
+        
+        self.high_water_post_no = max(self.high_water_post_no, max_post_no)
+        self.covered_from = min(self.covered_from, start)
+        self.covered_to = max(self.covered_to, end)
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """조건부 GET 헤더 (저장된 ETag/Last-Modified)"""
+        entry = self.files.get(url) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def is_unchanged(self, url: str, sha256: str) -> bool:
+        """이전에 받은 파일과 내용 해시가 같은지"""
+        entry = self.files.get(url)
+        return bool(entry) and entry.get('sha256') == sha256
+    
+    def record_file(self, url: str, filename: str, sha256: str, size: int, headers=None):
+        """새로 저장한 파일 기록"""
+        self.files[url] = {
+            'filename': filename,
+            'sha256': sha256,
+            'size': size,
+            'etag': None,
+            'last_modified': None,
+            'downloaded_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self.record_validators(url, headers)
+    
+    def record_validators(self, url: str, headers=None):
+        """응답의 ETag/Last-Modified 갱신 (304 응답에는 생략될 수 있으므로 있는 값만)"""
+        entry = self.files.get(url)
+        if entry is None or not headers:
+            return
+        if headers.get('ETag'):
+            entry['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            entry['last_modified'] = headers['Last-Modified']
+        entry['checked_at'] = datetime.now().isoformat(timespec='seconds')
\ No newline at end of file
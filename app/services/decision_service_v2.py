@@ -1,10 +1,14 @@
 """
 V2 의결서 관련 비즈니스 로직 처리 서비스
 """
+import logging
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import List, Optional, Dict, Any
 from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2, ActionLawMapV2
+from app.services.analytics_engine import get_analytics_engine
+
+logger = logging.getLogger(__name__)
 
 
 class DecisionServiceV2:
@@ -80,19 +84,32 @@ class DecisionServiceV2:
         
         return self.get_laws_by_decision_pk(decision.decision_pk)
     
+    def fetch_aggregate(self, query) -> List:
+        """집계 쿼리 실행 (분석 엔진 활성화 시 DuckDB로 위임, 실패 시 SQLite 폴백)"""
+        analytics_engine = get_analytics_engine()
+        if analytics_engine.enabled:
+            try:
+                return analytics_engine.execute_query(query)
+            except Exception as e:
+                logger.warning(f"분석 엔진 집계 실패, SQLite로 폴백: {e}")
+        
+        return query.all()
+    
     def get_category_stats(self) -> Dict[str, Any]:
         """카테고리별 통계 조회"""
         # 대분류별 통계
         category_1_stats = self.db.query(
             DecisionV2.category_1,
             func.count(DecisionV2.decision_pk).label('count')
-        ).group_by(DecisionV2.category_1).all()
+        ).group_by(DecisionV2.category_1).order_by(DecisionV2.category_1)
+        category_1_stats = self.fetch_aggregate(category_1_stats)
         
         # 중분류별 통계
         category_2_stats = self.db.query(
             DecisionV2.category_2,
             func.count(DecisionV2.decision_pk).label('count')
-        ).group_by(DecisionV2.category_2).all()
+        ).group_by(DecisionV2.category_2).order_by(DecisionV2.category_2)
+        category_2_stats = self.fetch_aggregate(category_2_stats)
         
         # 대분류-중분류 조합 통계
         combined_stats = self.db.query(
@@ -102,7 +119,11 @@ class DecisionServiceV2:
         ).group_by(
             DecisionV2.category_1,
             DecisionV2.category_2
-        ).all()
+        ).order_by(
+            DecisionV2.category_1,
+            DecisionV2.category_2
+        )
+        combined_stats = self.fetch_aggregate(combined_stats)
         
         return {
             "category_1": [
@@ -127,8 +148,9 @@ class DecisionServiceV2:
         """조치 유형별 통계 조회"""
         stats = self.db.query(
             ActionV2.action_type,
-            func.count(ActionV2.action_pk).label('count')
-        ).group_by(ActionV2.action_type).all()
+            func.count(ActionV2.action_id).label('count')
+        ).group_by(ActionV2.action_type).order_by(ActionV2.action_type)
+        stats = self.fetch_aggregate(stats)
         
         return [
             {"action_type": stat[0], "count": stat[1]}
@@ -139,8 +161,9 @@ class DecisionServiceV2:
         """업권별 통계 조회"""
         stats = self.db.query(
             ActionV2.industry_sector,
-            func.count(ActionV2.action_pk).label('count')
-        ).group_by(ActionV2.industry_sector).all()
+            func.count(ActionV2.action_id).label('count')
+        ).group_by(ActionV2.industry_sector).order_by(ActionV2.industry_sector)
+        stats = self.fetch_aggregate(stats)
         
         return [
             {"industry_sector": stat[0], "count": stat[1]}
@@ -152,7 +175,8 @@ class DecisionServiceV2:
         stats = self.db.query(
             DecisionV2.decision_year,
             func.count(DecisionV2.decision_pk).label('count')
-        ).group_by(DecisionV2.decision_year).order_by(DecisionV2.decision_year.desc()).all()
+        ).group_by(DecisionV2.decision_year).order_by(DecisionV2.decision_year.desc())
+        stats = self.fetch_aggregate(stats)
         
         return [
             {"year": stat[0], "count": stat[1]}
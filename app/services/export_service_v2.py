@@ -0,0 +1,314 @@
+"""
+V2 데이터 내보내기 서비스
+의결서-조치-법률 조인 결과를 NDJSON / CSV / Parquet 스트림으로 변환
+- 서버 사이드 커서(yield_per)로 일정한 메모리 사용
+- 고급 검색(advanced_search)과 동일한 필터 지원
+- gzip 실시간 압축 지원
+"""
+import csv
+import io
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.core.config import settings
+from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2, ActionLawMapV2
+from app.services.search_service_v2 import apply_advanced_criteria
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 내보내기는 pyarrow 설치 시에만 지원
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+# 지원 포맷: (media type, 파일 확장자)
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+# 내보내기 컬럼 (순서 유지)
+DECISION_COLUMNS = [
+    DecisionV2.decision_pk,
+    DecisionV2.decision_year,
+    DecisionV2.decision_id,
+    DecisionV2.decision_month,
+    DecisionV2.decision_day,
+    DecisionV2.agenda_no,
+    DecisionV2.title,
+    DecisionV2.category_1,
+    DecisionV2.category_2,
+    DecisionV2.submitter,
+    DecisionV2.submission_date,
+    DecisionV2.stated_purpose,
+    DecisionV2.source_file,
+]
+
+ACTION_COLUMNS = [
+    ActionV2.action_id,
+    ActionV2.entity_name,
+    ActionV2.industry_sector,
+    ActionV2.action_type,
+    ActionV2.fine_amount,
+    ActionV2.fine_basis_amount,
+    ActionV2.sanction_period,
+    ActionV2.sanction_scope,
+    ActionV2.effective_date,
+    ActionV2.violation_summary,
+    ActionV2.violation_details,
+]
+
+LAW_COLUMNS = [
+    LawV2.law_name,
+    LawV2.law_short_name,
+    ActionLawMapV2.article_details,
+]
+
+
+def is_format_available(fmt: str) -> bool:
+    """해당 포맷의 내보내기가 가능한지 확인"""
+    if fmt not in EXPORT_FORMATS:
+        return False
+    if fmt == 'parquet':
+        return pa is not None
+    return True
+
+
+class _ChunkSink:
+    """ParquetWriter 출력을 청크 단위로 회수하기 위한 파일 객체"""
+    
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+    
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.closed = True
+    
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ExportServiceV2:
+    """V2 일괄 내보내기 서비스"""
+    
+    def __init__(self, session_factory=None, batch_size: Optional[int] = None):
+        # 스트리밍 응답은 요청 세션보다 오래 살아있으므로 자체 세션을 사용
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    
+    def _build_query(self, session, criteria: Dict[str, Any], include_full_text: bool):
+        """의결서-조치-법률 조인 쿼리 생성"""
+        columns = list(DECISION_COLUMNS)
+        if include_full_text:
+            columns.append(DecisionV2.full_text)
+        columns += ACTION_COLUMNS + LAW_COLUMNS
+        
+        query = session.query(*columns).select_from(DecisionV2).outerjoin(
+            ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk
+        ).outerjoin(
+            ActionLawMapV2, ActionLawMapV2.action_id == ActionV2.action_id
+        ).outerjoin(
+            LawV2, LawV2.law_id == ActionLawMapV2.law_id
+        )
+        
+        query = apply_advanced_criteria(query, criteria)
+        
+        # 조치 단위 그룹핑을 위해 정렬 필수
+        return query.order_by(
+            DecisionV2.decision_pk,
+            ActionV2.action_id,
+            ActionLawMapV2.map_id
+        )
+    
+    def iter_rows(self, criteria: Dict[str, Any], include_full_text: bool = False) -> Iterator[Dict[str, Any]]:
+        """조치 단위 행(관련 법률 포함)을 순차적으로 생성"""
+        session = self.session_factory()
+        
+        try:
+            query = self._build_query(session, criteria, include_full_text)
+            law_keys = {column.key for column in LAW_COLUMNS}
+            
+            # yield_per는 stream_results를 함께 활성화 (PostgreSQL: named cursor)
+            rows = query.yield_per(self.batch_size)
+            
+            for _, group in groupby(rows, key=lambda r: (r.decision_pk, r.action_id)):
+                group = list(group)
+                first = group[0]._asdict()
+                
+                record = {
+                    key: self._serialize_value(value)
+                    for key, value in first.items()
+                    if key not in law_keys
+                }
+                record['laws'] = [
+                    {
+                        'law_name': row.law_name,
+                        'law_short_name': row.law_short_name,
+                        'article_details': row.article_details
+                    }
+                    for row in group
+                    if row.law_name is not None
+                ]
+                yield record
+        finally:
+            session.close()
+    
+    def stream(
+        self,
+        criteria: Dict[str, Any],
+        fmt: str = 'ndjson',
+        compress: bool = False,
+        include_full_text: bool = False
+    ) -> Iterator[bytes]:
+        """지정한 포맷의 바이트 스트림 생성"""
+        if not is_format_available(fmt):
+            raise ValueError(f"지원하지 않는 내보내기 포맷입니다: {fmt}")
+        
+        rows = self.iter_rows(criteria, include_full_text)
+        
+        if fmt == 'ndjson':
+            chunks = self._encode_ndjson(rows)
+        elif fmt == 'csv':
+            chunks = self._encode_csv(rows, include_full_text)
+        else:
+            chunks = self._encode_parquet(rows, include_full_text)
+        
+        if compress:
+            chunks = self._gzip(chunks)
+        
+        return chunks
+    
+    def _batched(self, rows: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """행을 batch_size 단위로 묶기"""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _encode_ndjson(self, rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """NDJSON 인코딩 (한 줄에 조치 하나)"""
+        for batch in self._batched(rows):
+            yield ''.join(
+                json.dumps(row, ensure_ascii=False) + '\n' for row in batch
+            ).encode('utf-8')
+    
+    def _encode_csv(self, rows: Iterable[Dict[str, Any]], include_full_text: bool) -> Iterator[bytes]:
+        """CSV 인코딩 (법률은 '; '로 연결된 문자열)"""
+        fieldnames = self._column_names(include_full_text)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+        
+        # 엑셀 호환을 위한 BOM
+        yield '\ufeff'.encode('utf-8')
+        writer.writeheader()
+        
+        for batch in self._batched(rows):
+            for row in batch:
+                flat = dict(row)
+                flat['laws'] = '; '.join(
+                    f"{law['law_name']} {law['article_details'] or ''}".strip()
+                    for law in row['laws']
+                )
+                writer.writerow(flat)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+        
+        # 데이터가 없어도 헤더는 전송
+        remaining = buffer.getvalue()
+        if remaining:
+            yield remaining.encode('utf-8')
+    
+    def _encode_parquet(self, rows: Iterable[Dict[str, Any]], include_full_text: bool) -> Iterator[bytes]:
+        """Parquet 인코딩 (batch_size 단위 row group)"""
+        schema = self._parquet_schema(include_full_text)
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        
+        try:
+            for batch in self._batched(rows):
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        finally:
+            writer.close()
+        
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    
+    def _gzip(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """gzip 실시간 압축"""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+    
+    def _column_names(self, include_full_text: bool) -> List[str]:
+        """출력 컬럼명 목록"""
+        names = [column.key for column in DECISION_COLUMNS]
+        if include_full_text:
+            names.append('full_text')
+        names += [column.key for column in ACTION_COLUMNS]
+        names.append('laws')
+        return names
+    
+    def _parquet_schema(self, include_full_text: bool):
+        """Parquet 스키마 정의"""
+        int_columns = {
+            'decision_pk', 'decision_year', 'decision_id', 'decision_month',
+            'decision_day', 'action_id', 'fine_amount', 'fine_basis_amount'
+        }
+        fields = []
+        for name in self._column_names(include_full_text):
+            if name == 'laws':
+                fields.append(pa.field('laws', pa.list_(pa.struct([
+                    ('law_name', pa.string()),
+                    ('law_short_name', pa.string()),
+                    ('article_details', pa.string()),
+                ]))))
+            elif name in int_columns:
+                fields.append(pa.field(name, pa.int64()))
+            else:
+                fields.append(pa.field(name, pa.string()))
+        return pa.schema(fields)
+    
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        """JSON/CSV 직렬화를 위한 값 변환"""
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
\ No newline at end of file
@@ -0,0 +1,260 @@
+"""
+고급 검색 패싯 인덱스
+의결서-조치 외부 조인 행 단위의 NumPy 비트맵으로 범주형 필터와 패싯 집계를 처리
+- 컬럼 값별 불리언 비트맵, 필터 조합은 비트 AND
+- 과징금 금액 범위 필터 및 금액 구간 패싯
+- 패싯 건수는 고유 의결서 수 (advanced_search의 DISTINCT와 동일)
+- 조회마다 DB 서명(건수, 최대 키, 최종 수정 시각)을 확인해 다른 프로세스가 저장한 변경도 반영
+  (신규 의결서만 늘었으면 증분 적재, 수정/삭제가 있으면 전체 재적재, FACET_INDEX_MAX_AGE마다 전체 재적재)
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.models.fsc_models_v2 import DecisionV2, ActionV2
+
+logger = logging.getLogger(__name__)
+
+
+# 패싯 컬럼 (검색 조건 키와 동일)
+FACET_COLUMNS = {
+    'decision_year': DecisionV2.decision_year,
+    'category_1': DecisionV2.category_1,
+    'category_2': DecisionV2.category_2,
+    'industry_sector': ActionV2.industry_sector,
+    'action_type': ActionV2.action_type,
+}
+
+# 과징금 구간: (라벨, 하한 이상, 상한 미만)
+FINE_BUCKETS = [
+    ('1천만원 미만', 0, 10_000_000),
+    ('1천만원~1억원', 10_000_000, 100_000_000),
+    ('1억원~10억원', 100_000_000, 1_000_000_000),
+    ('10억원~100억원', 1_000_000_000, 10_000_000_000),
+    ('100억원 이상', 10_000_000_000, float('inf')),
+]
+
+# 비트맵으로 처리 가능한 검색 조건 (keyword는 SQL 사용)
+BITMAP_CRITERIA = set(FACET_COLUMNS) | {'min_fine_amount', 'max_fine_amount'}
+
+
+class FacetIndex:
+    """비트맵 기반 패싯/필터 인덱스"""
+    
+    def __init__(self, session_factory=None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self.max_age = settings.FACET_INDEX_MAX_AGE
+        
+        self._reset()
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def _reset(self):
+        """빈 인덱스로 초기화"""
+        # 행 단위 배열 (조치가 없는 의결서도 한 행)
+        self.decision_pks = np.empty(0, dtype=np.int64)
+        self.fines = np.empty(0, dtype=np.float64)  # NULL은 NaN
+        self.codes: Dict[str, np.ndarray] = {name: np.empty(0, dtype=np.int32) for name in FACET_COLUMNS}
+        self.values: Dict[str, List[Any]] = {name: [] for name in FACET_COLUMNS}
+        self.bitmaps: Dict[str, Dict[Any, np.ndarray]] = {name: {} for name in FACET_COLUMNS}
+        
+        self._max_decision_pk = 0
+        self._signature: Optional[Tuple] = None  # 적재 시점의 DB 서명
+        self._loaded_at = 0.0
+    
+    @property
+    def size(self) -> int:
+        return len(self.decision_pks)
+    
+    @staticmethod
+    def supports(criteria: Dict[str, Any]) -> bool:
+        """비트맵만으로 처리 가능한 검색 조건인지 확인"""
+        return not criteria.get('keyword') and set(criteria) <= BITMAP_CRITERIA
+    
+    @staticmethod
+    def _db_signature(session, upto: Optional[int] = None) -> Tuple:
+        """의결서/조치 테이블 서명 (건수, 최대 키, 최종 수정 시각), upto 지정 시 해당 decision_pk 이하만"""
+        decisions = session.query(
+            func.count(DecisionV2.decision_pk),
+            func.max(DecisionV2.decision_pk),
+            func.max(DecisionV2.updated_at)
+        )
+        actions = session.query(
+            func.count(ActionV2.action_id),
+            func.max(ActionV2.action_id),
+            func.max(ActionV2.updated_at)
+        )
+        if upto is not None:
+            decisions = decisions.filter(DecisionV2.decision_pk <= upto)
+            actions = actions.filter(ActionV2.decision_pk <= upto)
+        return tuple(decisions.one()) + tuple(actions.one())
+    
+    def refresh(self, full: bool = False) -> int:
+        """DB 변경 반영 후 추가된 행 수 반환
+        
+        이미 적재한 의결서 범위가 그대로면 이후 의결서 행만 추가하고,
+        그 범위에서 수정/삭제/조치 추가가 있었거나 full이면 전체 재적재
+        """
+        session = self.session_factory()
+        
+        try:
+            signature = self._db_signature(session)
+            if not full and self._loaded:
+                if signature == self._signature:
+                    return 0
+                full = self._db_signature(session, upto=self._max_decision_pk) != self._signature
+            
+            if full:
+                self._reset()
+            
+            # 서명을 구한 시점까지의 의결서만 적재 (이후 저장분은 다음 확인에서 반영)
+            latest_pk = signature[1] or 0
+            rows = session.query(
+                DecisionV2.decision_pk,
+                ActionV2.fine_amount,
+                *FACET_COLUMNS.values()
+            ).outerjoin(
+                ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk
+            ).filter(
+                DecisionV2.decision_pk > self._max_decision_pk,
+                DecisionV2.decision_pk <= latest_pk
+            ).order_by(DecisionV2.decision_pk, ActionV2.action_id).all()
+        finally:
+            session.close()
+        
+        self._loaded = True
+        self._signature = signature
+        if full:
+            self._loaded_at = time.monotonic()
+        self._max_decision_pk = max(self._max_decision_pk, latest_pk)
+        if not rows:
+            return 0
+        
+        columns = list(zip(*rows))
+        self.decision_pks = np.concatenate([self.decision_pks, np.asarray(columns[0], dtype=np.int64)])
+        self.fines = np.concatenate([self.fines, np.asarray(columns[1], dtype=np.float64)])
+        
+        for offset, name in enumerate(FACET_COLUMNS, start=2):
+            vocabulary = {value: code for code, value in enumerate(self.values[name])}
+            new_codes = np.empty(len(rows), dtype=np.int32)
+            for i, value in enumerate(columns[offset]):
+                if value is None:
+                    new_codes[i] = -1
+                    continue
+                code = vocabulary.get(value)
+                if code is None:
+                    code = len(self.values[name])
+                    vocabulary[value] = code
+                    self.values[name].append(value)
+                new_codes[i] = code
+            self.codes[name] = np.concatenate([self.codes[name], new_codes])
+            
+            # 값별 비트맵 재생성 (신규 행 포함)
+            self.bitmaps[name] = {
+                value: self.codes[name] == code
+                for code, value in enumerate(self.values[name])
+            }
+        
+        logger.info(f"패싯 인덱스 {'재적재' if full else '갱신'}: {len(rows)}행 추가 (총 {self.size}행)")
+        return len(rows)
+    
+    def match_mask(self, criteria: Dict[str, Any]) -> np.ndarray:
+        """검색 조건에 해당하는 행 비트맵"""
+        mask = np.ones(self.size, dtype=bool)
+        
+        for name in FACET_COLUMNS:
+            # advanced_search와 동일하게 값이 있는 조건만 적용
+            if criteria.get(name):
+                bitmap = self.bitmaps[name].get(criteria[name])
+                if bitmap is None:
+                    return np.zeros(self.size, dtype=bool)
+                mask &= bitmap
+        
+        # NaN 비교는 False (SQL의 NULL 비교와 동일)
+        if criteria.get('min_fine_amount'):
+            mask &= self.fines >= criteria['min_fine_amount']
+        if criteria.get('max_fine_amount'):
+            mask &= self.fines <= criteria['max_fine_amount']
+        
+        return mask
+    
+    def search(self, criteria: Dict[str, Any], limit: Optional[int] = None) -> List[int]:
+        """조건에 해당하는 decision_pk 목록 (오름차순)"""
+        with self._lock:
+            self._ensure_loaded()
+            decision_pks = np.unique(self.decision_pks[self.match_mask(criteria)])
+        
+        if limit is not None:
+            decision_pks = decision_pks[:limit]
+        return decision_pks.tolist()
+    
+    def facets(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """현재 조건에서 각 컬럼 값별 고유 의결서 수"""
+        with self._lock:
+            self._ensure_loaded()
+            mask = self.match_mask(criteria)
+            decision_pks = self.decision_pks[mask]
+            unique_pks, decision_rows = np.unique(decision_pks, return_inverse=True)
+            
+            result = {}
+            for name in FACET_COLUMNS:
+                result[name] = self._distinct_counts(
+                    self.codes[name][mask], decision_rows, len(unique_pks), self.values[name]
+                )
+            
+            bucket_codes = np.full(len(decision_pks), -1, dtype=np.int32)
+            fines = self.fines[mask]
+            for code, (_, low, high) in enumerate(FINE_BUCKETS):
+                bucket_codes[(fines >= low) & (fines < high)] = code
+            result['fine_bucket'] = self._distinct_counts(
+                bucket_codes, decision_rows, len(unique_pks), [label for label, _, _ in FINE_BUCKETS]
+            )
+        
+        return {
+            'criteria': criteria,
+            'total_decisions': int(len(unique_pks)),
+            'facets': result
+        }
+    
+    @staticmethod
+    def _distinct_counts(
+        codes: np.ndarray,
+        decision_rows: np.ndarray,
+        n_decisions: int,
+        values: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """(값, 의결서) 고유 쌍을 값별로 집계, 건수 내림차순"""
+        valid = codes >= 0
+        pairs = np.unique(codes[valid].astype(np.int64) * max(n_decisions, 1) + decision_rows[valid])
+        counts = np.bincount(pairs // max(n_decisions, 1), minlength=len(values))
+        
+        order = np.argsort(-counts, kind='stable')
+        return [
+            {'value': values[code], 'count': int(counts[code])}
+            for code in order
+            if counts[code] > 0
+        ]
+    
+    def _ensure_loaded(self):
+        """조회 전 DB 변경 확인 (최초 적재 또는 max_age 경과 시 전체 재적재)"""
+        expired = time.monotonic() - self._loaded_at > self.max_age
+        self.refresh(full=not self._loaded or expired)
+
+
+# 싱글톤 인스턴스
+_facet_index_instance = None
+
+def get_facet_index() -> FacetIndex:
+    """패싯 인덱스 싱글톤 인스턴스 반환"""
+    global _facet_index_instance
+    if _facet_index_instance is None:
+        _facet_index_instance = FacetIndex()
+    return _facet_index_instance
\ No newline at end of file
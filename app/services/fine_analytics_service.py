@@ -0,0 +1,316 @@
+"""
+과징금/과태료 분석 서비스
+조치별 금액을 NumPy 배열로 메모리에 유지하고 벡터 연산으로 분포 통계를 계산
+- 연도/업권/조치유형 코드 배열 기반 마스크 필터링
+- 백분위수, 로그 스케일 히스토그램, 산정근거 대비 비율, 연도별 증감
+- 조회마다 DB 서명(건수, 최대 키, 최종 수정 시각)을 비교하여 신규 조치만 증분 적재 (action_id 기준),
+  적재한 범위가 수정/삭제되었으면 전체 재적재 (다른 프로세스의 저장도 반영)
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+from app.models.fsc_models_v2 import DecisionV2, ActionV2
+
+logger = logging.getLogger(__name__)
+
+
+# 기본 백분위수
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90, 95, 99)
+
+# 필터 결과 캐시 최대 크기
+MAX_CACHE_SIZE = 256
+
+
+class _Vocabulary:
+    """문자열 값을 정수 코드로 변환 (None은 -1)"""
+    
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+    
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+    
+    def lookup(self, value: str) -> Optional[int]:
+        return self.codes.get(value)
+
+
+class FineAnalyticsIndex:
+    """조치 금액 인메모리 분석 인덱스"""
+    
+    def __init__(self, session_factory=None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        
+        self._version = 0
+        self._reset()
+        self._loaded = False
+        self._cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def _reset(self):
+        """빈 인덱스로 초기화"""
+        self.action_ids = np.empty(0, dtype=np.int64)
+        self.years = np.empty(0, dtype=np.int32)
+        self.sectors = np.empty(0, dtype=np.int32)
+        self.action_types = np.empty(0, dtype=np.int32)
+        self.fines = np.empty(0, dtype=np.float64)  # NULL은 NaN
+        self.basis = np.empty(0, dtype=np.float64)  # NULL은 NaN
+        
+        self.sector_vocab = _Vocabulary()
+        self.action_type_vocab = _Vocabulary()
+        
+        self._max_action_id = 0
+        self._max_decision_pk = 0
+        self._signature: Optional[Tuple] = None  # 적재 시점의 DB 서명
+    
+    @property
+    def size(self) -> int:
+        return len(self.action_ids)
+    
+    @staticmethod
+    def _db_signature(session, max_action_id: Optional[int] = None, max_decision_pk: Optional[int] = None) -> Tuple:
+        """조치/의결서 테이블 서명 (건수, 최대 키, 최종 수정 시각), 최대 키 지정 시 해당 범위만"""
+        actions = session.query(
+            func.count(ActionV2.action_id),
+            func.max(ActionV2.action_id),
+            func.max(ActionV2.updated_at)
+        )
+        decisions = session.query(
+            func.count(DecisionV2.decision_pk),
+            func.max(DecisionV2.decision_pk),
+            func.max(DecisionV2.updated_at)
+        )
+        if max_action_id is not None:
+            actions = actions.filter(ActionV2.action_id <= max_action_id)
+            decisions = decisions.filter(DecisionV2.decision_pk <= max_decision_pk)
+        return tuple(actions.one()) + tuple(decisions.one())
+    
+    def refresh(self, full: bool = False) -> int:
+        """DB 변경 반영 후 추가된 건수 반환
+        
+        적재한 범위가 그대로면 action_id가 마지막 적재 이후인 조치만 추가하고,
+        그 범위에서 수정/삭제가 있었거나 full이면 전체 재적재
+        """
+        session = self.session_factory()
+        
+        try:
+            signature = self._db_signature(session)
+            if not full and self._loaded:
+                if signature == self._signature:
+                    return 0
+                loaded_range = self._db_signature(session, self._max_action_id, self._max_decision_pk)
+                full = loaded_range != self._signature
+            
+            if full:
+                self._reset()
+                self._cache.clear()
+                self._version += 1
+            
+            # 서명을 구한 시점까지의 조치만 적재 (이후 저장분은 다음 확인에서 반영)
+            latest_action_id = signature[1] or 0
+            rows = session.query(
+                ActionV2.action_id,
+                DecisionV2.decision_year,
+                ActionV2.industry_sector,
+                ActionV2.action_type,
+                ActionV2.fine_amount,
+                ActionV2.fine_basis_amount
+            ).join(
+                DecisionV2, DecisionV2.decision_pk == ActionV2.decision_pk
+            ).filter(
+                ActionV2.action_id > self._max_action_id,
+                ActionV2.action_id <= latest_action_id
+            ).order_by(ActionV2.action_id).all()
+        finally:
+            session.close()
+        
+        self._loaded = True
+        self._signature = signature
+        self._max_action_id = max(self._max_action_id, latest_action_id)
+        self._max_decision_pk = max(self._max_decision_pk, signature[4] or 0)
+        if not rows:
+            return 0
+        
+        columns = list(zip(*rows))
+        self.action_ids = np.concatenate([self.action_ids, np.asarray(columns[0], dtype=np.int64)])
+        self.years = np.concatenate([self.years, np.asarray(columns[1], dtype=np.int32)])
+        self.sectors = np.concatenate([
+            self.sectors,
+            np.fromiter((self.sector_vocab.encode(v) for v in columns[2]), dtype=np.int32, count=len(rows))
+        ])
+        self.action_types = np.concatenate([
+            self.action_types,
+            np.fromiter((self.action_type_vocab.encode(v) for v in columns[3]), dtype=np.int32, count=len(rows))
+        ])
+        self.fines = np.concatenate([self.fines, np.asarray(columns[4], dtype=np.float64)])
+        self.basis = np.concatenate([self.basis, np.asarray(columns[5], dtype=np.float64)])
+        
+        self._version += 1
+        self._cache.clear()
+        
+        logger.info(f"과징금 분석 인덱스 갱신: {len(rows)}건 추가 (총 {self.size}건)")
+        return len(rows)
+    
+    def analyze(
+        self,
+        decision_year: Optional[int] = None,
+        industry_sector: Optional[str] = None,
+        action_type: Optional[str] = None,
+        bins: int = 10
+    ) -> Dict[str, Any]:
+        """필터 조건에 해당하는 조치들의 금액 분포 통계 (조회 전 DB 변경 확인)"""
+        with self._lock:
+            self.refresh()
+            
+            cache_key = (self._version, decision_year, industry_sector, action_type, bins)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            mask = self._build_mask(decision_year, industry_sector, action_type)
+            result = {
+                'filters': {
+                    'decision_year': decision_year,
+                    'industry_sector': industry_sector,
+                    'action_type': action_type
+                },
+                'summary': self._summary(self.fines[mask]),
+                'percentiles': self._percentiles(self.fines[mask]),
+                'log_histogram': self._log_histogram(self.fines[mask], bins),
+                'fine_to_basis_ratio': self._ratio_stats(self.fines[mask], self.basis[mask]),
+                'yearly': self._yearly(self.years[mask], self.fines[mask])
+            }
+            
+            if len(self._cache) >= MAX_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[cache_key] = result
+            return result
+    
+    def _build_mask(
+        self,
+        decision_year: Optional[int],
+        industry_sector: Optional[str],
+        action_type: Optional[str]
+    ) -> np.ndarray:
+        """필터 조건 마스크 (존재하지 않는 값은 빈 결과)"""
+        mask = np.ones(self.size, dtype=bool)
+        
+        if decision_year is not None:
+            mask &= self.years == decision_year
+        
+        if industry_sector is not None:
+            code = self.sector_vocab.lookup(industry_sector)
+            mask &= self.sectors == (-2 if code is None else code)
+        
+        if action_type is not None:
+            code = self.action_type_vocab.lookup(action_type)
+            mask &= self.action_types == (-2 if code is None else code)
+        
+        return mask
+    
+    @staticmethod
+    def _summary(fines: np.ndarray) -> Dict[str, Any]:
+        valid = fines[~np.isnan(fines)]
+        if not valid.size:
+            return {'actions': int(fines.size), 'actions_with_fine': 0, 'total': 0,
+                    'mean': None, 'min': None, 'max': None}
+        return {
+            'actions': int(fines.size),
+            'actions_with_fine': int(valid.size),
+            'total': int(valid.sum()),
+            'mean': float(valid.mean()),
+            'min': int(valid.min()),
+            'max': int(valid.max())
+        }
+    
+    @staticmethod
+    def _percentiles(fines: np.ndarray) -> Dict[str, Optional[float]]:
+        valid = fines[~np.isnan(fines)]
+        if not valid.size:
+            return {f"p{p}": None for p in DEFAULT_PERCENTILES}
+        values = np.percentile(valid, DEFAULT_PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(DEFAULT_PERCENTILES, values)}
+    
+    @staticmethod
+    def _log_histogram(fines: np.ndarray, bins: int) -> List[Dict[str, Any]]:
+        """양수 금액의 log10 구간 히스토그램"""
+        positive = fines[fines > 0]  # NaN 비교는 False
+        if not positive.size:
+            return []
+        
+        log_values = np.log10(positive)
+        low, high = np.floor(log_values.min()), np.ceil(log_values.max())
+        if high == low:
+            high = low + 1
+        counts, edges = np.histogram(log_values, bins=bins, range=(low, high))
+        bounds = np.power(10.0, edges)
+        
+        return [
+            {'min': float(bounds[i]), 'max': float(bounds[i + 1]), 'count': int(counts[i])}
+            for i in range(len(counts))
+        ]
+    
+    @staticmethod
+    def _ratio_stats(fines: np.ndarray, basis: np.ndarray) -> Dict[str, Any]:
+        """산정근거 금액 대비 부과 금액 비율"""
+        valid = (fines >= 0) & (basis > 0)
+        if not valid.any():
+            return {'count': 0, 'mean': None, 'median': None, 'p90': None}
+        ratios = fines[valid] / basis[valid]
+        median, p90 = np.percentile(ratios, [50, 90])
+        return {
+            'count': int(ratios.size),
+            'mean': float(ratios.mean()),
+            'median': float(median),
+            'p90': float(p90)
+        }
+    
+    @staticmethod
+    def _yearly(years: np.ndarray, fines: np.ndarray) -> List[Dict[str, Any]]:
+        """연도별 건수/총액 및 전년 대비 증감"""
+        if not years.size:
+            return []
+        
+        unique_years, inverse = np.unique(years, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(unique_years))
+        totals = np.bincount(inverse, weights=np.nan_to_num(fines), minlength=len(unique_years))
+        deltas = np.diff(totals, prepend=np.nan)
+        previous = np.concatenate([[np.nan], totals[:-1]])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = np.where(previous > 0, deltas / previous * 100, np.nan)
+        
+        return [
+            {
+                'year': int(unique_years[i]),
+                'actions': int(counts[i]),
+                'total': int(totals[i]),
+                'delta': None if np.isnan(deltas[i]) else int(deltas[i]),
+                'change_pct': None if np.isnan(changes[i]) else round(float(changes[i]), 2)
+            }
+            for i in range(len(unique_years))
+        ]
+    
+
+# 싱글톤 인스턴스
+_fine_analytics_instance = None
+
+def get_fine_analytics_index() -> FineAnalyticsIndex:
+    """과징금 분석 인덱스 싱글톤 인스턴스 반환"""
+    global _fine_analytics_instance
+    if _fine_analytics_instance is None:
+        _fine_analytics_instance = FineAnalyticsIndex()
+    return _fine_analytics_instance
\ No newline at end of file
@@ -1,25 +1,73 @@
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+import hashlib
+import re
 import time
 import os
 import zipfile
 from app.core.config import settings
+from app.services.content_store import LEDGER_FILENAME, ContentStore, ExtractionLedger
+from app.services.crawl_state import CrawlState, parse_post_no
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ZIP 파일명의 연도 (예: 2025년 제1차 의결서.zip)
+ZIP_YEAR_PATTERN = re.compile(r'(\d{4})년')
+
+
+def zip_year(zip_name: str) -> Optional[str]:
+    """ZIP 파일명에서 연도 추출 (없으면 None)"""
+    match = ZIP_YEAR_PATTERN.search(zip_name)
+    return match.group(1) if match else None
+
+
+def is_decision_pdf_member(member_name: str) -> bool:
+    """ZIP 안의 의결서 PDF인지 (의결서 본문, 의결N.pdf 등)"""
+    return member_name.endswith('.pdf') and '의결' in member_name
+
+
+# 처리 대상 본문 문서 (금융위 의결서(제YYYY-XXX호)_... 형식)
+FSC_DOCUMENT_PREFIX = '금융위 의결서'
+
+
+def is_fsc_document(path: str) -> bool:
+    """파이프라인으로 처리할 의결서 본문인지 (의결N.pdf 등 보조 문서 제외)"""
+    return os.path.basename(path).startswith(FSC_DOCUMENT_PREFIX)
+
 
 class FSCCrawler:
     """금융위원회 웹사이트 크롤러"""
     
-    def __init__(self):
-        self.base_url = settings.FSC_BASE_URL
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        raw_zip_dir: Optional[str] = None,
+        processed_pdf_dir: Optional[str] = None,
+        state_path: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        store_dir: Optional[str] = None
+    ):
+        self.base_url = (base_url or settings.FSC_BASE_URL).rstrip('/')
         self.delay = settings.DOWNLOAD_DELAY
         self.max_retries = settings.MAX_RETRIES
-        self.raw_zip_dir = settings.RAW_ZIP_DIR
-        self.processed_pdf_dir = settings.PROCESSED_PDF_DIR
+        self.raw_zip_dir = raw_zip_dir or settings.RAW_ZIP_DIR
+        self.processed_pdf_dir = processed_pdf_dir or settings.PROCESSED_PDF_DIR
+        
+        # 증분 크롤링 상태 (게시물 번호 상한, 파일별 ETag/Last-Modified/해시)
+        self.incremental = settings.CRAWLER_INCREMENTAL if incremental is None else incremental
+        self.state = CrawlState(state_path)
+        self.stats = {'not_modified': 0, 'unchanged_files': 0}
+        self.failed_downloads: List[str] = []
+        self._max_post_no_seen = 0
+        self._listing_complete = False
+        self._search_range: Optional[Tuple[datetime, datetime]] = None
+        
+        # ZIP/PDF 콘텐츠 주소 저장소 및 압축 해제 원장
+        self.store = ContentStore(store_dir)
+        self.ledger = ExtractionLedger(self.store.root / LEDGER_FILENAME)
         
         # 디렉토리 생성
         os.makedirs(self.raw_zip_dir, exist_ok=True)
@@ -38,14 +86,8 @@ class FSCCrawler:
         # FSC 홈페이지의 실제 의결서 검색 URL
         search_url = f"{self.base_url}/no020101"
         
-        # 검색 파라미터 (실제 FSC 게시판 구조에 맞게 수정)
-        params = {
-            'srchBeginDt': start_date.strftime('%Y-%m-%d'),
-            'srchEndDt': end_date.strftime('%Y-%m-%d'),
-            'srchKey': 'sj',  # 제목 검색
-            'srchText': '의결서',  # 의결서 검색
-            'curPage': 1
-        }
+        params = self._search_params(start_date, end_date)
+        self._begin_listing(start_date, end_date)
         
         try:
             current_page = 1
@@ -56,22 +98,11 @@ class FSCCrawler:
                 response = self.session.get(search_url, params=params)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 실제 FSC 게시판 구조에 맞게 게시물 목록 파싱
-                board_items = soup.select('div.board-list-wrap ul li')
+                page_decisions, has_next = self._parse_listing_page(response.content)
+                decisions.extend(page_decisions)
                 
-                if not board_items:
-                    break
-                
-                for item in board_items:
-                    decision_info = self._parse_decision_item(item)
-                    if decision_info and self._is_decision_document(decision_info):
-                        decisions.append(decision_info)
-                
-                # 다음 페이지 확인 (실제 페이징 구조에 맞게 수정)
-                next_page = soup.select_one('a.com.next')
-                if not next_page or 'disabled' in next_page.get('class', []):
+                if not has_next:
+                    self._listing_complete = True
                     break
                 
                 current_page += 1
@@ -82,6 +113,60 @@ class FSCCrawler:
             
         return decisions
     
+    def _begin_listing(self, start_date: datetime, end_date: datetime):
+        """목록 조회 시작 (조회 기간은 수집 게시물 판단과 상태 갱신에 사용)"""
+        self._listing_complete = False
+        self._search_range = (start_date, end_date)
+    
+    @staticmethod
+    def _search_params(start_date: datetime, end_date: datetime) -> Dict:
+        """검색 파라미터 (실제 FSC 게시판 구조에 맞게 수정)"""
+        return {
+            'srchBeginDt': start_date.strftime('%Y-%m-%d'),
+            'srchEndDt': end_date.strftime('%Y-%m-%d'),
+            'srchKey': 'sj',  # 제목 검색
+            'srchText': '의결서',  # 의결서 검색
+            'curPage': 1
+        }
+    
+    def _parse_listing_page(self, content: bytes) -> Tuple[List[Dict], bool]:
+        """목록 페이지 → (의결서 목록, 다음 페이지 조회 필요 여부)
+
+        증분 모드에서는 이미 수집한 게시물(조회 기간이 상태의 보장 범위에서 이어질 때 번호 상한 이하)을
+        건너뛰고, 이를 만난 페이지에서 조회를 멈춥니다.
+        (게시판은 최신 게시물부터 나열되므로 이후 페이지는 모두 수집된 게시물)
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # 실제 FSC 게시판 구조에 맞게 게시물 목록 파싱
+        board_items = soup.select('div.board-list-wrap ul li')
+        
+        if not board_items:
+            return [], False
+        
+        decisions = []
+        reached_known = False
+        for item in board_items:
+            decision_info = self._parse_decision_item(item)
+            if not decision_info:
+                continue
+            
+            post_no = parse_post_no(decision_info['post_no'])
+            if post_no is not None:
+                self._max_post_no_seen = max(self._max_post_no_seen, post_no)
+            
+            if self.incremental and self._search_range and self.state.is_known_post(post_no, self._search_range[0]):
+                reached_known = True
+                continue
+            
+            if self._is_decision_document(decision_info):
+                decisions.append(decision_info)
+        
+        # 다음 페이지 확인 (실제 페이징 구조에 맞게 수정)
+        next_page = soup.select_one('a.com.next')
+        has_next = not reached_known and next_page is not None and 'disabled' not in next_page.get('class', [])
+        return decisions, has_next
+    
     def _parse_decision_item(self, item) -> Optional[Dict]:
         """게시물 아이템을 파싱합니다."""
         try:
@@ -177,7 +262,7 @@ class FSCCrawler:
                 
                 # 의결서 ZIP 파일 우선 다운로드
                 if '의결서' in file_name and '.zip' in file_name:
-                    full_url = f"{self.base_url}{file_url}" if file_url.startswith('/') else file_url
+                    full_url = self._absolute_url(file_url)
                     filename = self._download_file(full_url, decision['title'], file_name)
                     
                     if filename:
@@ -191,87 +276,164 @@ class FSCCrawler:
     def _download_file(self, url: str, decision_title: str, original_filename: str = None) -> Optional[str]:
         """파일을 다운로드합니다."""
         try:
-            response = self.session.get(url, stream=True)
+            response = self.session.get(url, stream=True, headers=self._conditional_headers(url))
+            if response.status_code == 304:
+                self._mark_not_modified(url, response.headers)
+                return None
             response.raise_for_status()
             
-            # 파일명 생성 (원본 파일명 우선 사용)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            
-            if original_filename:
-                # 원본 파일명에서 확장자 추출
-                name, ext = os.path.splitext(original_filename)
-                safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                filename = f"{timestamp}_{safe_name[:50]}{ext}"
-            else:
-                # 의결서 제목으로 파일명 생성
-                safe_title = "".join(c for c in decision_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                filename = f"{timestamp}_{safe_title[:50]}.zip"
-            
+            filename = self._build_filename(decision_title, original_filename)
             filepath = os.path.join(self.raw_zip_dir, filename)
             
-            # 파일 저장
+            # 파일 저장 (내용 해시 계산)
+            digest = hashlib.sha256()
+            size = 0
             with open(filepath, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
             
-            logger.info(f"파일 다운로드 완료: {filename}")
-            return filename
+            return self._finish_download(url, filepath, digest.hexdigest(), size, response.headers)
             
         except Exception as e:
             logger.error(f"파일 다운로드 실패: {url} - {str(e)}")
+            self.failed_downloads.append(url)
+            return None
+    
+    def _absolute_url(self, url: str) -> str:
+        return f"{self.base_url}{url}" if url.startswith('/') else url
+        
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """조건부 GET 헤더 (이전에 받은 내용이 저장소에 남아 있을 때만)"""
+        entry = self.state.files.get(url)
+        if not entry or not self.store.contains(entry['sha256'], '.zip'):
+            return {}
+        return self.state.conditional_headers(url)
+    
+    def _mark_not_modified(self, url: str, headers):
+        """304 응답: 다운로드 생략"""
+        self.state.record_validators(url, headers)
+        self.stats['not_modified'] += 1
+        logger.info(f"변경 없음 (304), 다운로드 생략: {self.state.files[url]['filename']}")
+    
+    def _finish_download(self, url: str, filepath: str, sha256: str, size: int, headers) -> Optional[str]:
+        """다운로드 결과를 상태/저장소에 기록 (압축 해제할 필요가 없으면 None)"""
+        filename = os.path.basename(filepath)
+        
+        if self.state.is_unchanged(url, sha256) and self.store.contains(sha256, '.zip'):
+            os.remove(filepath)
+            self.state.record_validators(url, headers)
+            self.stats['unchanged_files'] += 1
+            logger.info(f"내용 변경 없음, 저장 생략: {self.state.files[url]['filename']}")
             return None
+        
+        # 같은 내용이 이미 저장소에 있으면 새 파일을 저장소 객체의 하드링크로 교체 (디스크 중복 제거)
+        _, _, is_new = self.store.put_file(filepath, '.zip', sha256)
+        if not is_new:
+            self.store.link(sha256, '.zip', filepath)
+        self.state.record_file(url, filename, sha256, size, headers)
+        
+        if not is_new and self.ledger.is_extracted(sha256):
+            self.stats['unchanged_files'] += 1
+            logger.info(f"같은 내용의 ZIP이 이미 압축 해제됨: {filename}")
+            return None
+        
+        logger.info(f"파일 다운로드 완료: {filename}")
+        return filename
     
-    def extract_zip_files(self) -> List[str]:
-        """다운로드된 ZIP 파일들을 연도별로 분류하여 압축 해제합니다."""
-        import re
+    def _update_state(self, decisions: List[Dict]):
+        """게시물 번호 상한 갱신 및 상태 저장
+
+        목록을 끝까지(또는 수집된 게시물까지) 보지 못했으면 상한을 올리지 않습니다.
+        (중간 페이지의 새 게시물을 다음 실행에서 건너뛰지 않도록)
+        """
+        if self._listing_complete and self._search_range:
+            failed_urls = set(self.failed_downloads)
+            failed_post_nos = [
+                parse_post_no(decision['post_no']) for decision in decisions
+                if any(self._absolute_url(file_info.get('url', '')) in failed_urls for file_info in decision.get('files', []))
+            ]
+            self.state.advance(
+                self._max_post_no_seen,
+                [post_no for post_no in failed_post_nos if post_no is not None],
+                *self._search_range
+            )
+        self.state.save()
+    
+    @staticmethod
+    def _build_filename(decision_title: str, original_filename: str = None) -> str:
+        """저장 파일명을 생성합니다. (원본 파일명 우선 사용)"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        if original_filename:
+            # 원본 파일명에서 확장자 추출
+            name, ext = os.path.splitext(original_filename)
+            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            return f"{timestamp}_{safe_name[:50]}{ext}"
         
+        # 의결서 제목으로 파일명 생성
+        safe_title = "".join(c for c in decision_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        return f"{timestamp}_{safe_title[:50]}.zip"
+    
+    def extract_zip_files(self, zip_files: Optional[List[str]] = None) -> List[str]:
+        """다운로드된 ZIP 파일들을 연도별로 분류하여 압축 해제합니다. (zip_files 미지정 시 디렉토리 전체)
+
+        PDF는 콘텐츠 주소 저장소에 한 번만 저장하고 processed_pdf/<연도>/에는 하드링크로 배치합니다.
+        같은 내용의 ZIP은 원장 기준으로 한 번만 압축 해제합니다. 반환한 경로는 호출자(수집 작업, 핫 폴더 감시, Celery)가 처리합니다.
+        """
         extracted_files = []
+        self.ledger.load()  # 다른 인스턴스(수집 작업, 핫 폴더 감시)가 그 사이 압축 해제한 ZIP 반영
         
         # ZIP 파일 목록 확인
-        zip_files = [f for f in os.listdir(self.raw_zip_dir) if f.endswith('.zip')]
+        if zip_files is None:
+            zip_files = [f for f in os.listdir(self.raw_zip_dir) if f.endswith('.zip')]
         
         for zip_file in zip_files:
             zip_path = os.path.join(self.raw_zip_dir, zip_file)
             
+            try:
+                zip_sha256, _, _ = self.store.put_file(zip_path, '.zip')
+            except OSError as e:
+                logger.error(f"ZIP 파일 저장소 등록 실패: {zip_file} - {str(e)}")
+                continue
+            
+            if self.ledger.is_extracted(zip_sha256):
+                logger.info(f"이미 압축 해제된 ZIP, 건너뜀: {zip_file}")
+                continue
+            
             # ZIP 파일명에서 연도 추출
-            year_match = re.search(r'(\d{4})년', zip_file)
-            if not year_match:
+            year = zip_year(zip_file)
+            if not year:
                 logger.warning(f"연도 추출 실패, 기본 폴더에 저장: {zip_file}")
                 year_dir = self.processed_pdf_dir
             else:
-                year = year_match.group(1)
                 year_dir = os.path.join(self.processed_pdf_dir, year)
-                os.makedirs(year_dir, exist_ok=True)
                 logger.info(f"ZIP 파일 처리: {zip_file} -> {year}년 폴더")
             
             try:
+                pdfs = []
                 with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    # ZIP 파일 내용 확인
-                    file_list = zip_ref.namelist()
+                    # 의결서 PDF 파일만 추출 (중간 디렉토리는 무시하고 파일명만 사용)
+                    for member in zip_ref.infolist():
+                        file_name = member.filename
+                        if not is_decision_pdf_member(file_name):
+                            continue
                     
-                    # 의결서 PDF 파일만 추출
-                    for file_name in file_list:
-                        if file_name.endswith('.pdf') and '의결' in file_name:
-                            # 임시 위치에 파일 추출
-                            zip_ref.extract(file_name, year_dir)
-                            
-                            # 파일명 정리
-                            original_path = os.path.join(year_dir, file_name)
-                            new_name = os.path.basename(file_name)
-                            new_path = os.path.join(year_dir, new_name)
+                        with zip_ref.open(member) as source:
+                            pdf_sha256, _, is_new = self.store.put_stream(source, '.pdf')
                             
-                            if original_path != new_path:
-                                # 중간 디렉토리가 있는 경우 파일을 이동
-                                if os.path.dirname(file_name):
-                                    os.rename(original_path, new_path)
-                                    # 빈 디렉토리 정리
-                                    try:
-                                        os.rmdir(os.path.dirname(original_path))
-                                    except OSError:
-                                        pass  # 디렉토리가 비어있지 않으면 무시
+                        new_name = os.path.basename(file_name)
+                        new_path = os.path.join(year_dir, new_name)
+                        self.store.link(pdf_sha256, '.pdf', new_path)
                             
-                            extracted_files.append(f"{year if year_match else 'default'}/{new_name}")
-                            logger.info(f"PDF 파일 추출 완료: {year if year_match else 'default'}/{new_name}")
+                        relative_path = f"{year or 'default'}/{new_name}"
+                        pdfs.append({'sha256': pdf_sha256, 'name': new_name, 'path': relative_path})
+                        extracted_files.append(relative_path)
+                        logger.info(f"PDF 파일 추출 완료: {relative_path}{'' if is_new else ' (기존 내용과 동일)'}")
+                
+                self.ledger.record(zip_sha256, zip_file, pdfs)
+                self.ledger.save()
                 
             except Exception as e:
                 logger.error(f"ZIP 파일 압축 해제 실패: {zip_file} - {str(e)}")
@@ -279,21 +441,31 @@ class FSCCrawler:
         
         return extracted_files
     
-    def crawl_decisions(self, start_date: datetime, end_date: datetime) -> Dict[str, List[str]]:
-        """의결서 크롤링 전체 프로세스를 실행합니다."""
+    def crawl_decisions(self, start_date: datetime, end_date: datetime, extract: bool = True) -> Dict[str, List[str]]:
+        """의결서 크롤링 전체 프로세스를 실행합니다. (extract=False면 다운로드까지만, 압축 해제는 호출자가 수행)"""
         logger.info(f"의결서 크롤링 시작: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        cutoff = self.state.cutoff_for(start_date)
+        if self.incremental and cutoff:
+            logger.info(f"증분 크롤링: 게시물 번호 {cutoff} 이하는 수집 완료")
+        self.failed_downloads = []
         
         # 1. 의결서 목록 검색
         decisions = self.search_decisions(start_date, end_date)
         logger.info(f"검색된 의결서 수: {len(decisions)}")
         
-        # 2. 파일 다운로드
+        # 2. 파일 다운로드 (변경 없는 파일은 생략)
         downloaded_files = self.download_decision_files(decisions)
-        logger.info(f"다운로드된 파일 수: {len(downloaded_files)}")
+        logger.info(
+            f"다운로드된 파일 수: {len(downloaded_files)} "
+            f"(304 생략 {self.stats['not_modified']}, 내용 동일 {self.stats['unchanged_files']})"
+        )
+        self._update_state(decisions)
         
-        # 3. ZIP 파일 압축 해제
-        extracted_files = self.extract_zip_files()
-        logger.info(f"추출된 PDF 파일 수: {len(extracted_files)}")
+        # 3. 이번에 받은 ZIP 파일만 압축 해제
+        extracted_files = []
+        if extract:
+            extracted_files = self.extract_zip_files(downloaded_files)
+            logger.info(f"추출된 PDF 파일 수: {len(extracted_files)}")
         
         return {
             'decisions': decisions,
@@ -3,9 +3,8 @@ from typing import Dict, Any, Optional
 from app.core.config import settings
 import json
 import logging
-import asyncio
-import time
 from datetime import datetime, timedelta
+from app.services.adaptive_concurrency import get_llm_limiter, is_throttle_error
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +21,20 @@ class GeminiService:
         self.prompt_dir = settings.PROMPT_DIR
         self._load_prompts()
         
-        # Rate limiting 설정 (Free tier: 분당 10회)
-        self.rate_limit_requests_per_minute = 10
-        self.rate_limit_window = 60  # 초
-        self.request_timestamps = []
-        self.max_retries = 5
-        self.base_delay = 6  # 초 (60초 / 10회 = 6초)
+        # 호출 한도: 고정 간격 대신 429 응답에 맞춰 동시 호출 수 조절 (프로세스 내 Gemini 호출 공유)
+        self.limiter = get_llm_limiter()
+        self.max_retries = settings.LLM_MAX_RETRIES
+        
+        # 추출용 입력 컨텍스트 구성기 (첫 사용 시 생성)
+        self._context_builder = None
+    
+    @property
+    def context_builder(self):
+        """관련 섹션 선별 컨텍스트 구성기 (NL2SQL 전용 사용 시 로드하지 않음)"""
+        if self._context_builder is None:
+            from app.services.llm_context_builder import LLMContextBuilder
+            self._context_builder = LLMContextBuilder()
+        return self._context_builder
     
     def _load_prompts(self):
         """프롬프트 파일들을 로드합니다."""
@@ -67,65 +74,23 @@ class GeminiService:
             self.analyzer_prompt = "문서의 구조를 분석하고 위반 사항을 논리적 그룹으로 묶어주세요."
             self.db_structuring_prompt = "분석된 데이터를 DB 스키마에 맞게 변환해주세요."
     
-    def _check_rate_limit(self) -> float:
-        """Rate limit을 확인하고 필요한 대기 시간을 반환합니다."""
-        now = time.time()
-        
-        # 1분 이전의 요청들 제거
-        self.request_timestamps = [
-            timestamp for timestamp in self.request_timestamps 
-            if now - timestamp < self.rate_limit_window
-        ]
-        
-        # 현재 요청 수가 제한을 초과하는지 확인
-        if len(self.request_timestamps) >= self.rate_limit_requests_per_minute:
-            # 가장 오래된 요청 시간을 기준으로 대기 시간 계산
-            oldest_request = min(self.request_timestamps)
-            wait_time = self.rate_limit_window - (now - oldest_request) + 1  # 1초 버퍼
-            return max(wait_time, 0)
+    async def _make_api_request_with_rate_limit(self, prompt: str, model=None) -> str:
+        """적응형 동시성 한도 안에서 API 요청을 수행합니다. (429/할당량 초과는 한도 감소 후 재시도)"""
+        # 모델 선택 (기본값: main_model)
+        selected_model = model if model is not None else self.main_model
         
-        return 0
-    
-    def _record_request(self):
-        """API 요청을 기록합니다."""
-        self.request_timestamps.append(time.time())
-    
-    async def _make_api_request_with_rate_limit(self, prompt: str, model=None, retry_count: int = 0) -> str:
-        """Rate limit을 고려하여 API 요청을 수행합니다."""
-        try:
-            # 모델 선택 (기본값: main_model)
-            selected_model = model if model is not None else self.main_model
-            
-            # Rate limit 확인
-            wait_time = self._check_rate_limit()
-            if wait_time > 0:
-                logger.info(f"Rate limit 대기: {wait_time:.1f}초")
-                await asyncio.sleep(wait_time)
-            
-            # API 요청 기록
-            self._record_request()
-            
-            # API 호출
+        async def call() -> str:
             response = await selected_model.generate_content_async(prompt)
             return response.text.strip()
             
+        try:
+            return await self.limiter.run(call, max_retries=self.max_retries)
         except Exception as e:
-            error_str = str(e)
-            
-            # Rate limit 에러 처리
-            if "quota" in error_str.lower() or "rate" in error_str.lower() or "429" in error_str:
-                if retry_count < self.max_retries:
-                    # 지수 백오프로 대기 시간 증가
-                    wait_time = self.base_delay * (2 ** retry_count)
-                    logger.warning(f"Rate limit 에러 발생, {wait_time}초 후 재시도 ({retry_count + 1}/{self.max_retries}): {error_str}")
-                    await asyncio.sleep(wait_time)
-                    return await self._make_api_request_with_rate_limit(prompt, model, retry_count + 1)
-                else:
-                    logger.error(f"최대 재시도 횟수 초과, API 요청 실패: {error_str}")
-                    raise Exception(f"Rate limit 에러로 인한 API 요청 실패: {error_str}")
-            else:
-                logger.error(f"API 요청 에러: {error_str}")
-                raise
+            if is_throttle_error(e):
+                logger.error(f"최대 재시도 횟수 초과, API 요청 실패: {e}")
+                raise Exception(f"Rate limit 에러로 인한 API 요청 실패: {e}")
+            logger.error(f"API 요청 에러: {e}")
+            raise
 
     async def extract_structured_data_2_step(self, pdf_content: str, pdf_filename: str = "") -> Dict[str, Any]:
         """2단계 파이프라인을 통해 PDF에서 구조화된 데이터를 추출합니다."""
@@ -134,6 +99,9 @@ class GeminiService:
         try:
             # --- Step 1: 분석 및 그룹핑 ---
             logger.info("2단계 추출 파이프라인 시작: 1단계 - 분석 및 그룹핑")
+            if settings.LLM_CONTEXT_ENABLED:
+                # 머리, 조치내용, 근거법규, 위반사실 섹션만 토큰 예산 내로 전송
+                pdf_content = self.context_builder.build(pdf_content, name=pdf_filename)['text']
             step1_prompt = f"{self.analyzer_prompt}\n\n**문서 원본 텍스트:**\n{pdf_content}"
             
             analysis_result_str = await self._make_api_request_with_rate_limit(step1_prompt, model=self.main_model)
@@ -150,7 +118,9 @@ class GeminiService:
             logger.info("2단계 추출 파이프라인 시작: 2단계 - DB 구조화")
             db_schema = self._get_db_schema()
             filename_info = f"\n\n**파일명:** {pdf_filename}" if pdf_filename else ""
-            step2_prompt = f"{self.db_structuring_prompt}\n\n**DB 스키마:**\n{db_schema}{filename_info}\n\n**1단계 분석 결과 (JSON):**\n{json.dumps(analysis_json, ensure_ascii=False, indent=2)}"
+            # 1단계 결과는 들여쓰기 없이 압축하여 전달 (공백 토큰 절감)
+            analysis_compact = json.dumps(analysis_json, ensure_ascii=False, separators=(',', ':'))
+            step2_prompt = f"{self.db_structuring_prompt}\n\n**DB 스키마:**\n{db_schema}{filename_info}\n\n**1단계 분석 결과 (JSON):**\n{analysis_compact}"
 
             final_result_str = await self._make_api_request_with_rate_limit(step2_prompt, model=self.main_model)
 
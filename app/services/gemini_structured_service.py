@@ -5,13 +5,12 @@ Pydantic 모델과 response_schema를 활용한 구조화된 데이터 추출
 import os
 import json
 import logging
-import asyncio
 from typing import Optional, Dict, Any, Type
-from datetime import datetime
 import google.generativeai as genai
 from pydantic import BaseModel, ValidationError
 from app.models.pydantic_models import Decision, Action, ActionLawMap
 from app.core.config import settings
+from app.services.adaptive_concurrency import get_llm_limiter, is_throttle_error
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +39,9 @@ class GeminiStructuredService:
             }
         )
         
-        # Rate limiting 설정
-        self.rate_limit_delay = 6  # 분당 10회 제한 (6초 간격)
-        self.last_request_time = None
+        # 호출 한도: 고정 6초 간격 대신 429 응답에 맞춰 동시 호출 수 조절 (프로세스 내 Gemini 호출 공유)
+        self.limiter = get_llm_limiter()
+        self.rate_limit_wait_seconds = 0.0  # 호출 제한으로 대기한 누적 시간 (진행 상태 보고용)
         
     async def extract_decision_data(
         self, 
@@ -51,9 +50,6 @@ class GeminiStructuredService:
     ) -> Decision:
         """PDF 텍스트에서 의결서 데이터를 구조화하여 추출"""
         try:
-            # Rate limiting
-            await self._apply_rate_limit()
-            
             # 프롬프트 생성
             prompt = self._create_extraction_prompt(pdf_text, metadata)
             
@@ -67,11 +63,11 @@ class GeminiStructuredService:
                 temperature=0.1,
             )
             
-            # API 호출
+            # API 호출 (적응형 동시성 한도 안에서, 429/할당량 초과는 한도 감소 후 재시도)
             logger.info(f"Gemini API 호출 시작 - 파일: {metadata.get('filename', 'unknown')}")
-            response = self.model.generate_content(
-                prompt,
-                generation_config=generation_config
+            response = await self.limiter.run(
+                lambda: self.model.generate_content_async(prompt, generation_config=generation_config),
+                on_wait=self._record_wait
             )
             
             # 응답 파싱
@@ -137,16 +133,11 @@ class GeminiStructuredService:
         
         return prompt
     
-    async def _apply_rate_limit(self):
-        """Rate limiting 적용"""
-        if self.last_request_time:
-            elapsed = (datetime.now() - self.last_request_time).total_seconds()
-            if elapsed < self.rate_limit_delay:
-                wait_time = self.rate_limit_delay - elapsed
-                logger.debug(f"Rate limiting: {wait_time:.1f}초 대기")
-                await asyncio.sleep(wait_time)
-        
-        self.last_request_time = datetime.now()
+    def _record_wait(self, seconds: float):
+        """호출 한도(동시성/Retry-After)로 대기한 시간 누적"""
+        if seconds > 0:
+            logger.debug(f"Rate limiting: {seconds:.1f}초 대기")
+            self.rate_limit_wait_seconds += seconds
     
     async def extract_with_retry(
         self, 
@@ -154,19 +145,19 @@ class GeminiStructuredService:
         metadata: Dict[str, Any], 
         max_retries: int = 3
     ) -> Optional[Decision]:
-        """재시도 로직을 포함한 데이터 추출"""
+        """재시도 로직을 포함한 데이터 추출 (응답 파싱/검증 실패 재시도, 호출 한도 초과는 limiter가 처리)"""
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
                     logger.info(f"재시도 {attempt}/{max_retries}")
-                    await asyncio.sleep(self.rate_limit_delay * (attempt + 1))
                 
                 decision = await self.extract_decision_data(pdf_text, metadata)
                 return decision
                 
             except Exception as e:
                 logger.error(f"추출 시도 {attempt + 1} 실패: {e}")
-                if attempt == max_retries - 1:
+                # 호출 한도 초과는 limiter 재시도를 모두 소진한 경우이므로 바로 실패
+                if attempt == max_retries - 1 or is_throttle_error(e):
                     raise
         
         return None
@@ -294,5 +285,5 @@ class GeminiStructuredService:
         return {
             'model_name': self.model.model_name,
             'generation_config': self.model.generation_config,
-            'rate_limit': f"{60 / self.rate_limit_delay:.1f} requests/min"
+            'concurrency': self.limiter.snapshot()
         }
\ No newline at end of file
@@ -0,0 +1,413 @@
+"""
+핫 폴더 감시 서비스
+raw_zip/에 들어온 ZIP과 processed_pdf/<연도>/에 들어온 PDF를 감지하여 바로 수집
+- 리눅스는 inotify(ctypes, 디렉토리 재스캔 없음), 그 외/실패 시 폴링(mtime/크기 비교)으로 대체
+- 같은 파일의 연속 이벤트는 디바운스 후 한 번만 처리 (복사 중인 파일 제외)
+- ZIP은 압축 해제 후 해제된 의결서 PDF를 바로 처리
+- 직접 넣은 PDF는 내용 해시가 바뀐 경우만 PDFProcessorV2로 처리
+  (압축 해제 원장에 있는 PDF는 압축을 해제한 쪽(수집 작업 또는 위의 ZIP 처리)이 처리하므로 건너뜀)
+- 이미 저장된 의결서의 PDF 내용이 바뀌어도 기존 데이터는 갱신하지 않음 (stats['existing']으로 집계, 경고 로그)
+- 처리 대기열은 크기 제한 큐 (가득 차면 이벤트 전달이 대기)
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+from app.services.content_store import file_sha256
+from app.services.fsc_crawler import FSCCrawler, is_fsc_document
+from app.services.json_state import update_json
+
+logger = logging.getLogger(__name__)
+
+# inotify 상수 (<sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+READ_BUFFER_SIZE = 64 * 1024
+
+WATCHED_SUFFIXES = ('.zip', '.pdf')
+
+
+def _is_candidate(path: str) -> bool:
+    """감시 대상 파일인지 (임시/숨김 파일 제외)"""
+    name = os.path.basename(path)
+    return not name.startswith('.') and name.lower().endswith(WATCHED_SUFFIXES)
+
+
+class InotifyWatcher:
+    """ctypes 기반 inotify 래퍼 (하위 디렉토리는 생성 시점에 감시 추가)"""
+    
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 실패')
+        self._paths: Dict[int, str] = {}
+    
+    @staticmethod
+    def available() -> bool:
+        if not hasattr(os, 'uname') or os.uname().sysname != 'Linux':
+            return False
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6')
+            return hasattr(libc, 'inotify_init1')
+        except OSError:
+            return False
+    
+    def add_watch(self, path: str):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch 실패: {path} ({os.strerror(err)})")
+        self._paths[wd] = path
+    
+    def read_events(self) -> Iterable[Tuple[str, int]]:
+        """읽을 수 있는 이벤트 전부 → (경로, mask)"""
+        try:
+            data = os.read(self.fd, READ_BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+        except OSError as e:
+            if e.errno == errno.EINTR:
+                return []
+            raise
+        
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+            
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                continue
+            directory = self._paths.get(wd)
+            if mask & IN_Q_OVERFLOW or directory is None:
+                events.append(('', mask))
+                continue
+            events.append((os.path.join(directory, os.fsdecode(name)), mask))
+        return events
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """폴링 기반 변경 감지 (inotify를 쓸 수 없을 때)"""
+    
+    def __init__(self):
+        self._roots = []
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+    
+    def add_watch(self, path: str):
+        self._roots.append(path)
+        self._snapshot.update(self._scan(path))
+    
+    @staticmethod
+    def _scan(root: str) -> Dict[str, Tuple[int, int]]:
+        entries = {}
+        for directory, _, files in os.walk(root):
+            for name in files:
+                path = os.path.join(directory, name)
+                if not _is_candidate(path):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries[path] = (stat.st_mtime_ns, stat.st_size)
+        return entries
+    
+    def poll(self) -> Iterable[str]:
+        """이전 스캔 이후 새로 생기거나 바뀐 파일"""
+        current = {}
+        for root in self._roots:
+            current.update(self._scan(root))
+        changed = [path for path, signature in current.items() if self._snapshot.get(path) != signature]
+        self._snapshot = current
+        return changed
+
+
+class HotFolderWatcher:
+    """raw_zip/processed_pdf 감시 → 디바운스 → 크기 제한 큐 → 압축 해제/PDF 처리"""
+    
+    def __init__(
+        self,
+        processor=None,
+        raw_zip_dir: Optional[str] = None,
+        processed_pdf_dir: Optional[str] = None,
+        debounce_seconds: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        use_inotify: Optional[bool] = None,
+        state_path: Optional[str] = None
+    ):
+        self._processor = processor
+        self.raw_zip_dir = raw_zip_dir or settings.RAW_ZIP_DIR
+        self.processed_pdf_dir = processed_pdf_dir or settings.PROCESSED_PDF_DIR
+        self.debounce_seconds = settings.WATCHER_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
+        self.queue_size = queue_size or settings.WATCHER_QUEUE_SIZE
+        self.poll_interval = poll_interval or settings.WATCHER_POLL_INTERVAL
+        self.use_inotify = InotifyWatcher.available() if use_inotify is None else use_inotify
+        self.state_path = Path(state_path or settings.WATCHER_STATE_PATH)
+        
+        self.stats = {'events': 0, 'zips': 0, 'processed': 0, 'unchanged': 0, 'extracted': 0, 'existing': 0, 'failed': 0}
+        self._hashes: Dict[str, str] = self._load_state()
+        self._pending: Dict[str, float] = {}  # 경로 → 마지막 이벤트 시각 (디바운스)
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._crawler: Optional[FSCCrawler] = None
+        self._inotify: Optional[InotifyWatcher] = None
+    
+    # 상태 (PDF 경로별 마지막으로 처리한 내용 해시)
+    
+    def _load_state(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.state_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"감시 상태 파일을 읽을 수 없어 새로 시작: {self.state_path} - {e}")
+            return {}
+    
+    def _save_state(self):
+        """상태 저장 (다른 감시 인스턴스가 기록한 경로와 병합)"""
+        def merge(current):
+            self._hashes = {**(current or {}), **self._hashes}
+            return self._hashes
+        
+        try:
+            update_json(self.state_path, merge)
+        except OSError as e:
+            logger.error(f"감시 상태 저장 실패: {self.state_path} - {e}")
+    
+    # 실행/중지
+    
+    async def run(self):
+        """감시 시작 (stop() 호출 시까지)"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        for directory in (self.raw_zip_dir, self.processed_pdf_dir):
+            os.makedirs(directory, exist_ok=True)
+        
+        source = self._start_inotify() if self.use_inotify else None
+        if source is None:
+            source = PollingWatcher()
+            for directory in (self.raw_zip_dir, self.processed_pdf_dir):
+                source.add_watch(directory)
+            logger.info(f"폴링 감시 시작 ({self.poll_interval}초 주기): {self.raw_zip_dir}, {self.processed_pdf_dir}")
+        
+        tasks = [
+            asyncio.create_task(self._dispatch_loop()),
+            asyncio.create_task(self._consume_loop()),
+        ]
+        if isinstance(source, PollingWatcher):
+            tasks.append(asyncio.create_task(self._poll_loop(source)))
+        
+        try:
+            await self._stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(source, InotifyWatcher):
+                self._loop.remove_reader(source.fd)
+                source.close()
+            self._save_state()
+            logger.info(f"핫 폴더 감시 종료: {self.stats}")
+    
+    def stop(self):
+        """다른 스레드에서도 호출 가능"""
+        if self._loop and self._stop_event:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+    
+    def start_in_thread(self) -> threading.Thread:
+        """전용 스레드의 이벤트 루프에서 실행 (API 서버 이벤트 루프를 막지 않음)"""
+        thread = threading.Thread(target=lambda: asyncio.run(self.run()), name='hot-folder-watcher', daemon=True)
+        thread.start()
+        return thread
+    
+    # 이벤트 수집
+    
+    def _start_inotify(self) -> Optional[InotifyWatcher]:
+        try:
+            watcher = self._inotify = InotifyWatcher()
+        except OSError as e:
+            logger.warning(f"inotify를 사용할 수 없어 폴링으로 대체: {e}")
+            return None
+        try:
+            self._watch_tree(self.raw_zip_dir)
+            self._watch_tree(self.processed_pdf_dir)
+        except OSError as e:
+            # fs.inotify.max_user_watches 초과 등
+            logger.warning(f"inotify 감시 추가 실패, 폴링으로 대체: {e}")
+            watcher.close()
+            return None
+        
+        self._loop.add_reader(watcher.fd, self._on_inotify_readable)
+        logger.info(f"inotify 감시 시작: {self.raw_zip_dir}, {self.processed_pdf_dir}")
+        return watcher
+    
+    def _watch_tree(self, root: str):
+        """디렉토리와 하위 디렉토리 감시 추가"""
+        for directory, _, _ in os.walk(root):
+            self._inotify.add_watch(directory)
+    
+    def _on_inotify_readable(self):
+        for path, mask in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("inotify 이벤트 큐 초과, 일부 이벤트가 누락되었을 수 있음")
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # 새 연도 폴더: 감시 추가 후 감시 전에 들어온 파일 반영
+                    try:
+                        self._watch_tree(path)
+                    except OSError as e:
+                        logger.error(f"하위 디렉토리 감시 추가 실패: {path} - {e}")
+                    for directory, _, files in os.walk(path):
+                        for name in files:
+                            self._mark_pending(os.path.join(directory, name))
+                continue
+            # IN_CREATE만 온 파일은 쓰기가 끝나면 IN_CLOSE_WRITE가 다시 옴
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self._mark_pending(path)
+    
+    async def _poll_loop(self, source: PollingWatcher):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            changed = await asyncio.to_thread(source.poll)
+            for path in changed:
+                self._mark_pending(path)
+    
+    def _mark_pending(self, path: str):
+        if _is_candidate(path):
+            self.stats['events'] += 1
+            self._pending[path] = time.monotonic()
+    
+    async def _dispatch_loop(self):
+        """디바운스 시간 동안 이벤트가 없던 파일을 큐에 전달 (큐가 가득 차면 대기)"""
+        interval = max(self.debounce_seconds / 4, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            ready = [path for path, last in self._pending.items() if now - last >= self.debounce_seconds]
+            for path in ready:
+                # 대기 중 새 이벤트가 오면 다음 주기로 미룸
+                if now - self._pending.get(path, now) < self.debounce_seconds:
+                    continue
+                del self._pending[path]
+                await self._queue.put(path)
+    
+    # 처리
+    
+    def _get_processor(self):
+        if self._processor is None:
+            from app.services.pdf_processor_v2 import PDFProcessorV2
+            self._processor = PDFProcessorV2()
+        return self._processor
+    
+    async def _consume_loop(self):
+        while True:
+            path = await self._queue.get()
+            try:
+                if path.lower().endswith('.zip'):
+                    await self._handle_zip(path)
+                else:
+                    await self._handle_pdf(path)
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.error(f"감시 파일 처리 실패: {path} - {e}")
+            finally:
+                self._queue.task_done()
+    
+    def _get_crawler(self) -> FSCCrawler:
+        if self._crawler is None:
+            self._crawler = FSCCrawler(raw_zip_dir=self.raw_zip_dir, processed_pdf_dir=self.processed_pdf_dir)
+        return self._crawler
+    
+    def _is_extracted_pdf(self, sha256: str) -> bool:
+        """ZIP 압축 해제로 배치된 PDF인지 (다른 프로세스의 수집 작업이 기록한 원장도 반영)"""
+        ledger = self._get_crawler().ledger
+        ledger.load()
+        return ledger.contains_pdf(sha256)
+    
+    async def _handle_zip(self, path: str):
+        """ZIP 압축 해제 (원장 기준 1회) 후 해제된 의결서 PDF 처리"""
+        if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.raw_zip_dir) or not os.path.exists(path):
+            return
+        extracted = await asyncio.to_thread(self._get_crawler().extract_zip_files, [os.path.basename(path)])
+        self.stats['zips'] += 1
+        logger.info(f"감시: ZIP 압축 해제 {os.path.basename(path)} → PDF {len(extracted)}개")
+        
+        for relative_path in extracted:
+            pdf_path = os.path.join(self.processed_pdf_dir, relative_path)
+            if is_fsc_document(pdf_path):
+                await self._process_pdf(pdf_path, await asyncio.to_thread(file_sha256, pdf_path))
+    
+    async def _handle_pdf(self, path: str):
+        """직접 넣은 PDF 중 내용이 바뀐 의결서 본문만 처리 (압축 해제로 배치된 PDF는 압축을 해제한 쪽이 처리)"""
+        if not is_fsc_document(path) or not os.path.exists(path):
+            return
+        sha256 = await asyncio.to_thread(file_sha256, path)
+        if self._hashes.get(os.path.abspath(path)) == sha256:
+            self.stats['unchanged'] += 1
+            return
+        if await asyncio.to_thread(self._is_extracted_pdf, sha256):
+            self.stats['extracted'] += 1
+            logger.debug(f"감시: ZIP 압축 해제로 배치된 PDF, 건너뜀 {os.path.basename(path)}")
+            return
+        await self._process_pdf(path, sha256)
+    
+    async def _process_pdf(self, path: str, sha256: str):
+        """PDF 처리 후 내용 해시 기록 (이미 저장된 의결서면 기존 데이터를 유지하고 경고)"""
+        result = await self._get_processor().process_single_pdf(path)
+        if not result['success']:
+            self.stats['failed'] += 1
+            return
+        
+        if (result.get('db_result') or {}).get('success'):
+            self.stats['processed'] += 1
+            logger.info(f"감시: 처리 완료 {os.path.basename(path)}")
+        else:
+            self.stats['existing'] += 1
+            logger.warning(f"감시: 이미 저장된 의결서라 기존 데이터를 갱신하지 않음 {os.path.basename(path)}")
+        self._hashes[os.path.abspath(path)] = sha256
+        self._save_state()
+
+
+# 싱글톤 인스턴스
+_hot_folder_watcher_instance = None
+
+
+def get_hot_folder_watcher() -> HotFolderWatcher:
+    global _hot_folder_watcher_instance
+    if _hot_folder_watcher_instance is None:
+        _hot_folder_watcher_instance = HotFolderWatcher()
+    return _hot_folder_watcher_instance
\ No newline at end of file
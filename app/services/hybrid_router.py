@@ -0,0 +1,336 @@
+"""
+하이브리드 추출 라우터
+Rule-based 추출을 먼저 수행하고 완전성 점수에 따라 LLM 호출 여부를 결정
+- 완전성 필드: 의결번호, 조치대상자, 금액(과태료/과징금 조치), 근거법규, 조치유형,
+  조치 수(조치대상자 인적사항/조치내용에 나열된 대상자 수만큼 조치가 있는지)
+- 점수가 임계값 이상이면 LLM 호출 없이 Rule-based 결과 저장
+- 임계값 미만이면 LLM 결과로 누락된 필드만 보완
+- 라우팅 경로별 건수 및 LLM 호출 절감 통계 제공
+"""
+import logging
+import os
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.pydantic_models import Action, ActionLawMap, Decision
+from app.services.rule_based_extractor import PATTERNS, RuleBasedExtractor
+
+logger = logging.getLogger(__name__)
+
+# 완전성 점수 필드 (동일 가중치)
+COMPLETENESS_FIELDS = ('decision_number', 'entities', 'fine_amounts', 'laws', 'action_types', 'action_count')
+
+# 금액이 있어야 하는 조치 유형
+FINE_ACTION_TYPES = ('과태료', '과징금')
+
+# Rule-based 추출기가 대상자를 찾지 못했을 때 쓰는 값
+PLACEHOLDER_ENTITIES = ('', '조치대상자')
+
+# 라우팅 경로
+ROUTE_RULE_ONLY = 'rule_only'  # LLM 호출 없음
+ROUTE_LLM_FILL = 'llm_fill'  # LLM으로 누락 필드 보완
+ROUTE_LLM_ONLY = 'llm_only'  # Rule-based 실패 또는 라우팅 비활성화
+
+VIOLATION_SUMMARY_CHARS = 200
+
+# "2. 조치내용" 섹션 (다음 번호 제목 전까지)과 그 안의 대상자 항목 ("ㅇ 대상자" 다음 줄이 "- 조치")
+ACTION_SECTION = re.compile(r'\d+\.\s*조치\s*내용([\s\S]*?)(?=\n\s*\d+\.\s*\S|$)')
+TARGET_BULLET = re.compile(r'[ㅇ○]\s*[^\n]+\n\s*-')
+
+
+class HybridExtractionRouter:
+    """Rule-based 완전성 기반 LLM 호출 라우터"""
+    
+    def __init__(self, threshold: Optional[float] = None, extractor: Optional[RuleBasedExtractor] = None):
+        self.threshold = settings.HYBRID_CONFIDENCE_THRESHOLD if threshold is None else threshold
+        self.extractor = extractor or RuleBasedExtractor()
+        self.stats = self.summarize([])
+    
+    def score(self, rule_result: Dict[str, Any], text: str, filename: str) -> Tuple[float, Dict[str, bool]]:
+        """Rule-based 결과의 완전성 점수 (0~1)와 필드별 충족 여부"""
+        actions = rule_result.get('actions') or []
+        
+        fine_actions = [
+            action for action in actions
+            if any(fine_type in (action.get('action_type') or '') for fine_type in FINE_ACTION_TYPES)
+        ]
+        fields = {
+            # 추출기는 의결번호가 없으면 기본값을 채우므로 원문/파일명에서 직접 확인
+            'decision_number': self._decision_number(text, filename) is not None,
+            'entities': bool(actions) and all(
+                (action.get('entity_name') or '').strip() not in PLACEHOLDER_ENTITIES for action in actions
+            ),
+            'fine_amounts': bool(actions) and all((action.get('fine_amount') or 0) > 0 for action in fine_actions),
+            'laws': any(law.get('law_name') and law.get('article_details') for law in rule_result.get('laws') or []),
+            'action_types': bool(actions) and all((action.get('action_type') or '').strip() for action in actions),
+            # 대상자 일부만 추출된 경우 (예: 기관만 추출되고 임원/과징금 누락)
+            'action_count': bool(actions) and self._targets_covered(actions) >= self._targets_listed(text),
+        }
+        return sum(fields.values()) / len(fields), fields
+    
+    @staticmethod
+    def _targets_covered(actions: List[Dict[str, Any]]) -> int:
+        """추출된 조치가 다루는 대상자 수 (복수 조치 통합 결과는 통합된 대상자 수)"""
+        covered = 0
+        for action in actions:
+            target_details = action.get('target_details') or {}
+            if target_details.get('type') == 'multiple_sanctions':
+                covered += len(target_details.get('targets') or [])
+            else:
+                covered += 1
+        return covered
+    
+    def _targets_listed(self, text: str) -> int:
+        """원문에 나열된 조치대상자 수 (인적사항 표와 조치내용 항목 중 큰 값)"""
+        segments = self.extractor.segment(text)
+        listed = 0
+        target_section = segments.get(segments.target_info_section)
+        if target_section:
+            listed = sum(len(pattern.findall(target_section)) for pattern in PATTERNS['target_types'].values())
+        
+        action_section = ACTION_SECTION.search(text)
+        if action_section:
+            listed = max(listed, len(TARGET_BULLET.findall(action_section.group(1))))
+        return listed
+    
+    async def route(
+        self,
+        text: str,
+        metadata: Dict[str, Any],
+        llm_extract: Callable[[], Awaitable[Optional[Decision]]],
+        filename: str = ''
+    ) -> Tuple[Decision, Dict[str, Any]]:
+        """문서 1건 추출 → (Decision, 라우팅 정보)
+
+        Args:
+            text: 전처리된 의결서 텍스트
+            metadata: PDFPreprocessor 메타데이터
+            llm_extract: LLM 추출 코루틴 함수 (필요할 때만 호출)
+            filename: 원본 파일명 (의결번호/제목 추출용)
+        """
+        evaluation = self.evaluate(text, metadata, filename)
+        if not evaluation['llm_required']:
+            return self.complete(evaluation)
+        
+        llm_decision = await self._call_llm(llm_extract)
+        return self.complete(evaluation, llm_decision)
+    
+    def evaluate(self, text: str, metadata: Dict[str, Any], filename: str = '') -> Dict[str, Any]:
+        """Rule-based 추출 및 완전성 평가 (LLM 호출 전 단계)
+
+        Returns:
+            decision(Rule-based Decision, 추출 실패 시 None), score, fields, missing, llm_required
+        """
+        filename = filename or metadata.get('filename', '')
+        
+        try:
+            rule_result = self.extractor.extract_full_document_structure(text, filename)
+        except Exception as e:
+            logger.warning(f"Rule-based 추출 실패, LLM으로 전체 추출: {filename} - {e}")
+            return {
+                'decision': None,
+                'score': 0.0,
+                'fields': {},
+                'missing': list(COMPLETENESS_FIELDS),
+                'llm_required': True
+            }
+        
+        score, fields = self.score(rule_result, text, filename)
+        missing = [field for field, complete in fields.items() if not complete]
+        llm_required = score < self.threshold
+        if llm_required:
+            logger.info(f"LLM으로 누락 필드 보완: {filename} - 완전성 {score:.2f}, 누락: {', '.join(missing)}")
+        else:
+            logger.info(f"Rule-based 결과 사용 (LLM 생략): {filename} - 완전성 {score:.2f}")
+        
+        return {
+            'decision': self.to_decision(rule_result, text, metadata, filename),
+            'score': score,
+            'fields': fields,
+            'missing': missing,
+            'llm_required': llm_required
+        }
+        
+    def complete(self, evaluation: Dict[str, Any], llm_decision: Optional[Decision] = None) -> Tuple[Decision, Dict[str, Any]]:
+        """평가 결과와 (필요한 경우) LLM 결과 → (최종 Decision, 라우팅 정보)"""
+        if evaluation['decision'] is None:
+            return llm_decision, self._record(ROUTE_LLM_ONLY, 0.0, evaluation['missing'])
+        if not evaluation['llm_required']:
+            return evaluation['decision'], self._record(ROUTE_RULE_ONLY, evaluation['score'], evaluation['missing'])
+        return (
+            self.merge(evaluation['decision'], llm_decision, evaluation['fields']),
+            self._record(ROUTE_LLM_FILL, evaluation['score'], evaluation['missing'])
+        )
+    
+    @staticmethod
+    async def _call_llm(llm_extract: Callable[[], Awaitable[Optional[Decision]]]) -> Decision:
+        decision = await llm_extract()
+        if not decision:
+            raise Exception("데이터 추출 실패")
+        return decision
+    
+    def _record(self, route: str, score: float, missing: List[str]) -> Dict[str, Any]:
+        """라우팅 정보 생성 및 누적 통계 반영"""
+        routing = {
+            'route': route,
+            'score': round(score, 3),
+            'missing': missing,
+            'llm_called': route != ROUTE_RULE_ONLY
+        }
+        self.stats = self.summarize([routing], self.stats)
+        return routing
+    
+    @staticmethod
+    def summarize(routings: List[Dict[str, Any]], base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """라우팅 정보 목록 → 경로별 건수 및 LLM 호출 절감 통계 (base에 누적)"""
+        stats = dict(base) if base else {
+            'documents': 0,
+            ROUTE_RULE_ONLY: 0,
+            ROUTE_LLM_FILL: 0,
+            ROUTE_LLM_ONLY: 0,
+            'llm_calls': 0,
+            'llm_calls_avoided': 0,
+            'avoided_ratio': 0.0,
+            'score_sum': 0.0,
+        }
+        for routing in routings:
+            stats['documents'] += 1
+            stats[routing['route']] += 1
+            stats['score_sum'] += routing['score']
+            if routing['llm_called']:
+                stats['llm_calls'] += 1
+            else:
+                stats['llm_calls_avoided'] += 1
+        if stats['documents']:
+            stats['avoided_ratio'] = round(stats['llm_calls_avoided'] / stats['documents'], 3)
+            stats['average_score'] = round(stats['score_sum'] / stats['documents'], 3)
+        return stats
+    
+    @staticmethod
+    def _decision_number(text: str, filename: str) -> Optional[Tuple[int, int]]:
+        """파일명 우선, 없으면 원문의 '제YYYY-N호'"""
+        match = PATTERNS['decision_number'].search(filename) or PATTERNS['decision_number'].search(text)
+        if not match:
+            return None
+        return int(match.group(1)), int(match.group(2))
+    
+    def to_decision(self, rule_result: Dict[str, Any], text: str, metadata: Dict[str, Any], filename: str) -> Decision:
+        """Rule-based 결과 → Decision 모델"""
+        decision_meta = rule_result.get('decision') or {}
+        decision_number = self._decision_number(text, filename)
+        if decision_number:
+            decision_year, decision_id = decision_number
+        else:
+            decision_year, decision_id = metadata.get('year') or 0, metadata.get('decision_id') or 0
+        
+        laws = rule_result.get('laws') or []
+        actions = [self._to_action(action, laws) for action in rule_result.get('actions') or []]
+        category_1, category_2 = self._infer_categories(rule_result.get('actions') or [])
+        
+        return Decision(
+            decision_year=decision_year,
+            decision_id=decision_id,
+            title=decision_meta.get('title') or os.path.splitext(os.path.basename(filename))[0],
+            full_text=text,
+            actions=actions,
+            agenda_no=metadata.get('agenda_no') or f"제{decision_id}호",
+            category_1=category_1,
+            category_2=category_2,
+            decision_month=decision_meta.get('decision_month') or None,
+            decision_day=decision_meta.get('decision_day') or None,
+        )
+    
+    @staticmethod
+    def _to_action(action: Dict[str, Any], laws: List[Dict[str, Any]]) -> Action:
+        violation_text = action.get('violation_full_text') or ''
+        summary = ' '.join(violation_text.split())
+        summary = re.sub(r'^지적사항\s*', '', summary)[:VIOLATION_SUMMARY_CHARS]
+        
+        return Action(
+            entity_name=action.get('entity_name') or '',
+            industry_sector=action.get('industry_sector') or None,
+            violation_details=action.get('violation_details') or violation_text or None,
+            action_type=action.get('action_type') or '',
+            fine_amount=action.get('fine_amount') or None,
+            violation_summary=summary,
+            target_details=action.get('target_details') or None,
+            action_law_map=[
+                ActionLawMap(
+                    law_name=law['law_name'],
+                    article_details=law.get('article_details') or '',
+                    article_purpose=law.get('article_purpose') or None
+                )
+                for law in action.get('laws_cited') or laws
+                if law.get('law_name')
+            ],
+            fine_basis_amount=action.get('fine_basis_amount'),
+            sanction_period=action.get('sanction_period') or None,
+            sanction_scope=action.get('sanction_scope') or None,
+            effective_date=action.get('effective_date'),
+        )
+    
+    @staticmethod
+    def _infer_categories(actions: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+        """조치가 있으면 제재, 대상 유형으로 기관/임직원 분류 (판단 불가 시 None)"""
+        if not actions:
+            return None, None
+        
+        entity_types = set()
+        for action in actions:
+            target_details = action.get('target_details') or {}
+            for target in target_details.get('targets') or []:
+                if target.get('entity_type'):
+                    entity_types.add(target['entity_type'])
+            if not target_details.get('targets') and action.get('industry_sector'):
+                entity_types.add('기관')
+        
+        if '기관' in entity_types:
+            return '제재', '기관'
+        if '임직원' in entity_types:
+            return '제재', '임직원'
+        return '제재', None
+    
+    @staticmethod
+    def merge(rule_decision: Decision, llm_decision: Decision, fields: Dict[str, bool]) -> Decision:
+        """LLM 결과를 기본으로 Rule-based가 충족한 필드를 유지 (누락 필드만 LLM 값 사용)"""
+        update: Dict[str, Any] = {}
+        
+        if fields['decision_number']:
+            update['decision_year'] = rule_decision.decision_year
+            update['decision_id'] = rule_decision.decision_id
+        
+        rule_law_maps = [law_map for action in rule_decision.actions for law_map in action.action_law_map]
+        actions_complete = (
+            fields['entities'] and fields['fine_amounts'] and fields['action_types'] and fields['action_count']
+        )
+        
+        if actions_complete and rule_decision.actions:
+            # 조치는 Rule-based 유지, 법규만 누락이면 LLM 법규로 보완
+            actions = rule_decision.actions
+            if not fields['laws']:
+                llm_law_maps = _unique_law_maps(
+                    law_map for action in llm_decision.actions for law_map in action.action_law_map
+                )
+                actions = [action.model_copy(update={'action_law_map': llm_law_maps}) for action in actions]
+            update['actions'] = actions
+        elif fields['laws'] and rule_law_maps:
+            # 조치는 LLM 사용, 법규가 비어 있는 조치는 Rule-based 법규로 보완
+            update['actions'] = [
+                action if action.action_law_map else action.model_copy(update={'action_law_map': _unique_law_maps(rule_law_maps)})
+                for action in llm_decision.actions
+            ]
+        
+        return llm_decision.model_copy(update=update)
+
+
+def _unique_law_maps(law_maps) -> List[ActionLawMap]:
+    """(법률명, 조항) 기준 중복 제거"""
+    seen = set()
+    unique = []
+    for law_map in law_maps:
+        key = (law_map.law_name, law_map.article_details)
+        if key not in seen:
+            seen.add(key)
+            unique.append(law_map)
+    return unique
\ No newline at end of file
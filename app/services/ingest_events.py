@@ -0,0 +1,44 @@
+"""
+수집(ingest) 이벤트 버스
+의결서 저장 등 수집 파이프라인의 이벤트를 인메모리 인덱스/캐시에 전달
+- 동일 프로세스 내 동기 호출 (구독자 예외는 로깅 후 무시)
+"""
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+# 이벤트 종류
+DECISION_INGESTED = 'decision_ingested'  # payload: decision_pk, action_ids
+
+_subscribers: Dict[str, List[Callable[..., None]]] = defaultdict(list)
+_lock = threading.Lock()
+
+
+def subscribe(event: str, callback: Callable[..., None]):
+    """이벤트 구독 (중복 등록 무시)"""
+    with _lock:
+        if callback not in _subscribers[event]:
+            _subscribers[event].append(callback)
+
+
+def unsubscribe(event: str, callback: Callable[..., None]):
+    """이벤트 구독 해제"""
+    with _lock:
+        if callback in _subscribers[event]:
+            _subscribers[event].remove(callback)
+
+
+def publish(event: str, **payload):
+    """이벤트 발행"""
+    with _lock:
+        callbacks = list(_subscribers[event])
+    
+    for callback in callbacks:
+        try:
+            callback(**payload)
+        except Exception as e:
+            logger.error(f"이벤트 처리 실패 ({event}, {getattr(callback, '__qualname__', callback)}): {e}")
\ No newline at end of file
@@ -0,0 +1,440 @@
+"""
+수집 작업 관리자
+크롤링/PDF 처리 작업을 백그라운드 스레드에서 순서대로 실행하고 진행 상태를 DB(ingest_jobs_v2)에 기록
+- 작업 종류: crawl(기간 크롤링 → 압축 해제 → 처리), directory(디렉토리의 PDF 처리)
+- 진행 상태: 단계별 건수, 처리량(문서/분), 예상 남은 시간, LLM 호출 제한 대기 시간
+- 취소: 단계 사이와 문서 사이에서 DB 상태를 확인하여 처리 중인 문서를 마친 뒤 중단 (다른 프로세스의 취소 요청도 반영)
+- 실행 선점: 대기 상태인 작업만 조건부 UPDATE로 가져가므로 여러 프로세스가 같은 작업을 중복 실행하지 않음
+- 재개: 대기 중인 작업과, 실행 중이지만 INGEST_JOB_STALE_SECONDS 동안 갱신이 없는(프로세스가 중단된) 작업을
+  다시 큐에 넣고 처리를 마친 PDF는 건너뜀 (실행 중인 작업은 주기적으로 행을 갱신)
+- directory 작업은 PROCESSED_PDF_DIR 하위 디렉토리만 허용
+"""
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.fsc_models_v2 import IngestJobV2
+from app.services.fsc_crawler import is_fsc_document
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류
+JOB_TYPES = ('crawl', 'directory')
+
+# 작업 상태
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_CANCELLING = 'cancelling'
+STATUS_CANCELLED = 'cancelled'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING, STATUS_CANCELLING)
+TERMINAL_STATUSES = (STATUS_CANCELLED, STATUS_COMPLETED, STATUS_FAILED)
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 중단"""
+
+
+def resolve_job_directory(directory: str) -> str:
+    """directory 작업 경로 확인 → 실제 절대 경로 (PROCESSED_PDF_DIR 밖이면 ValueError)"""
+    root = os.path.realpath(settings.PROCESSED_PDF_DIR)
+    path = os.path.realpath(directory or '')
+    if not directory or os.path.commonpath([root, path]) != root:
+        raise ValueError(f"PROCESSED_PDF_DIR({settings.PROCESSED_PDF_DIR}) 하위 디렉토리만 처리할 수 있습니다: {directory}")
+    return path
+
+
+def initial_progress() -> Dict[str, Any]:
+    return {
+        'stage': 'pending',
+        'crawl': {'decisions': 0, 'downloaded': 0, 'not_modified': 0, 'unchanged': 0, 'extracted': 0},
+        'process': {'total': 0, 'done': 0, 'succeeded': 0, 'skipped': 0, 'failed': 0},
+        'routing': {'rule_only': 0, 'llm_fill': 0, 'llm_only': 0},
+        'throughput_per_min': 0.0,
+        'eta_seconds': None,
+        'llm_wait_seconds': 0.0,
+    }
+
+
+class IngestJobManager:
+    """수집 작업 제출/조회/취소 및 단일 백그라운드 실행 스레드"""
+    
+    def __init__(self, session_factory=None, processor=None):
+        self.SessionLocal = session_factory or SessionLocal
+        self._processor = processor
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+    
+    # 조회/제출/취소
+    
+    def submit(self, job_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 등록 후 실행 큐에 추가"""
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"지원하지 않는 작업 종류입니다: {job_type}")
+        if job_type == 'directory':
+            params = {**params, 'directory': resolve_job_directory(params.get('directory'))}
+        
+        session = self.SessionLocal()
+        try:
+            job = IngestJobV2(
+                job_id=uuid.uuid4().hex,
+                job_type=job_type,
+                status=STATUS_QUEUED,
+                params=params,
+                processed_files=[],
+                progress=initial_progress()
+            )
+            session.add(job)
+            session.commit()
+            job_data = self._to_dict(job)
+        finally:
+            session.close()
+        
+        logger.info(f"수집 작업 등록: {job_data['job_id']} ({job_type}, {params})")
+        self._enqueue(job_data['job_id'])
+        return job_data
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        session = self.SessionLocal()
+        try:
+            job = session.get(IngestJobV2, job_id)
+            return self._to_dict(job) if job else None
+        finally:
+            session.close()
+    
+    def list_jobs(self, limit: int = 20, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        session = self.SessionLocal()
+        try:
+            query = session.query(IngestJobV2)
+            if status:
+                query = query.filter(IngestJobV2.status == status)
+            jobs = query.order_by(IngestJobV2.created_at.desc()).limit(limit).all()
+            return [self._to_dict(job) for job in jobs]
+        finally:
+            session.close()
+    
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """취소 요청 (대기 중이면 즉시 취소, 실행 중이면 실행 중인 프로세스가 현재 문서 처리 후 중단)"""
+        session = self.SessionLocal()
+        try:
+            if self._transition(session, job_id, STATUS_QUEUED, status=STATUS_CANCELLED, finished_at=datetime.now()) or \
+                    self._transition(session, job_id, STATUS_RUNNING, status=STATUS_CANCELLING):
+                session.commit()
+                logger.info(f"수집 작업 취소 요청: {job_id}")
+            job = session.get(IngestJobV2, job_id)
+            return self._to_dict(job) if job else None
+        finally:
+            session.close()
+    
+    def resume_pending(self) -> List[str]:
+        """대기 중인 작업과 중단된 프로세스의 작업 재개 (중단된 채 취소 중이던 작업은 취소 완료 처리)
+
+        서버 시작 시 호출하며, 이후에는 실행 스레드가 대기열이 빌 때마다 주기적으로 호출합니다.
+        실행 중인 작업은 마지막 갱신 후 INGEST_JOB_STALE_SECONDS가 지나야 중단된 것으로 봅니다.
+        """
+        session = self.SessionLocal()
+        try:
+            stale_before = session.query(func.now()).scalar() - timedelta(seconds=settings.INGEST_JOB_STALE_SECONDS)
+            jobs = session.query(IngestJobV2.job_id, IngestJobV2.status).filter(
+                IngestJobV2.status.in_(ACTIVE_STATUSES)
+            ).order_by(IngestJobV2.created_at).all()
+            
+            resumed = []
+            for job_id, status in jobs:
+                if status == STATUS_QUEUED:
+                    resumed.append(job_id)
+                elif status == STATUS_RUNNING:
+                    if self._transition(session, job_id, STATUS_RUNNING, stale_before, status=STATUS_QUEUED):
+                        resumed.append(job_id)
+                else:
+                    self._transition(session, job_id, STATUS_CANCELLING, stale_before,
+                                     status=STATUS_CANCELLED, finished_at=datetime.now())
+            session.commit()
+        finally:
+            session.close()
+        
+        self._ensure_worker()
+        for job_id in resumed:
+            self._enqueue(job_id)
+        if resumed:
+            logger.info(f"미완료 수집 작업 재개: {len(resumed)}건")
+        return resumed
+    
+    async def stream(self, job_id: str, interval: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """진행 상태가 바뀔 때마다 작업 정보를 내보내고, 종료 상태가 되면 끝남 (SSE용)"""
+        interval = settings.INGEST_JOB_EVENT_INTERVAL if interval is None else interval
+        last_seen = None
+        
+        while True:
+            job = await asyncio.to_thread(self.get, job_id)
+            if job is None:
+                return
+            
+            signature = (job['status'], job['updated_at'], job['progress'])
+            if signature != last_seen:
+                last_seen = signature
+                yield job
+            if job['status'] in TERMINAL_STATUSES:
+                return
+            await asyncio.sleep(interval)
+    
+    # 실행
+    
+    @staticmethod
+    def _transition(session, job_id: str, from_status: str, stale_before: Optional[datetime] = None, **values) -> bool:
+        """조건부 상태 변경 (현재 상태가 from_status일 때만, 커밋은 호출자) → 변경 여부"""
+        query = session.query(IngestJobV2).filter(
+            IngestJobV2.job_id == job_id,
+            IngestJobV2.status == from_status
+        )
+        if stale_before is not None:
+            query = query.filter(IngestJobV2.updated_at < stale_before)
+        return query.update(values, synchronize_session=False) == 1
+    
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._worker_loop, name='ingest-jobs', daemon=True)
+                self._worker.start()
+    
+    def _enqueue(self, job_id: str):
+        self._ensure_worker()
+        self._queue.put(job_id)
+    
+    def shutdown(self, timeout: Optional[float] = None):
+        """실행 스레드 종료 (실행 중인 작업은 마친 뒤 종료, 이후 제출/재개 시 다시 시작)"""
+        with self._lock:
+            worker = self._worker
+            self._stopping.set()
+        if worker is not None:
+            worker.join(timeout)
+        with self._lock:
+            self._worker = None
+            self._stopping.clear()
+    
+    def _worker_loop(self):
+        """작업을 하나씩 실행 (스레드 전용 이벤트 루프에서 처리기 비동기 메서드 실행)
+
+        대기열이 비어 있으면 DB에서 다른 프로세스가 등록했거나 중단된 작업을 찾아 실행합니다.
+        """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while not self._stopping.is_set():
+            try:
+                job_id = self._queue.get(timeout=settings.INGEST_JOB_HEARTBEAT_SECONDS)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    break
+                try:
+                    self.resume_pending()
+                except Exception as e:
+                    logger.error(f"미완료 수집 작업 확인 오류: {e}")
+                continue
+            try:
+                loop.run_until_complete(self._run_job(job_id))
+            except Exception as e:
+                logger.error(f"수집 작업 실행 오류: {job_id} - {e}")
+            finally:
+                self._queue.task_done()
+        loop.close()
+    
+    def _get_processor(self):
+        if self._processor is None:
+            from app.services.pdf_processor_v2 import PDFProcessorV2
+            self._processor = PDFProcessorV2()
+        return self._processor
+    
+    def _claim(self, job_id: str) -> bool:
+        """대기 중인 작업을 실행 상태로 선점 (다른 프로세스가 먼저 가져갔거나 취소되었으면 False)"""
+        session = self.SessionLocal()
+        try:
+            claimed = self._transition(session, job_id, STATUS_QUEUED, status=STATUS_RUNNING, updated_at=func.now())
+            session.commit()
+            return claimed
+        finally:
+            session.close()
+    
+    def _check_cancelled(self, job_id: str):
+        """취소 요청 확인 (다른 프로세스의 API 요청도 반영되도록 DB 상태 기준)"""
+        session = self.SessionLocal()
+        try:
+            status = session.query(IngestJobV2.status).filter(IngestJobV2.job_id == job_id).scalar()
+        finally:
+            session.close()
+        if status in (STATUS_CANCELLING, STATUS_CANCELLED):
+            raise JobCancelled()
+    
+    async def _heartbeat(self, job_id: str):
+        """실행 중 표시 갱신 (다른 프로세스가 중단된 작업으로 보고 다시 가져가지 않도록)"""
+        while True:
+            await asyncio.sleep(settings.INGEST_JOB_HEARTBEAT_SECONDS)
+            await asyncio.to_thread(self._update, job_id, updated_at=func.now())
+    
+    def _update(self, job_id: str, **values):
+        """작업 행 갱신 (JSON 컬럼은 새 객체로 대입)"""
+        session = self.SessionLocal()
+        try:
+            job = session.get(IngestJobV2, job_id)
+            for key, value in values.items():
+                setattr(job, key, value)
+            session.commit()
+        finally:
+            session.close()
+    
+    async def _run_job(self, job_id: str):
+        if not self._claim(job_id):
+            return
+        job = self.get(job_id)
+        
+        progress = job['progress'] or initial_progress()
+        if job['started_at']:
+            logger.info(f"수집 작업 재개: {job_id} ({job['job_type']}, 처리 완료 {len(job['processed_files'] or [])}건)")
+        else:
+            self._update(job_id, started_at=datetime.now())
+            logger.info(f"수집 작업 시작: {job_id} ({job['job_type']})")
+        
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            self._check_cancelled(job_id)
+            files = job['files']
+            if files is None:
+                files = await self._collect_files(job_id, job, progress)
+                self._update(job_id, files=list(files), progress=dict(progress))
+            
+            await self._process_files(job_id, files, list(job['processed_files'] or []), progress)
+            
+            progress['stage'] = 'done'
+            self._update(job_id, status=STATUS_COMPLETED, progress=dict(progress), finished_at=datetime.now())
+            logger.info(f"수집 작업 완료: {job_id} - {progress['process']}")
+        
+        except JobCancelled:
+            self._update(job_id, status=STATUS_CANCELLED, progress=dict(progress), finished_at=datetime.now())
+            logger.info(f"수집 작업 취소됨: {job_id}")
+        except Exception as e:
+            logger.error(f"수집 작업 실패: {job_id} - {e}")
+            self._update(job_id, status=STATUS_FAILED, error=str(e), progress=dict(progress), finished_at=datetime.now())
+        finally:
+            heartbeat.cancel()
+    
+    async def _collect_files(self, job_id: str, job: Dict[str, Any], progress: Dict[str, Any]) -> List[str]:
+        """처리 대상 PDF 목록 확정 (crawl 작업은 크롤링 및 압축 해제 단계 포함)"""
+        params = job['params']
+        fsc_only = params.get('fsc_only', True)
+        
+        if job['job_type'] == 'directory':
+            progress['stage'] = 'scan'
+            directory = resolve_job_directory(params['directory'])  # 이전에 등록된 작업도 확인
+            files = [str(path) for path in sorted(Path(directory).rglob('*.pdf'))]
+        else:
+            from app.services.async_fsc_crawler import AsyncFSCCrawler
+            
+            progress['stage'] = 'crawl'
+            self._update(job_id, progress=dict(progress))
+            async with AsyncFSCCrawler(incremental=not params.get('full', False)) as crawler:
+                results = await crawler.crawl_decisions(
+                    datetime.strptime(params['start_date'], '%Y-%m-%d'),
+                    datetime.strptime(params['end_date'], '%Y-%m-%d')
+                )
+            progress['crawl'] = {
+                'decisions': len(results['decisions']),
+                'downloaded': len(results['downloaded_files']),
+                'not_modified': crawler.stats['not_modified'],
+                'unchanged': crawler.stats['unchanged_files'],
+                'extracted': len(results['extracted_files']),
+            }
+            files = [os.path.join(crawler.processed_pdf_dir, path) for path in results['extracted_files']]
+        
+        self._check_cancelled(job_id)
+        return [path for path in files if not fsc_only or is_fsc_document(path)]
+    
+    async def _process_files(self, job_id: str, files: List[str], processed_files: List[str], progress: Dict[str, Any]):
+        """문서별 처리 및 진행 상태 기록 (이미 처리한 파일은 건너뜀)"""
+        processor = self._get_processor()
+        gemini_service = getattr(processor, 'gemini_service', None)
+        
+        done = set(processed_files)
+        remaining = [path for path in files if path not in done]
+        progress['stage'] = 'process'
+        progress['process']['total'] = len(files)
+        progress['process']['done'] = len(files) - len(remaining)
+        self._update(job_id, progress=dict(progress))
+        
+        started = time.monotonic()
+        processed_this_run = 0
+        wait_base = progress['llm_wait_seconds']
+        wait_start = getattr(gemini_service, 'rate_limit_wait_seconds', 0.0)
+        
+        for pdf_path in remaining:
+            self._check_cancelled(job_id)
+            
+            result = await processor.process_single_pdf(pdf_path)
+            counts = progress['process']
+            if not result['success']:
+                counts['failed'] += 1
+            elif result['db_result'].get('success'):
+                counts['succeeded'] += 1
+            else:
+                counts['skipped'] += 1  # 이미 저장된 의결서
+            route = (result.get('routing') or {}).get('route')
+            if route in progress['routing']:
+                progress['routing'][route] += 1
+            
+            counts['done'] += 1
+            processed_this_run += 1
+            processed_files.append(pdf_path)
+            
+            # 이번 실행 기준 처리량 (재개 전 처리분은 시간에 포함되지 않으므로 제외)
+            elapsed = time.monotonic() - started
+            rate = processed_this_run / elapsed if elapsed > 0 else 0.0
+            progress['throughput_per_min'] = round(rate * 60, 2)
+            progress['eta_seconds'] = round((counts['total'] - counts['done']) / rate, 1) if rate else None
+            progress['llm_wait_seconds'] = round(
+                wait_base + getattr(gemini_service, 'rate_limit_wait_seconds', 0.0) - wait_start, 1
+            )
+            self._update(job_id, processed_files=list(processed_files), progress=dict(progress))
+    
+    @staticmethod
+    def _to_dict(job: IngestJobV2) -> Dict[str, Any]:
+        def isoformat(value):
+            return value.isoformat() if value else None
+        
+        return {
+            'job_id': job.job_id,
+            'job_type': job.job_type,
+            'status': job.status,
+            'params': job.params,
+            'files': job.files,
+            'processed_files': job.processed_files,
+            'progress': job.progress,
+            'error': job.error,
+            'created_at': isoformat(job.created_at),
+            'started_at': isoformat(job.started_at),
+            'finished_at': isoformat(job.finished_at),
+            'updated_at': isoformat(job.updated_at),
+        }
+
+
+# 싱글톤 인스턴스
+_ingest_job_manager_instance = None
+
+
+def get_ingest_job_manager() -> IngestJobManager:
+    """전역 수집 작업 관리자"""
+    global _ingest_job_manager_instance
+    if _ingest_job_manager_instance is None:
+        _ingest_job_manager_instance = IngestJobManager()
+    return _ingest_job_manager_instance
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+JSON 상태 파일 갱신
+크롤링 상태, 압축 해제 원장, 감시 상태처럼 여러 주체(수집 작업, 핫 폴더 감시, 스크립트)가 함께 쓰는 파일을
+잠금 안에서 디스크의 최신 내용과 병합한 뒤 교체 (마지막 저장이 다른 쓰기를 덮어쓰지 않도록)
+- 잠금: <파일명>.lock에 fcntl.flock (fcntl이 없는 환경은 프로세스 내 잠금만)
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: Path):
+    """상태 파일 쓰기 잠금 (프로세스 간 + 프로세스 내)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _thread_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(path.with_name(f'{path.name}.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """상태 파일 읽기 (없거나 손상되었으면 None)"""
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def update_json(path, merge: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]) -> Dict[str, Any]:
+    """잠금 안에서 현재 내용(없으면 None)을 merge에 넘기고 그 결과로 교체 (임시 파일 작성 후 교체)"""
+    path = Path(path)
+    with file_lock(path):
+        data = merge(read_json(path))
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp_path, path)
+    return data
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+LLM 입력 컨텍스트 구성 모듈
+의결서 전문 대신 추출에 필요한 섹션(문서 머리, 조치내용, 근거법규, 위반사실)만 골라 토큰 예산 내로 구성
+- 섹션 위치: PDFPreprocessor 섹션 식별 + Rule-based 단일 스캔 분할기(DocumentSegmenter)
+- 예산 초과 시 우선순위가 낮은 섹션부터 잘라냄
+- 문서별 입력 토큰 절감량 보고
+"""
+import bisect
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.preprocessing import PDFPreprocessor
+from app.services.rule_based_extractor import DocumentSegmenter
+
+logger = logging.getLogger(__name__)
+
+# 토큰 추정용 (한글 음절은 1.5자당, 그 외 공백 아닌 문자는 4자당 1토큰으로 근사)
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+NON_SPACE_PATTERN = re.compile(r'\S')
+HANGUL_CHARS_PER_TOKEN = 1.5
+OTHER_CHARS_PER_TOKEN = 4.0
+
+# 섹션 우선순위 (낮을수록 먼저 포함)
+PRIORITY_HEADER = 0
+PRIORITY_ACTION = 1
+PRIORITY_LAW = 2
+PRIORITY_VIOLATION = 3
+PRIORITY_FALLBACK = 9
+
+# PDFPreprocessor._identify_sections 섹션 유형 → (우선순위, 이름)
+SECTION_PRIORITIES = {
+    'decision': (PRIORITY_ACTION, '조치내용'),
+    'sanctions': (PRIORITY_ACTION, '조치내용'),
+    'actions': (PRIORITY_ACTION, '조치내용'),
+    'laws': (PRIORITY_LAW, '근거법규'),
+    'violations': (PRIORITY_VIOLATION, '위반사실'),
+}
+
+# 떨어진 구간 사이 구분자
+GAP_MARKER = '\n\n(중략)\n\n'
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 근사치 (API 호출 없이 예산 계산용)"""
+    hangul = len(HANGUL_PATTERN.findall(text))
+    others = len(NON_SPACE_PATTERN.findall(text)) - hangul
+    return int(hangul / HANGUL_CHARS_PER_TOKEN + others / OTHER_CHARS_PER_TOKEN + 0.5)
+
+
+class LLMContextBuilder:
+    """섹션 선별 기반 LLM 입력 컨텍스트 구성기"""
+    
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        header_chars: Optional[int] = None,
+        preprocessor: Optional[PDFPreprocessor] = None,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
+        self.token_budget = token_budget or settings.LLM_CONTEXT_TOKEN_BUDGET
+        self.header_chars = settings.LLM_CONTEXT_HEADER_CHARS if header_chars is None else header_chars
+        self.preprocessor = preprocessor or PDFPreprocessor()
+        self.segmenter = DocumentSegmenter()
+        # 정확한 토큰 수가 필요하면 모델의 count_tokens 등을 주입
+        self.token_counter = token_counter or estimate_tokens
+    
+    def build(self, text: str, sections: Optional[List[dict]] = None, name: str = '') -> Dict[str, Any]:
+        """관련 섹션만 담은 컨텍스트와 토큰 절감 보고 반환
+
+        Args:
+            text: 전처리된 의결서 텍스트
+            sections: PDFPreprocessor._identify_sections 결과 (없으면 직접 식별)
+            name: 로그용 문서 이름
+        """
+        if sections is None:
+            sections = self.preprocessor._identify_sections(text)
+        
+        candidates = self._collect_spans(text, sections)
+        fallback = all(priority == PRIORITY_HEADER for priority, _, _, _ in candidates)
+        if fallback:
+            # 섹션을 찾지 못한 문서는 전문을 예산 내로 사용
+            candidates = [(PRIORITY_FALLBACK, 0, len(text), '전문')]
+        
+        selected, labels, truncated = self._fit_budget(text, candidates)
+        context_text = GAP_MARKER.join(text[start:end].strip() for start, end in selected)
+        
+        original_tokens = self.token_counter(text)
+        context_tokens = self.token_counter(context_text)
+        saved_tokens = max(original_tokens - context_tokens, 0)
+        report = {
+            'text': context_text,
+            'sections': labels,
+            'original_tokens': original_tokens,
+            'context_tokens': context_tokens,
+            'saved_tokens': saved_tokens,
+            'saved_ratio': round(saved_tokens / original_tokens, 3) if original_tokens else 0.0,
+            'truncated': truncated,
+            'fallback': fallback
+        }
+        
+        logger.info(
+            f"LLM 입력 축소{f' [{name}]' if name else ''}: {original_tokens} → {context_tokens} 토큰 "
+            f"({report['saved_ratio'] * 100:.1f}% 절감, 섹션: {', '.join(labels) or '없음'}"
+            f"{', 예산 초과로 일부 생략' if truncated else ''})"
+        )
+        return report
+    
+    def _collect_spans(self, text: str, sections: List[dict]) -> List[Tuple[int, int, int, str]]:
+        """후보 구간 (우선순위, 시작, 끝, 이름) 목록"""
+        candidates = []
+        
+        # 문서 머리: 의안번호, 제목, 조치대상자 (첫 섹션 이전까지, 최대 header_chars자)
+        if self.header_chars > 0 and text:
+            candidates.append((PRIORITY_HEADER, 0, min(len(text), self.header_chars), '머리'))
+        
+        # 전처리기 섹션 (다음 섹션 시작까지)
+        ordered = sorted(sections, key=lambda section: section['start'])
+        for i, section in enumerate(ordered):
+            if section['type'] not in SECTION_PRIORITIES:
+                continue
+            priority, label = SECTION_PRIORITIES[section['type']]
+            end = ordered[i + 1]['start'] if i + 1 < len(ordered) else len(text)
+            candidates.append((priority, section['start'], end, label))
+        
+        # Rule-based 분할기 섹션 (문서 끝까지 이어지는 구간이 있으므로 다음 전처리기 섹션 시작에서 자름)
+        boundaries = [section['start'] for section in ordered]
+        segments = self.segmenter.segment(text)
+        rule_spans = [
+            (PRIORITY_ACTION, segments.target_info_section, '조치내용'),
+            (PRIORITY_ACTION, segments.action_section, '조치내용'),
+            (PRIORITY_ACTION, segments.sanction_table, '조치내용'),
+            (PRIORITY_LAW, segments.law_section, '근거법규'),
+            (PRIORITY_VIOLATION, segments.violation_fallback, '위반사실'),
+        ]
+        rule_spans.extend((PRIORITY_VIOLATION, span, '위반사실') for span in segments.violation_sections)
+        for priority, span, label in rule_spans:
+            if span is None:
+                continue
+            start, end = span
+            next_index = bisect.bisect_right(boundaries, start)
+            if next_index < len(boundaries):
+                end = min(end, boundaries[next_index])
+            if end > start:
+                candidates.append((priority, start, end, label))
+        
+        # 우선순위 → 문서 위치 순
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[1]))
+        return candidates
+    
+    def _fit_budget(self, text: str, candidates) -> Tuple[List[Tuple[int, int]], List[str], bool]:
+        """우선순위 순으로 아직 포함되지 않은 부분만 예산 내에서 추가 → (병합된 구간, 섹션 이름, 잘림 여부)"""
+        remaining = self.token_budget
+        covered: List[Tuple[int, int]] = []
+        labels: List[str] = []
+        truncated = False
+        
+        for _, start, end, label in candidates:
+            pieces = self._uncovered(covered, start, end)
+            if not pieces and label not in labels:
+                # 이미 포함된 구간 안에 있는 섹션
+                labels.append(label)
+            for piece_start, piece_end in pieces:
+                if remaining <= 0:
+                    truncated = True
+                    break
+                tokens = self.token_counter(text[piece_start:piece_end])
+                if tokens > remaining:
+                    # 남은 예산 비율만큼 앞부분만 포함
+                    piece_end = piece_start + int((piece_end - piece_start) * remaining / tokens)
+                    truncated = True
+                    if piece_end <= piece_start:
+                        remaining = 0
+                        break
+                    tokens = remaining
+                covered.append((piece_start, piece_end))
+                remaining -= tokens
+                if label not in labels:
+                    labels.append(label)
+        
+        return self._merge(covered), labels, truncated
+    
+    @staticmethod
+    def _uncovered(covered: List[Tuple[int, int]], start: int, end: int) -> List[Tuple[int, int]]:
+        """[start, end) 중 이미 포함된 구간을 제외한 부분"""
+        pieces = [(start, end)]
+        for covered_start, covered_end in covered:
+            next_pieces = []
+            for piece_start, piece_end in pieces:
+                if covered_end <= piece_start or covered_start >= piece_end:
+                    next_pieces.append((piece_start, piece_end))
+                    continue
+                if piece_start < covered_start:
+                    next_pieces.append((piece_start, covered_start))
+                if covered_end < piece_end:
+                    next_pieces.append((covered_end, piece_end))
+            pieces = next_pieces
+        return pieces
+    
+    @staticmethod
+    def _merge(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """인접/겹치는 구간 병합 (문서 순서)"""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(spans):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
\ No newline at end of file
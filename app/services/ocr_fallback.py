@@ -0,0 +1,289 @@
+"""
+스캔 PDF OCR 폴백
+텍스트 레이어가 없거나 깨진 페이지만 골라 래스터화 후 Tesseract로 OCR
+- 페이지 지문(콘텐츠 스트림 + 이미지 XObject 해시) 기준 디스크 캐시로 같은 페이지 재처리 방지
+- 페이지 단위 작업을 공유 프로세스 풀에 분산하여 스캔 문서 하나가 배치를 직렬화하지 않도록 처리
+- 페이지별 래스터화/OCR 소요 시간 보고
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import PyPDF2
+
+from app.core.config import settings
+from app.services.pdf_backends import PDFSource, describe_pdf_source, open_pdf_source
+
+try:
+    from pdf2image import convert_from_bytes, convert_from_path
+except ImportError:  # OCR 폴백은 pdf2image(poppler) 설치 시에만 사용 가능
+    convert_from_bytes = convert_from_path = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 버전 (지문 계산 방식 변경 시 증가)
+OCR_CACHE_VERSION = 1
+
+# 의미 있는 문자 (한글, 영문, 숫자)
+MEANINGFUL_CHAR_PATTERN = re.compile(r'[가-힣A-Za-z0-9]')
+
+# 공백 외 문자 중 의미 있는 문자 비율이 이보다 낮으면 깨진 텍스트 레이어로 판단
+MIN_MEANINGFUL_RATIO = 0.3
+
+
+def is_low_text_page(text: str, min_chars: Optional[int] = None) -> bool:
+    """텍스트 레이어가 비었거나 깨진 페이지인지 판단 (스캔 페이지 추정)"""
+    if min_chars is None:
+        min_chars = settings.OCR_MIN_PAGE_CHARS
+    
+    meaningful = len(MEANINGFUL_CHAR_PATTERN.findall(text))
+    if meaningful < min_chars:
+        return True
+    
+    visible = sum(1 for char in text if not char.isspace())
+    return visible > 0 and meaningful / visible < MIN_MEANINGFUL_RATIO
+
+
+def _stream_bytes(stream) -> bytes:
+    try:
+        return stream.get_data()
+    except Exception:
+        # 디코딩할 수 없는 필터(JBIG2 등)는 인코딩된 원본 바이트로 대체
+        return getattr(stream, '_data', b'') or b''
+
+
+def _update_with_resources(digest, resources, depth: int = 0):
+    """페이지 리소스의 이미지/폼 XObject 내용을 지문에 반영"""
+    if resources is None or depth > 2:
+        return
+    xobjects = resources.get_object().get('/XObject')
+    if xobjects is None:
+        return
+    xobjects = xobjects.get_object()
+    for name in sorted(xobjects.keys()):
+        xobject = xobjects[name].get_object()
+        digest.update(name.encode('utf-8'))
+        digest.update(_stream_bytes(xobject))
+        if xobject.get('/Subtype') == '/Form':
+            _update_with_resources(digest, xobject.get('/Resources'), depth + 1)
+
+
+def page_fingerprint(page, dpi: int, lang: str) -> str:
+    """페이지 내용 + OCR 설정 기준 캐시 키 (파일명/페이지 번호와 무관)"""
+    digest = hashlib.sha256()
+    digest.update(f"{OCR_CACHE_VERSION}:{dpi}:{lang}:{page.get('/Rotate', 0)}:{list(page.mediabox)}".encode('utf-8'))
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(_stream_bytes(contents))
+    _update_with_resources(digest, page.get('/Resources'))
+    return digest.hexdigest()
+
+
+def _init_ocr_worker():
+    """OCR 워커 초기화 (프로세스 단위 병렬이므로 Tesseract 내부 스레드는 1개로 제한)"""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _ocr_page(pdf_path: PDFSource, page_number: int, dpi: int, lang: str) -> Tuple[str, float, float]:
+    """단일 페이지 래스터화 + OCR → (텍스트, 래스터화 ms, OCR ms)"""
+    start = time.perf_counter()
+    convert = convert_from_bytes if isinstance(pdf_path, bytes) else convert_from_path
+    images = convert(pdf_path, dpi=dpi, first_page=page_number + 1, last_page=page_number + 1)
+    rasterized = time.perf_counter()
+    text = pytesseract.image_to_string(images[0], lang=lang) if images else ''
+    finished = time.perf_counter()
+    return text, (rasterized - start) * 1000, (finished - rasterized) * 1000
+
+
+# OCR용 프로세스 풀 (첫 사용 시 생성, 프로세스 내 모든 문서가 공유)
+_ocr_pool: Optional[ProcessPoolExecutor] = None
+_ocr_pool_workers = 0
+_ocr_pool_lock = threading.Lock()
+
+def _get_ocr_pool(workers: int) -> ProcessPoolExecutor:
+    global _ocr_pool, _ocr_pool_workers
+    with _ocr_pool_lock:
+        if _ocr_pool is None or _ocr_pool_workers != workers:
+            if _ocr_pool is not None:
+                _ocr_pool.shutdown(wait=False)
+            _ocr_pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker)
+            _ocr_pool_workers = workers
+        return _ocr_pool
+
+
+def shutdown_ocr_pool(wait: bool = True):
+    """OCR 풀 종료 (다음 호출 시 재생성)"""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=wait, cancel_futures=True)
+            _ocr_pool = None
+
+
+class OCRFallback:
+    """저텍스트 페이지 OCR 폴백"""
+    
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        min_chars: Optional[int] = None,
+        workers: Optional[int] = None,
+        dpi: Optional[int] = None,
+        lang: Optional[str] = None,
+        cache_dir: Optional[str] = None
+    ):
+        self.enabled = settings.OCR_ENABLED if enabled is None else enabled
+        self.min_chars = settings.OCR_MIN_PAGE_CHARS if min_chars is None else min_chars
+        workers = settings.OCR_WORKERS if workers is None else workers
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.dpi = dpi or settings.OCR_DPI
+        self.lang = lang or settings.OCR_LANG
+        self.cache_dir = Path(cache_dir or settings.OCR_CACHE_DIR)
+        self._warned_unavailable = False
+    
+    @staticmethod
+    def available() -> bool:
+        """pdf2image/pytesseract 및 poppler/tesseract 실행 파일 설치 여부"""
+        if convert_from_path is None or pytesseract is None:
+            return False
+        return shutil.which('pdftoppm') is not None and shutil.which(pytesseract.pytesseract.tesseract_cmd) is not None
+    
+    def _cache_path(self, fingerprint: str) -> Path:
+        return self.cache_dir / fingerprint[:2] / f"{fingerprint}.txt"
+    
+    def _load_cached(self, fingerprint: str) -> Optional[str]:
+        try:
+            return self._cache_path(fingerprint).read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def _save_cached(self, fingerprint: str, text: str):
+        cache_path = self._cache_path(fingerprint)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(text, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"OCR 캐시 저장 실패: {cache_path} - {e}")
+    
+    def apply(
+        self,
+        pdf_path: PDFSource,
+        page_texts: List[str],
+        name: Optional[str] = None
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """저텍스트 페이지를 OCR 결과로 교체 → (페이지 텍스트 목록, 페이지별 OCR 보고)
+
+        pdf_path는 경로 또는 PDF 바이트, name은 로그용 파일명 (미지정 시 경로의 파일명)
+        보고 항목: page(0부터), source(cache/ocr/error), rasterize_ms, ocr_ms, chars, error
+        """
+        if not self.enabled:
+            return page_texts, []
+        
+        low_pages = [i for i, text in enumerate(page_texts) if is_low_text_page(text, self.min_chars)]
+        if not low_pages:
+            return page_texts, []
+        
+        if not self.available():
+            if not self._warned_unavailable:
+                logger.warning("저텍스트 페이지가 있으나 OCR 의존성(pdf2image/poppler, pytesseract/tesseract)이 없어 OCR 생략")
+                self._warned_unavailable = True
+            return page_texts, []
+        
+        name = name or (os.path.basename(pdf_path) if isinstance(pdf_path, str) else '메모리 PDF')
+        page_texts = list(page_texts)
+        reports = []
+        pending: Dict[str, List[int]] = {}
+        
+        # 캐시 조회 (페이지 지문 기준, 같은 문서 내 동일 페이지는 1회만 OCR)
+        reader = PyPDF2.PdfReader(open_pdf_source(pdf_path))
+        for page_number in low_pages:
+            fingerprint = page_fingerprint(reader.pages[page_number], self.dpi, self.lang)
+            cached = self._load_cached(fingerprint)
+            if cached is not None:
+                page_texts[page_number] = cached
+                reports.append({'page': page_number, 'source': 'cache', 'rasterize_ms': 0.0, 'ocr_ms': 0.0, 'chars': len(cached)})
+            else:
+                pending.setdefault(fingerprint, []).append(page_number)
+        
+        # 캐시에 없는 페이지만 OCR (워커 1개면 현재 프로세스에서 순차 처리)
+        if pending:
+            ocr_pages = [page_numbers[0] for page_numbers in pending.values()]
+            if self.workers <= 1:
+                results = {page_number: self._run_serial(pdf_path, page_number) for page_number in ocr_pages}
+            else:
+                results = self._run_parallel(pdf_path, ocr_pages)
+            
+            for fingerprint, page_numbers in pending.items():
+                text, rasterize_ms, ocr_ms, error = results[page_numbers[0]]
+                if error:
+                    logger.warning(f"페이지 OCR 실패: {name} p{page_numbers[0] + 1} - {error}")
+                else:
+                    self._save_cached(fingerprint, text)
+                
+                for page_number in page_numbers:
+                    report = {
+                        'page': page_number,
+                        'source': 'error' if error else 'ocr',
+                        'rasterize_ms': round(rasterize_ms, 1),
+                        'ocr_ms': round(ocr_ms, 1),
+                        'chars': len(text)
+                    }
+                    if error:
+                        report['error'] = error
+                    else:
+                        page_texts[page_number] = text
+                    reports.append(report)
+        
+        reports.sort(key=lambda report: report['page'])
+        for report in reports:
+            logger.info(
+                f"OCR {name} p{report['page'] + 1}: {report['source']} "
+                f"(래스터화 {report['rasterize_ms']}ms, OCR {report['ocr_ms']}ms, {report['chars']}자)"
+            )
+        return page_texts, reports
+    
+    def _run_serial(self, pdf_path: PDFSource, page_number: int) -> Tuple[str, float, float, Optional[str]]:
+        try:
+            return (*_ocr_page(pdf_path, page_number, self.dpi, self.lang), None)
+        except Exception as e:
+            return '', 0.0, 0.0, str(e)
+    
+    def _run_parallel(self, pdf_path: PDFSource, page_numbers: List[int]) -> Dict[int, Tuple[str, float, float, Optional[str]]]:
+        """페이지별 작업을 공유 풀에 제출 (다른 문서의 OCR 작업과 같은 풀에서 섞여 실행)"""
+        results = {}
+        try:
+            pool = _get_ocr_pool(self.workers)
+            futures = {
+                page_number: pool.submit(_ocr_page, pdf_path, page_number, self.dpi, self.lang)
+                for page_number in page_numbers
+            }
+        except Exception as e:
+            logger.warning(f"OCR 풀 제출 실패, 순차 처리로 대체: {describe_pdf_source(pdf_path)} - {e}")
+            shutdown_ocr_pool(wait=False)
+            return {page_number: self._run_serial(pdf_path, page_number) for page_number in page_numbers}
+        
+        for page_number, future in futures.items():
+            try:
+                results[page_number] = (*future.result(), None)
+            except BrokenProcessPool as e:
+                # 워커 비정상 종료 시 풀 폐기 (다음 호출 시 재생성)
+                shutdown_ocr_pool(wait=False)
+                results[page_number] = ('', 0.0, 0.0, str(e) or 'OCR 워커 비정상 종료')
+            except Exception as e:
+                results[page_number] = ('', 0.0, 0.0, str(e))
+        return results
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+PDF 텍스트 추출 백엔드
+페이지 단위 텍스트 추출을 백엔드 인터페이스로 분리하고, 문서 내 페이지를 병렬 추출
+- pypdf2 (기본), pdfminer (pdfminer.six), pypdfium2 백엔드 (설치된 경우만 사용 가능)
+- 페이지 수가 기준 이상이면 연속 페이지 구간을 프로세스 풀에 나눠 추출 (각 워커가 문서를 직접 열음)
+- 자동 설정 시 풀 크기는 작게 제한하고, 이미 워커 프로세스(Celery, extract_many 등) 안이면 순차 추출
+- 병렬 추출 실패 시 순차 추출로 폴백
+- 입력은 파일 경로 또는 PDF 바이트 (ZIP에서 바로 읽은 문서를 디스크에 풀지 않고 추출)
+"""
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Type, Union
+
+import PyPDF2
+
+from app.core.config import settings
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+    from pdfminer.pdfpage import PDFPage
+except ImportError:  # pdfminer 백엔드는 pdfminer.six 설치 시에만 사용 가능
+    pdfminer_extract_text = None
+    PDFPage = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# PDF 입력 (파일 경로 또는 PDF 바이트)
+PDFSource = Union[str, bytes]
+
+
+def open_pdf_source(pdf_path: PDFSource):
+    """경로는 그대로, 바이트는 파일 객체로 (PDF 라이브러리 입력용)"""
+    return io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else pdf_path
+
+
+def describe_pdf_source(pdf_path: PDFSource) -> str:
+    """로그용 입력 설명"""
+    return f"<메모리 PDF {len(pdf_path)}바이트>" if isinstance(pdf_path, bytes) else pdf_path
+
+
+class PDFTextBackend:
+    """PDF 텍스트 추출 백엔드 인터페이스"""
+    
+    name = ''
+    
+    @classmethod
+    def available(cls) -> bool:
+        """백엔드 라이브러리 설치 여부"""
+        return True
+    
+    def page_count(self, pdf_path: PDFSource) -> int:
+        raise NotImplementedError
+    
+    def extract_pages(self, pdf_path: PDFSource, page_numbers: Sequence[int]) -> List[str]:
+        """지정한 페이지(0부터)의 텍스트를 순서대로 반환 (pdf_path는 경로 또는 PDF 바이트)"""
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PDFTextBackend):
+    """PyPDF2 백엔드 (순수 Python)"""
+    
+    name = 'pypdf2'
+    
+    def page_count(self, pdf_path: PDFSource) -> int:
+        return len(PyPDF2.PdfReader(open_pdf_source(pdf_path)).pages)
+    
+    def extract_pages(self, pdf_path: PDFSource, page_numbers: Sequence[int]) -> List[str]:
+        reader = PyPDF2.PdfReader(open_pdf_source(pdf_path))
+        return [reader.pages[page_number].extract_text() or '' for page_number in page_numbers]
+
+
+class PdfMinerBackend(PDFTextBackend):
+    """pdfminer.six 백엔드 (레이아웃 분석 기반)"""
+    
+    name = 'pdfminer'
+    
+    @classmethod
+    def available(cls) -> bool:
+        return pdfminer_extract_text is not None
+    
+    def page_count(self, pdf_path: PDFSource) -> int:
+        if isinstance(pdf_path, bytes):
+            return sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf_path)))
+        with open(pdf_path, 'rb') as f:
+            return sum(1 for _ in PDFPage.get_pages(f))
+    
+    def extract_pages(self, pdf_path: PDFSource, page_numbers: Sequence[int]) -> List[str]:
+        texts = []
+        for page_number in page_numbers:
+            # 페이지 끝의 폼피드 문자 제거
+            texts.append(pdfminer_extract_text(open_pdf_source(pdf_path), page_numbers=[page_number]).rstrip('\x0c'))
+        return texts
+
+
+class PdfiumBackend(PDFTextBackend):
+    """pypdfium2 백엔드 (PDFium 네이티브)"""
+    
+    name = 'pypdfium2'
+    
+    @classmethod
+    def available(cls) -> bool:
+        return pdfium is not None
+    
+    def page_count(self, pdf_path: PDFSource) -> int:
+        # PdfDocument는 경로와 바이트를 모두 받음
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    
+    def extract_pages(self, pdf_path: PDFSource, page_numbers: Sequence[int]) -> List[str]:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            texts = []
+            for page_number in page_numbers:
+                page = pdf[page_number]
+                text_page = page.get_textpage()
+                texts.append(text_page.get_text_range())
+                text_page.close()
+                page.close()
+            return texts
+        finally:
+            pdf.close()
+
+
+# 백엔드 레지스트리 (이름 → 클래스)
+PDF_BACKENDS: Dict[str, Type[PDFTextBackend]] = {
+    PyPDF2Backend.name: PyPDF2Backend,
+    PdfMinerBackend.name: PdfMinerBackend,
+    PdfiumBackend.name: PdfiumBackend,
+}
+
+_backend_instances: Dict[str, PDFTextBackend] = {}
+
+
+def register_backend(backend_class: Type[PDFTextBackend]):
+    """추출 백엔드 등록 (같은 이름은 교체)"""
+    PDF_BACKENDS[backend_class.name] = backend_class
+    _backend_instances.pop(backend_class.name, None)
+
+
+def available_backends() -> List[str]:
+    """설치되어 사용 가능한 백엔드 이름 목록"""
+    return [name for name, backend_class in PDF_BACKENDS.items() if backend_class.available()]
+
+
+def get_pdf_backend(name: Optional[str] = None) -> PDFTextBackend:
+    """백엔드 인스턴스 반환 (미지정 시 PDF_TEXT_BACKEND, 사용 불가 시 pypdf2로 폴백)"""
+    name = (name or settings.PDF_TEXT_BACKEND).lower()
+    
+    backend_class = PDF_BACKENDS.get(name)
+    if backend_class is None or not backend_class.available():
+        logger.warning(f"PDF 백엔드 '{name}' 사용 불가, pypdf2로 대체")
+        name = PyPDF2Backend.name
+        backend_class = PyPDF2Backend
+    
+    if name not in _backend_instances:
+        _backend_instances[name] = backend_class()
+    return _backend_instances[name]
+
+
+def _extract_page_range(backend_name: str, pdf_path: PDFSource, start: int, end: int) -> List[str]:
+    """워커 프로세스에서 페이지 구간 추출"""
+    return get_pdf_backend(backend_name).extract_pages(pdf_path, range(start, end))
+
+
+# 자동 설정(PDF_PAGE_WORKERS=0) 시 페이지 병렬 워커 수 상한
+DEFAULT_PAGE_WORKERS = 4
+
+# 작업 워커 프로세스 표시 (Celery 워커 등 프로세스 풀 자식으로 감지되지 않는 워커용)
+_worker_process = False
+
+def mark_worker_process():
+    """현재 프로세스를 작업 워커로 표시 (자동 설정 시 페이지 병렬 추출 풀을 만들지 않음)"""
+    global _worker_process
+    _worker_process = True
+
+
+def in_worker_process() -> bool:
+    """이미 병렬 작업 워커 안에서 실행 중인지 (표시된 워커 또는 multiprocessing 자식 프로세스)"""
+    return _worker_process or multiprocessing.parent_process() is not None
+
+
+# 페이지 병렬 추출용 프로세스 풀 (첫 사용 시 생성, 프로세스 내 공유)
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != workers:
+            if _page_pool is not None:
+                _page_pool.shutdown(wait=False)
+            _page_pool = ProcessPoolExecutor(max_workers=workers)
+            _page_pool_workers = workers
+        return _page_pool
+
+
+def shutdown_page_pool(wait: bool = True):
+    """페이지 병렬 추출 풀 종료 (다음 호출 시 재생성)"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is not None:
+            _page_pool.shutdown(wait=wait, cancel_futures=True)
+            _page_pool = None
+
+
+def resolve_page_workers(workers: Optional[int] = None) -> int:
+    """페이지 병렬 워커 수 (0이면 워커 프로세스 안에서는 1, 그 외 CPU 수와 DEFAULT_PAGE_WORKERS 중 작은 값)"""
+    if workers is None:
+        workers = settings.PDF_PAGE_WORKERS
+    if workers > 0:
+        return workers
+    if in_worker_process():
+        return 1
+    return min(os.cpu_count() or 1, DEFAULT_PAGE_WORKERS)
+
+
+def extract_pdf_pages(
+    pdf_path: PDFSource,
+    backend: Optional[PDFTextBackend] = None,
+    workers: Optional[int] = None,
+    min_parallel_pages: Optional[int] = None
+) -> List[str]:
+    """PDF 전체 페이지 텍스트 (페이지 수가 기준 이상이면 프로세스 풀로 병렬 추출)
+
+    pdf_path가 바이트면 각 워커에 문서 바이트를 전달합니다.
+    """
+    backend = backend or get_pdf_backend()
+    workers = resolve_page_workers(workers)
+    if min_parallel_pages is None:
+        min_parallel_pages = settings.PDF_PARALLEL_MIN_PAGES
+    
+    page_count = backend.page_count(pdf_path)
+    workers = min(workers, page_count)
+    
+    if workers <= 1 or page_count < min_parallel_pages:
+        return backend.extract_pages(pdf_path, range(page_count))
+    
+    # 연속 페이지 구간으로 분할 (워커당 1구간)
+    chunk = -(-page_count // workers)
+    bounds = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    
+    try:
+        pool = _get_page_pool(workers)
+        chunks = pool.map(
+            _extract_page_range,
+            [backend.name] * len(bounds),
+            [pdf_path] * len(bounds),
+            [start for start, _ in bounds],
+            [end for _, end in bounds]
+        )
+        return [text for chunk_texts in chunks for text in chunk_texts]
+    except Exception as e:
+        logger.warning(f"페이지 병렬 추출 실패, 순차 추출로 대체: {describe_pdf_source(pdf_path)} - {e}")
+        shutdown_page_pool(wait=False)
+        return backend.extract_pages(pdf_path, range(page_count))
\ No newline at end of file
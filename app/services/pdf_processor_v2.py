@@ -3,8 +3,11 @@ PDF 처리 서비스 V2
 Gemini Structured Output을 활용한 새로운 파이프라인
 """
 import os
+import json
+import asyncio
+import itertools
 import logging
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Iterable, Optional, List
 from datetime import datetime, date
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
@@ -12,6 +15,9 @@ from sqlalchemy.orm import sessionmaker
 
 from app.services.preprocessing import PDFPreprocessor
 from app.services.gemini_structured_service import GeminiStructuredService
+from app.services.hybrid_router import HybridExtractionRouter
+from app.services.llm_context_builder import LLMContextBuilder
+from app.services import ingest_events
 from app.models.pydantic_models import Decision, Action, ActionLawMap
 from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2, ActionLawMapV2, Base
 from app.core.config import settings
@@ -36,66 +42,130 @@ class PDFProcessorV2:
         # 서비스 초기화
         self.preprocessor = PDFPreprocessor()
         self.gemini_service = GeminiStructuredService()
+        self.context_builder = LLMContextBuilder(preprocessor=self.preprocessor)
+        self.router = HybridExtractionRouter()
         
         # 디렉토리 설정
         self.processed_pdf_dir = settings.PROCESSED_PDF_DIR or "data/processed_pdf"
         
-    async def process_single_pdf(self, pdf_path: str) -> Dict[str, Any]:
-        """단일 PDF 파일을 처리합니다."""
-        session = self.SessionLocal()
+    async def process_single_pdf(self, pdf_path: str, data: Optional[bytes] = None) -> Dict[str, Any]:
+        """단일 PDF 파일을 처리합니다.
         
+        data가 있으면 디스크 대신 메모리의 PDF 바이트를 전처리합니다. (pdf_path는 보관 경로/원본 파일명)
+        """
         try:
             logger.info(f"PDF 처리 시작 (V2): {pdf_path}")
             
-            # 1단계: 전처리
+            # 1단계: 전처리 (텍스트 추출/OCR 대기는 블로킹이므로 스레드에서 실행해 이벤트 루프를 막지 않음)
             logger.info("1단계: PDF 전처리")
-            preprocessed_data = self.preprocessor.preprocess_pdf(pdf_path)
-            
-            # 2단계: Structured Output 추출
-            logger.info("2단계: Gemini Structured Output 추출")
-            decision_data = await self.gemini_service.extract_with_retry(
-                preprocessed_data['markdown_text'],
-                preprocessed_data['metadata']
-            )
-            
-            if not decision_data:
-                raise Exception("데이터 추출 실패")
-            
-            # 3단계: 데이터베이스 저장
-            logger.info("3단계: 데이터베이스 저장")
-            db_result = await self._save_to_database(session, decision_data, pdf_path)
-            
-            # 4단계: 실제 날짜 추출 (의결*.pdf에서)
-            if db_result.get('decision'):
-                await self._update_decision_date(session, db_result['decision'])
-            
-            session.commit()
+            preprocessed_data = await asyncio.to_thread(self.preprocessor.preprocess_pdf, pdf_path, data)
+            
+            # 2단계: 데이터 추출 (Rule-based 우선, 완전성이 임계값 미만일 때만 Gemini로 누락 필드 보완)
+            llm_context = None
+            
+            async def llm_extract():
+                nonlocal llm_context
+                logger.info("2단계: Gemini Structured Output 추출")
+                decision, llm_context = await self._extract_with_llm(preprocessed_data, pdf_path)
+                return decision
+            
+            if settings.HYBRID_ROUTING_ENABLED:
+                logger.info("2단계: Rule-based 추출 및 완전성 평가")
+                decision_data, routing = await self.router.route(
+                    preprocessed_data['raw_text'],
+                    preprocessed_data['metadata'],
+                    llm_extract,
+                    os.path.basename(pdf_path)
+                )
+            else:
+                decision_data = await llm_extract()
+                if not decision_data:
+                    raise Exception("데이터 추출 실패")
+                routing = {'route': 'llm_only', 'score': 0.0, 'missing': [], 'llm_called': True}
+            
+            # 3~4단계: 데이터베이스 저장 및 실제 날짜 추출
+            db_result = await self.persist_decision(decision_data, pdf_path, routing['route'])
             
             return {
                 'success': True,
                 'pdf_path': pdf_path,
                 'decision_data': decision_data.model_dump(),
                 'db_result': db_result,
+                'llm_context': llm_context,
+                'routing': routing,
                 'processing_mode': 'structured_output'
             }
-            
+        
         except Exception as e:
             logger.error(f"PDF 처리 실패 (V2): {pdf_path} - {str(e)}")
-            session.rollback()
             return {
                 'success': False,
                 'pdf_path': pdf_path,
                 'error': str(e),
                 'processing_mode': 'structured_output'
             }
+    
+    async def persist_decision(
+        self,
+        decision_data: Decision,
+        pdf_path: str,
+        extraction_route: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """추출 결과를 저장하고 실제 날짜를 갱신한 뒤 커밋합니다. (신규 저장 시 DECISION_INGESTED 발행)"""
+        session = self.SessionLocal()
+        
+        try:
+            # 3단계: 데이터베이스 저장
+            logger.info("3단계: 데이터베이스 저장")
+            db_result = await self._save_to_database(session, decision_data, pdf_path, extraction_route)
+            
+            # 4단계: 실제 날짜 추출 (의결*.pdf에서)
+            if db_result.get('decision'):
+                await self._update_decision_date(session, db_result['decision'])
+            
+            session.commit()
+            
+            # 인메모리 인덱스 갱신 알림 (신규 저장 시에만)
+            if db_result.get('success'):
+                ingest_events.publish(
+                    ingest_events.DECISION_INGESTED,
+                    decision_pk=db_result['decision'].decision_pk,
+                    action_ids=db_result['actions_saved']
+                )
+            
+            return db_result
+        
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
     
+    async def _extract_with_llm(self, preprocessed_data: Dict[str, Any], pdf_path: str):
+        """Gemini 추출 (관련 섹션만 토큰 예산 내로 선별) → (Decision, 컨텍스트 보고)"""
+        llm_text = preprocessed_data['markdown_text']
+        llm_context = None
+        if settings.LLM_CONTEXT_ENABLED:
+            context = self.context_builder.build(
+                preprocessed_data['raw_text'],
+                preprocessed_data['sections'],
+                name=os.path.basename(pdf_path)
+            )
+            llm_text = context.pop('text')
+            llm_context = context
+        
+        decision = await self.gemini_service.extract_with_retry(
+            llm_text,
+            preprocessed_data['metadata']
+        )
+        return decision, llm_context
+    
     async def _save_to_database(
         self, 
         session: Session, 
         decision_data: Decision, 
-        pdf_path: str
+        pdf_path: str,
+        extraction_route: Optional[str] = None
     ) -> Dict[str, Any]:
         """추출된 데이터를 데이터베이스에 저장합니다."""
         try:
@@ -130,7 +200,8 @@ class PDFProcessorV2:
                 source_file=os.path.basename(pdf_path),
                 extra_metadata={
                     'extracted_at': datetime.now().isoformat(),
-                    'extractor_version': 'v2_structured_output'
+                    'extractor_version': 'v2_structured_output',
+                    'extraction_route': extraction_route
                 }
             )
             
@@ -389,37 +460,121 @@ class PDFProcessorV2:
         except Exception as e:
             logger.error(f"날짜 업데이트 실패: {e}")
     
+    @staticmethod
+    def summarize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """process_single_pdf 결과 → 배치 요약 (원문 full_text, ORM 객체 제외)"""
+        decision_data = result.get('decision_data') or {}
+        db_result = result.get('db_result') or {}
+        return {
+            'success': result['success'],
+            'pdf_path': result['pdf_path'],
+            'error': result.get('error'),
+            'decision_year': decision_data.get('decision_year'),
+            'decision_id': decision_data.get('decision_id'),
+            'saved': bool(db_result.get('success')),  # False면 이미 저장된 의결서
+            'actions_saved': db_result.get('actions_saved', []),
+            'routing': result.get('routing')
+        }
+    
+    @staticmethod
+    def _report_record(result: Dict[str, Any]) -> Dict[str, Any]:
+        """보고서에 기록할 상세 결과 (세션이 닫힌 ORM 객체 제외)"""
+        db_result = result.get('db_result')
+        if not db_result:
+            return result
+        return {**result, 'db_result': {k: v for k, v in db_result.items() if k != 'decision'}}
+    
+    @staticmethod
+    def default_report_path() -> str:
+        return os.path.join(settings.BATCH_REPORT_DIR, f"batch_{datetime.now():%Y%m%d_%H%M%S_%f}.jsonl")
+    
+    async def iter_batch(
+        self,
+        pdf_files: Iterable[str],
+        report_path: Optional[str] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """PDF 파일들을 처리하며 완료 순서대로 파일별 요약을 생성합니다.
+
+        상세 결과(추출 데이터 전체, LLM 컨텍스트)는 report_path(JSONL)에 한 줄씩 기록하고 메모리에 남기지 않습니다.
+        report_path 미지정 시 BATCH_REPORT_DIR/batch_<시각>.jsonl (이어서 기록)
+        동시에 처리 중인 문서는 최대 concurrency(기본 BATCH_CONCURRENCY)개이며, 실제 Gemini 동시 호출 수는 AIMD 한도가 조절합니다.
+        """
+        if report_path is None:
+            report_path = self.default_report_path()
+        os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+        concurrency = max(1, concurrency or settings.BATCH_CONCURRENCY)
+        
+        files = iter(pdf_files)
+        pending = set()
+        with open(report_path, 'a', encoding='utf-8') as report:
+            try:
+                while True:
+                    for pdf_file in itertools.islice(files, concurrency - len(pending)):
+                        pending.add(asyncio.ensure_future(self.process_single_pdf(pdf_file)))
+                    if not pending:
+                        break
+                    
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = list(done)
+                    while done:
+                        result = done.pop().result()
+                        report.write(json.dumps(self._report_record(result), ensure_ascii=False, default=str) + '\n')
+                        report.flush()
+                        summary = self.summarize_result(result)
+                        del result  # 소비자가 다음 파일을 요청할 때까지 원문을 붙잡지 않음
+                        yield summary
+            finally:
+                for task in pending:
+                    task.cancel()
+    
     async def process_batch(
         self, 
         pdf_files: List[str], 
-        batch_size: int = 10
+        batch_size: int = 10,
+        report_path: Optional[str] = None,
+        concurrency: Optional[int] = None
     ) -> Dict[str, Any]:
-        """배치로 PDF 파일들을 처리합니다."""
+        """배치로 PDF 파일들을 처리합니다.
+
+        success/failed에는 파일별 요약(summarize_result)만 담고, 상세 결과는 report_path(JSONL)에 기록합니다.
+        """
+        if report_path is None:
+            report_path = self.default_report_path()
         results = {
             'success': [],
             'failed': [],
             'total': len(pdf_files),
-            'processed': 0
+            'processed': 0,
+            'report_path': report_path
         }
+        routing_stats = None
         
-        for i in range(0, len(pdf_files), batch_size):
-            batch = pdf_files[i:i + batch_size]
-            logger.info(f"배치 처리: {i+1}-{min(i+batch_size, len(pdf_files))}/{len(pdf_files)}")
-            
-            for pdf_file in batch:
-                result = await self.process_single_pdf(pdf_file)
+        async for summary in self.iter_batch(pdf_files, report_path, concurrency):
+            if results['processed'] % batch_size == 0:
+                start = results['processed']
+                logger.info(f"배치 처리: {start+1}-{min(start+batch_size, len(pdf_files))}/{len(pdf_files)}")
+            
+            if summary['success']:
+                results['success'].append(summary)
+            else:
+                results['failed'].append(summary)
                 
-                if result['success']:
-                    results['success'].append(result)
-                else:
-                    results['failed'].append(result)
+            results['processed'] += 1
+            routing = summary['routing'] or {'route': 'llm_only', 'score': 0.0, 'missing': [], 'llm_called': True}
+            routing_stats = HybridExtractionRouter.summarize([routing], routing_stats)
                 
-                results['processed'] += 1
+            # 진행상황 로그
+            if results['processed'] % 10 == 0:
+                logger.info(f"진행률: {results['processed']}/{results['total']} "
+                          f"(성공: {len(results['success'])}, 실패: {len(results['failed'])})")
                 
-                # 진행상황 로그
-                if results['processed'] % 10 == 0:
-                    logger.info(f"진행률: {results['processed']}/{results['total']} "
-                              f"(성공: {len(results['success'])}, 실패: {len(results['failed'])})")
+        # 배치 라우팅 통계 (LLM 호출 절감 건수)
+        results['routing'] = routing_stats or HybridExtractionRouter.summarize([])
+        logger.info(f"LLM 호출 절감: {results['routing']['llm_calls_avoided']}/{results['routing']['documents']}건 "
+                    f"(Rule-based 단독 {results['routing']['rule_only']}, LLM 보완 {results['routing']['llm_fill']}, "
+                    f"LLM 단독 {results['routing']['llm_only']})")
+        logger.info(f"상세 결과 보고서: {report_path}")
         
         return results
     
@@ -453,6 +608,9 @@ class PDFProcessorV2:
             
             stats['by_category'] = {cat: count for cat, count in category_stats if cat}
             
+            # 하이브리드 라우팅 누적 통계 (현재 프로세스)
+            stats['routing'] = self.router.stats
+            
             return stats
             
         finally:
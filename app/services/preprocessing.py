@@ -1,29 +1,38 @@
 """
 PDF 전처리 모듈
 PDF 파일에서 Gemini가 잘 이해할 수 있는 고품질 텍스트를 추출하고 정제
+- 파일 대신 PDF 바이트(data)를 받으면 디스크를 읽지 않고 메모리에서 추출
 """
 import re
 import logging
 from typing import Optional, List, Tuple
-import PyPDF2
 import os
 
+from app.services.ocr_fallback import OCRFallback
+from app.services.pdf_backends import extract_pdf_pages, get_pdf_backend
+from app.services.text_normalizer import TextNormalizer
+
 logger = logging.getLogger(__name__)
 
 
 class PDFPreprocessor:
     """PDF 전처리 서비스"""
     
-    def __init__(self):
-        # 제거할 패턴들
-        self.header_patterns = [
-            r'금융위원회\s*\d{4}-\d+호',
-            r'의\s*결\s*서',
-            r'금\s*융\s*위\s*원\s*회',
-            r'Financial Services Commission',
-            r'페이지\s*\d+\s*/\s*\d+',
-            r'- \d+ -',
-        ]
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        page_workers: Optional[int] = None,
+        ocr_workers: Optional[int] = None
+    ):
+        # 텍스트 추출 백엔드 (미지정 시 PDF_TEXT_BACKEND) 및 페이지 병렬 워커 수 (미지정 시 PDF_PAGE_WORKERS)
+        self.backend = get_pdf_backend(backend)
+        self.page_workers = page_workers
+        
+        # 스캔 페이지 OCR 폴백 (OCR 워커 수 미지정 시 OCR_WORKERS)
+        self.ocr = OCRFallback(workers=ocr_workers)
+        
+        # 머리글/바닥글 제거 및 텍스트 정제 (결합 정규식 단일 패스)
+        self.normalizer = TextNormalizer()
         
         # 테이블 감지 패턴
         self.table_patterns = [
@@ -32,37 +41,36 @@ class PDFPreprocessor:
             r'(?:구분|항목|내용|조치|대상)\s*(?:\||:)',  # 테이블 헤더 패턴
         ]
         
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def extract_text_from_pdf(self, pdf_path: str, data: Optional[bytes] = None) -> str:
         """PDF 파일에서 텍스트를 추출합니다."""
+        text, _ = self.extract_text_with_ocr_report(pdf_path, data)
+        return text
+    
+    def extract_text_with_ocr_report(self, pdf_path: str, data: Optional[bytes] = None) -> Tuple[str, List[dict]]:
+        """PDF 텍스트와 페이지별 OCR 보고(OCR 대상 페이지만)를 함께 반환
+
+        data가 있으면 pdf_path 파일 대신 해당 바이트에서 추출 (pdf_path는 파일명/로그용)
+        """
+        source = pdf_path if data is None else data
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                pages_text = []
+            # 페이지 수가 많으면 페이지 구간별 병렬 추출
+            pages = extract_pdf_pages(source, self.backend, self.page_workers)
                 
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
+            # 텍스트 레이어가 없거나 깨진 페이지만 OCR로 대체
+            pages, ocr_report = self.ocr.apply(source, pages, name=os.path.basename(pdf_path))
                     
-                    # 페이지별 텍스트 정제
-                    cleaned_text = self._clean_page_text(page_text)
-                    if cleaned_text.strip():
-                        pages_text.append(cleaned_text)
-                
-                # 전체 텍스트 결합
-                full_text = "\n\n".join(pages_text)
-                
-                # 최종 정제
-                return self._final_cleanup(full_text)
+            # 페이지별 머리글 제거 후 전체 텍스트 정제
+            return self.normalizer.normalize_pages(pages), ocr_report
                 
         except Exception as e:
             logger.error(f"PDF 텍스트 추출 실패: {pdf_path} - {str(e)}")
             raise
     
-    def preprocess_pdf(self, pdf_path: str) -> dict:
-        """PDF를 전처리하여 구조화된 텍스트 반환"""
+    def preprocess_pdf(self, pdf_path: str, data: Optional[bytes] = None) -> dict:
+        """PDF를 전처리하여 구조화된 텍스트 반환 (data가 있으면 메모리에서 추출)"""
         try:
-            # 1. 텍스트 추출
-            raw_text = self.extract_text_from_pdf(pdf_path)
+            # 1. 텍스트 추출 (스캔 페이지는 OCR)
+            raw_text, ocr_report = self.extract_text_with_ocr_report(pdf_path, data)
             
             # 2. 구조 분석
             sections = self._identify_sections(raw_text)
@@ -78,6 +86,7 @@ class PDFPreprocessor:
                 'markdown_text': markdown_text,
                 'sections': sections,
                 'metadata': metadata,
+                'ocr_pages': ocr_report,
                 'file_path': pdf_path
             }
             
@@ -85,34 +94,6 @@ class PDFPreprocessor:
             logger.error(f"PDF 전처리 실패: {pdf_path} - {str(e)}")
             raise
     
-    def _clean_page_text(self, text: str) -> str:
-        """페이지 텍스트 정제"""
-        # 머리글/바닥글 제거
-        for pattern in self.header_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # 연속된 공백 정리
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 줄바꿈 정리
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        return text.strip()
-    
-    def _final_cleanup(self, text: str) -> str:
-        """최종 텍스트 정제"""
-        # 특수문자 정리
-        text = re.sub(r'[^\w\s\d가-힣.,;:!?()[\]{}""''`~@#$%^&*+=/<>|\\-]', ' ', text)
-        
-        # 중복 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 문장 사이 공백 정리
-        text = re.sub(r'\.\s+', '. ', text)
-        text = re.sub(r',\s+', ', ', text)
-        
-        return text.strip()
-    
     def _identify_sections(self, text: str) -> List[dict]:
         """문서의 주요 섹션 식별"""
         sections = []
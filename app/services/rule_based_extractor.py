@@ -1,6 +1,8 @@
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 import sys
 import os
@@ -13,55 +15,405 @@ from utils.law_normalizer import get_law_normalizer
 logger = logging.getLogger(__name__)
 
 
+# 컴파일된 정규식 레지스트리 (모듈 로드 시 1회 컴파일, 호출 시 재컴파일/캐시 조회 없음)
+PATTERNS = {
+    # 의결 정보 패턴
+    'decision_number': re.compile(r'제(\d{4})-(\d+)호'),
+    'decision_date': re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),
+    'title_from_filename': re.compile(r'_([^_]+?)(?:\(공개용\))?\.pdf$'),
+    'entity_from_filename': re.compile(r'_([^_]+?)에 대한'),
+    
+    # 근거법규 섹션 패턴 (숫자와 한글 기호 모두 지원)
+    'law_section': re.compile(r'(?:\d+\.|[가-하]\.)\s*근거법규(.*?)(?=\d+\.|[가-하]\.|$)', re.DOTALL | re.IGNORECASE),
+    
+    # 법률명과 조항 패턴
+    'law_with_articles': re.compile(r'[｢「]([^｣」]+)[｣」]\s*([^｢「\n]+?)(?=[｢「]|$|\n\s*\n)'),
+    'law_in_section': re.compile(r'[｢「]([^｣」]+)[｣」]\s*([^｢「]*?)(?=[｢「]|$)'),
+    'article_pattern': re.compile(r'제(\d+)조(?:\s*제(\d+)항)?(?:\s*제(\d+)호)?(?:의\s*(\d+))?'),
+    'single_article': re.compile(r'제(\d+)조(?:제(\d+)항)?(?:제(\d+)호)?(?:의\s*(\d+))?'),
+    'full_article': re.compile(r'제(\d+)조(?:제(\d+)항)?(?:제(\d+)호)?'),
+    'paragraph': re.compile(r'제(\d+)항'),
+    'item': re.compile(r'제(\d+)호'),
+    'whitespace': re.compile(r'\s+'),
+    
+    # 금액 패턴
+    'amount_million': re.compile(r'(\d+(?:,\d{3})*)\s*백만원'),
+    'amount_won': re.compile(r'(\d+(?:,\d{3})*)\s*원'),
+    'revised_amounts': [
+        re.compile(r'(\d+(?:,\d{3})*)\s*백만원으로\s*상향'),
+        re.compile(r'수정의결.*?(\d+(?:,\d{3})*)\s*백만원'),
+        re.compile(r'상향.*?(\d+(?:,\d{3})*)\s*백만원'),
+        re.compile(r'수정.*?(\d+(?:,\d{3})*)\s*백만원'),
+    ],
+    'digits': re.compile(r'\d+'),
+    'number_groups': re.compile(r'[\d,]+'),
+    'million_part': re.compile(r'([\d,\.]+)\s*백만'),
+    'eok_tail': re.compile(r'([\d,]+)\s*$'),
+    'man_part': re.compile(r'([\d,]+)\s*만'),
+    
+    # 기관명 패턴
+    'entity_name': re.compile(r'([^에\s]+)(?:에\s*대한|의\s*)'),
+    'entity_label': re.compile(r'^기\s*관\s*'),
+    'position': re.compile(r'(前?\s*(?:대표이사|담당임원|이사|감사))'),
+    
+    # 조치 이유 섹션 패턴 (더 견고한 패턴)
+    'violation_section': [
+        re.compile(r'가\.([^나다라마바사아자차카타파하]*?)(?=나\.|\d+\.|$)', re.DOTALL | re.IGNORECASE),  # 가. ~ 나./숫자. 까지
+        re.compile(r'가\.([^가-하]*?)(?=[나-하]\.|\d+\.|$)', re.DOTALL | re.IGNORECASE),  # 가. ~ 다른 한글 기호까지
+        re.compile(r'가\.(.{10,}?)(?=(?:[나-하]\.|\d+\.|4\.|5\.|6\.|7\.|8\.|9\.))', re.DOTALL | re.IGNORECASE),  # 최소 10자 이상
+    ],
+    'violation_fallback': re.compile(r'가\.(.{20,})', re.DOTALL | re.IGNORECASE),
+    
+    # 조치대상자 정보 패턴
+    'target_info_section': re.compile(r'1\.\s*조치대상자의\s*인적사항(.*?)(?=2\.|$)', re.DOTALL | re.IGNORECASE),
+    'target_types': {
+        '기관': re.compile(r'기\s*관\s*([^\n]+)'),
+        '임직원': re.compile(r'임직원\s*([^\n]+)'),
+        '외부감사인': re.compile(r'외부감사인\s*([^\n]+)')
+    },
+    
+    # 복수 조치 감지 패턴
+    'sanction_table_detect': re.compile(r'제재대상[\s\S]*?제재조치[\s\S]*?(?=ㅇ|$)'),
+    'sanction_table': re.compile(r'제재대상[\s\S]*?제재조치[\s\S]*?(?=ㅇ\(금감원|$)'),
+    'table_entity_fine': re.compile(r'([\w\s\(\)㈜]+(?:前\s*\w+\s*\w+)?)\s*(?:과태료|과징금)\s*[\d,]+\s*(?:백만원|만원|억원)'),
+    'action_section_detect': re.compile(r'조치내용([\s\S]*?)(?=\s*\d+\.\s*조치이유|\s*나\.\s*근거법규|$)', re.IGNORECASE),
+    'action_section': re.compile(r'조치내용([\s\S]*?)(?=\s*\d+\.\s*조치이유|\s*가\.\s*지적사항|$)', re.IGNORECASE),
+    'bullet_item': re.compile(r'ㅇ\s*[^\n]+'),
+    'multiple_indicators': [
+        re.compile(r'다음\s*각\s*호의\s*자', re.IGNORECASE | re.DOTALL),
+        re.compile(r'아래와\s*같이\s*조치', re.IGNORECASE | re.DOTALL),
+        re.compile(r'각각\s*부과', re.IGNORECASE | re.DOTALL),
+        re.compile(r'다음과\s*같이\s*과[징태]금을\s*부과', re.IGNORECASE | re.DOTALL),
+        re.compile(r'조치대상자별\s*조치내용', re.IGNORECASE | re.DOTALL),
+        re.compile(r'주요골자.*?과[징태]금.*?계', re.IGNORECASE | re.DOTALL),  # 주요골자 테이블에 합계가 있는 경우
+    ],
+    'fine_amounts': re.compile(r'과[징태]금\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:백만)?원'),
+    'entity_with_fine': re.compile(r'(㈜\w+|前?\s*(?:대표이사|담당임원|이사|감사)\s*[★☆◇◆○●□■△▲\w]+|\w+회계법인)\s*\n?\s*-\s*과[징태]금'),
+    
+    # 복수 조치 추출 패턴
+    'action_item': re.compile(r'ㅇ\s*([^\n]+)\s*\n\s*-\s*과[징태]금\s*([\d,\.]+(?:\s*억)?(?:\s*[\d,\.]+)?\s*(?:백만|만)?)\s*원'),
+    'table_entity_fines': [
+        # 기관 + 금액 패턴 (기관 라벨 제거)
+        re.compile(r'(?:기\s*관\s*)?([\w\s]+㈜)(?:[\s\S]*?)(?:과태료|과징금)\s*([\d,]+)\s*백만원'),
+        # 임직원 + 금액 패턴
+        re.compile(r'(前\s*[\w\s]+\s*[A-Z]\d*)\s*(?:과태료|과징금)\s*([\d,]+)\s*백만원'),
+    ],
+    'summary_table': re.compile(r'주요골자.*?과[징태]금.*?\n([\s\S]*?)(?:계|합계)', re.IGNORECASE | re.DOTALL),
+    'summary_table_row': re.compile(r'([^\n│|]+?)\s*[│|]\s*([\d,]+)\s*(?:백만)?원'),
+    'company_fine': re.compile(r'(㈜\w+)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'),
+    'executive_fine': re.compile(r'(前?\s*(?:대표이사|담당임원|이사|감사)\s*[★☆◇◆○●□■△▲\w]+)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'),
+    'auditor_fine': re.compile(r'([◆◇○●□■△▲\w]+회계법인)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'),
+    
+    # 원안/수정안 표 패턴
+    'revision_table': re.compile(r'원안\s*수정안'),
+    'revision_table_amounts': [
+        # 원안 수정안 형태의 표
+        re.compile(r'원안\s*수정안[\s\S]*?과[태징]료\s*([\d,]+)\s*백만원\s*과[태징]료\s*([\d,]+)\s*백만원', re.IGNORECASE),
+        # 제재조치 표에서 수정안 열
+        re.compile(r'제재조치\s*\n\s*원안\s*수정안[\s\S]*?과[태징]료[^\n]*?\n[^\n]*?과[태징]료\s*([\d,]+)\s*백만원', re.IGNORECASE),
+    ],
+    'revision_window_fine': re.compile(r'수정안[\s\S]{0,200}?과[태징]료\s*([\d,]+)\s*백만원'),
+    'revision_action_types': [
+        (re.compile(r'과태료'), '과태료'),
+        (re.compile(r'과징금'), '과징금'),
+        (re.compile(r'기관경고'), '경고'),
+        (re.compile(r'업무\s*일부\s*정지'), '직무정지'),
+        (re.compile(r'직무정지'), '직무정지'),
+        (re.compile(r'시정명령'), '시정명령'),
+        (re.compile(r'경고'), '경고')
+    ],
+    'institution_warning': re.compile(r'기관\s*경고'),
+    'revision_fine': re.compile(r'과태료\s*([\d,]+)\s*백만원'),
+    'revision_penalty': re.compile(r'과징금\s*([\d,]+)\s*백만원'),
+    'suspension': re.compile(r'업무\s*(?:일부\s*)?정지\s*(\d+)\s*개?월'),
+    'periods': [
+        re.compile(r'(\d+)\s*개?월'),
+        re.compile(r'(\d+)\s*년'),
+        re.compile(r'(\d+)\s*일')
+    ],
+    
+    # 의결일자 패턴 (update_decision_dates.py에서 가져옴)
+    'decision_dates': [
+        # 의결연월일 2025. 3.19. (제5차) 패턴
+        re.compile(r'의결\s*연월일\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*\(제(\d+)차\)'),
+        # 의결일: 2025. 1. 8
+        re.compile(r'의결일\s*[:：]\s*(\d{4})[\.\년]\s*(\d{1,2})[\.\월]\s*(\d{1,2})'),
+        # 의결일자: 2025년 1월 8일
+        re.compile(r'의결일자\s*[:：]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),
+        # 2025년 1월 8일 (문서 상단에 있는 경우)
+        re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일.*?의결'),
+        # 2025. 1. 8. (일반 날짜 형식)
+        re.compile(r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.'),
+    ],
+}
+
+# 업권 분류 키워드
+INDUSTRY_KEYWORDS = {
+    '은행': ['은행', '저축은행'],
+    '보험': ['보험', '생명보험', '손해보험'],
+    '금융투자': ['자산운용', '투자', '증권', '선물'],
+    '회계/감사': ['회계법인', '감사', '회계사']
+}
+
+# 섹션 위치 탐색용 앵커 (서로 겹치지 않는 리터럴, 1회 스캔으로 모든 위치 수집)
+SECTION_ANCHORS = ('근거법규', '조치대상자의', '가.', '원안', '수정안', '조치내용', '제재대상', '제재조치', '주요골자')
+_ANCHOR_PATTERN = re.compile('|'.join(re.escape(anchor) for anchor in SECTION_ANCHORS))
+
+
+class DocumentSegments:
+    """문서 1건의 섹션 위치 (오프셋) 모음
+
+    각 섹션은 원래 정규식이 전체 텍스트에서 찾았을 결과와 동일한 (시작, 끝) 오프셋이며,
+    섹션이 없으면 None
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.anchors: Dict[str, List[int]] = {}
+        self.law_section: Optional[Tuple[int, int]] = None
+        self.target_info_section: Optional[Tuple[int, int]] = None
+        self.violation_sections: List[Optional[Tuple[int, int]]] = []
+        self.violation_fallback: Optional[Tuple[int, int]] = None
+        self.action_section: Optional[Tuple[int, int]] = None
+        self.action_section_detect: Optional[Tuple[int, int]] = None
+        self.sanction_table: Optional[Tuple[int, int]] = None
+        self.sanction_table_detect: Optional[Tuple[int, int]] = None
+        self.summary_table: Optional[Tuple[int, int]] = None
+        self.has_revision_table = False
+        self.revision_offset: Optional[int] = None
+        self._lowered: Optional[str] = None
+    
+    def first(self, anchor: str) -> Optional[int]:
+        """앵커의 첫 등장 위치"""
+        offsets = self.anchors.get(anchor)
+        return offsets[0] if offsets else None
+    
+    def get(self, span: Optional[Tuple[int, int]]) -> Optional[str]:
+        """오프셋에 해당하는 텍스트"""
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]]
+    
+    def revision_window(self, size: int) -> Optional[str]:
+        """첫 '수정안'부터 최대 size자 (`수정안[\\s\\S]{0,size}`와 동일)"""
+        if self.revision_offset is None:
+            return None
+        return self.text[self.revision_offset:self.revision_offset + len('수정안') + size]
+    
+    @property
+    def lowered(self) -> str:
+        """업권 분류용 소문자 텍스트 (문서당 1회 변환)"""
+        if self._lowered is None:
+            self._lowered = self.text.lower()
+        return self._lowered
+
+
+class DocumentSegmenter:
+    """단일 스캔 문서 분할기
+
+    앵커 리터럴을 한 번에 스캔해 위치를 수집한 뒤, 각 섹션 정규식은 해당 앵커 위치에서만
+    매칭하여 (근거법규, 조치대상자 인적사항, 가./나. 항목, 조치내용, 원안/수정안 표 등)
+    문서 전체 재스캔 없이 오프셋을 계산한다.
+    """
+    
+    def segment(self, text: str) -> DocumentSegments:
+        segments = DocumentSegments(text)
+        
+        for match in _ANCHOR_PATTERN.finditer(text):
+            segments.anchors.setdefault(match.group(0), []).append(match.start())
+        
+        segments.law_section = self._find_heading_section(
+            segments, PATTERNS['law_section'], '근거법규', self._law_heading_start
+        )
+        segments.target_info_section = self._find_heading_section(
+            segments, PATTERNS['target_info_section'], '조치대상자의', self._target_heading_start
+        )
+        
+        # 가. 항목 (패턴은 모두 '가.'로 시작하므로 첫 '가.' 위치부터 검색)
+        ga_offset = segments.first('가.')
+        if ga_offset is not None:
+            segments.violation_sections = [
+                self._group_span(pattern.search(text, ga_offset))
+                for pattern in PATTERNS['violation_section']
+            ]
+            segments.violation_fallback = self._group_span(PATTERNS['violation_fallback'].search(text, ga_offset))
+        else:
+            segments.violation_sections = [None] * len(PATTERNS['violation_section'])
+        
+        action_offset = segments.first('조치내용')
+        if action_offset is not None:
+            segments.action_section = self._group_span(PATTERNS['action_section'].search(text, action_offset))
+            segments.action_section_detect = self._group_span(PATTERNS['action_section_detect'].search(text, action_offset))
+        
+        table_offset = segments.first('제재대상')
+        if table_offset is not None and '제재조치' in segments.anchors:
+            match = PATTERNS['sanction_table'].search(text, table_offset)
+            segments.sanction_table = match.span() if match else None
+            match = PATTERNS['sanction_table_detect'].search(text, table_offset)
+            segments.sanction_table_detect = match.span() if match else None
+        
+        summary_offset = segments.first('주요골자')
+        if summary_offset is not None:
+            segments.summary_table = self._group_span(PATTERNS['summary_table'].search(text, summary_offset))
+        
+        original_offset = segments.first('원안')
+        if original_offset is not None:
+            segments.has_revision_table = PATTERNS['revision_table'].search(text, original_offset) is not None
+        segments.revision_offset = segments.first('수정안')
+        
+        return segments
+    
+    @staticmethod
+    def _group_span(match) -> Optional[Tuple[int, int]]:
+        return match.span(1) if match else None
+    
+    def _find_heading_section(self, segments: DocumentSegments, pattern, anchor: str, heading_start) -> Optional[Tuple[int, int]]:
+        """'<번호>. <제목>' 형태 섹션을 제목 앵커 위치에서 역방향으로 번호 시작점을 찾아 매칭
+
+        가장 앞선 앵커부터 시도하므로 전체 텍스트 search와 같은 (가장 왼쪽) 매치를 얻는다.
+        """
+        text = segments.text
+        for offset in segments.anchors.get(anchor, []):
+            start = heading_start(text, offset)
+            if start is None:
+                continue
+            match = pattern.match(text, start)
+            if match:
+                return match.span(1)
+        return None
+    
+    @staticmethod
+    def _skip_spaces_back(text: str, offset: int) -> int:
+        while offset > 0 and text[offset - 1].isspace():
+            offset -= 1
+        return offset
+    
+    def _law_heading_start(self, text: str, offset: int) -> Optional[int]:
+        """`(?:\\d+\\.|[가-하]\\.)\\s*근거법규`의 시작 위치"""
+        end = self._skip_spaces_back(text, offset)
+        if end < 2 or text[end - 1] != '.':
+            return None
+        
+        start = end - 1
+        while start > 0 and text[start - 1].isdecimal():
+            start -= 1
+        if start < end - 1:
+            return start
+        if '가' <= text[end - 2] <= '하':
+            return end - 2
+        return None
+    
+    def _target_heading_start(self, text: str, offset: int) -> Optional[int]:
+        """`1\\.\\s*조치대상자의`의 시작 위치"""
+        end = self._skip_spaces_back(text, offset)
+        if end >= 2 and text[end - 2:end] == '1.':
+            return end - 2
+        return None
+
+
 class RuleBasedExtractor:
     """Rule-based 추출기 - 금융위 의결서 표준 포맷 대응"""
     
     def __init__(self):
-        # 법률명 정규화기 초기화
-        self.law_normalizer = get_law_normalizer()
-        # 정규식 패턴 정의
+        # 원본 정규식 패턴 문자열 (하위 호환용, 매칭에는 컴파일된 PATTERNS 사용)
         self.patterns = {
-            # 의결 정보 패턴
-            'decision_number': r'제(\d{4})-(\d+)호',
-            'decision_date': r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-            
-            # 근거법규 섹션 패턴 (숫자와 한글 기호 모두 지원)
-            'law_section': r'(?:\d+\.|[가-하]\.)\s*근거법규(.*?)(?=\d+\.|[가-하]\.|$)',
-            
-            # 법률명과 조항 패턴
-            'law_with_articles': r'[｢「]([^｣」]+)[｣」]\s*([^｢「\n]+?)(?=[｢「]|$|\n\s*\n)',
-            'article_pattern': r'제(\d+)조(?:\s*제(\d+)항)?(?:\s*제(\d+)호)?(?:의\s*(\d+))?',
-            
-            # 금액 패턴
-            'amount_million': r'(\d+(?:,\d{3})*)\s*백만원',
-            'amount_won': r'(\d+(?:,\d{3})*)\s*원',
-            
-            # 기관명 패턴
-            'entity_name': r'([^에\s]+)(?:에\s*대한|의\s*)',
-            
-            # 업권 분류 키워드
-            'industry_keywords': {
-                '은행': ['은행', '저축은행'],
-                '보험': ['보험', '생명보험', '손해보험'],
-                '금융투자': ['자산운용', '투자', '증권', '선물'],
-                '회계/감사': ['회계법인', '감사', '회계사']
-            },
-            
-            # 조치 이유 섹션 패턴 (더 견고한 패턴)
-            'violation_section': [
-                r'가\.([^나다라마바사아자차카타파하]*?)(?=나\.|\d+\.|$)',  # 가. ~ 나./숫자. 까지
-                r'가\.([^가-하]*?)(?=[나-하]\.|\d+\.|$)',  # 가. ~ 다른 한글 기호까지
-                r'가\.(.{10,}?)(?=(?:[나-하]\.|\d+\.|4\.|5\.|6\.|7\.|8\.|9\.))',  # 최소 10자 이상
-            ],
-            
-            # 조치대상자 정보 패턴
-            'target_info_section': r'1\.\s*조치대상자의\s*인적사항(.*?)(?=2\.|$)',
-            'target_types': {
-                '기관': r'기\s*관\s*([^\n]+)',
-                '임직원': r'임직원\s*([^\n]+)',
-                '외부감사인': r'외부감사인\s*([^\n]+)'
-            }
+            'decision_number': PATTERNS['decision_number'].pattern,
+            'decision_date': PATTERNS['decision_date'].pattern,
+            'law_section': PATTERNS['law_section'].pattern,
+            'law_with_articles': PATTERNS['law_with_articles'].pattern,
+            'article_pattern': PATTERNS['article_pattern'].pattern,
+            'amount_million': PATTERNS['amount_million'].pattern,
+            'amount_won': PATTERNS['amount_won'].pattern,
+            'entity_name': PATTERNS['entity_name'].pattern,
+            'industry_keywords': INDUSTRY_KEYWORDS,
+            'violation_section': [pattern.pattern for pattern in PATTERNS['violation_section']],
+            'target_info_section': PATTERNS['target_info_section'].pattern,
+            'target_types': {name: pattern.pattern for name, pattern in PATTERNS['target_types'].items()}
         }
+            
+        self.segmenter = DocumentSegmenter()
+        self._last_segments: Optional[DocumentSegments] = None
+            
+    def segment(self, text: str) -> DocumentSegments:
+        """문서 섹션 위치 계산 (같은 텍스트 객체는 직전 결과 재사용)"""
+        segments = self._last_segments
+        if segments is None or segments.text is not text:
+            segments = self.segmenter.segment(text)
+            self._last_segments = segments
+        return segments
+            
+    @property
+    def law_normalizer(self):
+        """법률명 정규화기 (첫 사용 시 로드)"""
+        return get_law_normalizer()
+            
+    def extract_pdf(self, pdf_path: str, preprocessor=None) -> Dict[str, Any]:
+        """PDF 파일 1건 추출 (예외 대신 실패 결과 반환)"""
+        if preprocessor is None:
+            from app.services.preprocessing import PDFPreprocessor
+            preprocessor = PDFPreprocessor()
+            
+        start = time.perf_counter()
+        try:
+            text = preprocessor.extract_text_from_pdf(pdf_path)
+            result = self.extract_full_document_structure(text, os.path.basename(pdf_path))
+            return {
+                'pdf_path': pdf_path,
+                'success': True,
+                'result': result,
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+            }
+        except Exception as e:
+            logger.error(f"Rule-based PDF 추출 실패: {pdf_path} - {e}")
+            return {
+                'pdf_path': pdf_path,
+                'success': False,
+                'error': str(e),
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+            }
+            
+    def extract_many(
+        self,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        chunksize: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """여러 PDF 일괄 추출 (프로세스 풀, 결과 스트리밍)
+            
+        Args:
+            paths: PDF 파일 경로 목록
+            workers: 워커 프로세스 수 (None이면 CPU 수, 1 이하면 현재 프로세스에서 순차 처리)
+            ordered: True면 입력 순서대로, False면 완료되는 순서대로 반환
+            chunksize: ordered 모드에서 워커에 한 번에 전달할 파일 수
+        
+        Yields:
+            extract_pdf 결과 ({'pdf_path', 'success', 'result' 또는 'error', 'elapsed_ms'})
+        """
+        paths = list(paths)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(paths))
+        
+        if workers <= 1:
+            from app.services.preprocessing import PDFPreprocessor
+            preprocessor = PDFPreprocessor()
+            for path in paths:
+                yield self.extract_pdf(path, preprocessor)
+            return
+        
+        logger.info(f"Rule-based 일괄 추출 시작: {len(paths)}개 파일, 워커 {workers}개")
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_extract_worker)
+        try:
+            if ordered:
+                yield from executor.map(_extract_in_worker, paths, chunksize=max(1, chunksize))
+            else:
+                futures = [executor.submit(_extract_in_worker, path) for path in paths]
+                for future in as_completed(futures):
+                    yield future.result()
+        finally:
+            # 소비자가 중간에 중단하면 대기 중인 작업은 취소
+            executor.shutdown(wait=True, cancel_futures=True)
     
     def extract_decision_metadata(self, text: str, filename: str) -> Dict[str, Any]:
         """의결서 메타데이터 추출"""
@@ -69,7 +421,7 @@ class RuleBasedExtractor:
             metadata = {}
             
             # 파일명에서 의결번호 추출
-            filename_match = re.search(self.patterns['decision_number'], filename)
+            filename_match = PATTERNS['decision_number'].search(filename)
             if filename_match:
                 metadata['decision_year'] = int(filename_match.group(1))
                 metadata['decision_id'] = int(filename_match.group(2))
@@ -78,7 +430,7 @@ class RuleBasedExtractor:
             # 실제 날짜는 나중에 의결*.pdf 파일에서 추출
             
             # 제목 추출 (파일명에서)
-            title_match = re.search(r'_([^_]+?)(?:\(공개용\))?\.pdf$', filename)
+            title_match = PATTERNS['title_from_filename'].search(filename)
             if title_match:
                 metadata['title'] = title_match.group(1)
             
@@ -112,21 +464,21 @@ class RuleBasedExtractor:
             laws = []
             
             # 근거법규 섹션 찾기
-            law_section_match = re.search(self.patterns['law_section'], text, re.DOTALL | re.IGNORECASE)
+            segments = self.segment(text)
+            law_section_text = segments.get(segments.law_section)
             
-            if not law_section_match:
+            if law_section_text is None:
                 logger.warning("근거법규 섹션을 찾을 수 없습니다.")
                 return laws
             
-            law_section_text = law_section_match.group(1)
             logger.info(f"근거법규 섹션 발견: {law_section_text[:100]}...")
             
             # 법률명과 조항을 함께 추출 (줄바꿈 무시하고 전체 텍스트에서 추출)
             # 줄바꿈과 불필요한 공백 정리
-            cleaned_text = re.sub(r'\s+', ' ', law_section_text.strip())
+            cleaned_text = PATTERNS['whitespace'].sub(' ', law_section_text.strip())
             
             # 법률명 패턴으로 모든 매칭 찾기
-            law_matches = re.finditer(r'[｢「]([^｣」]+)[｣」]\s*([^｢「]*?)(?=[｢「]|$)', cleaned_text)
+            law_matches = PATTERNS['law_in_section'].finditer(cleaned_text)
             
             for match in law_matches:
                 law_name = match.group(1).strip()
@@ -236,7 +588,7 @@ class RuleBasedExtractor:
         """단일 조항 추출"""
         try:
             # 조항 패턴 매칭
-            article_match = re.search(r'제(\d+)조(?:제(\d+)항)?(?:제(\d+)호)?(?:의\s*(\d+))?', text)
+            article_match = PATTERNS['single_article'].search(text)
             
             if not article_match:
                 return None
@@ -274,7 +626,7 @@ class RuleBasedExtractor:
             # 또는 "제3호" -> "제10조 제1항 제3호" (base_article_num=10인 경우)
             
             # 완전한 조항이 있는 경우 (예: "제19조제1항제2호")
-            full_article_match = re.search(r'제(\d+)조(?:제(\d+)항)?(?:제(\d+)호)?', abbrev_text)
+            full_article_match = PATTERNS['full_article'].search(abbrev_text)
             if full_article_match:
                 new_article_num = full_article_match.group(1)
                 paragraph = full_article_match.group(2)
@@ -295,7 +647,7 @@ class RuleBasedExtractor:
                 }
             
             # 항만 있는 경우
-            paragraph_match = re.search(r'제(\d+)항', abbrev_text)
+            paragraph_match = PATTERNS['paragraph'].search(abbrev_text)
             if paragraph_match:
                 paragraph = paragraph_match.group(1)
                 article_details = f"제{base_article_num}조 제{paragraph}항"
@@ -309,7 +661,7 @@ class RuleBasedExtractor:
                 }
             
             # 호만 있는 경우 (제2호, 제3호 등)
-            item_match = re.search(r'제(\d+)호', abbrev_text)
+            item_match = PATTERNS['item'].search(abbrev_text)
             if item_match:
                 item = item_match.group(1)
                 # 기본적으로 제1항을 가정하거나, 이전 컨텍스트에서 항 정보를 가져와야 함
@@ -357,29 +709,26 @@ class RuleBasedExtractor:
     def detect_multiple_actions(self, text: str) -> bool:
         """텍스트에서 복수 조치 가능성을 감지"""
         try:
+            segments = self.segment(text)
+            
             # 1. 표 형식의 복수 제재대상 확인 (2025-70호 케이스)
             # "제재대상"과 "제재조치" 테이블에서 여러 개체 확인
-            if '제재대상' in text and '제재조치' in text:
+            if '제재대상' in segments.anchors and '제재조치' in segments.anchors:
                 # 표 형식에서 과태료/과징금이 여러 개체에 부과되는지 확인
-                table_pattern = r'제재대상[\s\S]*?제재조치[\s\S]*?(?=ㅇ|$)'
-                table_match = re.search(table_pattern, text)
-                if table_match:
-                    table_content = table_match.group(0)
+                table_content = segments.get(segments.sanction_table_detect)
+                if table_content is not None:
                     # 여러 개체에 대한 과태료/과징금 패턴
-                    entity_fine_pattern = r'([\w\s\(\)㈜]+(?:前\s*\w+\s*\w+)?)\s*(?:과태료|과징금)\s*[\d,]+\s*(?:백만원|만원|억원)'
-                    entity_fines = re.findall(entity_fine_pattern, table_content)
+                    entity_fines = PATTERNS['table_entity_fine'].findall(table_content)
                     if len(entity_fines) >= 2:
                         logger.info(f"표 형식에서 복수 제재대상 감지: {len(entity_fines)}개")
                         return True
             
             # 2. "조치내용" 섹션에서 여러 개의 "ㅇ"로 시작하는 항목 확인
-            action_section_pattern = r'조치내용([\s\S]*?)(?=\s*\d+\.\s*조치이유|\s*나\.\s*근거법규|$)'
-            action_section_match = re.search(action_section_pattern, text, re.IGNORECASE)
+            action_content = segments.get(segments.action_section_detect)
             
-            if action_section_match:
-                action_content = action_section_match.group(1)
+            if action_content is not None:
                 # "ㅇ"로 시작하는 항목 개수 확인
-                bullet_items = re.findall(r'ㅇ\s*[^\n]+', action_content)
+                bullet_items = PATTERNS['bullet_item'].findall(action_content)
                 if len(bullet_items) >= 2:
                     logger.info(f"조치내용 섹션에서 복수 항목 감지: {len(bullet_items)}개")
                     # 과징금이 포함된 항목인지 확인
@@ -389,23 +738,13 @@ class RuleBasedExtractor:
                         return True
             
             # 3. 복수 조치를 나타내는 키워드 확인
-            multiple_indicators = [
-                r'다음\s*각\s*호의\s*자',
-                r'아래와\s*같이\s*조치',
-                r'각각\s*부과',
-                r'다음과\s*같이\s*과[징태]금을\s*부과',
-                r'조치대상자별\s*조치내용',
-                r'주요골자.*?과[징태]금.*?계'  # 주요골자 테이블에 합계가 있는 경우
-            ]
-            
-            for pattern in multiple_indicators:
-                if re.search(pattern, text, re.IGNORECASE | re.DOTALL):
-                    logger.info(f"복수 조치 키워드 감지: {pattern}")
+            for pattern in PATTERNS['multiple_indicators']:
+                if pattern.search(text):
+                    logger.info(f"복수 조치 키워드 감지: {pattern.pattern}")
                     return True
             
             # 3. 여러 금액이 나열되는지 확인 (더 정확한 패턴)
-            amount_pattern = r'과[징태]금\s*(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:백만)?원'
-            amounts = re.findall(amount_pattern, text)
+            amounts = PATTERNS['fine_amounts'].findall(text)
             
             # 중복 제거하고 유니크한 금액 개수 확인
             unique_amounts = set(amounts)
@@ -414,8 +753,7 @@ class RuleBasedExtractor:
                 return True
             
             # 4. 조치 대상자가 여러 명 나열되는 패턴
-            entity_with_fine_pattern = r'(㈜\w+|前?\s*(?:대표이사|담당임원|이사|감사)\s*[★☆◇◆○●□■△▲\w]+|\w+회계법인)\s*\n?\s*-\s*과[징태]금'
-            entity_matches = re.findall(entity_with_fine_pattern, text)
+            entity_matches = PATTERNS['entity_with_fine'].findall(text)
             
             if len(entity_matches) >= 2:
                 logger.info(f"복수 조치 대상자 감지: {len(entity_matches)}명")
@@ -471,10 +809,12 @@ class RuleBasedExtractor:
     
     def _classify_industry(self, text: str, entity_name: str) -> str:
         """업권 분류"""
-        combined_text = f"{text} {entity_name}".lower()
+        # 키워드에 공백이 없으므로 "본문 + 기관명" 결합 대신 각각 검사 (본문 소문자 변환은 문서당 1회)
+        lowered_text = self.segment(text).lowered
+        lowered_entity = entity_name.lower()
         
-        for industry, keywords in self.patterns['industry_keywords'].items():
-            if any(keyword in combined_text for keyword in keywords):
+        for industry, keywords in INDUSTRY_KEYWORDS.items():
+            if any(keyword in lowered_text or keyword in lowered_entity for keyword in keywords):
                 return industry
         
         return '기타'
@@ -513,15 +853,8 @@ class RuleBasedExtractor:
             return table_amount
             
         # 수정의결 금액 우선 확인
-        revised_patterns = [
-            r'(\d+(?:,\d{3})*)\s*백만원으로\s*상향',
-            r'수정의결.*?(\d+(?:,\d{3})*)\s*백만원',
-            r'상향.*?(\d+(?:,\d{3})*)\s*백만원',
-            r'수정.*?(\d+(?:,\d{3})*)\s*백만원'
-        ]
-        
-        for pattern in revised_patterns:
-            revised_match = re.search(pattern, text)
+        for pattern in PATTERNS['revised_amounts']:
+            revised_match = pattern.search(text)
             if revised_match:
                 amount_str = revised_match.group(1).replace(',', '')
                 logger.info(f"수정의결 금액 발견: {amount_str}백만원")
@@ -529,13 +862,13 @@ class RuleBasedExtractor:
         
         # 수정의결이 없으면 일반 금액 패턴 확인
         # 백만원 단위 먼저 확인
-        million_match = re.search(self.patterns['amount_million'], text)
+        million_match = PATTERNS['amount_million'].search(text)
         if million_match:
             amount_str = million_match.group(1).replace(',', '')
             return int(amount_str) * 1000000
         
         # 원 단위 확인
-        won_match = re.search(self.patterns['amount_won'], text)
+        won_match = PATTERNS['amount_won'].search(text)
         if won_match:
             amount_str = won_match.group(1).replace(',', '')
             return int(amount_str)
@@ -545,20 +878,19 @@ class RuleBasedExtractor:
     def extract_violation_full_text(self, text: str) -> str:
         """조치 이유 전문 추출 (가. 지적사항 섹션) - 여러 패턴 시도"""
         try:
-            # 여러 패턴을 순서대로 시도
-            for i, pattern in enumerate(self.patterns['violation_section']):
-                violation_match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+            segments = self.segment(text)
                 
-                if violation_match:
-                    violation_text = violation_match.group(1).strip()
+            # 여러 패턴을 순서대로 시도 (가. 항목 위치는 분할기에서 계산)
+            for i, span in enumerate(segments.violation_sections):
+                if span is not None:
+                    violation_text = segments.get(span).strip()
                     if len(violation_text) > 10:  # 최소 길이 체크
                         logger.info(f"위반 전문 텍스트 추출 성공 (패턴 {i+1}): {len(violation_text)}자")
                         return violation_text
             
             # 모든 패턴 실패 시 fallback - 간단한 "가." 이후 텍스트 추출
-            fallback_match = re.search(r'가\.(.{20,})', text, re.DOTALL | re.IGNORECASE)
-            if fallback_match:
-                violation_text = fallback_match.group(1).strip()
+            if segments.violation_fallback is not None:
+                violation_text = segments.get(segments.violation_fallback).strip()
                 # 다음 섹션에서 자르기
                 for separator in ['나.', '다.', '라.', '4.', '5.', '근거법규']:
                     if separator in violation_text:
@@ -584,18 +916,18 @@ class RuleBasedExtractor:
             }
             
             # 조치대상자 섹션 찾기
-            target_section_match = re.search(self.patterns['target_info_section'], text, re.DOTALL | re.IGNORECASE)
+            segments = self.segment(text)
+            target_section = segments.get(segments.target_info_section)
             
-            if not target_section_match:
+            if target_section is None:
                 logger.warning("조치대상자 인적사항 섹션을 찾을 수 없습니다.")
                 return target_details
             
-            target_section = target_section_match.group(1)
             logger.info(f"조치대상자 섹션 발견: {target_section[:100]}...")
             
             # 각 대상자 유형별로 정보 추출
-            for target_type, pattern in self.patterns['target_types'].items():
-                matches = re.findall(pattern, target_section)
+            for target_type, pattern in PATTERNS['target_types'].items():
+                matches = pattern.findall(target_section)
                 if matches:
                     target_details['target_type'] = target_type
                     for match in matches:
@@ -632,6 +964,9 @@ class RuleBasedExtractor:
     def extract_full_document_structure(self, text: str, filename: str) -> Dict[str, Any]:
         """전체 문서 구조 추출 (통합 메서드)"""
         try:
+            # 문서 섹션 위치 1회 계산 (이후 추출기들은 같은 텍스트의 오프셋을 재사용)
+            self.segment(text)
+            
             # 메타데이터 추출
             decision_metadata = self.extract_decision_metadata(text, filename)
             
@@ -680,18 +1015,18 @@ class RuleBasedExtractor:
     def _extract_single_action(self, text: str, filename: str) -> Dict[str, Any]:
         """단일 조치 정보 추출 (기존 로직) - 복수 조치 지원"""
         # 원안/수정안 표가 있는지 확인
-        has_revision_table = bool(re.search(r'원안\s*수정안', text))
+        has_revision_table = self.segment(text).has_revision_table
         
         # 기관명 추출 (파일명에서 우선 추출)
         entity_name = ''
         
         # 1. 파일명에서 기관명 추출 시도
-        filename_entity_match = re.search(r'_([^_]+?)에 대한', filename)
+        filename_entity_match = PATTERNS['entity_from_filename'].search(filename)
         if filename_entity_match:
             entity_name = filename_entity_match.group(1)
         else:
             # 2. 텍스트에서 기관명 추출 시도
-            entity_match = re.search(self.patterns['entity_name'], text)
+            entity_match = PATTERNS['entity_name'].search(text)
             entity_name = entity_match.group(1) if entity_match else '조치대상자'
         
         # 업권 분류
@@ -754,22 +1089,19 @@ class RuleBasedExtractor:
         actions = []
         
         try:
+            segments = self.segment(text)
+            
             # 원안/수정안 표가 있는지 먼저 확인
-            has_revision_table = bool(re.search(r'원안\s*수정안', text))
-            if has_revision_table:
+            if segments.has_revision_table:
                 logger.info("원안/수정안 표 발견, 단일 조치 처리로 전달")
                 # 원안/수정안 표는 _extract_single_action에서 처리
                 return []  # 빈 리스트 반환하여 단일 조치 처리로 fallback
             # 1. "조치내용" 섹션에서 추출 (최우선)
-            action_section_pattern = r'조치내용([\s\S]*?)(?=\s*\d+\.\s*조치이유|\s*가\.\s*지적사항|$)'
-            action_section_match = re.search(action_section_pattern, text, re.IGNORECASE)
+            action_content = segments.get(segments.action_section)
             
-            if action_section_match:
-                action_content = action_section_match.group(1)
-                
+            if action_content is not None:
                 # "ㅇ 대상자명\n    - 과징금 금액" 패턴 (백만원 단위 포함)
-                action_pattern = r'ㅇ\s*([^\n]+)\s*\n\s*-\s*과[징태]금\s*([\d,\.]+(?:\s*억)?(?:\s*[\d,\.]+)?\s*(?:백만|만)?)\s*원'
-                action_matches = re.findall(action_pattern, action_content)
+                action_matches = PATTERNS['action_item'].findall(action_content)
                 
                 for entity_name, amount_str in action_matches:
                     entity_name = entity_name.strip()
@@ -792,29 +1124,20 @@ class RuleBasedExtractor:
                         logger.info(f"조치내용 섹션에서 조치 추출: {entity_name} - {fine_amount:,}원")
             
             # 2. 표 형식의 제재대상-제재조치 테이블 처리 (2025-70호 케이스)
-            if not actions and '제재대상' in text and '제재조치' in text:
+            if not actions and '제재대상' in segments.anchors and '제재조치' in segments.anchors:
                 logger.info("표 형식 제재대상-제재조치 테이블 처리 시도")
                 # 표 형식에서 추출
-                table_pattern = r'제재대상[\s\S]*?제재조치[\s\S]*?(?=ㅇ\(금감원|$)'
-                table_match = re.search(table_pattern, text)
+                table_content = segments.get(segments.sanction_table)
                 
-                if table_match:
-                    table_content = table_match.group(0)
+                if table_content is not None:
                     # 패턴 1: "유진투자증권㈜...과태료 3,600 백만원"
                     # 패턴 2: "前 영업이사 G1 과태료 15백만원"
-                    entity_fine_patterns = [
-                        # 기관 + 금액 패턴 (기관 라벨 제거)
-                        r'(?:기\s*관\s*)?([\w\s]+㈜)(?:[\s\S]*?)(?:과태료|과징금)\s*([\d,]+)\s*백만원',
-                        # 임직원 + 금액 패턴
-                        r'(前\s*[\w\s]+\s*[A-Z]\d*)\s*(?:과태료|과징금)\s*([\d,]+)\s*백만원'
-                    ]
-                    
-                    for pattern in entity_fine_patterns:
-                        matches = re.findall(pattern, table_content)
+                    for pattern in PATTERNS['table_entity_fines']:
+                        matches = pattern.findall(table_content)
                         for entity_name, amount_str in matches:
                             entity_name = entity_name.strip()
                             # "기  관" 같은 불필요한 텍스트 제거
-                            entity_name = re.sub(r'^기\s*관\s*', '', entity_name).strip()
+                            entity_name = PATTERNS['entity_label'].sub('', entity_name).strip()
                             fine_amount = self._parse_complex_amount(amount_str + '백만원')
                             
                             if entity_name and fine_amount:
@@ -837,15 +1160,11 @@ class RuleBasedExtractor:
             # 3. 조치내용 섹션 추출 실패 시 다른 패턴 시도
             if not actions:
                 # 주요골자 테이블에서 추출 시도
-                table_pattern = r'주요골자.*?과[징태]금.*?\n([\s\S]*?)(?:계|합계)'
-                table_match = re.search(table_pattern, text, re.IGNORECASE | re.DOTALL)
+                table_content = segments.get(segments.summary_table)
                 
-                if table_match:
-                    table_content = table_match.group(1)
-                    
+                if table_content is not None:
                     # 테이블 행 패턴: 대상자 | 금액
-                    row_pattern = r'([^\n│|]+?)\s*[│|]\s*([\d,]+)\s*(?:백만)?원'
-                    rows = re.findall(row_pattern, table_content)
+                    rows = PATTERNS['summary_table_row'].findall(table_content)
                     
                     for entity, amount_str in rows:
                         entity_name = entity.strip()
@@ -870,16 +1189,13 @@ class RuleBasedExtractor:
             if not actions:
                 # 조치대상자별 상세 패턴으로 시도
                 # 회사 패턴
-                company_pattern = r'(㈜\w+)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'
-                company_matches = re.findall(company_pattern, text)
+                company_matches = PATTERNS['company_fine'].findall(text)
                 
                 # 임원 패턴
-                executive_pattern = r'(前?\s*(?:대표이사|담당임원|이사|감사)\s*[★☆◇◆○●□■△▲\w]+)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'
-                executive_matches = re.findall(executive_pattern, text)
+                executive_matches = PATTERNS['executive_fine'].findall(text)
                 
                 # 회계법인 패턴
-                auditor_pattern = r'([◆◇○●□■△▲\w]+회계법인)\s*\n?\s*-?\s*과[징태]금\s*([\d,]+(?:\s*억)?(?:\s*[\d,]+)?\s*(?:만)?)\s*원'
-                auditor_matches = re.findall(auditor_pattern, text)
+                auditor_matches = PATTERNS['auditor_fine'].findall(text)
                 
                 all_matches = company_matches + executive_matches + auditor_matches
                 
@@ -913,16 +1229,14 @@ class RuleBasedExtractor:
     def _extract_from_revision_table(self, text: str) -> Optional[int]:
         """원안/수정안 표 형태에서 금액 추출"""
         try:
-            # 원안/수정안 표 패턴
-            table_patterns = [
-                # 원안 수정안 형태의 표
-                r'원안\s*수정안[\s\S]*?과[태징]료\s*([\d,]+)\s*백만원\s*과[태징]료\s*([\d,]+)\s*백만원',
-                # 제재조치 표에서 수정안 열
-                r'제재조치\s*\n\s*원안\s*수정안[\s\S]*?과[태징]료[^\n]*?\n[^\n]*?과[태징]료\s*([\d,]+)\s*백만원',
-            ]
+            segments = self.segment(text)
             
-            for pattern in table_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            # 원안/수정안 표 패턴 (각 패턴의 첫 리터럴 앵커 위치부터 매칭)
+            for pattern, anchor in zip(PATTERNS['revision_table_amounts'], ('원안', '제재조치')):
+                offset = segments.first(anchor)
+                if offset is None:
+                    continue
+                match = pattern.search(text, offset)
                 if match:
                     # 수정안 금액 (마지막 그룹)
                     if len(match.groups()) >= 2:
@@ -937,7 +1251,9 @@ class RuleBasedExtractor:
                         return int(amount) * 1000000
             
             # 더 넓은 패턴으로 수정안 금액 찾기
-            revision_section = re.search(r'수정안[\s\S]{0,200}?과[태징]료\s*([\d,]+)\s*백만원', text)
+            revision_section = None
+            if segments.revision_offset is not None:
+                revision_section = PATTERNS['revision_window_fine'].search(text, segments.revision_offset)
             if revision_section:
                 amount = revision_section.group(1).replace(',', '')
                 logger.info(f"수정안 섹션에서 금액 추출: {amount}백만원")
@@ -952,23 +1268,11 @@ class RuleBasedExtractor:
         """원안/수정안 표에서 조치 유형 추출"""
         try:
             # 수정안 부분에서 조치 유형 찾기
-            revision_section = re.search(r'수정안[\s\S]{0,200}', text)
-            if revision_section:
-                section_text = revision_section.group(0)
-                
+            section_text = self.segment(text).revision_window(200)
+            if section_text is not None:
                 # 조치 유형 패턴
-                action_patterns = [
-                    (r'과태료', '과태료'),
-                    (r'과징금', '과징금'),
-                    (r'기관경고', '경고'),
-                    (r'업무\s*일부\s*정지', '직무정지'),
-                    (r'직무정지', '직무정지'),
-                    (r'시정명령', '시정명령'),
-                    (r'경고', '경고')
-                ]
-                
-                for pattern, action_type in action_patterns:
-                    if re.search(pattern, section_text):
+                for pattern, action_type in PATTERNS['revision_action_types']:
+                    if pattern.search(section_text):
                         logger.info(f"수정안에서 조치 유형 추출: {action_type}")
                         return action_type
         except Exception as e:
@@ -983,15 +1287,13 @@ class RuleBasedExtractor:
         
         try:
             # 수정안 섹션 찾기
-            revision_pattern = r'수정안[\s\S]{0,500}'
-            revision_match = re.search(revision_pattern, text)
+            revision_text = self.segment(text).revision_window(500)
             
-            if revision_match:
-                revision_text = revision_match.group(0)
+            if revision_text is not None:
                 logger.info("수정안 섹션에서 복수 조치 추출 시작")
                 
                 # 1. 기관경고 확인
-                if re.search(r'기관\s*경고', revision_text):
+                if PATTERNS['institution_warning'].search(revision_text):
                     actions.append({
                         'action_type': '경고',
                         'fine_amount': 0,
@@ -1002,7 +1304,7 @@ class RuleBasedExtractor:
                 
                 # 2. 과태료 금액 추출 (수정안에서 마지막 과태료 금액 찾기)
                 # 공백을 포함한 더 정확한 패턴 사용
-                fine_matches = re.findall(r'과태료\s*([\d,]+)\s*백만원', revision_text)
+                fine_matches = PATTERNS['revision_fine'].findall(revision_text)
                 if fine_matches:
                     # 감경 금액이 아닌 실제 과태료 금액만 추출
                     # "감경(XXX백만원" 패턴은 제외
@@ -1030,7 +1332,7 @@ class RuleBasedExtractor:
                     logger.info(f"과태료 조치 추출: {amount:,}원")
                 
                 # 3. 과징금 금액 추출
-                penalty_match = re.search(r'과징금\s*([\d,]+)\s*백만원', revision_text)
+                penalty_match = PATTERNS['revision_penalty'].search(revision_text)
                 if penalty_match:
                     amount = int(penalty_match.group(1).replace(',', '')) * 1000000
                     actions.append({
@@ -1043,7 +1345,7 @@ class RuleBasedExtractor:
                 
                 # 4. 업무정지 기간 추출 (기관경고가 없는 경우에만)
                 if not any(a['action_type'] == '경고' for a in actions):
-                    suspension_match = re.search(r'업무\s*(?:일부\s*)?정지\s*(\d+)\s*개?월', revision_text)
+                    suspension_match = PATTERNS['suspension'].search(revision_text)
                     if suspension_match:
                         period = f"{suspension_match.group(1)}개월"
                         actions.append({
@@ -1063,19 +1365,11 @@ class RuleBasedExtractor:
         """원안/수정안 표에서 제재 기간 추출"""
         try:
             # 수정안 부분에서 기간 찾기
-            revision_section = re.search(r'수정안[\s\S]{0,200}', text)
-            if revision_section:
-                section_text = revision_section.group(0)
-                
+            section_text = self.segment(text).revision_window(200)
+            if section_text is not None:
                 # 기간 패턴
-                period_patterns = [
-                    r'(\d+)\s*개?월',
-                    r'(\d+)\s*년',
-                    r'(\d+)\s*일'
-                ]
-                
-                for pattern in period_patterns:
-                    match = re.search(pattern, section_text)
+                for pattern in PATTERNS['periods']:
+                    match = pattern.search(section_text)
                     if match:
                         period = match.group(0)
                         logger.info(f"수정안에서 제재 기간 추출: {period}")
@@ -1093,7 +1387,7 @@ class RuleBasedExtractor:
         
         try:
             # 숫자만 추출
-            numbers = re.findall(r'\d+', str(amount_str).replace(',', ''))
+            numbers = PATTERNS['digits'].findall(str(amount_str).replace(',', ''))
             if not numbers:
                 return None
             
@@ -1129,7 +1423,7 @@ class RuleBasedExtractor:
             # 백만원 단위 처리 (예: 9.8백만원)
             if '백만' in amount_str:
                 # 백만 앞의 숫자 추출 (소수점 포함)
-                baek_match = re.search(r'([\d,\.]+)\s*백만', amount_str)
+                baek_match = PATTERNS['million_part'].search(amount_str)
                 if baek_match:
                     baek = float(baek_match.group(1).replace(',', ''))
                     total = int(baek * 1000000)
@@ -1141,7 +1435,7 @@ class RuleBasedExtractor:
                 parts = amount_str.split('억')
                 if len(parts) >= 1 and parts[0].strip():
                     # 억 앞의 숫자 추출
-                    eok_match = re.search(r'([\d,]+)\s*$', parts[0])
+                    eok_match = PATTERNS['eok_tail'].search(parts[0])
                     if eok_match:
                         eok = int(eok_match.group(1).replace(',', ''))
                         total += eok * 100000000
@@ -1153,13 +1447,13 @@ class RuleBasedExtractor:
             # 만원 단위 처리
             if '만' in amount_str and '백만' not in amount_str:
                 # 만 앞의 숫자 추출
-                man_match = re.search(r'([\d,]+)\s*만', amount_str)
+                man_match = PATTERNS['man_part'].search(amount_str)
                 if man_match:
                     man = int(man_match.group(1).replace(',', ''))
                     total += man * 10000
             # 만이 없고 숫자만 있는 경우 (원 단위)
             elif total == 0:
-                numbers = re.findall(r'[\d,]+', amount_str)
+                numbers = PATTERNS['number_groups'].findall(amount_str)
                 if numbers:
                     total = int(numbers[0].replace(',', ''))
             
@@ -1213,7 +1507,7 @@ class RuleBasedExtractor:
                 entity_name = action.get('entity_name', '')
                 if '대표이사' in entity_name or '임원' in entity_name or '이사' in entity_name:
                     # 직책 추출
-                    position_match = re.search(r'(前?\s*(?:대표이사|담당임원|이사|감사))', entity_name)
+                    position_match = PATTERNS['position'].search(entity_name)
                     if position_match:
                         target_info['position'] = position_match.group(1).strip()
                 
@@ -1307,22 +1601,8 @@ class RuleBasedExtractor:
                 for page_num, page in enumerate(reader.pages[:3]):
                     text += page.extract_text()
             
-            # 날짜 패턴들 (update_decision_dates.py에서 가져옴)
-            date_patterns = [
-                # 의결연월일 2025. 3.19. (제5차) 패턴
-                r'의결\s*연월일\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.\s*\(제(\d+)차\)',
-                # 의결일: 2025. 1. 8
-                r'의결일\s*[:：]\s*(\d{4})[\.\년]\s*(\d{1,2})[\.\월]\s*(\d{1,2})',
-                # 의결일자: 2025년 1월 8일
-                r'의결일자\s*[:：]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-                # 2025년 1월 8일 (문서 상단에 있는 경우)
-                r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일.*?의결',
-                # 2025. 1. 8. (일반 날짜 형식)
-                r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.',
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, text[:1000])  # 문서 앞부분에서만 검색
+            for pattern in PATTERNS['decision_dates']:
+                match = pattern.search(text[:1000])  # 문서 앞부분에서만 검색
                 if match:
                     year = int(match.group(1))
                     month = int(match.group(2))
@@ -1333,4 +1613,24 @@ class RuleBasedExtractor:
             
         except Exception as e:
             logger.error(f"PDF 텍스트 추출 실패 {pdf_path}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+# 프로세스 풀 워커 상태 (워커 프로세스마다 1회 초기화)
+_worker_extractor: Optional[RuleBasedExtractor] = None
+_worker_preprocessor = None
+
+def _init_extract_worker():
+    """워커 초기화: 추출기, 법률명 정규화기(사전 로드), PDF 전처리기 준비"""
+    global _worker_extractor, _worker_preprocessor
+    from app.services.preprocessing import PDFPreprocessor
+    
+    _worker_extractor = RuleBasedExtractor()
+    _worker_extractor.law_normalizer  # 첫 문서 처리 전에 법률 사전 로드
+    # 파일 단위로 이미 병렬 처리 중이므로 문서 내 페이지 병렬 추출/OCR은 사용하지 않음
+    _worker_preprocessor = PDFPreprocessor(page_workers=1, ocr_workers=1)
+
+
+def _extract_in_worker(pdf_path: str) -> Dict[str, Any]:
+    """워커 프로세스에서 PDF 1건 추출"""
+    return _worker_extractor.extract_pdf(pdf_path, _worker_preprocessor)
\ No newline at end of file
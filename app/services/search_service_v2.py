@@ -1,13 +1,60 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, func, text
 from typing import List, Dict, Any
+import asyncio
 import logging
+from app.core.database import run_in_session
 from app.models.fsc_models_v2 import DecisionV2, ActionV2, LawV2, ActionLawMapV2
 from app.services.gemini_service import GeminiService
 from app.services.ai_only_nl2sql_engine_v2 import AIOnlyNL2SQLEngineV2
+from app.services.facet_index import get_facet_index
+from app.services.singleflight import SingleFlight, freeze_criteria
 
 logger = logging.getLogger(__name__)
 
+# 동시에 들어온 같은 조건의 검색은 한 번만 실행
+_text_search_flight = SingleFlight('text_search')
+_advanced_search_flight = SingleFlight('advanced_search')
+
+
+def apply_advanced_criteria(query, criteria: Dict[str, Any]):
+    """고급 검색 조건을 쿼리에 적용 (검색/내보내기 공용)
+
+    DecisionV2와 ActionV2가 조인된 쿼리를 전제로 합니다.
+    """
+    if criteria.get('keyword'):
+        query = query.filter(
+            or_(
+                DecisionV2.title.contains(criteria['keyword']),
+                DecisionV2.stated_purpose.contains(criteria['keyword']),
+                ActionV2.entity_name.contains(criteria['keyword']),
+                ActionV2.violation_summary.contains(criteria['keyword'])
+            )
+        )
+    
+    if criteria.get('decision_year'):
+        query = query.filter(DecisionV2.decision_year == criteria['decision_year'])
+    
+    if criteria.get('category_1'):
+        query = query.filter(DecisionV2.category_1 == criteria['category_1'])
+    
+    if criteria.get('category_2'):
+        query = query.filter(DecisionV2.category_2 == criteria['category_2'])
+    
+    if criteria.get('industry_sector'):
+        query = query.filter(ActionV2.industry_sector == criteria['industry_sector'])
+    
+    if criteria.get('action_type'):
+        query = query.filter(ActionV2.action_type == criteria['action_type'])
+    
+    if criteria.get('min_fine_amount'):
+        query = query.filter(ActionV2.fine_amount >= criteria['min_fine_amount'])
+    
+    if criteria.get('max_fine_amount'):
+        query = query.filter(ActionV2.fine_amount <= criteria['max_fine_amount'])
+    
+    return query
+
 
 class SearchServiceV2:
     """V2 고급 검색 관련 서비스"""
@@ -17,9 +64,9 @@ class SearchServiceV2:
         self.gemini_service = GeminiService()
         self.ai_nl2sql_engine = AIOnlyNL2SQLEngineV2(db)
     
-    def _get_laws_for_action(self, action_id: int) -> List[Dict[str, str]]:
+    def _get_laws_for_action(self, action_id: int, db: Session = None) -> List[Dict[str, str]]:
         """특정 조치에 대한 법률 정보 조회"""
-        laws = self.db.query(
+        laws = (db or self.db).query(
             LawV2.law_name,
             ActionLawMapV2.article_details
         ).join(
@@ -73,9 +120,17 @@ class SearchServiceV2:
             }
     
     async def text_search(self, text: str, limit: int = 50) -> Dict[str, Any]:
-        """텍스트 기반 검색 (V2)"""
+        """텍스트 기반 검색 (V2, 동시에 들어온 같은 검색은 진행 중인 결과 공유)"""
+        return await _text_search_flight.do(
+            (text, limit),
+            # 공유 작업은 첫 호출자의 요청 세션 대신 전용 세션 사용
+            lambda: asyncio.to_thread(run_in_session, self.db.get_bind(), self._text_search, text, limit)
+        )
+    
+    def _text_search(self, db: Session, text: str, limit: int) -> Dict[str, Any]:
+        """텍스트 기반 검색 실행 (DB 조회는 스레드에서 수행)"""
         try:
-            query = self.db.query(DecisionV2).join(
+            query = db.query(DecisionV2).join(
                 ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk
             ).filter(
                 or_(
@@ -101,7 +156,7 @@ class SearchServiceV2:
                 }
                 
                 # 관련 조치 정보 추가
-                actions = self.db.query(ActionV2).filter(
+                actions = db.query(ActionV2).filter(
                     ActionV2.decision_pk == decision.decision_pk
                 ).all()
                 
@@ -115,7 +170,7 @@ class SearchServiceV2:
                     # 법률 정보 추가
                     laws = []
                     for action in actions:
-                        action_laws = self._get_laws_for_action(action.action_id)
+                        action_laws = self._get_laws_for_action(action.action_id, db)
                         laws.extend(action_laws)
                     
                     # 중복 제거
@@ -148,45 +203,33 @@ class SearchServiceV2:
             }
     
     async def advanced_search(self, criteria: Dict[str, Any], limit: int = 50) -> Dict[str, Any]:
-        """고급 검색 (V2)"""
+        """고급 검색 (V2, 동시에 들어온 같은 조건의 검색은 진행 중인 결과 공유)"""
+        return await _advanced_search_flight.do(
+            (freeze_criteria(criteria), limit),
+            # 공유 작업은 첫 호출자의 요청 세션 대신 전용 세션 사용
+            lambda: asyncio.to_thread(run_in_session, self.db.get_bind(), self._advanced_search, criteria, limit)
+        )
+    
+    def _advanced_search(self, db: Session, criteria: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        """고급 검색 실행 (DB 조회는 스레드에서 수행)"""
         try:
-            query = self.db.query(DecisionV2).join(
-                ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk, isouter=True
-            )
+            facet_index = get_facet_index()
             
-            # 조건별 필터링
-            if criteria.get('keyword'):
-                query = query.filter(
-                    or_(
-                        DecisionV2.title.contains(criteria['keyword']),
-                        DecisionV2.stated_purpose.contains(criteria['keyword']),
-                        ActionV2.entity_name.contains(criteria['keyword']),
-                        ActionV2.violation_summary.contains(criteria['keyword'])
-                    )
+            if facet_index.supports(criteria):
+                # 범주형/금액 조건만 있으면 비트맵 인덱스로 의결서 선택
+                decision_pks = facet_index.search(criteria, limit)
+                decisions = db.query(DecisionV2).filter(
+                    DecisionV2.decision_pk.in_(decision_pks)
+                ).order_by(DecisionV2.decision_pk).all()
+            else:
+                query = db.query(DecisionV2).join(
+                    ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk, isouter=True
                 )
             
-            if criteria.get('decision_year'):
-                query = query.filter(DecisionV2.decision_year == criteria['decision_year'])
-            
-            if criteria.get('category_1'):
-                query = query.filter(DecisionV2.category_1 == criteria['category_1'])
-            
-            if criteria.get('category_2'):
-                query = query.filter(DecisionV2.category_2 == criteria['category_2'])
-            
-            if criteria.get('industry_sector'):
-                query = query.filter(ActionV2.industry_sector == criteria['industry_sector'])
-            
-            if criteria.get('action_type'):
-                query = query.filter(ActionV2.action_type == criteria['action_type'])
-            
-            if criteria.get('min_fine_amount'):
-                query = query.filter(ActionV2.fine_amount >= criteria['min_fine_amount'])
-            
-            if criteria.get('max_fine_amount'):
-                query = query.filter(ActionV2.fine_amount <= criteria['max_fine_amount'])
+                # 조건별 필터링
+                query = apply_advanced_criteria(query, criteria)
             
-            decisions = query.distinct().limit(limit).all()
+                decisions = query.distinct().limit(limit).all()
             
             results = []
             for decision in decisions:
@@ -201,7 +244,7 @@ class SearchServiceV2:
                 }
                 
                 # 관련 조치 정보 추가
-                actions = self.db.query(ActionV2).filter(
+                actions = db.query(ActionV2).filter(
                     ActionV2.decision_pk == decision.decision_pk
                 ).all()
                 
@@ -215,7 +258,7 @@ class SearchServiceV2:
                     # 법률 정보 추가
                     laws = []
                     for action in actions:
-                        action_laws = self._get_laws_for_action(action.action_id)
+                        action_laws = self._get_laws_for_action(action.action_id, db)
                         laws.extend(action_laws)
                     
                     # 중복 제거
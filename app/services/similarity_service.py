@@ -0,0 +1,434 @@
+"""
+유사 의결서 추천 서비스
+위반 내용/목적 텍스트의 문자 n-gram TF-IDF 벡터로 유사 의결서를 검색 (외부 모델/네트워크 불필요)
+- 한국어 형태소 분석 없이 어절 단위 문자 2~3-gram 사용
+- CSR 형태의 .npy 파일로 저장하고 memory-map으로 로드
+- 선택적으로 randomized SVD(LSA) 밀집 벡터 사용, 신규 문서는 fold-in
+- 조회 전 DB의 최대 decision_pk를 인덱스와 비교하여 누락된 신규 문서만 증분 추가 (다른 프로세스의 저장도 반영)
+"""
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.models.fsc_models_v2 import DecisionV2, ActionV2
+
+logger = logging.getLogger(__name__)
+
+
+NGRAM_RANGE = (2, 3)
+
+# 한글/영문/숫자 외 문자는 공백으로 치환
+_NON_TEXT_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = NGRAM_RANGE) -> Counter:
+    """어절 경계를 포함한 문자 n-gram 빈도"""
+    grams = Counter()
+    min_n, max_n = ngram_range
+    
+    for word in _NON_TEXT_PATTERN.sub(' ', text.lower()).split():
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            for i in range(len(padded) - n + 1):
+                grams[padded[i:i + n]] += 1
+    
+    return grams
+
+
+class SimilarityIndex:
+    """문자 n-gram TF-IDF 기반 유사 의결서 인덱스"""
+    
+    def __init__(self, index_dir: Optional[str] = None, session_factory=None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self.index_dir = index_dir or settings.SIMILARITY_INDEX_DIR
+        
+        # CSR 행렬 (행: 의결서, 값: 1 + log(tf))
+        self.indptr: Optional[np.ndarray] = None
+        self.indices: Optional[np.ndarray] = None
+        self.tf: Optional[np.ndarray] = None
+        self.doc_ids: Optional[np.ndarray] = None
+        self.df: Optional[np.ndarray] = None
+        self.vocab: Dict[str, int] = {}
+        
+        # LSA (선택)
+        self.components: Optional[np.ndarray] = None  # (k, V)
+        self.doc_vectors: Optional[np.ndarray] = None  # (N, k), 행 정규화
+        
+        self._row_ids: Optional[np.ndarray] = None
+        self._idf: Optional[np.ndarray] = None
+        self._doc_norms: Optional[np.ndarray] = None
+        self._pk_to_row: Dict[int, int] = {}
+        self._max_pk = 0  # 인덱스에 포함된 최대 decision_pk
+        
+        self._pending: set = set()
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        """인덱스 로드 여부"""
+        return self.indptr is not None
+    
+    @property
+    def size(self) -> int:
+        return 0 if self.doc_ids is None else len(self.doc_ids)
+    
+    def build(self, svd_components: Optional[int] = None) -> int:
+        """전체 의결서로 인덱스 재구축, 문서 수 반환"""
+        svd_components = settings.SIMILARITY_SVD_COMPONENTS if svd_components is None else svd_components
+        
+        with self._lock:
+            documents = self._load_documents()
+            self.vocab = {}
+            self.df = np.zeros(0, dtype=np.int64)
+            self._clear_arrays()
+            
+            doc_ids, indptr, indices, tf = self._vectorize(documents)
+            self.doc_ids = doc_ids
+            self.indptr = indptr
+            self.indices = indices
+            self.tf = tf
+            self._prepare()
+            
+            if svd_components and self.size:
+                self.components, self.doc_vectors = self._randomized_svd(svd_components)
+            
+            self._save()
+            self._pending.clear()
+            logger.info(f"유사도 인덱스 구축 완료: 문서 {self.size}건, 어휘 {len(self.vocab)}개")
+            return self.size
+    
+    def load(self) -> bool:
+        """저장된 인덱스를 memory-map으로 로드"""
+        with self._lock:
+            return self._load()
+    
+    def add_decisions(self, decision_pks: Iterable[int]) -> int:
+        """신규 의결서를 인덱스에 증분 추가, 추가된 문서 수 반환"""
+        with self._lock:
+            self._pending.update(decision_pks)
+            return self._flush_pending()
+    
+    def similar(self, decision_pk: int, limit: int = 10) -> Optional[List[Tuple[int, float]]]:
+        """유사 의결서 (decision_pk, 점수) 목록, 인덱스에 없는 의결서는 None (조회 전 신규 의결서 추가)"""
+        with self._lock:
+            if not self.available and not self._load():
+                raise RuntimeError("유사도 인덱스가 없습니다. scripts/build_similarity_index.py를 실행하세요.")
+            
+            self._pending.update(self._new_decision_pks())
+            self._flush_pending()
+            
+            row = self._pk_to_row.get(decision_pk)
+            if row is None:
+                return None
+            
+            if self.doc_vectors is not None:
+                scores = np.asarray(self.doc_vectors @ self.doc_vectors[row], dtype=np.float64)
+            else:
+                scores = self._sparse_scores(row)
+            
+            scores[row] = -np.inf
+            limit = min(limit, self.size - 1)
+            if limit <= 0:
+                return []
+            
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top])]
+            return [
+                (int(self.doc_ids[i]), round(float(scores[i]), 4))
+                for i in top
+                if scores[i] > 0
+            ]
+    
+    def _sparse_scores(self, row: int) -> np.ndarray:
+        """희소 TF-IDF 코사인 유사도 (전체 문서)"""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        query_indices = np.asarray(self.indices[start:end])
+        query_weights = np.asarray(self.tf[start:end]) * self._idf[query_indices]
+        query_weights /= max(self._doc_norms[row], 1e-12)
+        
+        # 문서 가중치(tf * idf)와 곱하기 위해 idf를 한 번 더 반영
+        query_dense = np.zeros(len(self.vocab), dtype=np.float32)
+        query_dense[query_indices] = query_weights * self._idf[query_indices]
+        
+        contributions = self.tf * query_dense[self.indices]
+        dots = np.bincount(self._row_ids, weights=contributions, minlength=self.size)
+        return dots / np.maximum(self._doc_norms, 1e-12)
+    
+    def _load_documents(self, decision_pks: Optional[Iterable[int]] = None) -> List[Tuple[int, str]]:
+        """의결서별 텍스트 (stated_purpose + 조치 위반 요약/상세)"""
+        session = self.session_factory()
+        
+        try:
+            decision_query = session.query(DecisionV2.decision_pk, DecisionV2.stated_purpose)
+            action_query = session.query(
+                ActionV2.decision_pk,
+                ActionV2.violation_summary,
+                ActionV2.violation_details
+            )
+            if decision_pks is not None:
+                decision_pks = list(decision_pks)
+                decision_query = decision_query.filter(DecisionV2.decision_pk.in_(decision_pks))
+                action_query = action_query.filter(ActionV2.decision_pk.in_(decision_pks))
+            
+            action_texts = defaultdict(list)
+            for pk, summary, details in action_query.order_by(ActionV2.action_id):
+                action_texts[pk].extend(text for text in (summary, details) if text)
+            
+            return [
+                (pk, ' '.join([purpose or ''] + action_texts.get(pk, [])))
+                for pk, purpose in decision_query.order_by(DecisionV2.decision_pk)
+            ]
+        finally:
+            session.close()
+    
+    def _vectorize(self, documents: List[Tuple[int, str]]):
+        """문서를 CSR 배열로 변환 (어휘/df는 제자리 확장)"""
+        doc_ids = np.fromiter((pk for pk, _ in documents), dtype=np.int64, count=len(documents))
+        indptr = [0]
+        indices = []
+        counts = []
+        new_df = Counter()
+        
+        for _, text in documents:
+            grams = char_ngrams(text)
+            row = []
+            for gram, count in grams.items():
+                term = self.vocab.get(gram)
+                if term is None:
+                    term = len(self.vocab)
+                    self.vocab[gram] = term
+                row.append((term, count))
+                new_df[term] += 1
+            row.sort()
+            indices.extend(term for term, _ in row)
+            counts.extend(count for _, count in row)
+            indptr.append(len(indices))
+        
+        df = np.zeros(len(self.vocab), dtype=np.int64)
+        df[:len(self.df)] = self.df
+        if new_df:
+            terms = np.fromiter(new_df.keys(), dtype=np.int64, count=len(new_df))
+            df[terms] += np.fromiter(new_df.values(), dtype=np.int64, count=len(new_df))
+        self.df = df
+        
+        tf = 1.0 + np.log(np.asarray(counts, dtype=np.float32)) if counts else np.zeros(0, dtype=np.float32)
+        return (
+            doc_ids,
+            np.asarray(indptr, dtype=np.int64),
+            np.asarray(indices, dtype=np.int32),
+            tf.astype(np.float32)
+        )
+    
+    def _prepare(self):
+        """idf, 문서 노름, 행 번호 등 조회용 파생 배열 계산"""
+        n_docs = self.size
+        self._idf = (np.log((1.0 + n_docs) / (1.0 + self.df)) + 1.0).astype(np.float32)
+        self._row_ids = np.repeat(np.arange(n_docs, dtype=np.int32), np.diff(self.indptr))
+        weights = self.tf * self._idf[self.indices]
+        self._doc_norms = np.sqrt(np.bincount(self._row_ids, weights=weights * weights, minlength=n_docs))
+        self._pk_to_row = {int(pk): i for i, pk in enumerate(self.doc_ids)}
+        self._max_pk = int(self.doc_ids.max()) if n_docs else 0
+    
+    def _normalized_data(self) -> np.ndarray:
+        """L2 정규화된 TF-IDF 값 (CSR data)"""
+        norms = np.maximum(self._doc_norms, 1e-12)[self._row_ids]
+        return (self.tf * self._idf[self.indices] / norms).astype(np.float32)
+    
+    def _matmul(self, data: np.ndarray, dense: np.ndarray) -> np.ndarray:
+        """X @ dense (X: N x V 희소)"""
+        return np.column_stack([
+            np.bincount(self._row_ids, weights=data * dense[self.indices, j], minlength=self.size)
+            for j in range(dense.shape[1])
+        ])
+    
+    def _rmatmul(self, data: np.ndarray, dense: np.ndarray) -> np.ndarray:
+        """X.T @ dense (X: N x V 희소)"""
+        return np.column_stack([
+            np.bincount(self.indices, weights=data * dense[self._row_ids, j], minlength=len(self.vocab))
+            for j in range(dense.shape[1])
+        ])
+    
+    def _randomized_svd(self, n_components: int, n_oversamples: int = 10, n_iter: int = 2):
+        """Halko 방식 randomized SVD, (components, 정규화된 문서 벡터) 반환"""
+        data = self._normalized_data()
+        n_random = min(n_components + n_oversamples, self.size, len(self.vocab))
+        rng = np.random.default_rng(42)
+        
+        sample = self._matmul(data, rng.standard_normal((len(self.vocab), n_random)))
+        basis, _ = np.linalg.qr(sample)
+        for _ in range(n_iter):
+            basis, _ = np.linalg.qr(self._rmatmul(data, basis))
+            basis, _ = np.linalg.qr(self._matmul(data, basis))
+        
+        projected = self._rmatmul(data, basis).T  # (l, V)
+        _, _, vt = np.linalg.svd(projected, full_matrices=False)
+        components = vt[:n_components].astype(np.float32)
+        
+        doc_vectors = self._matmul(data, components.T).astype(np.float32)
+        return components, self._normalize_rows(doc_vectors)
+    
+    def _fold_in(self, start_row: int) -> np.ndarray:
+        """신규 문서를 기존 LSA 공간에 투영"""
+        data = self._normalized_data()
+        start = self.indptr[start_row]
+        n_terms = self.components.shape[1]
+        
+        vectors = np.zeros((self.size - start_row, self.components.shape[0]), dtype=np.float32)
+        row_ids = self._row_ids[start:] - start_row
+        indices = np.asarray(self.indices[start:])
+        known = indices < n_terms  # SVD 이후 추가된 어휘는 제외
+        np.add.at(vectors, row_ids[known], data[start:][known, None] * self.components[:, indices[known]].T)
+        return self._normalize_rows(vectors)
+    
+    @staticmethod
+    def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+    
+    def _new_decision_pks(self) -> List[int]:
+        """DB의 최대 decision_pk가 인덱스보다 크면 인덱스 이후 저장된 의결서 pk 목록"""
+        session = self.session_factory()
+        
+        try:
+            latest_pk = session.query(func.max(DecisionV2.decision_pk)).scalar() or 0
+            if latest_pk <= self._max_pk:
+                return []
+            return [
+                pk for (pk,) in session.query(DecisionV2.decision_pk)
+                .filter(DecisionV2.decision_pk > self._max_pk)
+                .order_by(DecisionV2.decision_pk)
+            ]
+        finally:
+            session.close()
+    
+    def _flush_pending(self) -> int:
+        """대기 중인 신규 의결서를 인덱스에 추가"""
+        if not self._pending or not self.available:
+            return 0
+        
+        pending = [pk for pk in sorted(self._pending) if pk not in self._pk_to_row]
+        self._pending.clear()
+        documents = self._load_documents(pending)
+        if not documents:
+            return 0
+        
+        start_row = self.size
+        doc_ids, indptr, indices, tf = self._vectorize(documents)
+        
+        # memory-map 해제 전에 기존 배열을 메모리로 읽어 연결
+        self.doc_ids = np.concatenate([self.doc_ids, doc_ids])
+        self.indptr = np.concatenate([self.indptr, indptr[1:] + self.indptr[-1]])
+        self.indices = np.concatenate([self.indices, indices])
+        self.tf = np.concatenate([self.tf, tf])
+        if self.doc_vectors is not None:
+            self.doc_vectors = np.asarray(self.doc_vectors)
+            self.components = np.asarray(self.components)
+        self._prepare()
+        
+        if self.components is not None:
+            self.doc_vectors = np.concatenate([self.doc_vectors, self._fold_in(start_row)])
+        
+        self._save()
+        logger.info(f"유사도 인덱스 증분 추가: {len(documents)}건 (총 {self.size}건)")
+        return len(documents)
+    
+    def _path(self, name: str) -> str:
+        return os.path.join(self.index_dir, name)
+    
+    def _save(self):
+        """인덱스 파일 저장 (임시 파일 후 교체) 및 memory-map 재로드"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        
+        arrays = {
+            'doc_ids.npy': self.doc_ids,
+            'indptr.npy': self.indptr,
+            'indices.npy': self.indices,
+            'tf.npy': self.tf,
+            'df.npy': self.df,
+        }
+        if self.components is not None:
+            arrays['svd_components.npy'] = self.components
+            arrays['svd_vectors.npy'] = self.doc_vectors
+        
+        arrays = {name: np.asarray(array) for name, array in arrays.items()}
+        self._clear_arrays()  # Windows에서 열린 memory-map 파일은 교체 불가
+        
+        for name, array in arrays.items():
+            temp_path = self._path(f"{name}.tmp")
+            with open(temp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(temp_path, self._path(name))
+        
+        for name in ('svd_components.npy', 'svd_vectors.npy'):
+            if name not in arrays and os.path.exists(self._path(name)):
+                os.remove(self._path(name))
+        
+        vocab = sorted(self.vocab, key=self.vocab.get)
+        with open(self._path('vocab.json.tmp'), 'w', encoding='utf-8') as f:
+            json.dump(vocab, f, ensure_ascii=False)
+        os.replace(self._path('vocab.json.tmp'), self._path('vocab.json'))
+        
+        with open(self._path('meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'documents': len(arrays['doc_ids.npy']),
+                'vocabulary': len(vocab),
+                'ngram_range': list(NGRAM_RANGE),
+                'svd_components': None if self.components is None else self.components.shape[0],
+                'updated_at': datetime.now().isoformat()
+            }, f, ensure_ascii=False, indent=2)
+        
+        self._load()
+    
+    def _load(self) -> bool:
+        if not os.path.exists(self._path('meta.json')):
+            return False
+        
+        self.doc_ids = np.load(self._path('doc_ids.npy'))
+        self.indptr = np.load(self._path('indptr.npy'))
+        self.indices = np.load(self._path('indices.npy'), mmap_mode='r')
+        self.tf = np.load(self._path('tf.npy'), mmap_mode='r')
+        self.df = np.load(self._path('df.npy'))
+        
+        with open(self._path('vocab.json'), 'r', encoding='utf-8') as f:
+            self.vocab = {gram: i for i, gram in enumerate(json.load(f))}
+        
+        if os.path.exists(self._path('svd_components.npy')):
+            self.components = np.load(self._path('svd_components.npy'), mmap_mode='r')
+            self.doc_vectors = np.load(self._path('svd_vectors.npy'), mmap_mode='r')
+        else:
+            self.components = None
+            self.doc_vectors = None
+        
+        self._prepare()
+        return True
+    
+    def _clear_arrays(self):
+        self.indptr = None
+        self.indices = None
+        self.tf = None
+        self.doc_ids = None
+        self.components = None
+        self.doc_vectors = None
+    
+
+# 싱글톤 인스턴스
+_similarity_index_instance = None
+
+def get_similarity_index() -> SimilarityIndex:
+    """유사도 인덱스 싱글톤 인스턴스 반환"""
+    global _similarity_index_instance
+    if _similarity_index_instance is None:
+        _similarity_index_instance = SimilarityIndex()
+    return _similarity_index_instance
\ No newline at end of file
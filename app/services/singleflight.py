@@ -0,0 +1,59 @@
+"""
+동시 요청 병합 (SingleFlight)
+같은 키의 요청이 처리 중이면 새로 실행하지 않고 진행 중인 결과를 함께 기다림
+- 대시보드 추천 질의처럼 여러 사용자가 같은 질의를 동시에 보낼 때 Gemini 호출/SQL 실행을 한 번으로
+- 완료된 결과는 보관하지 않음 (캐시가 아니라 진행 중인 요청만 공유)
+- 공유 결과는 여러 호출자에게 같은 객체로 전달되므로 호출자는 수정하지 않아야 함
+- 요청 1건이 취소되어도 공유 작업은 계속 진행 (다른 대기자에게 결과 전달)
+"""
+import asyncio
+import logging
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from app.core.metrics import set_gauge
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def normalize_query(query: str) -> str:
+    """자연어 질의 병합 키 (유니코드 정규화, 공백 정리, 대소문자/끝 문장부호 무시)"""
+    normalized = ' '.join(unicodedata.normalize('NFKC', query).split()).casefold()
+    return normalized.rstrip('?.! ')
+
+
+def freeze_criteria(criteria: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """검색 조건 dict → 순서와 무관한 병합 키"""
+    return tuple(sorted((key, value) for key, value in criteria.items() if value is not None))
+
+
+class SingleFlight:
+    """키별 진행 중 작업 공유 (이벤트 루프별)"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+        self.stats = {'executed': 0, 'shared': 0}
+    
+    async def do(self, key: Hashable, make_call: Callable[[], Awaitable[T]]) -> T:
+        """같은 키의 작업이 진행 중이면 그 결과를, 아니면 make_call()을 실행한 결과를 반환"""
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        
+        task = self._calls.get(call_key)
+        if task is None:
+            task = loop.create_task(make_call())
+            self._calls[call_key] = task
+            task.add_done_callback(lambda _: self._calls.pop(call_key, None))
+            self.stats['executed'] += 1
+        else:
+            self.stats['shared'] += 1
+            logger.debug(f"{self.name}: 진행 중인 동일 요청과 병합 ({key})")
+        set_gauge(f'singleflight_{self.name}_shared_total', self.stats['shared'])
+        
+        return await asyncio.shield(task)
+    
+    def in_flight(self) -> int:
+        return len(self._calls)
\ No newline at end of file
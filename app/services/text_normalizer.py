@@ -0,0 +1,45 @@
+"""
+PDF 추출 텍스트 정규화 모듈
+머리글/바닥글 제거, 허용 문자 필터링, 공백 정리를 최소 패스로 수행
+- 머리글/바닥글: 모든 패턴을 하나의 교대(alternation) 정규식으로 결합하여 페이지당 1회 치환
+- 허용 문자 필터링 + 공백 정리: 허용되지 않은 문자와 공백의 연속 구간을 한 번에 공백 1개로 치환
+"""
+import re
+from typing import Iterable
+
+# 페이지 머리글/바닥글 패턴 (우선순위 순서, 같은 위치에서는 앞의 패턴이 먼저 일치)
+HEADER_PATTERNS = (
+    r'금융위원회\s*\d{4}-\d+호',
+    r'의\s*결\s*서',
+    r'금\s*융\s*위\s*원\s*회',
+    r'Financial Services Commission',
+    r'페이지\s*\d+\s*/\s*\d+',
+    r'- \d+ -',
+)
+
+# 허용 문자 (공백 제외): 단어 문자(한글, 숫자 포함)와 일부 문장부호
+ALLOWED_CHARS = r'\w.,;:!?()\[\]{}"`~@#$%^&*+=/<>|\\-'
+
+HEADER_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in HEADER_PATTERNS), re.IGNORECASE)
+
+# 허용되지 않은 문자는 공백으로 바뀐 뒤 연속 공백과 함께 공백 1개로 합쳐지므로, 두 종류를 하나의 구간으로 치환
+NOISE_PATTERN = re.compile(f'[^{ALLOWED_CHARS}]+')
+
+
+class TextNormalizer:
+    """PDF 페이지 텍스트 정규화기"""
+    
+    def strip_headers(self, page_text: str) -> str:
+        """페이지 머리글/바닥글 제거 (1회 치환)"""
+        return HEADER_PATTERN.sub('', page_text)
+    
+    def normalize(self, text: str) -> str:
+        """허용 문자 외 제거 및 공백 정리 (1회 치환)"""
+        return NOISE_PATTERN.sub(' ', text).strip()
+    
+    def normalize_pages(self, pages: Iterable[str]) -> str:
+        """페이지별 머리글 제거 후 전체 텍스트 정규화
+
+        페이지 구분 공백은 정규화 과정에서 공백 1개로 합쳐지므로, 페이지 단위 공백 정리 없이 한 번에 결합
+        """
+        return self.normalize(' '.join(self.strip_headers(page) for page in pages))
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+ZIP 스트리밍 수집기
+다운로드한 의결서 ZIP을 디스크에 압축 해제하지 않고 PDF 멤버를 메모리로 읽어 바로 처리 파이프라인에 전달
+- 전처리(텍스트 추출, OCR 폴백)는 메모리의 PDF 바이트로 수행
+- 보관용 PDF는 콘텐츠 주소 저장소에 한 번만 기록하고 processed_pdf/<연도>/에 하드링크 (처리와 동시에 비동기 기록 가능)
+- 의결N.pdf 등 보조 문서는 의결일 조회(_update_decision_date)에 디스크 경로가 필요하므로 본문 처리 전에 먼저 보관
+- 압축 해제 원장은 FSCCrawler.extract_zip_files와 공유 (같은 ZIP은 한 번만 처리)
+- ZIP 등록, 멤버 읽기, 보관 기록은 기본 executor에서 수행 (이벤트 루프를 막지 않음)
+"""
+import asyncio
+import io
+import logging
+import os
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.content_store import LEDGER_FILENAME, ContentStore, ExtractionLedger
+from app.services.fsc_crawler import is_decision_pdf_member, is_fsc_document, zip_year
+from app.services.hybrid_router import HybridExtractionRouter
+from app.services.pdf_processor_v2 import PDFProcessorV2
+
+logger = logging.getLogger(__name__)
+
+
+class ZipStreamIngestor:
+    """ZIP → 메모리 → 처리 파이프라인 (중간 압축 해제 파일 없음)"""
+    
+    def __init__(
+        self,
+        processor: Optional[PDFProcessorV2] = None,
+        store_dir: Optional[str] = None,
+        processed_pdf_dir: Optional[str] = None,
+        archive_async: Optional[bool] = None,
+        fsc_only: bool = True
+    ):
+        self.processor = processor or PDFProcessorV2()
+        self.store = ContentStore(store_dir)
+        self.ledger = ExtractionLedger(self.store.root / LEDGER_FILENAME)
+        self.processed_pdf_dir = processed_pdf_dir or settings.PROCESSED_PDF_DIR
+        self.archive_async = settings.ZIP_STREAM_ARCHIVE_ASYNC if archive_async is None else archive_async
+        self.fsc_only = fsc_only
+        self.stats = {'zips': 0, 'skipped_zips': 0, 'failed_zips': 0, 'pdfs': 0, 'archived_bytes': 0}
+    
+    def _is_main_document(self, member_name: str) -> bool:
+        """파이프라인으로 처리할 본문 문서인지 (fsc_only가 아니면 모든 의결 PDF)"""
+        return not self.fsc_only or is_fsc_document(member_name)
+    
+    def _archive(self, data: bytes, dest: str) -> Tuple[str, bool]:
+        """PDF 바이트를 저장소에 기록하고 dest에 배치 → (해시, 새 객체 여부)"""
+        sha256, _, is_new = self.store.put_stream(io.BytesIO(data), '.pdf')
+        self.store.link(sha256, '.pdf', dest)
+        if is_new:
+            self.stats['archived_bytes'] += len(data)
+        return sha256, is_new
+    
+    async def ingest_zip(self, zip_path: str) -> List[Dict[str, Any]]:
+        """ZIP 1개 처리 → 본문 문서별 process_single_pdf 결과 목록 (이미 처리한 ZIP이면 빈 목록)"""
+        zip_name = os.path.basename(zip_path)
+        loop = asyncio.get_running_loop()
+        
+        try:
+            zip_sha256, _, _ = await loop.run_in_executor(None, self.store.put_file, zip_path, '.zip')
+        except OSError as e:
+            logger.error(f"ZIP 파일 저장소 등록 실패: {zip_name} - {str(e)}")
+            self.stats['failed_zips'] += 1
+            return []
+        
+        self.ledger.load()  # 다른 인스턴스가 그 사이 압축 해제한 ZIP 반영
+        if self.ledger.is_extracted(zip_sha256):
+            logger.info(f"이미 처리된 ZIP, 건너뜀: {zip_name}")
+            self.stats['skipped_zips'] += 1
+            return []
+        
+        year = zip_year(zip_name)
+        year_dir = os.path.join(self.processed_pdf_dir, year) if year else self.processed_pdf_dir
+        if not year:
+            logger.warning(f"연도 추출 실패, 기본 폴더에 저장: {zip_name}")
+        
+        results = []
+        pdfs = []
+        
+        def entry(member_name: str, sha256: str) -> Dict[str, str]:
+            name = os.path.basename(member_name)
+            return {'sha256': sha256, 'name': name, 'path': f"{year or 'default'}/{name}"}
+        
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                members = [m for m in zip_ref.infolist() if is_decision_pdf_member(m.filename)]
+                main_members = [m for m in members if self._is_main_document(m.filename)]
+                companion_members = [m for m in members if not self._is_main_document(m.filename)]
+                
+                # 1. 보조 문서 보관 (본문 처리 중 디스크에서 조회)
+                for member in companion_members:
+                    data = await loop.run_in_executor(None, zip_ref.read, member)
+                    dest = os.path.join(year_dir, os.path.basename(member.filename))
+                    sha256, _ = await loop.run_in_executor(None, self._archive, data, dest)
+                    pdfs.append(entry(member.filename, sha256))
+                
+                # 2. 본문 문서: 메모리 바이트로 처리하며 보관 파일은 동시에 기록
+                for member in main_members:
+                    data = await loop.run_in_executor(None, zip_ref.read, member)
+                    dest = os.path.join(year_dir, os.path.basename(member.filename))
+                    
+                    if self.archive_async:
+                        archive = loop.run_in_executor(None, self._archive, data, dest)
+                        try:
+                            result = await self.processor.process_single_pdf(dest, data=data)
+                        finally:
+                            # 처리 중 예외가 나도 보관 작업을 기다려 보관 오류를 놓치지 않음
+                            sha256, _ = await archive
+                    else:
+                        sha256, _ = await loop.run_in_executor(None, self._archive, data, dest)
+                        result = await self.processor.process_single_pdf(dest, data=data)
+                    
+                    pdfs.append(entry(member.filename, sha256))
+                    results.append(result)
+                    self.stats['pdfs'] += 1
+        except Exception as e:
+            logger.error(f"ZIP 스트리밍 처리 실패: {zip_name} - {str(e)}")
+            self.stats['failed_zips'] += 1
+            return results
+        
+        # 처리 실패 문서도 보관 파일은 남으므로 process_batch로 재처리 가능
+        self.ledger.record(zip_sha256, zip_name, pdfs)
+        self.ledger.save()
+        self.stats['zips'] += 1
+        logger.info(f"ZIP 스트리밍 처리 완료: {zip_name} - 본문 {len(results)}건, 보조 문서 {len(pdfs) - len(results)}건")
+        return results
+    
+    async def ingest_zips(self, zip_paths: List[str]) -> Dict[str, Any]:
+        """여러 ZIP 처리 → process_batch와 같은 형식의 결과 (success/failed/total/processed/routing, 문서별 요약)"""
+        results = {
+            'success': [],
+            'failed': [],
+            'total': 0,
+            'processed': 0
+        }
+        routings = []
+        
+        for zip_path in zip_paths:
+            for result in map(PDFProcessorV2.summarize_result, await self.ingest_zip(zip_path)):
+                if result['success']:
+                    results['success'].append(result)
+                else:
+                    results['failed'].append(result)
+                results['processed'] += 1
+                routings.append(result.get('routing') or {'route': 'llm_only', 'score': 0.0, 'missing': [], 'llm_called': True})
+        
+        results['total'] = results['processed']
+        results['routing'] = HybridExtractionRouter.summarize(routings)
+        results['zips'] = dict(self.stats)
+        logger.info(
+            f"ZIP 스트리밍 수집 완료: ZIP {self.stats['zips']}개 (건너뜀 {self.stats['skipped_zips']}, "
+            f"실패 {self.stats['failed_zips']}), 문서 {results['processed']}건 "
+            f"(성공: {len(results['success'])}, 실패: {len(results['failed'])})"
+        )
+        return results
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+유사 의결서 인덱스 구축 스크립트
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.similarity_service import SimilarityIndex
+from app.core.config import settings
+import logging
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='유사 의결서 TF-IDF 인덱스 구축')
+    parser.add_argument('--output-dir', type=str, help='인덱스 저장 디렉토리', default=settings.SIMILARITY_INDEX_DIR)
+    parser.add_argument('--svd-components', type=int, help='LSA 차원 수 (0이면 미사용)',
+                        default=settings.SIMILARITY_SVD_COMPONENTS)
+    
+    args = parser.parse_args()
+    
+    try:
+        index = SimilarityIndex(index_dir=args.output_dir)
+        count = index.build(svd_components=args.svd_components)
+        
+        logger.info("=== 인덱스 구축 결과 ===")
+        logger.info(f"문서 수: {count}")
+        logger.info(f"어휘 수: {len(index.vocab)}")
+        if index.components is not None:
+            logger.info(f"LSA 차원: {index.components.shape[0]}")
+        logger.info(f"저장 위치: {args.output_dir}")
+    
+    except Exception as e:
+        logger.error(f"인덱스 구축 실패: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.fsc_crawler import FSCCrawler
+from app.services.async_fsc_crawler import AsyncFSCCrawler
 from app.core.config import settings
 import logging
 
@@ -34,6 +35,9 @@ def main():
     parser.add_argument('--start-date', type=str, help='시작 날짜 (YYYY-MM-DD)', required=True)
     parser.add_argument('--end-date', type=str, help='종료 날짜 (YYYY-MM-DD)', required=True)
     parser.add_argument('--output-dir', type=str, help='출력 디렉토리', default=settings.RAW_ZIP_DIR)
+    parser.add_argument('--concurrent', action='store_true', help='비동기 크롤러 사용 (동시 요청 + 호스트별 속도 제한)')
+    parser.add_argument('--full', action='store_true', help='증분 상태를 무시하고 기간 전체 재조회 (변경 없는 파일은 계속 생략)')
+    parser.add_argument('--celery', action='store_true', help='Celery crawl 큐에 작업만 등록 (워커가 다운로드 이후 단계를 처리)')
     
     args = parser.parse_args()
     
@@ -44,11 +48,19 @@ def main():
         
         logger.info(f"크롤링 시작: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
         
-        # 크롤러 초기화
-        crawler = FSCCrawler()
+        if args.celery:
+            from app.celery_app import crawl
+            task = crawl.delay(args.start_date, args.end_date, full=args.full)
+            logger.info(f"크롤링 작업 등록: {task.id}")
+            return
         
-        # 크롤링 실행
-        results = crawler.crawl_decisions(start_date, end_date)
+        # 크롤러 초기화 및 크롤링 실행
+        if args.concurrent:
+            crawler = AsyncFSCCrawler(raw_zip_dir=args.output_dir, incremental=not args.full)
+            results = asyncio.run(crawler.crawl_decisions(start_date, end_date))
+        else:
+            crawler = FSCCrawler(raw_zip_dir=args.output_dir, incremental=not args.full)
+            results = crawler.crawl_decisions(start_date, end_date)
         
         # 결과 출력
         logger.info("=== 크롤링 결과 ===")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Rule-based 일괄 추출 스크립트
+data/processed_pdf/<연도> 디렉토리의 의결서 PDF를 멀티프로세스로 재추출하여 JSONL로 저장
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rule_based_extractor import RuleBasedExtractor
+from app.core.config import settings
+import logging
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def collect_pdf_files(pdf_dir: Path, fsc_only: bool) -> list:
+    """디렉토리(하위 포함)의 PDF 파일 목록"""
+    files = sorted(pdf_dir.rglob('*.pdf'))
+    if fsc_only:
+        # 금융위 의결서(제YYYY-XXX호)_... 형식만
+        files = [f for f in files if f.name.startswith('금융위 의결서')]
+    return [str(f) for f in files]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rule-based 일괄 추출 (멀티프로세스)')
+    parser.add_argument('year', nargs='?', type=str, help='처리 연도 (PROCESSED_PDF_DIR/<연도>)', default=None)
+    parser.add_argument('--pdf-dir', type=str, help='PDF 디렉토리 (연도 대신 직접 지정)', default=None)
+    parser.add_argument('--workers', type=int, help='워커 프로세스 수 (기본값: CPU 수)', default=None)
+    parser.add_argument('--unordered', action='store_true', help='완료되는 순서대로 결과 기록')
+    parser.add_argument('--chunksize', type=int, help='워커당 한 번에 전달할 파일 수', default=1)
+    parser.add_argument('--all-pdfs', action='store_true', help='금융위 의결서 형식이 아닌 PDF도 처리')
+    parser.add_argument('--output', type=str, help='결과 JSONL 파일 (기본값: rule_based_<연도>.jsonl)', default=None)
+    
+    args = parser.parse_args()
+    
+    if args.pdf_dir:
+        pdf_dir = Path(args.pdf_dir)
+    elif args.year:
+        pdf_dir = Path(settings.PROCESSED_PDF_DIR) / args.year
+    else:
+        parser.error('연도 또는 --pdf-dir 중 하나를 지정하세요.')
+    
+    if not pdf_dir.is_dir():
+        logger.error(f"디렉토리가 없습니다: {pdf_dir}")
+        sys.exit(1)
+    
+    output_path = Path(args.output or f"rule_based_{args.year or pdf_dir.name}.jsonl")
+    pdf_files = collect_pdf_files(pdf_dir, fsc_only=not args.all_pdfs)
+    logger.info(f"처리 대상: {len(pdf_files)}개 파일 ({pdf_dir})")
+    
+    extractor = RuleBasedExtractor()
+    successful = failed = 0
+    start = time.perf_counter()
+    
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for item in extractor.extract_many(
+                pdf_files,
+                workers=args.workers,
+                ordered=not args.unordered,
+                chunksize=args.chunksize
+            ):
+                f.write(json.dumps(item, ensure_ascii=False, default=str) + '\n')
+                
+                if item['success']:
+                    successful += 1
+                else:
+                    failed += 1
+                    logger.warning(f"추출 실패: {item['pdf_path']} - {item['error']}")
+                
+                if (successful + failed) % 50 == 0:
+                    logger.info(f"진행률: {successful + failed}/{len(pdf_files)}")
+    
+    except Exception as e:
+        logger.error(f"일괄 추출 실패: {str(e)}")
+        sys.exit(1)
+    
+    elapsed = time.perf_counter() - start
+    logger.info("=== 추출 결과 ===")
+    logger.info(f"총 파일 수: {len(pdf_files)}")
+    logger.info(f"성공: {successful}")
+    logger.info(f"실패: {failed}")
+    logger.info(f"소요 시간: {elapsed:.1f}초")
+    logger.info(f"결과 파일: {output_path}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+ZIP 스트리밍 수집 스크립트
+의결서 ZIP을 압축 해제하지 않고 PDF를 메모리에서 바로 처리합니다.
+"""
+
+import asyncio
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.zip_ingest import ZipStreamIngestor
+from app.core.config import settings
+import logging
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('pdf_processing.log'),
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+
+def collect_zip_files(paths) -> list:
+    """인자 목록 → ZIP 파일 목록 (디렉토리는 그 안의 *.zip)"""
+    zip_files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            zip_files.extend(sorted(path.glob('*.zip')))
+        else:
+            zip_files.append(path)
+    return [str(path) for path in zip_files]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='ZIP 스트리밍 수집 (압축 해제 없이 처리)')
+    parser.add_argument('paths', nargs='*', default=[settings.RAW_ZIP_DIR], help='ZIP 파일 또는 디렉토리')
+    parser.add_argument('--all-pdfs', action='store_true', help='금융위 의결서 형식이 아닌 의결 PDF도 처리')
+    parser.add_argument('--sync-archive', action='store_true', help='보관용 PDF를 처리 전에 기록 (동시 기록 끔)')
+    parser.add_argument('--celery', action='store_true', help='Celery extract 큐에 작업만 등록 (워커가 처리)')
+    
+    args = parser.parse_args()
+    
+    try:
+        zip_files = collect_zip_files(args.paths)
+        if args.celery:
+            from app.celery_app import enqueue_zip_files
+            task_ids = enqueue_zip_files(zip_files)
+            logger.info(f"ZIP 압축 해제 작업 {len(task_ids)}개 등록")
+            return
+        
+        logger.info(f"ZIP 스트리밍 수집 시작: {len(zip_files)}개")
+        
+        ingestor = ZipStreamIngestor(
+            archive_async=False if args.sync_archive else None,
+            fsc_only=not args.all_pdfs
+        )
+        results = await ingestor.ingest_zips(zip_files)
+        
+        # 결과 요약
+        logger.info("=== 처리 결과 ===")
+        logger.info(f"총 문서 수: {results['total']}")
+        logger.info(f"성공: {len(results['success'])}")
+        logger.info(f"실패: {len(results['failed'])}")
+        logger.info(f"LLM 호출 절감: {results['routing']['llm_calls_avoided']}/{results['routing']['documents']}건")
+        
+        # 실패한 파일 목록
+        if results['failed']:
+            logger.info("실패한 파일 목록:")
+            for result in results['failed']:
+                logger.info(f"  - {result['pdf_path']}: {result['error']}")
+    
+    except Exception as e:
+        logger.error(f"ZIP 스트리밍 수집 실패: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+핫 폴더 감시 스크립트
+raw_zip/, processed_pdf/<연도>/에 새로 들어온 ZIP/PDF를 자동으로 처리합니다.
+"""
+
+import asyncio
+import signal
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.hot_folder_watcher import HotFolderWatcher
+from app.core.config import settings
+import logging
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('pdf_processing.log'),
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='핫 폴더 감시 (새 ZIP/PDF 자동 수집)')
+    parser.add_argument('--raw-zip-dir', default=settings.RAW_ZIP_DIR, help='ZIP 감시 디렉토리')
+    parser.add_argument('--pdf-dir', default=settings.PROCESSED_PDF_DIR, help='PDF 감시 디렉토리 (연도별 하위 폴더 포함)')
+    parser.add_argument('--debounce', type=float, help=f'디바운스 시간 (초, 기본 {settings.WATCHER_DEBOUNCE_SECONDS})')
+    parser.add_argument('--polling', action='store_true', help='inotify 대신 폴링 사용')
+    
+    args = parser.parse_args()
+    
+    watcher = HotFolderWatcher(
+        raw_zip_dir=args.raw_zip_dir,
+        processed_pdf_dir=args.pdf_dir,
+        debounce_seconds=args.debounce,
+        use_inotify=False if args.polling else None
+    )
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, watcher.stop)
+    
+    await watcher.run()
+    
+    logger.info("=== 감시 결과 ===")
+    logger.info(f"이벤트: {watcher.stats['events']}")
+    logger.info(f"ZIP 압축 해제: {watcher.stats['zips']}")
+    logger.info(f"처리: {watcher.stats['processed']} (변경 없음: {watcher.stats['unchanged']}, 실패: {watcher.stats['failed']})")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+테스트용 PDF 생성 도우미
+페이지별 텍스트(ASCII)를 Helvetica 텍스트 레이어로 가진 PDF 바이트 생성 (외부 PDF 라이브러리 불필요)
+빈 문자열 페이지는 텍스트 레이어가 없는 페이지 (스캔 페이지 흉내)
+"""
+import io
+from typing import List
+
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+
+def make_pdf(page_texts: List[str]) -> bytes:
+    """페이지마다 한 줄씩 텍스트를 쓴 PDF"""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject('/Type'): NameObject('/Font'),
+        NameObject('/Subtype'): NameObject('/Type1'),
+        NameObject('/BaseFont'): NameObject('/Helvetica'),
+    }))
+    
+    for text in page_texts:
+        writer.add_blank_page(width=595, height=842)
+        page = writer.pages[-1]
+        escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+        contents = DecodedStreamObject()
+        contents.set_data(f"BT /F1 12 Tf 72 770 Td ({escaped}) Tj ET".encode('latin-1') if text else b'')
+        page[NameObject('/Contents')] = writer._add_object(contents)
+        page[NameObject('/Resources')] = DictionaryObject({
+            NameObject('/Font'): DictionaryObject({NameObject('/F1'): font})
+        })
+    
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
\ No newline at end of file
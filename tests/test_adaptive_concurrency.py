@@ -0,0 +1,166 @@
+"""
+LLM 호출 적응형 동시성(AIMD) 테스트
+동시 호출 수 상한이 있는 가상 API로 한도가 실제 상한 근처로 수렴하는지 확인 (실제 Gemini 호출 없음)
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.metrics import get_gauges
+from app.services.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    is_throttle_error,
+    is_transient_error,
+    retry_after_seconds,
+)
+
+
+class QuotaExceeded(Exception):
+    code = 429
+
+
+class FakeQuotaAPI:
+    """동시 호출이 capacity를 넘으면 429 (Retry-After 힌트 포함)"""
+    
+    def __init__(self, capacity: int, latency: float = 0.01, retry_after: float = 0.02):
+        self.capacity = capacity
+        self.latency = latency
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed = 0
+    
+    async def call(self):
+        if self.in_flight >= self.capacity:
+            raise QuotaExceeded(f"429 Resource has been exhausted (e.g. check quota). Please retry in {self.retry_after}s.")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            self.completed += 1
+            return 'ok'
+        finally:
+            self.in_flight -= 1
+
+
+def test_throttle_error_detection():
+    """429 판별과 Retry-After 힌트 추출"""
+    assert is_throttle_error(QuotaExceeded('boom'))
+    assert is_throttle_error(Exception('429 Quota exceeded for quota metric'))
+    assert not is_throttle_error(ValueError('JSON 파싱 실패: generate 응답 형식 오류'))
+    
+    assert retry_after_seconds(Exception('Please retry in 17.5s.')) == 17.5
+    assert retry_after_seconds(Exception('retry_delay {\n  seconds: 42\n}')) == 42
+    
+    class Response:
+        headers = {'Retry-After': '3'}
+    
+    error = Exception('429')
+    error.response = Response()
+    assert retry_after_seconds(error) == 3
+    assert retry_after_seconds(Exception('429')) is None
+
+
+def test_transient_error_detection():
+    """호출 한도/네트워크/5xx만 일시적 오류, 응답 검증/추출 실패는 제외"""
+    import requests
+    from pydantic import BaseModel, ValidationError
+    
+    class ServiceUnavailable(Exception):
+        code = 503
+    
+    class InvalidArgument(Exception):
+        code = 400
+    
+    class Model(BaseModel):
+        value: int
+    
+    try:
+        Model(value='숫자 아님')
+    except ValidationError as e:
+        validation_error = e
+    
+    for error in (QuotaExceeded('429'), ServiceUnavailable('unavailable'), ConnectionResetError(),
+                  asyncio.TimeoutError(), requests.ReadTimeout(), requests.ConnectionError()):
+        assert is_transient_error(error), error
+    for error in (validation_error, ValueError('JSON 파싱 실패'), Exception('데이터 추출 실패'), InvalidArgument('bad')):
+        assert not is_transient_error(error), error
+
+
+def test_limit_converges_to_quota():
+    """성공 시 가산 증가, 429 시 절반 감소 → 실제 동시 호출 상한 근처 유지"""
+    api = FakeQuotaAPI(capacity=6)
+    limiter = AdaptiveConcurrencyLimiter('test_llm', initial_limit=1, max_limit=32, default_backoff=0.02)
+    
+    async def run_all():
+        return await asyncio.gather(*(limiter.run(api.call, max_retries=50) for _ in range(300)))
+    
+    results = asyncio.run(run_all())
+    
+    assert results.count('ok') == 300 and api.completed == 300
+    assert limiter.stats['successes'] == 300
+    assert limiter.stats['throttled'] > 0 and limiter.stats['decreases'] > 0
+    assert api.max_in_flight == 6  # 상한까지 올라감
+    assert 3 <= limiter.limit <= 12, limiter.limit
+    assert limiter.in_flight == 0
+    
+    gauges = get_gauges()
+    assert gauges['test_llm_concurrency_limit'] == round(limiter.limit, 2)
+    assert gauges['test_llm_in_flight'] == 0
+
+
+def test_retry_after_pauses_new_calls():
+    """429 뒤에는 Retry-After 동안 새 호출을 시작하지 않고, 한 번의 초과로는 한 번만 감소"""
+    limiter = AdaptiveConcurrencyLimiter('test_pause', initial_limit=4, default_backoff=0.0)
+    
+    async def scenario():
+        started = [await limiter.acquire() for _ in range(4)]
+        # 같은 시점에 진행 중이던 호출 4건이 모두 429
+        for start in started:
+            limiter.release(start, 'throttled', retry_after=0.2)
+        assert limiter.limit == 2 and limiter.stats['decreases'] == 1
+        
+        begin = time.monotonic()
+        start = await limiter.acquire()
+        waited = time.monotonic() - begin
+        limiter.release(start)
+        return waited
+    
+    waited = asyncio.run(scenario())
+    assert waited >= 0.15, waited
+    assert limiter.limit > 2  # 성공 후 가산 증가
+
+
+def test_non_throttle_errors_keep_limit():
+    """429가 아닌 오류는 재시도 없이 전달하고 한도는 유지"""
+    limiter = AdaptiveConcurrencyLimiter('test_error', initial_limit=4)
+    calls = []
+    
+    async def broken():
+        calls.append(1)
+        raise ValueError('응답 파싱 실패')
+    
+    try:
+        asyncio.run(limiter.run(broken))
+        raise AssertionError('예외가 전달되어야 함')
+    except ValueError:
+        pass
+    
+    assert len(calls) == 1
+    assert limiter.limit == 4 and limiter.in_flight == 0
+
+
+if __name__ == "__main__":
+    for test in (
+        test_throttle_error_detection,
+        test_transient_error_detection,
+        test_limit_converges_to_quota,
+        test_retry_after_pauses_new_calls,
+        test_non_throttle_errors_keep_limit,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
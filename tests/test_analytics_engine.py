@@ -0,0 +1,151 @@
+"""
+통계 분석 엔진 경로 테스트
+- NL2SQL이 생성한 SQLite SQL은 분석 엔진 활성화 여부와 무관하게 SQLite에서 실행 (정수 나눗셈 등 의미 유지)
+- 고정 ORM 집계(fetch_aggregate)는 DuckDB(Parquet 스냅샷)에서 실행하고 SQLite와 같은 결과를 반환
+- 의결서 저장 이벤트 후에는 TTL과 무관하게 스냅샷을 다시 생성
+"""
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionV2, DecisionV2
+from app.services import analytics_engine as analytics_module
+from app.services import ingest_events
+from app.services.ai_only_nl2sql_engine_v2 import AIOnlyNL2SQLEngineV2
+from app.services.analytics_engine import AnalyticsEngine
+from app.services.decision_service_v2 import DecisionServiceV2
+
+
+def make_database(work_dir: str):
+    """의결서 3건(2024년 1건, 2025년 2건)이 있는 임시 DB → (URL, 엔진)"""
+    url = f"sqlite:///{work_dir}/test.sqlite"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    
+    session = sessionmaker(bind=engine)()
+    for decision_id, year, category in ((1, 2024, '제재'), (2, 2025, '제재'), (3, 2025, '인허가')):
+        decision = DecisionV2(
+            decision_year=year, decision_id=decision_id, title=f'의결 {decision_id}',
+            category_1=category, full_text='본문'
+        )
+        decision.actions.append(ActionV2(
+            entity_name=f'기관{decision_id}', violation_summary='위반', action_type='과태료', fine_amount=decision_id
+        ))
+        session.add(decision)
+    session.commit()
+    session.close()
+    return url, engine
+
+
+class FakeGeminiService:
+    """SQLite 의미가 드러나는 통계 SQL을 돌려주는 Gemini 대역"""
+    
+    async def _make_api_request_with_rate_limit(self, prompt):
+        return ('{"sql": "SELECT 7 / 2 AS half, SUM(fine_amount) / COUNT(*) AS average_fine FROM actions_v2", '
+                '"query_type": "statistics", "description": "평균 과태료"}')
+
+
+def test_nl2sql_statistics_run_on_sqlite(monkeypatch):
+    """분석 엔진이 켜져 있어도 LLM SQL은 SQLite 의미(정수 나눗셈)로 실행"""
+    monkeypatch.setattr(settings, 'ANALYTICS_BACKEND', 'duckdb')
+    
+    def fail_if_used():
+        raise AssertionError('LLM SQL이 분석 엔진으로 전달됨')
+    
+    monkeypatch.setattr(analytics_module, 'get_analytics_engine', fail_if_used)
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        _, engine = make_database(work_dir)
+        session = sessionmaker(bind=engine)()
+        try:
+            nl2sql = AIOnlyNL2SQLEngineV2.__new__(AIOnlyNL2SQLEngineV2)
+            nl2sql.db = session
+            nl2sql.gemini_service = FakeGeminiService()
+            result = asyncio.run(nl2sql.process_natural_query('건당 평균 과태료는?'))
+        finally:
+            session.close()
+            engine.dispose()
+    
+    assert result['success'], result
+    assert result['query_type'] == 'statistics'
+    assert result['results'][0]['half'] == 3
+    assert result['results'][0]['average_fine'] == 2
+
+
+def test_fetch_aggregate_on_duckdb_matches_sqlite(monkeypatch):
+    """고정 집계는 DuckDB 스냅샷에서 실행, 결과는 SQLite와 동일하며 의결서 저장 후 갱신"""
+    pytest.importorskip('duckdb')
+    pytest.importorskip('pyarrow')
+    monkeypatch.setattr(settings, 'ANALYTICS_BACKEND', 'duckdb')
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        url, engine = make_database(work_dir)
+        analytics = AnalyticsEngine(
+            database_url=url, source='parquet', snapshot_dir=f"{work_dir}/analytics", snapshot_ttl=3600
+        )
+        monkeypatch.setattr(analytics_module, '_analytics_engine_instance', analytics)
+        
+        session = sessionmaker(bind=engine)()
+        try:
+            service = DecisionServiceV2(session)
+            
+            def yearly():
+                return session.query(
+                    DecisionV2.decision_year,
+                    func.count(DecisionV2.decision_pk)
+                ).group_by(DecisionV2.decision_year).order_by(DecisionV2.decision_year)
+            
+            assert [tuple(row) for row in service.fetch_aggregate(yearly())] == \
+                [tuple(row) for row in yearly().all()] == [(2024, 1), (2025, 2)]
+            assert analytics.mode == 'parquet'
+            
+            # 새 의결서 저장 → 이벤트 수신 후 다음 집계에서 스냅샷 재생성
+            session.add(DecisionV2(decision_year=2025, decision_id=4, title='의결 4', full_text='본문'))
+            session.commit()
+            assert [tuple(row) for row in service.fetch_aggregate(yearly())] == [(2024, 1), (2025, 2)]
+            
+            ingest_events.publish(ingest_events.DECISION_INGESTED, decision_pk=4, action_ids=[])
+            assert [tuple(row) for row in service.fetch_aggregate(yearly())] == [(2024, 1), (2025, 3)]
+        finally:
+            ingest_events.unsubscribe(ingest_events.DECISION_INGESTED, analytics._on_decision_ingested)
+            analytics.close()
+            session.close()
+            engine.dispose()
+
+
+def test_fetch_aggregate_falls_back_to_sqlite(monkeypatch):
+    """분석 엔진 비활성화 시 SQLite에서 그대로 실행"""
+    monkeypatch.setattr(settings, 'ANALYTICS_BACKEND', 'sqlite')
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        _, engine = make_database(work_dir)
+        session = sessionmaker(bind=engine)()
+        try:
+            stats = DecisionServiceV2(session).get_category_stats()
+        finally:
+            session.close()
+            engine.dispose()
+    
+    assert stats['category_1'] == [{'name': '인허가', 'count': 1}, {'name': '제재', 'count': 2}]
+
+
+if __name__ == "__main__":
+    with pytest.MonkeyPatch.context() as patcher:
+        test_nl2sql_statistics_run_on_sqlite(patcher)
+    print("✅ test_nl2sql_statistics_run_on_sqlite")
+    with pytest.MonkeyPatch.context() as patcher:
+        test_fetch_aggregate_on_duckdb_matches_sqlite(patcher)
+    print("✅ test_fetch_aggregate_on_duckdb_matches_sqlite")
+    with pytest.MonkeyPatch.context() as patcher:
+        test_fetch_aggregate_falls_back_to_sqlite(patcher)
+    print("✅ test_fetch_aggregate_falls_back_to_sqlite")
\ No newline at end of file
@@ -0,0 +1,370 @@
+"""
+비동기 FSC 크롤러 테스트
+로컬 스텁 HTTP 서버가 저장된 게시판 목록 페이지(tests/fixtures/fsc_board)와 ZIP 파일을 제공
+- 목록 페이지 병렬 조회 및 의결서 필터링
+- 동시 다운로드 수 제한, 호스트별 토큰 버킷 간격
+- 일시적 오류(503, 타임아웃) 재시도
+- 증분 크롤링 (게시물 번호 상한과 보장 기간, 조건부 GET, 내용 해시)
+- 콘텐츠 주소 저장소 (하드링크 배치, 압축 해제 원장)
+"""
+import asyncio
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.async_fsc_crawler import AsyncFSCCrawler, TokenBucket
+from app.services.crawl_state import CrawlState
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'fsc_board'
+
+START_DATE = datetime(2025, 1, 1)
+END_DATE = datetime(2025, 3, 31)
+ZIP_DATE_TIME = (2025, 1, 15, 9, 0, 0)
+
+
+def build_zip(file_no: str) -> bytes:
+    """의결서 PDF 1개가 든 ZIP (항목 시각 고정으로 요청마다 같은 바이트)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr(zipfile.ZipInfo(f'의결서/금융위 의결서(제2025-{file_no}호)_테스트.pdf', ZIP_DATE_TIME), f'%PDF-1.4\n%stub {file_no}\n'.encode())
+        zf.writestr(zipfile.ZipInfo('안내.txt', ZIP_DATE_TIME), '의결서 외 파일')
+    return buffer.getvalue()
+
+
+class StubBoardServer:
+    """FSC 게시판 스텁 서버 (별도 스레드)"""
+    
+    def __init__(self, response_delay: float = 0.05, fail_once=(), slow_paths=(), etags: bool = True):
+        self.response_delay = response_delay
+        self.etags = etags  # 파일 응답에 ETag 포함 및 If-None-Match 처리
+        self.fail_once = set(fail_once)  # 첫 요청에 503을 돌려줄 fileNo
+        self.slow_paths = set(slow_paths)  # 응답하지 않는 fileNo
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def _handler(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                with stub.lock:
+                    stub.requests.append((time.monotonic(), url.path, query))
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.response_delay)
+                    if url.path == '/no020101':
+                        self._serve_listing(query)
+                    elif url.path == '/comm/getFile':
+                        self._serve_file(query['fileNo'][0])
+                    else:
+                        self._send(404, b'not found', 'text/plain')
+                finally:
+                    with stub.lock:
+                        stub.in_flight -= 1
+            
+            def _serve_listing(self, query):
+                page = query.get('curPage', ['1'])[0]
+                fixture = FIXTURE_DIR / f'list_page_{page}.html'
+                if not fixture.exists():
+                    self._send(404, b'not found', 'text/plain')
+                    return
+                self._send(200, fixture.read_bytes(), 'text/html; charset=UTF-8')
+            
+            def _serve_file(self, file_no):
+                if file_no in stub.slow_paths:
+                    # 클라이언트 타임아웃 이후까지 응답하지 않음
+                    time.sleep(1)
+                    return
+                with stub.lock:
+                    should_fail = file_no in stub.fail_once
+                    stub.fail_once.discard(file_no)
+                if should_fail:
+                    self._send(503, b'busy', 'text/plain')
+                    return
+                etag = f'"zip-{file_no}"' if stub.etags else None
+                if etag and self.headers.get('If-None-Match') == etag:
+                    self._send(304, b'', None, etag)
+                    return
+                self._send(200, build_zip(file_no), 'application/zip', etag)
+            
+            def _send(self, status, body, content_type, etag=None):
+                self.send_response(status)
+                if etag:
+                    self.send_header('ETag', etag)
+                if content_type:
+                    self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        
+        return Handler
+
+
+def make_crawler(base_url: str, work_dir: str, **kwargs) -> AsyncFSCCrawler:
+    options = dict(
+        listing_concurrency=4,
+        download_concurrency=2,
+        rate_per_host=0,
+        timeout=5,
+        max_retries=2,
+        retry_backoff=0.01
+    )
+    options.update(kwargs)
+    return AsyncFSCCrawler(
+        base_url=base_url,
+        raw_zip_dir=str(Path(work_dir) / 'raw_zip'),
+        processed_pdf_dir=str(Path(work_dir) / 'processed_pdf'),
+        state_path=str(Path(work_dir) / 'crawl_state.json'),
+        store_dir=str(Path(work_dir) / 'content_store'),
+        **options
+    )
+
+
+def test_crawl_recorded_board():
+    """저장된 목록 3페이지 → 의결서 5건 검색, ZIP 5개 다운로드/압축 해제"""
+    with StubBoardServer() as stub, tempfile.TemporaryDirectory() as work_dir:
+        crawler = make_crawler(stub.base_url, work_dir)
+        results = asyncio.run(crawler.crawl_decisions(START_DATE, END_DATE))
+        
+        titles = [decision['title'] for decision in results['decisions']]
+        assert titles == [f'2025년 제{i}차 금융위원회 의결서' for i in range(1, 6)], titles
+        assert len(results['downloaded_files']) == 5, results['downloaded_files']
+        assert sorted(results['extracted_files']) == [
+            f'2025/금융위 의결서(제2025-{file_no}호)_테스트.pdf' for file_no in (1001, 1004, 1005, 1006, 1007)
+        ], results['extracted_files']
+        assert not list((Path(work_dir) / 'raw_zip').glob('*.part'))
+        
+        # 목록 1~4페이지 동시 요청 (4페이지는 404지만 3페이지가 마지막이므로 무시)
+        listing_pages = sorted(int(query['curPage'][0]) for _, path, query in stub.requests if path == '/no020101')
+        assert listing_pages == [1, 2, 3, 4], listing_pages
+        assert results['stats']['failed_requests'] == 1
+        assert results['stats']['retries'] == 0
+
+
+def test_download_concurrency_bound():
+    """동시 다운로드 수는 download_concurrency를 넘지 않음"""
+    with StubBoardServer(response_delay=0.1) as stub, tempfile.TemporaryDirectory() as work_dir:
+        crawler = make_crawler(stub.base_url, work_dir, listing_concurrency=1, download_concurrency=2)
+        
+        async def run():
+            async with crawler:
+                decisions = await crawler.search_decisions(START_DATE, END_DATE)
+                stub.max_in_flight = 0
+                return await crawler.download_decision_files(decisions)
+        
+        downloaded = asyncio.run(run())
+        assert len(downloaded) == 5
+        assert stub.max_in_flight == 2, stub.max_in_flight
+
+
+def test_retry_transient_errors():
+    """503은 재시도 후 성공, 타임아웃이 계속되면 재시도 횟수 소진 후 실패 처리"""
+    with StubBoardServer(fail_once={'1004'}, slow_paths={'1007'}) as stub, tempfile.TemporaryDirectory() as work_dir:
+        crawler = make_crawler(stub.base_url, work_dir, timeout=0.3, max_retries=1)
+        results = asyncio.run(crawler.crawl_decisions(START_DATE, END_DATE))
+        
+        assert len(results['decisions']) == 5
+        assert len(results['downloaded_files']) == 4, results['downloaded_files']
+        downloads = [query['fileNo'][0] for _, path, query in stub.requests if path == '/comm/getFile']
+        assert downloads.count('1004') == 2
+        assert downloads.count('1007') == 2
+        # 503 1회 + 타임아웃 1회 재시도, 타임아웃 최종 실패 1회 + 목록 4페이지 404 1회
+        assert results['stats']['retries'] == 2, results['stats']
+        assert results['stats']['failed_requests'] == 2, results['stats']
+
+
+def test_host_rate_limit():
+    """호스트별 토큰 버킷: burst 이후 요청은 1/rate 간격"""
+    async def run():
+        bucket = TokenBucket(rate=20, burst=2)
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - started
+    
+    elapsed = asyncio.run(run())
+    # 2개는 즉시, 나머지 4개는 50ms 간격
+    assert 0.18 <= elapsed < 0.5, elapsed
+    
+    with StubBoardServer(response_delay=0) as stub, tempfile.TemporaryDirectory() as work_dir:
+        crawler = make_crawler(stub.base_url, work_dir, rate_per_host=10, burst=1)
+        asyncio.run(crawler.crawl_decisions(START_DATE, END_DATE))
+        
+        times = [requested for requested, _, _ in stub.requests]
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert len(times) == 9, len(times)
+        assert min(gaps) >= 0.07, gaps
+
+
+def test_incremental_recrawl():
+    """두 번째 실행은 목록 1페이지만 조회하고 다운로드 없음, 상한 이하 게시물은 건너뜀"""
+    with StubBoardServer(response_delay=0) as stub, tempfile.TemporaryDirectory() as work_dir:
+        first = asyncio.run(make_crawler(stub.base_url, work_dir, listing_concurrency=1).crawl_decisions(START_DATE, END_DATE))
+        assert len(first['downloaded_files']) == 5
+        
+        state = CrawlState(str(Path(work_dir) / 'crawl_state.json'))
+        assert state.high_water_post_no == 120
+        assert len(state.files) == 5
+        assert all(entry['etag'] and entry['sha256'] for entry in state.files.values())
+        
+        stub.requests.clear()
+        second = asyncio.run(make_crawler(stub.base_url, work_dir, listing_concurrency=1).crawl_decisions(START_DATE, END_DATE))
+        assert second['decisions'] == []
+        assert second['downloaded_files'] == [] and second['extracted_files'] == []
+        assert [path for _, path, _ in stub.requests] == ['/no020101'], stub.requests
+
+
+def test_incremental_high_water_mark_holds_back_failures():
+    """다운로드 실패 게시물이 있으면 상한을 그 아래까지만 올려 다음 실행에서 다시 조회"""
+    with StubBoardServer(response_delay=0, fail_once={'1005'}) as stub, tempfile.TemporaryDirectory() as work_dir:
+        first = asyncio.run(make_crawler(stub.base_url, work_dir, max_retries=0).crawl_decisions(START_DATE, END_DATE))
+        assert len(first['downloaded_files']) == 4
+        
+        # fileNo 1005 = 게시물 117
+        state = CrawlState(str(Path(work_dir) / 'crawl_state.json'))
+        assert state.high_water_post_no == 116
+        
+        second = asyncio.run(make_crawler(stub.base_url, work_dir).crawl_decisions(START_DATE, END_DATE))
+        assert [decision['post_no'] for decision in second['decisions']] == ['120', '118', '117']
+        assert len(second['downloaded_files']) == 1
+        assert second['stats']['not_modified'] == 2
+        assert CrawlState(str(Path(work_dir) / 'crawl_state.json')).high_water_post_no == 120
+
+
+def test_backfill_older_range_is_not_cut_off():
+    """최근 기간 수집 후 이전 기간(백필)을 요청하면 상한에서 멈추지 않고 목록 전체 조회, 이어지는 기간이면 보장 범위 확장"""
+    with StubBoardServer(response_delay=0) as stub, tempfile.TemporaryDirectory() as work_dir:
+        asyncio.run(make_crawler(stub.base_url, work_dir, listing_concurrency=1).crawl_decisions(START_DATE, END_DATE))
+        state = CrawlState(str(Path(work_dir) / 'crawl_state.json'))
+        assert (state.covered_from, state.covered_to) == (START_DATE.date(), END_DATE.date())
+        
+        stub.requests.clear()
+        backfill = asyncio.run(make_crawler(stub.base_url, work_dir, listing_concurrency=1).crawl_decisions(
+            datetime(2024, 1, 1), datetime(2024, 12, 31)
+        ))
+        assert len(backfill['decisions']) == 5
+        assert len([path for _, path, _ in stub.requests if path == '/no020101']) > 1
+        assert backfill['stats']['not_modified'] == 5
+        
+        state = CrawlState(str(Path(work_dir) / 'crawl_state.json'))
+        assert state.high_water_post_no == 120
+        assert (state.covered_from, state.covered_to) == (datetime(2024, 1, 1).date(), END_DATE.date())
+        assert state.cutoff_for(datetime(2024, 6, 1)) == 120
+        assert state.cutoff_for(datetime(2023, 1, 1)) == 0
+
+
+def test_legacy_state_without_range_is_not_cut_off():
+    """보장 기간이 없는 이전 형식 상태 파일은 상한을 적용하지 않고 이번 기간으로 범위를 기록"""
+    with StubBoardServer(response_delay=0) as stub, tempfile.TemporaryDirectory() as work_dir:
+        state_path = Path(work_dir) / 'crawl_state.json'
+        state_path.write_text(json.dumps({'version': 1, 'high_water_post_no': 120, 'files': {}}), encoding='utf-8')
+        assert CrawlState(str(state_path)).cutoff_for(START_DATE) == 0
+        
+        results = asyncio.run(make_crawler(stub.base_url, work_dir).crawl_decisions(START_DATE, END_DATE))
+        assert len(results['downloaded_files']) == 5
+        
+        state = CrawlState(str(state_path))
+        assert state.high_water_post_no == 120
+        assert (state.covered_from, state.covered_to) == (START_DATE.date(), END_DATE.date())
+
+
+def test_full_recrawl_skips_unchanged_files():
+    """전체 재크롤링: ETag가 있으면 304로, 없으면 내용 해시로 변경 없는 파일 저장 생략"""
+    for etags in (True, False):
+        with StubBoardServer(response_delay=0, etags=etags) as stub, tempfile.TemporaryDirectory() as work_dir:
+            asyncio.run(make_crawler(stub.base_url, work_dir).crawl_decisions(START_DATE, END_DATE))
+            results = asyncio.run(make_crawler(stub.base_url, work_dir, incremental=False).crawl_decisions(START_DATE, END_DATE))
+            
+            assert len(results['decisions']) == 5
+            assert results['downloaded_files'] == []
+            skipped = results['stats']['not_modified'] if etags else results['stats']['unchanged_files']
+            assert skipped == 5, results['stats']
+            assert len(list((Path(work_dir) / 'raw_zip').glob('*.zip'))) == 5
+
+
+def test_content_store_dedup():
+    """PDF는 저장소 객체의 하드링크, 같은 내용의 ZIP은 한 번만 압축 해제, 다른 ZIP의 같은 PDF는 같은 객체에 연결"""
+    with StubBoardServer(response_delay=0) as stub, tempfile.TemporaryDirectory() as work_dir:
+        crawler = make_crawler(stub.base_url, work_dir)
+        results = asyncio.run(crawler.crawl_decisions(START_DATE, END_DATE))
+        assert len(results['extracted_files']) == 5
+        
+        pdfs = [pdf for entry in crawler.ledger.zips.values() for pdf in entry['pdfs']]
+        assert sorted(pdf['path'] for pdf in pdfs) == sorted(results['extracted_files'])
+        for pdf in pdfs:
+            object_path = crawler.store.object_path(pdf['sha256'], '.pdf')
+            assert os.path.samefile(Path(crawler.processed_pdf_dir) / pdf['path'], object_path)
+            assert os.stat(object_path).st_nlink == 2
+        for zip_name in results['downloaded_files']:
+            assert os.stat(Path(crawler.raw_zip_dir) / zip_name).st_nlink == 2
+        assert len(crawler.ledger.zips) == 5
+        
+        # 디렉토리 전체 재처리 + 같은 내용의 ZIP 사본: 압축 해제 없음
+        first_zip = Path(crawler.raw_zip_dir) / results['downloaded_files'][0]
+        shutil.copy(first_zip, Path(crawler.raw_zip_dir) / '사본_2025년 제1차 의결서.zip')
+        assert crawler.extract_zip_files() == []
+        
+        # 다른 ZIP에 들어 있는 같은 PDF: 연도 폴더에 배치하되 저장소 객체는 공유
+        repacked = Path(crawler.raw_zip_dir) / '2024년 재배포 의결서.zip'
+        with zipfile.ZipFile(first_zip) as source, zipfile.ZipFile(repacked, 'w') as target:
+            for name in source.namelist():
+                target.writestr(name, source.read(name))
+        assert crawler.extract_zip_files([repacked.name]) == ['2024/금융위 의결서(제2025-1001호)_테스트.pdf']
+        assert os.path.samefile(
+            Path(crawler.processed_pdf_dir) / '2024' / '금융위 의결서(제2025-1001호)_테스트.pdf',
+            Path(crawler.processed_pdf_dir) / '2025' / '금융위 의결서(제2025-1001호)_테스트.pdf'
+        )
+        assert len(list(crawler.store.objects_dir.rglob('*.pdf'))) == 5
+
+
+if __name__ == "__main__":
+    for test in (
+        test_crawl_recorded_board,
+        test_download_concurrency_bound,
+        test_retry_transient_errors,
+        test_host_rate_limit,
+        test_incremental_recrawl,
+        test_incremental_high_water_mark_holds_back_failures,
+        test_backfill_older_range_is_not_cut_off,
+        test_legacy_state_without_range_is_not_cut_off,
+        test_full_recrawl_skips_unchanged_files,
+        test_content_store_dedup,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
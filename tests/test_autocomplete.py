@@ -0,0 +1,151 @@
+"""
+검색어 자동완성 테스트
+- 접두어/중간 어절 접두어 검색 (대소문자, 공백 무시), 빈도순 정렬과 개수 제한
+- 카테고리 필터, 쉼표로 기재된 조치유형 분리 집계
+- 법률 약칭 → 정식 명칭, 약칭 사전에만 있는 법률도 포함
+- 다른 엔진(다른 프로세스 역할)으로 저장/수정한 조치는 다음 조회에서 재구축하여 반영
+"""
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionLawMapV2, ActionV2, DecisionV2, LawV2
+from app.services.autocomplete_service import AutocompleteIndex
+
+CAPITAL_MARKETS_ACT = '자본시장과 금융투자업에 관한 법률'
+
+ACTIONS = [
+    # (기관명, 업권, 조치유형)
+    ('가나증권', '금융투자', '과징금,과태료'),
+    ('가나증권', '금융투자', '과태료'),
+    ('가나다 자산운용', '금융투자', '기관경고'),
+    ('KB 증권', '금융투자', '과태료'),
+    ('가람생명', '보험', '과징금'),
+]
+
+
+def add_actions(session, actions, decision_id: int):
+    decision = DecisionV2(decision_year=2025, decision_id=decision_id, title=f'의결 {decision_id}', full_text='본문')
+    for entity_name, sector, action_type in actions:
+        decision.actions.append(ActionV2(
+            entity_name=entity_name, industry_sector=sector, action_type=action_type, violation_summary='위반'
+        ))
+    session.add(decision)
+    session.commit()
+    return decision
+
+
+@contextmanager
+def autocomplete_index():
+    """조치 5건(자본시장법 2건 적용)이 있는 임시 DB와 자동완성 인덱스 → (인덱스, 다른 엔진의 쓰기용 세션)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        
+        # 다른 프로세스(스크립트/Celery persist 워커) 역할의 별도 엔진
+        writer_engine = create_engine(f"sqlite:///{work_dir}/test.sqlite")
+        session = sessionmaker(bind=writer_engine)()
+        decision = add_actions(session, ACTIONS, 1)
+        law = LawV2(law_name=CAPITAL_MARKETS_ACT, law_short_name='자본시장법')
+        for action in decision.actions[:2]:
+            action.law_mappings.append(ActionLawMapV2(law=law, article_details='제429조'))
+        session.commit()
+        
+        index = AutocompleteIndex(session_factory=sessionmaker(bind=engine))
+        try:
+            yield index, session
+        finally:
+            session.close()
+            writer_engine.dispose()
+            engine.dispose()
+
+
+@pytest.fixture
+def database():
+    with autocomplete_index() as context:
+        yield context
+
+
+def values(results):
+    return [result['value'] for result in results]
+
+
+def test_prefix_and_word_prefix(database):
+    """접두어는 빈도순, 중간 어절로도 검색, 대소문자/공백 무시, 개수 제한"""
+    index, _ = database
+    
+    results = index.suggest('가나', category='entity')
+    assert values(results) == ['가나증권', '가나다 자산운용']
+    assert results[0]['count'] == 2
+    
+    assert values(index.suggest('자산', category='entity')) == ['가나다 자산운용']
+    assert values(index.suggest('kb증', category='entity')) == ['KB 증권']
+    assert values(index.suggest('가', category='entity', limit=1)) == ['가나증권']
+    assert index.suggest('  ') == []
+    assert index.suggest('없는기관') == []
+
+
+def test_categories_and_action_types(database):
+    """카테고리 필터, 쉼표로 여러 개 기재된 조치유형은 각각 집계"""
+    index, _ = database
+    
+    action_types = {result['value']: result['count'] for result in index.suggest('과', category='action_type')}
+    assert action_types == {'과태료': 3, '과징금': 2}
+    
+    assert [(r['value'], r['count']) for r in index.suggest('금융', category='sector')] == [('금융투자', 4)]
+    assert {result['category'] for result in index.suggest('가', limit=50)} == {'entity', 'law'}  # 가상자산이용자보호법
+
+
+def test_law_abbreviations(database):
+    """약칭은 정식 명칭과 함께 반환되고 적용 건수를 공유, 약칭 사전에만 있는 법률도 검색"""
+    index, _ = database
+    
+    results = index.suggest('자본시장', category='law')
+    assert results[0] == {'value': '자본시장법', 'category': 'law', 'count': 2, 'canonical': CAPITAL_MARKETS_ACT}
+    assert {'value': CAPITAL_MARKETS_ACT, 'category': 'law', 'count': 2, 'canonical': None} in results
+    
+    consumer = index.suggest('금융소비자보호법', category='law')
+    assert consumer[0]['canonical'] == '금융소비자 보호에 관한 법률' and consumer[0]['count'] == 0
+
+
+def test_rebuild_after_changes_from_another_engine(database):
+    """다른 엔진으로 추가/수정한 조치는 다음 조회에서 반영, 변경이 없으면 재구축하지 않음"""
+    index, session = database
+    assert values(index.suggest('가람', category='entity')) == ['가람생명']
+    signature = index._signature
+    index.suggest('가나')
+    assert index._signature is signature
+    
+    add_actions(session, [('가람생명', '보험', '과태료'), ('가람캐피탈', '여신금융', '경고')], 2)
+    results = index.suggest('가람', category='entity')
+    assert values(results) == ['가람생명', '가람캐피탈']
+    assert results[0]['count'] == 2
+    
+    # 기존 조치 수정 (수정 시각 갱신)
+    session.execute(text(
+        "UPDATE actions_v2 SET entity_name = '가람손해보험', updated_at = :updated WHERE entity_name = '가람캐피탈'"
+    ), {'updated': datetime.now() + timedelta(minutes=1)})
+    session.commit()
+    assert values(index.suggest('가람', category='entity')) == ['가람생명', '가람손해보험']
+
+
+if __name__ == "__main__":
+    for test in (
+        test_prefix_and_word_prefix,
+        test_categories_and_action_types,
+        test_law_abbreviations,
+        test_rebuild_after_changes_from_another_engine,
+    ):
+        with autocomplete_index() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+배치 처리 메모리 테스트
+process_batch/iter_batch가 파일별 요약만 메모리에 두고 상세 결과는 JSONL 보고서로 내보내는지 확인
+(실제 PDF/Gemini 없이 process_single_pdf 결과 형식만 흉내냄)
+"""
+import asyncio
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.pdf_processor_v2 import PDFProcessorV2
+
+FULL_TEXT_SIZE = 200_000
+
+
+class FakeDecision:
+    """세션이 닫힌 ORM 객체 자리 (JSON 직렬화 대상 아님)"""
+
+
+def make_processor() -> PDFProcessorV2:
+    """DB/Gemini 초기화 없이 process_single_pdf만 대체한 프로세서"""
+    processor = PDFProcessorV2.__new__(PDFProcessorV2)
+    
+    async def process_single_pdf(pdf_path, data=None):
+        number = int(Path(pdf_path).stem)
+        if number % 10 == 9:
+            return {'success': False, 'pdf_path': pdf_path, 'error': '데이터 추출 실패', 'processing_mode': 'structured_output'}
+        return {
+            'success': True,
+            'pdf_path': pdf_path,
+            'decision_data': {'decision_year': 2025, 'decision_id': number, 'full_text': '가' * FULL_TEXT_SIZE, 'actions': []},
+            'db_result': {'success': True, 'decision': FakeDecision(), 'decision_year': 2025, 'decision_id': number, 'actions_saved': [number]},
+            'llm_context': None,
+            'routing': {'route': 'rule_only', 'score': 1.0, 'missing': [], 'llm_called': False},
+            'processing_mode': 'structured_output'
+        }
+    
+    processor.process_single_pdf = process_single_pdf
+    return processor
+
+
+def run_batch(file_count: int, report_path: str):
+    """배치 처리 → (결과, 처리 중 최대 메모리 증가량)"""
+    processor = make_processor()
+    pdf_files = [f'/tmp/pdf/{i}.pdf' for i in range(file_count)]
+    
+    tracemalloc.start()
+    try:
+        results = asyncio.run(processor.process_batch(pdf_files, batch_size=5, report_path=report_path))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return results, peak
+
+
+def test_process_batch_keeps_summaries_only():
+    """결과 형식은 유지하고 원문/ORM 객체는 보고서로만 기록"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        report_path = str(Path(work_dir) / 'report.jsonl')
+        results, _ = run_batch(20, report_path)
+        
+        assert results['total'] == results['processed'] == 20
+        assert len(results['success']) == 18 and len(results['failed']) == 2
+        assert results['routing']['documents'] == 20 and results['routing']['rule_only'] == 18
+        assert results['report_path'] == report_path
+        
+        summary = next(summary for summary in results['success'] if summary['decision_id'] == 0)
+        assert summary['decision_id'] == 0 and summary['saved'] and summary['actions_saved'] == [0]
+        assert 'decision_data' not in summary and 'db_result' not in summary
+        assert results['failed'][0]['error'] == '데이터 추출 실패'
+        
+        with open(report_path, encoding='utf-8') as report:
+            records = [json.loads(line) for line in report]
+        assert len(records) == 20
+        record = next(record for record in records if record['success'])
+        assert len(record['decision_data']['full_text']) == FULL_TEXT_SIZE
+        assert 'decision' not in record['db_result']
+
+
+def test_process_batch_memory_is_flat():
+    """파일 수가 10배여도 최대 메모리 사용량은 거의 같음"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        _, small_peak = run_batch(20, str(Path(work_dir) / 'small.jsonl'))
+        _, large_peak = run_batch(200, str(Path(work_dir) / 'large.jsonl'))
+    
+    # 결과를 모두 들고 있으면 200건 × 원문(UTF-8 기준 600KB) 이상 증가
+    assert large_peak < small_peak + 2 * FULL_TEXT_SIZE * 3, (small_peak, large_peak)
+
+
+if __name__ == "__main__":
+    for test in (
+        test_process_batch_keeps_summaries_only,
+        test_process_batch_memory_is_flat,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
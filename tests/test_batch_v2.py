@@ -2,6 +2,7 @@
 V2 파이프라인 배치 테스트
 """
 import asyncio
+import json
 import logging
 import os
 from datetime import datetime
@@ -67,7 +68,9 @@ async def test_batch():
         # 성공 샘플 출력
         if results['success']:
             logger.info("\n=== 성공 샘플 ===")
-            sample = results['success'][0]
+            # 배치 결과에는 요약만 있으므로 상세 추출 데이터는 보고서(JSONL)에서 읽음
+            with open(results['report_path'], encoding='utf-8') as report:
+                sample = next(record for record in map(json.loads, report) if record['success'])
             decision_data = sample['decision_data']
             logger.info(f"의결서: {decision_data['decision_year']}-{decision_data['decision_id']}")
             logger.info(f"제목: {decision_data['title']}")
@@ -0,0 +1,223 @@
+"""
+Celery 수집 워커 테스트
+메모리 브로커(memory://)와 메모리 결과 백엔드로 Redis 없이 실행
+- 단계별 큐 라우팅, LLM 작업 속도 제한, 재시도 정책
+- 단일 단계 워커 동시성 설정
+- extract 단계 워커가 ZIP을 풀고 의결서 본문만 preprocess 큐에 발행
+- 즉시 실행(task_always_eager)으로 preprocess → llm → persist 연쇄 (Gemini 대역)
+  LLM 추출은 일시적 오류만 재시도하고 검증/추출 실패는 바로 실패
+"""
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('celery')
+
+from celery.contrib.testing.worker import start_worker
+
+from app import celery_app as celery_module
+from app.celery_app import (
+    STAGE_QUEUES, TASK_CRAWL, TASK_EXTRACT_ZIP, TASK_LLM_EXTRACT, TASK_PERSIST, TASK_PREPROCESS,
+    TransientLLMError, celery_app, configure_stage_concurrency, extract_zip, preprocess
+)
+from app.core.config import settings
+from app.models.pydantic_models import Action, ActionLawMap, Decision
+from app.services.hybrid_router import ROUTE_LLM_FILL, HybridExtractionRouter
+
+celery_app.conf.update(
+    broker_url='memory://',
+    result_backend='cache+memory://',
+    broker_transport_options={}
+)
+
+MAIN_DOCUMENT = '금융위 의결서(제2025-7호)_테스트은행에 대한 조치(공개용).pdf'
+COMPANION_DOCUMENT = '의결7.pdf'
+
+
+# 조치대상자 2인 중 Rule-based 추출기가 기관만 추출하는 문서 (LLM 보완 경로)
+PIPELINE_DOCUMENT = """금융위원회 의결서
+의안번호 제 2025-101 호
+1. 조치대상자의 인적사항
+기 관 ㈜가나산업
+임직원 ㈜가나산업 前 대표이사 甲
+2. 조치내용
+ㅇ ㈜가나산업 : 과징금 1,200백만원
+ㅇ 前 대표이사 甲 : 과징금 249백만원
+3. 조치이유
+가. 지적사항
+회사는 매출을 과대계상하였다.
+나. 근거법규
+「자본시장과 금융투자업에 관한 법률」 제429조 제3항
+"""
+PIPELINE_FILENAME = '금융위 의결서(제2025-101호)_㈜가나산업에 대한 조사·감리결과 조치안.pdf'
+
+
+class StubPipelineProcessor:
+    """PDFProcessorV2 대역 (전처리 결과 고정, Gemini 호출은 llm_errors를 차례로 발생시킨 뒤 성공)"""
+    
+    def __init__(self, llm_errors=()):
+        self.router = HybridExtractionRouter(threshold=1.0)
+        self.preprocessor = SimpleNamespace(preprocess_pdf=lambda pdf_path, data=None: {
+            'raw_text': PIPELINE_DOCUMENT, 'markdown_text': PIPELINE_DOCUMENT, 'sections': [], 'metadata': {}
+        })
+        self.llm_errors = list(llm_errors)
+        self.llm_calls = 0
+        self.persisted = []
+    
+    async def _extract_with_llm(self, preprocessed, pdf_path):
+        self.llm_calls += 1
+        if self.llm_errors:
+            raise self.llm_errors.pop(0)
+        law = ActionLawMap(law_name='자본시장과 금융투자업에 관한 법률', article_details='제429조 제3항')
+        actions = [
+            Action(entity_name=name, action_type='과징금', fine_amount=amount,
+                   violation_summary='매출 과대계상', action_law_map=[law])
+            for name, amount in (('㈜가나산업', 1_200_000_000), ('前 대표이사 甲', 249_000_000))
+        ]
+        decision = Decision(decision_year=2025, decision_id=101, title='조치안', full_text=PIPELINE_DOCUMENT, actions=actions)
+        return decision, {'tokens': 100}
+    
+    async def persist_decision(self, decision_data, pdf_path, extraction_route=None):
+        self.persisted.append((decision_data, extraction_route))
+        return {'success': True, 'actions_saved': [1, 2]}
+
+
+def run_eager_pipeline(monkeypatch, processor):
+    """preprocess 작업을 즉시 실행 모드로 발행 (다음 단계 작업도 같은 스레드에서 연쇄 실행)"""
+    monkeypatch.setattr(celery_module, '_processor', processor)
+    monkeypatch.setattr(settings, 'HYBRID_ROUTING_ENABLED', True)
+    celery_app.conf.update(task_always_eager=True, task_eager_propagates=True)
+    try:
+        return preprocess.delay(f'/tmp/pdf/{PIPELINE_FILENAME}').get()
+    finally:
+        celery_app.conf.update(task_always_eager=False, task_eager_propagates=False)
+
+
+def build_zip(path: Path):
+    """의결서 본문 + 보조 문서 + 의결서 외 파일"""
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr(f'의결서/{MAIN_DOCUMENT}', b'%PDF-1.4\n%main\n')
+        zf.writestr(COMPANION_DOCUMENT, b'%PDF-1.4\n%companion\n')
+        zf.writestr('안내.txt', '의결서 외 파일')
+
+
+def test_stage_routing_and_policies():
+    """작업별 단계 큐, LLM 속도 제한, 재시도 정책"""
+    expected = {
+        TASK_CRAWL: 'crawl',
+        TASK_EXTRACT_ZIP: 'extract',
+        TASK_PREPROCESS: 'preprocess',
+        TASK_LLM_EXTRACT: 'llm',
+        TASK_PERSIST: 'persist',
+    }
+    assert set(expected.values()) == set(STAGE_QUEUES)
+    for task_name, queue in expected.items():
+        assert celery_app.conf.task_routes[task_name]['queue'] == queue
+        assert task_name in celery_app.tasks
+    
+    llm_task = celery_app.tasks[TASK_LLM_EXTRACT]
+    assert llm_task.rate_limit == settings.CELERY_LLM_RATE_LIMIT
+    assert llm_task.max_retries == settings.CELERY_TASK_MAX_RETRIES
+    assert llm_task.autoretry_for == (TransientLLMError,)
+    # 전처리는 입력이 같으면 결과도 같으므로 재시도하지 않음
+    assert not getattr(celery_app.tasks[TASK_PREPROCESS], 'autoretry_for', ())
+
+
+def test_stage_worker_concurrency():
+    """단일 단계 큐 워커만 단계별 동시성 적용 (-c 지정 시 그대로)"""
+    conf = SimpleNamespace(worker_concurrency=None)
+    configure_stage_concurrency(conf=conf, options={'queues': 'llm'})
+    assert conf.worker_concurrency == settings.CELERY_CONCURRENCY_LLM
+    
+    conf = SimpleNamespace(worker_concurrency=None)
+    configure_stage_concurrency(conf=conf, options={'queues': ['llm'], 'concurrency': 8})
+    assert conf.worker_concurrency is None
+    
+    conf = SimpleNamespace(worker_concurrency=None)
+    configure_stage_concurrency(conf=conf, options={'queues': 'llm,persist'})
+    assert conf.worker_concurrency is None
+
+
+def test_extract_stage_with_memory_broker():
+    """extract 큐 워커가 ZIP을 풀고 본문만 preprocess 큐에 발행 (같은 ZIP은 원장 기준 1회)"""
+    overrides = ('RAW_ZIP_DIR', 'PROCESSED_PDF_DIR', 'CONTENT_STORE_DIR', 'CRAWL_STATE_PATH')
+    original = {name: getattr(settings, name) for name in overrides}
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        work_dir = Path(work_dir)
+        settings.RAW_ZIP_DIR = str(work_dir / 'raw_zip')
+        settings.PROCESSED_PDF_DIR = str(work_dir / 'processed_pdf')
+        settings.CONTENT_STORE_DIR = str(work_dir / 'content_store')
+        settings.CRAWL_STATE_PATH = str(work_dir / 'crawl_state.json')
+        try:
+            os.makedirs(settings.RAW_ZIP_DIR)
+            zip_name = '2025년 제7차 의결서.zip'
+            build_zip(work_dir / 'raw_zip' / zip_name)
+            
+            # preprocess 큐는 소비하지 않으므로 발행된 작업이 큐에 남음
+            with start_worker(celery_app, pool='solo', perform_ping_check=False, queues=['extract']):
+                result = extract_zip.delay(zip_name).get(timeout=10)
+                repeated = extract_zip.delay(zip_name).get(timeout=10)
+            
+            assert sorted(result['extracted_files']) == sorted([f'2025/{MAIN_DOCUMENT}', f'2025/{COMPANION_DOCUMENT}'])
+            assert result['queued'] == [os.path.join(settings.PROCESSED_PDF_DIR, '2025', MAIN_DOCUMENT)]
+            assert (work_dir / 'processed_pdf' / '2025' / COMPANION_DOCUMENT).exists()
+            assert repeated['extracted_files'] == [] and repeated['queued'] == []
+            
+            with celery_app.connection_for_read() as conn:
+                queue = conn.SimpleQueue('preprocess', no_ack=True)
+                message = queue.get(timeout=2)
+                assert message.headers['task'] == TASK_PREPROCESS
+                assert message.payload[0] == [result['queued'][0]]
+                queue.close()
+        finally:
+            for name, value in original.items():
+                setattr(settings, name, value)
+
+
+def test_eager_pipeline_chain(monkeypatch):
+    """Rule-based가 대상자를 누락한 문서: preprocess → llm(일시적 오류 1회 재시도) → persist"""
+    processor = StubPipelineProcessor(llm_errors=[ConnectionResetError('연결 끊김')])
+    result = run_eager_pipeline(monkeypatch, processor)
+    
+    assert result['next'] == 'llm' and result['missing'] == ['action_count']
+    assert processor.llm_calls == 2
+    assert len(processor.persisted) == 1
+    decision, route = processor.persisted[0]
+    assert route == ROUTE_LLM_FILL
+    assert (decision.decision_year, decision.decision_id) == (2025, 101)
+    assert sum(action.fine_amount for action in decision.actions) == 1_449_000_000
+
+
+def test_eager_pipeline_does_not_retry_extraction_failures(monkeypatch):
+    """응답 검증/추출 실패는 Celery에서 다시 시도하지 않음 (extract_with_retry가 이미 재시도)"""
+    processor = StubPipelineProcessor(llm_errors=[ValueError('JSON 파싱 실패'), ValueError('JSON 파싱 실패')])
+    with pytest.raises(ValueError):
+        run_eager_pipeline(monkeypatch, processor)
+    assert processor.llm_calls == 1
+    assert processor.persisted == []
+
+
+if __name__ == "__main__":
+    for test in (
+        test_stage_routing_and_policies,
+        test_stage_worker_concurrency,
+        test_extract_stage_with_memory_broker,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
+    for test in (
+        test_eager_pipeline_chain,
+        test_eager_pipeline_does_not_retry_extraction_failures,
+    ):
+        with pytest.MonkeyPatch.context() as patcher:
+            test(patcher)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
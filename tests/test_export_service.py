@@ -0,0 +1,151 @@
+"""
+의결서 일괄 내보내기 테스트
+- 조치 단위 행에 관련 법률을 묶어 batch_size 단위 청크로 스트리밍
+- 고급 검색과 같은 필터 적용
+- CSV(BOM, 헤더, 법률 문자열), gzip 실시간 압축, Parquet 왕복
+"""
+import csv
+import gzip
+import io
+import json
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionLawMapV2, ActionV2, DecisionV2, LawV2
+from app.services.export_service_v2 import ExportServiceV2
+
+CAPITAL_MARKETS_ACT = '자본시장과 금융투자업에 관한 법률'
+BANKING_ACT = '은행법'
+
+
+def make_database(work_dir: str):
+    """의결서 2건, 조치 3건(법률 2개/1개/없음)이 있는 임시 DB → 엔진"""
+    engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    
+    session = sessionmaker(bind=engine)()
+    capital_markets = LawV2(law_name=CAPITAL_MARKETS_ACT, law_short_name='자본시장법')
+    banking = LawV2(law_name=BANKING_ACT, law_short_name='은행법')
+    
+    first = DecisionV2(
+        decision_year=2025, decision_id=1, title='의결 1', category_1='제재',
+        submission_date=date(2025, 3, 5), full_text='본문 1'
+    )
+    fined = ActionV2(entity_name='㈜가나증권', violation_summary='공시 위반', industry_sector='금융투자',
+                     action_type='과징금', fine_amount=300_000_000)
+    fined.law_mappings = [
+        ActionLawMapV2(law=capital_markets, article_details='제429조'),
+        ActionLawMapV2(law=banking, article_details='제34조'),
+    ]
+    warned = ActionV2(entity_name='前 대표이사 甲', violation_summary='공시 위반', industry_sector='금융투자',
+                      action_type='경고')
+    warned.law_mappings = [ActionLawMapV2(law=capital_markets, article_details='제429조')]
+    first.actions = [fined, warned]
+    
+    second = DecisionV2(decision_year=2024, decision_id=2, title='의결 2', category_1='제재', full_text='본문 2')
+    second.actions = [ActionV2(entity_name='㈜다라은행', violation_summary='보고 지연', industry_sector='은행',
+                               action_type='과태료', fine_amount=12_000_000)]
+    
+    session.add_all([first, second])
+    session.commit()
+    session.close()
+    return engine
+
+
+@pytest.fixture
+def service():
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = make_database(work_dir)
+        try:
+            yield ExportServiceV2(session_factory=sessionmaker(bind=engine), batch_size=2)
+        finally:
+            engine.dispose()
+
+
+def test_ndjson_groups_laws_per_action(service):
+    """조치 하나가 한 줄, 법률 조인 행은 laws 목록으로 묶이고 batch_size마다 청크 하나"""
+    chunks = list(service.stream({}, fmt='ndjson'))
+    assert len(chunks) == 2
+    
+    rows = [json.loads(line) for line in b''.join(chunks).decode('utf-8').splitlines()]
+    assert [row['entity_name'] for row in rows] == ['㈜가나증권', '前 대표이사 甲', '㈜다라은행']
+    assert [law['article_details'] for law in rows[0]['laws']] == ['제429조', '제34조']
+    assert [law['law_short_name'] for law in rows[1]['laws']] == ['자본시장법']
+    assert rows[2]['laws'] == []
+    assert rows[0]['submission_date'] == '2025-03-05'
+    assert 'full_text' not in rows[0]
+    
+    with_text = json.loads(next(service.stream({}, fmt='ndjson', include_full_text=True)).splitlines()[0])
+    assert with_text['full_text'] == '본문 1'
+
+
+def test_filters_match_advanced_search(service):
+    """고급 검색 조건(연도, 조치유형, 금액 범위) 적용"""
+    def entities(criteria):
+        body = b''.join(service.stream(criteria, fmt='ndjson')).decode('utf-8')
+        return [json.loads(line)['entity_name'] for line in body.splitlines()]
+    
+    assert entities({'decision_year': 2024}) == ['㈜다라은행']
+    assert entities({'action_type': '경고'}) == ['前 대표이사 甲']
+    assert entities({'min_fine_amount': 100_000_000}) == ['㈜가나증권']
+    assert entities({'industry_sector': '보험'}) == []
+
+
+def test_csv_and_gzip(service):
+    """CSV는 BOM과 헤더, 법률은 '; '로 연결 / gzip 스트림은 풀면 원본과 같음"""
+    body = b''.join(service.stream({}, fmt='csv'))
+    assert body.startswith('\ufeff'.encode('utf-8'))
+    
+    rows = list(csv.DictReader(io.StringIO(body.decode('utf-8-sig'))))
+    assert len(rows) == 3
+    assert rows[0]['laws'] == f'{CAPITAL_MARKETS_ACT} 제429조; {BANKING_ACT} 제34조'
+    assert rows[2]['fine_amount'] == '12000000' and rows[2]['laws'] == ''
+    
+    assert gzip.decompress(b''.join(service.stream({}, fmt='csv', compress=True))) == body
+    
+    empty = b''.join(service.stream({'decision_year': 2000}, fmt='csv')).decode('utf-8-sig')
+    assert empty.splitlines()[0].startswith('decision_pk,decision_year')
+
+
+def test_parquet_round_trip(service):
+    """Parquet은 batch_size 단위 row group, 법률은 struct 목록"""
+    pq = pytest.importorskip('pyarrow.parquet')
+    
+    parquet_file = pq.ParquetFile(io.BytesIO(b''.join(service.stream({}, fmt='parquet'))))
+    assert parquet_file.metadata.num_row_groups == 2
+    
+    table = parquet_file.read()
+    assert table.column('fine_amount').to_pylist() == [300_000_000, None, 12_000_000]
+    assert [law['law_name'] for law in table.column('laws').to_pylist()[0]] == [CAPITAL_MARKETS_ACT, BANKING_ACT]
+
+
+def test_unknown_format_rejected(service):
+    with pytest.raises(ValueError):
+        service.stream({}, fmt='xlsx')
+
+
+if __name__ == "__main__":
+    for test in (
+        test_ndjson_groups_laws_per_action,
+        test_filters_match_advanced_search,
+        test_csv_and_gzip,
+        test_parquet_round_trip,
+        test_unknown_format_rejected,
+    ):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = make_database(directory)
+            try:
+                test(ExportServiceV2(session_factory=sessionmaker(bind=engine), batch_size=2))
+            finally:
+                engine.dispose()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
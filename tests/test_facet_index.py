@@ -0,0 +1,163 @@
+"""
+고급 검색 패싯 인덱스 테스트
+- 비트맵 필터/패싯 결과가 SQL 고급 검색과 같은지 확인
+- 다른 엔진(다른 프로세스 역할)으로 저장/수정/삭제한 행이 재시작 없이 다음 조회에 반영되는지 확인
+"""
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionV2, DecisionV2
+from app.services.facet_index import FacetIndex
+from app.services.search_service_v2 import apply_advanced_criteria
+
+DECISIONS = [
+    # (decision_id, 연도, 대분류, [(업권, 조치유형, 금액)])
+    (1, 2024, '제재', [('은행', '과태료', 5_000_000)]),
+    (2, 2025, '제재', [('은행', '과징금', 300_000_000), ('은행', '과태료', 20_000_000)]),
+    (3, 2025, '제재', [('보험', '과태료', 60_000_000)]),
+    (4, 2025, '인허가', []),
+]
+
+
+def add_decision(session, decision_id, year, category, actions):
+    decision = DecisionV2(
+        decision_year=year, decision_id=decision_id, title=f'의결 {decision_id}',
+        category_1=category, full_text='본문'
+    )
+    for sector, action_type, amount in actions:
+        decision.actions.append(ActionV2(
+            entity_name=f'기관{decision_id}', violation_summary='위반',
+            industry_sector=sector, action_type=action_type, fine_amount=amount
+        ))
+    session.add(decision)
+
+
+def make_database(work_dir: str):
+    url = f"sqlite:///{work_dir}/test.sqlite"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for row in DECISIONS:
+        add_decision(session, *row)
+    session.commit()
+    session.close()
+    return url, engine
+
+
+def sql_search(session, criteria):
+    """SQL 고급 검색 결과 decision_pk (비교 기준)"""
+    query = session.query(DecisionV2.decision_pk).join(
+        ActionV2, DecisionV2.decision_pk == ActionV2.decision_pk, isouter=True
+    )
+    return sorted(row[0] for row in apply_advanced_criteria(query, criteria).distinct())
+
+
+def test_bitmap_search_matches_sql():
+    """범주형/금액 조건 조합별로 SQL 고급 검색과 같은 의결서 선택, 패싯은 고유 의결서 수"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        _, engine = make_database(work_dir)
+        make_session = sessionmaker(bind=engine)
+        index = FacetIndex(session_factory=make_session)
+        session = make_session()
+        try:
+            for criteria in (
+                {},
+                {'decision_year': 2025},
+                {'industry_sector': '은행', 'action_type': '과태료'},
+                {'min_fine_amount': 10_000_000, 'max_fine_amount': 100_000_000},
+                {'category_1': '인허가'},
+                {'industry_sector': '증권'},
+            ):
+                assert index.search(criteria) == sql_search(session, criteria), criteria
+            
+            facets = index.facets({'decision_year': 2025})
+        finally:
+            session.close()
+            engine.dispose()
+    
+    assert FacetIndex.supports({'decision_year': 2025}) and not FacetIndex.supports({'keyword': '은행'})
+    assert facets['total_decisions'] == 3
+    assert facets['facets']['action_type'] == [{'value': '과태료', 'count': 2}, {'value': '과징금', 'count': 1}]
+    assert facets['facets']['industry_sector'] == [{'value': '은행', 'count': 1}, {'value': '보험', 'count': 1}]
+    assert {'value': '1억원~10억원', 'count': 1} in facets['facets']['fine_bucket']
+
+
+def test_changes_from_another_engine_are_visible():
+    """다른 엔진으로 저장(증분), 기존 의결서 수정/조치 추가/삭제(전체 재적재)한 내용이 다음 조회에 반영"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        url, engine = make_database(work_dir)
+        index = FacetIndex(session_factory=sessionmaker(bind=engine))
+        assert index.search({'decision_year': 2026}) == []
+        rows_before = index.size
+        
+        # 다른 프로세스(스크립트/Celery persist 워커) 역할의 별도 엔진
+        writer_engine = create_engine(url)
+        writer = sessionmaker(bind=writer_engine)()
+        try:
+            add_decision(writer, 5, 2026, '제재', [('증권', '과징금', 1_000_000)])
+            writer.commit()
+            assert index.search({'decision_year': 2026}) == [5]
+            assert index.size == rows_before + 1
+            
+            # 기존 의결서 수정 (수정 시각 갱신)
+            writer.execute(text(
+                "UPDATE actions_v2 SET industry_sector = '증권', updated_at = :updated WHERE decision_pk = 3"
+            ), {'updated': datetime.now() + timedelta(minutes=1)})
+            writer.commit()
+            assert index.search({'industry_sector': '증권'}) == [3, 5]
+            
+            # 기존 의결서에 조치 추가
+            writer.add(ActionV2(
+                decision_pk=4, entity_name='기관4', violation_summary='위반', action_type='경고'
+            ))
+            writer.commit()
+            assert index.search({'action_type': '경고'}) == [4]
+            
+            # 삭제
+            writer.execute(text("DELETE FROM actions_v2 WHERE decision_pk = 1"))
+            writer.execute(text("DELETE FROM decisions_v2 WHERE decision_pk = 1"))
+            writer.commit()
+            assert index.search({'decision_year': 2024}) == []
+            assert index.facets({})['total_decisions'] == 4
+        finally:
+            writer.close()
+            writer_engine.dispose()
+            engine.dispose()
+
+
+def test_unchanged_database_is_not_reloaded():
+    """변경이 없으면 재적재하지 않고, max_age가 지나면 전체 재적재"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        _, engine = make_database(work_dir)
+        index = FacetIndex(session_factory=sessionmaker(bind=engine))
+        try:
+            index.search({})
+            decision_pks = index.decision_pks
+            assert index.refresh() == 0
+            assert index.decision_pks is decision_pks
+            
+            index.max_age = 0
+            index.search({})
+            assert index.decision_pks is not decision_pks
+            assert index.size == len(decision_pks)
+        finally:
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    for test in (
+        test_bitmap_search_matches_sql,
+        test_changes_from_another_engine_are_visible,
+        test_unchanged_database_is_not_reloaded,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+과징금/과태료 분석 인덱스 테스트
+- 요약/백분위수/로그 히스토그램/산정근거 비율/연도별 증감이 직접 계산한 값과 같은지 확인
+- 연도/업권/조치유형 필터 (없는 값은 빈 결과)
+- 다른 엔진(다른 프로세스 역할)으로 저장한 조치는 다음 조회에서 증분 적재, 수정/삭제는 전체 재적재
+"""
+import statistics
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionV2, DecisionV2
+from app.services.fine_analytics_service import FineAnalyticsIndex
+
+ACTIONS = [
+    # (연도, 업권, 조치유형, 금액, 산정근거 금액)
+    (2023, '은행', '과태료', 10_000_000, 20_000_000),
+    (2024, '은행', '과징금', 300_000_000, 1_000_000_000),
+    (2024, '보험', '과태료', 50_000_000, None),
+    (2024, '보험', '경고', None, None),
+    (2025, '은행', '과징금', 900_000_000, 1_000_000_000),
+]
+
+
+def add_actions(session, actions, decision_id_start: int = 1):
+    for offset, (year, sector, action_type, fine, basis) in enumerate(actions):
+        decision = DecisionV2(
+            decision_year=year, decision_id=decision_id_start + offset,
+            title=f'의결 {decision_id_start + offset}', full_text='본문'
+        )
+        decision.actions.append(ActionV2(
+            entity_name='기관', violation_summary='위반', industry_sector=sector,
+            action_type=action_type, fine_amount=fine, fine_basis_amount=basis
+        ))
+        session.add(decision)
+    session.commit()
+
+
+@contextmanager
+def fine_index():
+    """임시 DB와 분석 인덱스 → (인덱스, 다른 엔진의 쓰기용 세션)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        index = FineAnalyticsIndex(session_factory=sessionmaker(bind=engine))
+        
+        # 다른 프로세스(스크립트/Celery persist 워커) 역할의 별도 엔진
+        writer_engine = create_engine(f"sqlite:///{work_dir}/test.sqlite")
+        writer = sessionmaker(bind=writer_engine)()
+        add_actions(writer, ACTIONS)
+        try:
+            yield index, writer
+        finally:
+            writer.close()
+            writer_engine.dispose()
+            engine.dispose()
+
+
+@pytest.fixture
+def database():
+    with fine_index() as context:
+        yield context
+
+
+def test_statistics_match_reference(database):
+    """전체 조치 통계가 직접 계산한 값과 같음 (금액 없는 조치는 건수에만 포함)"""
+    index, _ = database
+    result = index.analyze()
+    fines = [fine for _, _, _, fine, _ in ACTIONS if fine is not None]
+    
+    assert result['summary'] == {
+        'actions': 5, 'actions_with_fine': 4, 'total': sum(fines),
+        'mean': statistics.mean(fines), 'min': min(fines), 'max': max(fines)
+    }
+    assert result['percentiles']['p50'] == statistics.median(fines)
+    
+    histogram = result['log_histogram']
+    assert sum(bucket['count'] for bucket in histogram) == 4
+    assert histogram[0]['min'] == pytest.approx(1e7) and histogram[-1]['max'] == pytest.approx(1e9)
+    
+    ratios = [0.5, 0.3, 0.9]
+    ratio = result['fine_to_basis_ratio']
+    assert ratio['count'] == 3
+    assert ratio['mean'] == pytest.approx(statistics.mean(ratios))
+    assert ratio['median'] == pytest.approx(statistics.median(ratios))
+    
+    assert result['yearly'] == [
+        {'year': 2023, 'actions': 1, 'total': 10_000_000, 'delta': None, 'change_pct': None},
+        {'year': 2024, 'actions': 3, 'total': 350_000_000, 'delta': 340_000_000, 'change_pct': 3400.0},
+        {'year': 2025, 'actions': 1, 'total': 900_000_000, 'delta': 550_000_000, 'change_pct': 157.14},
+    ]
+
+
+def test_filters(database):
+    """연도/업권/조치유형 조합 필터, 없는 값은 빈 결과"""
+    index, _ = database
+    
+    banks = index.analyze(industry_sector='은행', action_type='과징금')
+    assert banks['summary']['total'] == 1_200_000_000
+    assert [row['year'] for row in banks['yearly']] == [2024, 2025]
+    
+    insurance_2024 = index.analyze(decision_year=2024, industry_sector='보험')
+    assert insurance_2024['summary']['actions'] == 2
+    assert insurance_2024['summary']['actions_with_fine'] == 1
+    assert insurance_2024['fine_to_basis_ratio']['count'] == 0
+    
+    unknown = index.analyze(industry_sector='증권')
+    assert unknown['summary']['actions'] == 0 and unknown['summary']['mean'] is None
+    assert unknown['percentiles']['p50'] is None
+    assert unknown['log_histogram'] == [] and unknown['yearly'] == []
+
+
+def test_changes_from_another_engine_are_visible(database):
+    """다른 엔진으로 추가한 조치는 증분 적재, 기존 조치 수정/삭제는 전체 재적재 후 반영"""
+    index, writer = database
+    assert index.analyze()['summary']['actions'] == 5
+    assert index.refresh() == 0
+    
+    add_actions(writer, [(2025, '증권', '과징금', 2_000_000_000, None)], decision_id_start=100)
+    result = index.analyze(industry_sector='증권')
+    assert result['summary']['total'] == 2_000_000_000
+    assert index.size == 6
+    
+    # 기존 조치 수정 (수정 시각 갱신)
+    writer.execute(text(
+        "UPDATE actions_v2 SET fine_amount = 30000000, updated_at = :updated WHERE action_id = 1"
+    ), {'updated': datetime.now() + timedelta(minutes=1)})
+    writer.commit()
+    assert index.analyze(decision_year=2023)['summary']['total'] == 30_000_000
+    
+    # 삭제
+    writer.execute(text("DELETE FROM actions_v2 WHERE action_id = 5"))
+    writer.commit()
+    assert index.analyze(decision_year=2025)['summary']['total'] == 2_000_000_000
+    assert index.size == 5
+
+
+if __name__ == "__main__":
+    for test in (
+        test_statistics_match_reference,
+        test_filters,
+        test_changes_from_another_engine_are_visible,
+    ):
+        with fine_index() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
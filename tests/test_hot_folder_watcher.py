@@ -0,0 +1,198 @@
+"""
+핫 폴더 감시 테스트
+- 폴링: 새 PDF 처리, 내용이 같으면 건너뜀, 내용이 바뀌면 다시 처리 (이미 저장된 의결서는 existing으로 집계)
+- inotify: 쓰기가 이어지는 동안은 디바운스로 한 번만 처리, 새 연도 폴더 감시 추가
+- ZIP: 감시가 압축 해제한 PDF는 한 번만 처리, 수집 작업이 압축 해제한 ZIP/PDF는 건너뜀
+- 원장/크롤링 상태: 여러 인스턴스가 저장해도 서로의 기록을 덮어쓰지 않음
+(실제 PDF/Gemini 없이 process_single_pdf 결과 형식만 흉내냄)
+"""
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.content_store import ExtractionLedger
+from app.services.crawl_state import CrawlState
+from app.services.fsc_crawler import FSCCrawler
+from app.services.hot_folder_watcher import HotFolderWatcher, InotifyWatcher
+
+DOCUMENT_NAME = '금융위 의결서(제2025-{number}호)_테스트.pdf'
+
+
+class FakeProcessor:
+    """처리한 경로와 그때의 파일 크기를 기록 (같은 파일명은 두 번째부터 이미 저장된 의결서)"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def process_single_pdf(self, pdf_path, data=None):
+        saved = all(os.path.basename(path) != os.path.basename(pdf_path) for path, _ in self.calls)
+        self.calls.append((pdf_path, os.path.getsize(pdf_path)))
+        return {'success': True, 'db_result': {'success': saved}}
+
+
+class RunningWatcher:
+    """감시를 별도 스레드에서 실행하는 컨텍스트"""
+    
+    def __init__(self, work_dir: str, **options):
+        self.raw_zip_dir = os.path.join(work_dir, 'raw_zip')
+        self.processed_pdf_dir = os.path.join(work_dir, 'processed_pdf')
+        self.processor = FakeProcessor()
+        self.watcher = HotFolderWatcher(
+            processor=self.processor,
+            raw_zip_dir=self.raw_zip_dir,
+            processed_pdf_dir=self.processed_pdf_dir,
+            state_path=os.path.join(work_dir, 'watcher_state.json'),
+            **options
+        )
+    
+    def __enter__(self):
+        self.thread = self.watcher.start_in_thread()
+        wait_until(lambda: self.watcher._queue is not None)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.watcher.stop()
+        self.thread.join(5)
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.02)
+    raise AssertionError('조건 대기 시간 초과')
+
+
+def settle(watcher: HotFolderWatcher, seconds: float = 0.5):
+    """대기 중인 이벤트가 모두 처리될 때까지 대기"""
+    time.sleep(seconds)
+    wait_until(lambda: not watcher._pending and watcher._queue.empty())
+
+
+def write_zip(path: str, numbers):
+    with zipfile.ZipFile(path, 'w') as zf:
+        for number in numbers:
+            zf.writestr(f'의결서/{DOCUMENT_NAME.format(number=number)}', f'%PDF-1.4\n%zip {number}\n'.encode())
+
+
+@pytest.fixture
+def work_dir(monkeypatch):
+    with tempfile.TemporaryDirectory() as directory:
+        monkeypatch.setattr(settings, 'CONTENT_STORE_DIR', os.path.join(directory, 'content_store'))
+        monkeypatch.setattr(settings, 'CRAWL_STATE_PATH', os.path.join(directory, 'crawl_state.json'))
+        yield directory
+
+
+def test_polling_processes_new_and_changed_pdfs(work_dir):
+    """폴링 경로: 새 PDF 처리, mtime만 바뀌면 건너뜀, 내용이 바뀌면 다시 처리하되 이미 저장된 의결서로 집계"""
+    with RunningWatcher(work_dir, use_inotify=False, poll_interval=0.05, debounce_seconds=0.1) as running:
+        year_dir = Path(running.processed_pdf_dir) / '2025'
+        year_dir.mkdir()
+        pdf_path = year_dir / DOCUMENT_NAME.format(number=1)
+        pdf_path.write_bytes(b'%PDF-1.4\n%v1\n')
+        (year_dir / '의결1.pdf').write_bytes(b'%PDF-1.4\n%attachment\n')
+        wait_until(lambda: running.watcher.stats['processed'] == 1)
+        
+        os.utime(pdf_path, (time.time() + 10, time.time() + 10))
+        wait_until(lambda: running.watcher.stats['unchanged'] == 1)
+        
+        pdf_path.write_bytes(b'%PDF-1.4\n%v2 changed\n')
+        wait_until(lambda: running.watcher.stats['existing'] == 1)
+        settle(running.watcher)
+    
+    assert [os.path.basename(path) for path, _ in running.processor.calls] == [pdf_path.name, pdf_path.name]
+    assert running.watcher.stats['failed'] == 0
+
+
+@pytest.mark.skipif(not InotifyWatcher.available(), reason='inotify 미지원 환경')
+def test_inotify_debounces_writes(work_dir):
+    """inotify 경로: 디바운스 시간 안에 이어진 쓰기는 마지막 내용으로 한 번만 처리, 새 연도 폴더도 감시"""
+    with RunningWatcher(work_dir, use_inotify=True, debounce_seconds=0.3) as running:
+        year_dir = Path(running.processed_pdf_dir) / '2026'
+        year_dir.mkdir()
+        time.sleep(0.1)  # 새 폴더 감시 추가 대기
+        
+        pdf_path = year_dir / DOCUMENT_NAME.format(number=2)
+        for chunk in range(5):
+            with open(pdf_path, 'ab') as f:
+                f.write(b'%PDF chunk\n')
+            time.sleep(0.05)
+        wait_until(lambda: running.watcher.stats['processed'] == 1)
+        settle(running.watcher)
+    
+    assert running.processor.calls == [(str(pdf_path), 5 * len(b'%PDF chunk\n'))]
+    assert running.watcher.stats['events'] >= 5
+
+
+def test_zip_pdfs_processed_once_and_job_extractions_skipped(work_dir):
+    """감시가 해제한 ZIP의 PDF는 한 번만 처리, 수집 작업(다른 크롤러 인스턴스)이 해제한 ZIP은 작업 몫으로 건너뜀"""
+    with RunningWatcher(work_dir, use_inotify=False, poll_interval=0.05, debounce_seconds=0.2) as running:
+        write_zip(os.path.join(running.raw_zip_dir, '2025년 제1차 의결서.zip'), [10, 11])
+        wait_until(lambda: running.watcher.stats['processed'] == 2)
+        settle(running.watcher)
+        
+        # 수집 작업: 다운로드 직후 같은 ZIP 원장으로 압축 해제 (감시의 디바운스보다 먼저)
+        job_crawler = FSCCrawler(raw_zip_dir=running.raw_zip_dir, processed_pdf_dir=running.processed_pdf_dir)
+        job_zip = '2025년 제2차 의결서.zip'
+        write_zip(os.path.join(running.raw_zip_dir, job_zip), [20])
+        assert job_crawler.extract_zip_files([job_zip]) == [f'2025/{DOCUMENT_NAME.format(number=20)}']
+        wait_until(lambda: running.watcher.stats['extracted'] >= 1)
+        settle(running.watcher)
+    
+    processed = sorted(os.path.basename(path) for path, _ in running.processor.calls)
+    assert processed == [DOCUMENT_NAME.format(number=10), DOCUMENT_NAME.format(number=11)]
+    assert running.watcher.stats['zips'] == 2
+
+
+def test_shared_ledger_and_state_are_merged(work_dir):
+    """먼저 읽어 둔 인스턴스가 나중에 저장해도 다른 인스턴스의 원장/상태 기록이 남음"""
+    ledger_path = Path(work_dir) / 'ledger.json'
+    watcher_ledger = ExtractionLedger(ledger_path)
+    job_ledger = ExtractionLedger(ledger_path)
+    job_ledger.record('a' * 64, 'job.zip', [{'sha256': 'b' * 64, 'name': 'job.pdf', 'path': '2025/job.pdf'}])
+    job_ledger.save()
+    watcher_ledger.record('c' * 64, 'watcher.zip', [])
+    watcher_ledger.save()
+    
+    merged = ExtractionLedger(ledger_path)
+    assert set(merged.zips) == {'a' * 64, 'c' * 64}
+    assert merged.contains_pdf('b' * 64) and watcher_ledger.contains_pdf('b' * 64)
+    
+    state_path = str(Path(work_dir) / 'state.json')
+    job_state = CrawlState(state_path)
+    watcher_state = CrawlState(state_path)
+    job_state.advance(120, (), datetime(2025, 1, 1), datetime(2025, 3, 31))
+    job_state.record_file('https://example/1', 'job.zip', 'd' * 64, 10)
+    job_state.save()
+    watcher_state.record_file('https://example/2', 'watcher.zip', 'e' * 64, 10)
+    watcher_state.save()
+    
+    merged = CrawlState(state_path)
+    assert merged.high_water_post_no == 120
+    assert set(merged.files) == {'https://example/1', 'https://example/2'}
+
+
+if __name__ == "__main__":
+    for test in (
+        test_polling_processes_new_and_changed_pdfs,
+        test_inotify_debounces_writes,
+        test_zip_pdfs_processed_once_and_job_extractions_skipped,
+        test_shared_ledger_and_state_are_merged,
+    ):
+        with pytest.MonkeyPatch.context() as patcher:
+            with tempfile.TemporaryDirectory() as directory:
+                patcher.setattr(settings, 'CONTENT_STORE_DIR', os.path.join(directory, 'content_store'))
+                patcher.setattr(settings, 'CRAWL_STATE_PATH', os.path.join(directory, 'crawl_state.json'))
+                test(directory)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
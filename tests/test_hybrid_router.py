@@ -0,0 +1,173 @@
+"""
+하이브리드 추출 라우터 테스트
+- 완전성 점수: 나열된 조치대상자 중 일부만 추출되면 LLM 보완 경로로 보냄
+- to_decision: Rule-based 결과 → Decision (의결번호, 분류, 법규, 위반 요약)
+- merge: Rule-based가 충족한 필드만 유지하고 나머지는 LLM 결과 사용
+(실제 Gemini 호출 없음)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.pydantic_models import Action, ActionLawMap, Decision
+from app.services.hybrid_router import (
+    ROUTE_LLM_FILL,
+    ROUTE_RULE_ONLY,
+    HybridExtractionRouter,
+)
+
+FILENAME = '금융위 의결서(제2025-101호)_㈜가나산업에 대한 조사·감리결과 조치안.pdf'
+
+DOCUMENT = """금융위원회 의결서
+의안번호 제 2025-101 호
+안 건 명 ㈜가나산업의 사업보고서 등에 대한 조사·감리결과 조치안
+1. 조치대상자의 인적사항
+기 관 ㈜가나산업
+임직원 ㈜가나산업 前 대표이사 甲
+2. 조치내용
+{actions}
+3. 조치이유
+가. 지적사항
+회사는 매출을 과대계상하였다.
+나. 근거법규
+「자본시장과 금융투자업에 관한 법률」 제429조 제3항
+"""
+
+# 대상자 2인이 모두 추출되는 형식
+BOTH_TARGETS = DOCUMENT.format(actions="ㅇ ㈜가나산업\n- 과징금 1,200백만원\nㅇ 前 대표이사 甲\n- 과징금 249백만원")
+
+# Rule-based 추출기가 기관만 추출하는 형식 (前 대표이사 甲과 249백만원 누락)
+FIRST_TARGET_ONLY = DOCUMENT.format(actions="ㅇ ㈜가나산업 : 과징금 1,200백만원\nㅇ 前 대표이사 甲 : 과징금 249백만원")
+
+# 조치대상자 1인 문서
+SINGLE_FILENAME = '금융위 의결서(제2025-102호)_㈜다라증권에 대한 검사결과 조치안.pdf'
+SINGLE_TARGET = """금융위원회 의결서
+의안번호 제 2025-102 호
+1. 조치대상자의 인적사항
+기 관 ㈜다라증권
+2. 조치내용
+ㅇ ㈜다라증권
+- 과태료 12백만원
+3. 조치이유
+가. 지적사항
+투자권유 과정에서 설명의무를 위반하였다.
+나. 근거법규
+「금융소비자 보호에 관한 법률」 제19조 제1항
+"""
+
+
+def llm_decision() -> Decision:
+    """LLM이 두 대상자를 모두 추출한 결과 (의결번호는 잘못 읽음)"""
+    law = ActionLawMap(law_name='자본시장과 금융투자업에 관한 법률', article_details='제429조 제3항')
+    return Decision(
+        decision_year=2025,
+        decision_id=999,
+        title='㈜가나산업 조사·감리결과 조치안',
+        full_text=FIRST_TARGET_ONLY,
+        actions=[
+            Action(entity_name='㈜가나산업', action_type='과징금', fine_amount=1_200_000_000,
+                   violation_summary='매출 과대계상', action_law_map=[law]),
+            Action(entity_name='前 대표이사 甲', action_type='과징금', fine_amount=249_000_000,
+                   violation_summary='매출 과대계상', action_law_map=[law]),
+        ]
+    )
+
+
+def test_score_counts_listed_targets():
+    """두 대상자가 모두 추출되면 1.0, 기관만 추출되면 action_count 미충족"""
+    router = HybridExtractionRouter(threshold=1.0)
+    
+    rule_result = router.extractor.extract_full_document_structure(BOTH_TARGETS, FILENAME)
+    score, fields = router.score(rule_result, BOTH_TARGETS, FILENAME)
+    assert score == 1.0 and all(fields.values())
+    
+    rule_result = router.extractor.extract_full_document_structure(FIRST_TARGET_ONLY, FILENAME)
+    assert len(rule_result['actions']) == 1
+    score, fields = router.score(rule_result, FIRST_TARGET_ONLY, FILENAME)
+    assert not fields['action_count']
+    assert [field for field, complete in fields.items() if not complete] == ['action_count']
+    assert score < 1.0
+    
+    rule_result = router.extractor.extract_full_document_structure(SINGLE_TARGET, SINGLE_FILENAME)
+    score, fields = router.score(rule_result, SINGLE_TARGET, SINGLE_FILENAME)
+    assert fields['action_count'] and score == 1.0
+
+
+def test_to_decision():
+    """Rule-based 결과의 의결번호/분류/금액/법규/위반 요약이 Decision에 반영"""
+    router = HybridExtractionRouter()
+    rule_result = router.extractor.extract_full_document_structure(BOTH_TARGETS, FILENAME)
+    decision = router.to_decision(rule_result, BOTH_TARGETS, {}, FILENAME)
+    
+    assert (decision.decision_year, decision.decision_id) == (2025, 101)
+    assert decision.agenda_no == '제101호'
+    assert (decision.category_1, decision.category_2) == ('제재', '기관')
+    assert len(decision.actions) == 1
+    action = decision.actions[0]
+    assert action.entity_name == '㈜가나산업 외 1인'
+    assert action.fine_amount == 1_449_000_000
+    assert action.action_type == '과징금'
+    assert [target['entity_name'] for target in action.target_details['targets']] == ['㈜가나산업', '前 대표이사 甲']
+    assert action.action_law_map[0].law_name == '자본시장과 금융투자업에 관한 법률'
+    assert not action.violation_summary.startswith('지적사항')
+
+
+def test_merge_uses_llm_actions_when_targets_missing():
+    """조치 수가 모자라면 LLM 조치 사용, 의결번호는 Rule-based 유지"""
+    router = HybridExtractionRouter()
+    rule_result = router.extractor.extract_full_document_structure(FIRST_TARGET_ONLY, FILENAME)
+    _, fields = router.score(rule_result, FIRST_TARGET_ONLY, FILENAME)
+    rule_decision = router.to_decision(rule_result, FIRST_TARGET_ONLY, {}, FILENAME)
+    
+    merged = router.merge(rule_decision, llm_decision(), fields)
+    assert (merged.decision_year, merged.decision_id) == (2025, 101)
+    assert [action.entity_name for action in merged.actions] == ['㈜가나산업', '前 대표이사 甲']
+    assert sum(action.fine_amount for action in merged.actions) == 1_449_000_000
+
+
+def test_merge_fills_only_missing_laws():
+    """조치가 완전하고 법규만 누락이면 Rule-based 조치에 LLM 법규만 채움"""
+    router = HybridExtractionRouter()
+    rule_result = router.extractor.extract_full_document_structure(BOTH_TARGETS, FILENAME)
+    rule_decision = router.to_decision(rule_result, BOTH_TARGETS, {}, FILENAME)
+    rule_decision.actions[0].action_law_map = []
+    fields = {'decision_number': True, 'entities': True, 'fine_amounts': True,
+              'laws': False, 'action_types': True, 'action_count': True}
+    
+    merged = router.merge(rule_decision, llm_decision(), fields)
+    assert [action.entity_name for action in merged.actions] == ['㈜가나산업 외 1인']
+    assert [law.article_details for law in merged.actions[0].action_law_map] == ['제429조 제3항']
+
+
+def test_route_calls_llm_only_when_incomplete():
+    """완전한 문서는 LLM 생략, 대상자가 누락된 문서는 LLM 1회 호출 후 보완"""
+    router = HybridExtractionRouter(threshold=1.0)
+    calls = []
+    
+    async def llm_extract():
+        calls.append(1)
+        return llm_decision()
+    
+    decision, routing = asyncio.run(router.route(BOTH_TARGETS, {}, llm_extract, FILENAME))
+    assert routing['route'] == ROUTE_RULE_ONLY and not calls
+    assert decision.actions[0].fine_amount == 1_449_000_000
+    
+    decision, routing = asyncio.run(router.route(FIRST_TARGET_ONLY, {}, llm_extract, FILENAME))
+    assert routing['route'] == ROUTE_LLM_FILL and routing['missing'] == ['action_count']
+    assert len(calls) == 1 and len(decision.actions) == 2
+    assert router.stats[ROUTE_RULE_ONLY] == 1 and router.stats[ROUTE_LLM_FILL] == 1
+
+
+if __name__ == "__main__":
+    for test in (
+        test_score_counts_listed_targets,
+        test_to_decision,
+        test_merge_uses_llm_actions_when_targets_missing,
+        test_merge_fills_only_missing_laws,
+        test_route_calls_llm_only_when_incomplete,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""
+수집 작업 관리자 테스트
+- directory 작업은 PROCESSED_PDF_DIR 하위만 허용
+- 제출한 작업이 백그라운드에서 처리되고 진행 상태가 기록되는지 확인
+- 다른 프로세스(같은 DB를 쓰는 별도 관리자)의 취소 요청으로 처리 중인 문서를 마친 뒤 중단
+- 여러 프로세스가 동시에 재개해도 한 번만 실행, 갱신이 끊긴 실행 중 작업만 재개하고 처리한 PDF는 건너뜀
+(실제 PDF/Gemini 없이 process_single_pdf 결과 형식만 흉내냄)
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.fsc_models_v2 import IngestJobV2
+from app.services.ingest_job_manager import (
+    STATUS_CANCELLED,
+    STATUS_COMPLETED,
+    STATUS_RUNNING,
+    TERMINAL_STATUSES,
+    IngestJobManager,
+    initial_progress,
+)
+
+
+class FakeProcessor:
+    """문서별 호출을 기록하는 처리기 (release가 설정될 때까지 첫 문서에서 대기 가능)"""
+    
+    def __init__(self, calls, release=None):
+        self.calls = calls
+        self.started = threading.Event()
+        self.release = release
+    
+    async def process_single_pdf(self, pdf_path, data=None):
+        self.calls.append(pdf_path)
+        self.started.set()
+        while self.release is not None and not self.release.is_set():
+            time.sleep(0.01)
+        return {'success': True, 'db_result': {'success': True}, 'routing': {'route': 'rule_only'}}
+
+
+def make_environment(work_dir: str, monkeypatch, file_count: int = 3):
+    """임시 DB와 PROCESSED_PDF_DIR/2025 아래 PDF 파일 → (세션 팩토리, PDF 디렉토리, 엔진)"""
+    processed_dir = Path(work_dir) / 'processed_pdf'
+    pdf_dir = processed_dir / '2025'
+    pdf_dir.mkdir(parents=True)
+    for number in range(file_count):
+        (pdf_dir / f'{number}.pdf').write_bytes(b'%PDF-1.4')
+    monkeypatch.setattr(settings, 'PROCESSED_PDF_DIR', str(processed_dir))
+    monkeypatch.setattr(settings, 'INGEST_JOB_HEARTBEAT_SECONDS', 0.05)
+    
+    engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine), pdf_dir, engine
+
+
+def wait_for(manager: IngestJobManager, job_id: str, statuses=TERMINAL_STATUSES, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"작업 상태 대기 시간 초과: {manager.get(job_id)['status']}")
+
+
+def test_directory_must_be_under_processed_pdf_dir(monkeypatch):
+    """PROCESSED_PDF_DIR 밖의 경로, 상위 경로(..) 우회, 심볼릭 링크 우회는 거부"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        make_session, pdf_dir, engine = make_environment(work_dir, monkeypatch)
+        manager = IngestJobManager(session_factory=make_session, processor=FakeProcessor([]))
+        outside = Path(work_dir) / 'outside'
+        outside.mkdir()
+        os.symlink(outside, pdf_dir / 'link')
+        try:
+            for directory in (str(outside), str(pdf_dir / '..' / '..' / 'outside'), str(pdf_dir / 'link'), '', '/etc'):
+                with pytest.raises(ValueError):
+                    manager.submit('directory', {'directory': directory, 'fsc_only': False})
+            
+            session = make_session()
+            assert session.query(IngestJobV2).count() == 0
+            session.close()
+        finally:
+            manager.shutdown()
+            engine.dispose()
+
+
+def test_submit_processes_directory(monkeypatch):
+    """제출한 directory 작업이 모든 PDF를 처리하고 진행 상태를 기록"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        make_session, pdf_dir, engine = make_environment(work_dir, monkeypatch)
+        calls = []
+        manager = IngestJobManager(session_factory=make_session, processor=FakeProcessor(calls))
+        try:
+            job = manager.submit('directory', {'directory': str(pdf_dir), 'fsc_only': False})
+            job = wait_for(manager, job['job_id'])
+        finally:
+            manager.shutdown()
+            engine.dispose()
+    
+    assert job['status'] == STATUS_COMPLETED
+    assert job['params']['directory'] == os.path.realpath(pdf_dir)
+    assert sorted(calls) == sorted(job['files']) == sorted(job['processed_files'])
+    assert len(calls) == 3
+    assert job['progress']['process']['done'] == job['progress']['process']['succeeded'] == 3
+    assert job['progress']['routing']['rule_only'] == 3
+
+
+def test_cancel_from_another_process(monkeypatch):
+    """다른 관리자(다른 프로세스 역할)의 취소 요청 → 처리 중인 문서를 마친 뒤 취소 완료"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        make_session, pdf_dir, engine = make_environment(work_dir, monkeypatch)
+        calls = []
+        release = threading.Event()
+        processor = FakeProcessor(calls, release)
+        runner = IngestJobManager(session_factory=make_session, processor=processor)
+        api = IngestJobManager(session_factory=make_session, processor=FakeProcessor([]))
+        try:
+            job = runner.submit('directory', {'directory': str(pdf_dir), 'fsc_only': False})
+            assert processor.started.wait(5)
+            
+            assert api.cancel(job['job_id'])['status'] == 'cancelling'
+            release.set()
+            job = wait_for(runner, job['job_id'])
+        finally:
+            release.set()
+            runner.shutdown()
+            api.shutdown()
+            engine.dispose()
+    
+    assert job['status'] == STATUS_CANCELLED
+    assert len(calls) == 1 and job['processed_files'] == calls
+
+
+def test_resume_runs_each_job_once(monkeypatch):
+    """두 프로세스가 동시에 재개해도 대기 작업은 한 번만 실행, 갱신이 끊긴 실행 중 작업은 처리한 PDF를 건너뛰고 재개"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        make_session, pdf_dir, engine = make_environment(work_dir, monkeypatch)
+        files = sorted(str(path) for path in pdf_dir.glob('*.pdf'))
+        
+        session = make_session()
+        for job_id, status, updated_at, processed in (
+            ('queued', 'queued', func.now(), []),
+            ('stale', 'running', datetime(2000, 1, 1), files[:1]),
+            ('alive', 'running', func.now(), files[:1]),
+        ):
+            session.add(IngestJobV2(
+                job_id=job_id, job_type='directory', status=status,
+                params={'directory': str(pdf_dir), 'fsc_only': False},
+                files=files, processed_files=processed, progress=initial_progress(),
+                started_at=None if status == 'queued' else datetime.now(), updated_at=updated_at
+            ))
+        session.commit()
+        session.close()
+        
+        calls = []
+        managers = [IngestJobManager(session_factory=make_session, processor=FakeProcessor(calls)) for _ in range(2)]
+        try:
+            resumed = [manager.resume_pending() for manager in managers]
+            assert sorted(resumed[0]) == ['queued', 'stale']
+            queued = wait_for(managers[0], 'queued')
+            stale = wait_for(managers[0], 'stale')
+            time.sleep(0.2)  # 유휴 상태의 주기적 확인에서도 다시 실행하지 않는지
+            alive = managers[0].get('alive')
+        finally:
+            for manager in managers:
+                manager.shutdown()
+            engine.dispose()
+    
+    assert queued['status'] == stale['status'] == STATUS_COMPLETED
+    assert sorted(calls) == sorted(files + files[1:])
+    assert stale['processed_files'] == files
+    assert alive['status'] == STATUS_RUNNING and alive['processed_files'] == files[:1]
+
+
+if __name__ == "__main__":
+    for test in (
+        test_directory_must_be_under_processed_pdf_dir,
+        test_submit_processes_directory,
+        test_cancel_from_another_process,
+        test_resume_runs_each_job_once,
+    ):
+        with pytest.MonkeyPatch.context() as patcher:
+            test(patcher)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
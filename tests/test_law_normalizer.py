@@ -0,0 +1,185 @@
+"""
+법률명 정규화기 테스트
+- 컴파일된 법률 사전 캐시: 같은 JSON이면 재구축 없이 로드
+- JSON 내용(source_hash)이나 LAW_CACHE_VERSION이 바뀌면 재구축 후 캐시 갱신
+- 손상된 캐시 파일은 무시하고 재구축 (임시 파일은 남기지 않음)
+- Aho-Corasick 부분 매칭이 기존 선형 탐색과 같은 결과 (겹치거나 포함 관계인 법률명)
+"""
+import json
+import pickle
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.metrics import get_startup_metrics
+from utils import law_normalizer
+from utils.benchmark_law_normalizer import (
+    LAWS_JSON_PATH, build_inputs, legacy_find_best_match, legacy_normalize_law_name
+)
+from utils.law_normalizer import LAW_CACHE_FILENAME, AhoCorasick, LawNormalizer
+
+LAWS = [
+    {'law_name': '자본시장과 금융투자업에 관한 법률', 'law_short_name_api': '자본시장법'},
+    {'law_name': '금융소비자 보호에 관한 법률', 'law_short_name': '금융소비자보호법'},
+    {'law_name': '은행법'},
+]
+
+# 서로 포함/겹치는 법률명 (은행법 ⊂ 저축은행법 ⊂ 상호저축은행법, 약칭이 다른 법률명에 포함 등)
+NESTED_LAWS = [
+    {'law_name': '은행법', 'law_short_name': '은행법'},
+    {'law_name': '상호저축은행법', 'law_short_name': '저축은행법'},
+    {'law_name': '한국산업은행법', 'law_short_name': '산업은행법'},
+    {'law_name': '금융회사의 지배구조에 관한 법률', 'law_short_name_api': '금융사지배구조법'},
+    {'law_name': '금융회사부실자산 등의 효율적 처리 및 한국자산관리공사의 설립에 관한 법률',
+     'law_short_name': '자산관리공사법'},
+    {'law_name': '자본시장과 금융투자업에 관한 법률', 'law_short_name_api': '자본시장법'},
+    {'law_name': '자본시장과 금융투자업에 관한 법률 시행령', 'law_short_name': '자본시장법 시행령'},
+    {'law_name': '보험업법', 'law_short_name': '보험업법'},
+    {'law_name': '약칭 없는 법률'},
+]
+
+NESTED_INPUTS = [
+    '은행법 제34조', '상호저축은행법 시행령', '구 상호저축은행법', '저축은행', '산업은행', '한국산업은행법 위반',
+    '금융회사의지배구조에관한법률', '금융회사 지배구조', '금융회사', '자산관리공사', '한국자산관리공사법',
+    '자본시장과 금융투자업에 관한 법률 시행령 제4조', '자본시장과금융투자업에관한법률시행규칙', '「자본시장법」',
+    '보험업법 및 은행법', '은행', '법', '관한 법률', 'BANK ACT', '약칭 없는 법률',
+]
+
+
+def write_laws(path: Path, laws):
+    path.write_text(json.dumps({'laws': laws}, ensure_ascii=False), encoding='utf-8')
+
+
+@contextmanager
+def law_files():
+    """임시 법률 JSON과 캐시 디렉토리 → (JSON 경로, 캐시 디렉토리)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        json_path = Path(work_dir) / 'laws.json'
+        write_laws(json_path, LAWS)
+        yield json_path, Path(work_dir) / 'cache'
+
+
+@pytest.fixture
+def files():
+    with law_files() as context:
+        yield context
+
+
+def make_normalizer(json_path: Path, cache_dir: Path) -> LawNormalizer:
+    return LawNormalizer(laws_json_path=str(json_path), cache_dir=str(cache_dir))
+
+
+def cache_hit() -> bool:
+    return get_startup_metrics()['law_normalizer_cache_hit']
+
+
+def test_cache_hit_skips_rebuild(files):
+    """두 번째 인스턴스는 조회 테이블을 다시 만들지 않고 캐시에서 같은 상태를 로드"""
+    json_path, cache_dir = files
+    built = make_normalizer(json_path, cache_dir)
+    assert not cache_hit()
+    assert [path.name for path in cache_dir.iterdir()] == [LAW_CACHE_FILENAME]  # 임시 파일 없음
+    
+    with pytest.MonkeyPatch.context() as patcher:
+        def fail_rebuild(self):
+            raise AssertionError("캐시가 있으면 재구축하지 않아야 함")
+        patcher.setattr(LawNormalizer, '_build_lookup_tables', fail_rebuild)
+        loaded = make_normalizer(json_path, cache_dir)
+    
+    assert cache_hit()
+    assert loaded.name_to_abbr == built.name_to_abbr
+    assert loaded.normalize_law_name('자본시장과금융투자업에관한법률') == '자본시장법'
+    assert loaded.find_best_match('금융소비자보호에관한법률 제19조') == '금융소비자보호법'
+
+
+def test_cache_invalidated_on_source_or_version_change(files):
+    """JSON 내용 또는 캐시 버전이 바뀌면 재구축하고 캐시를 새 값으로 교체"""
+    json_path, cache_dir = files
+    make_normalizer(json_path, cache_dir)
+    
+    write_laws(json_path, LAWS + [{'law_name': '보험업법', 'law_short_name': '보험업법'}])
+    normalizer = make_normalizer(json_path, cache_dir)
+    assert not cache_hit()
+    assert normalizer.get_full_name('보험업법') == '보험업법'
+    make_normalizer(json_path, cache_dir)
+    assert cache_hit()
+    
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(law_normalizer, 'LAW_CACHE_VERSION', law_normalizer.LAW_CACHE_VERSION + 1)
+        make_normalizer(json_path, cache_dir)
+        assert not cache_hit()
+        with open(cache_dir / LAW_CACHE_FILENAME, 'rb') as f:
+            assert pickle.load(f)['version'] == law_normalizer.LAW_CACHE_VERSION
+        make_normalizer(json_path, cache_dir)
+        assert cache_hit()
+
+
+def test_corrupt_cache_falls_back_to_rebuild(files):
+    """읽을 수 없는 캐시 파일은 무시하고 JSON에서 재구축한 뒤 다시 저장"""
+    json_path, cache_dir = files
+    cache_dir.mkdir()
+    (cache_dir / LAW_CACHE_FILENAME).write_bytes(b'\x80\x05 not a pickle')
+    
+    normalizer = make_normalizer(json_path, cache_dir)
+    assert not cache_hit()
+    assert normalizer.get_abbreviation('자본시장과 금융투자업에 관한 법률') == '자본시장법'
+    
+    make_normalizer(json_path, cache_dir)
+    assert cache_hit()
+    assert [path.name for path in cache_dir.iterdir()] == [LAW_CACHE_FILENAME]
+
+
+def test_aho_corasick_matches_brute_force():
+    """오토마톤이 찾은 패턴 집합이 단순 포함 검사와 같음 (접미사/중첩 패턴, 빈 패턴 포함)"""
+    patterns = ['은행법', '저축은행법', '상호저축은행법', '행법', '법', '자본시장', '시장과 금융', '', '은행법']
+    matcher = AhoCorasick(patterns)
+    for text in ('상호저축은행법', '한국산업은행법 및 자본시장과 금융투자업', '은행', '', '법법', '저축은행법은행법'):
+        assert set(matcher.iter_matches(text)) == {
+            pattern_id for pattern_id, pattern in enumerate(patterns) if pattern and pattern in text
+        }
+
+
+@pytest.mark.parametrize('laws', ['nested', 'archive'])
+def test_partial_matching_matches_legacy(files, laws):
+    """normalize_law_name/find_best_match 결과가 기존 선형 탐색 구현과 같음"""
+    json_path, cache_dir = files
+    if laws == 'nested':
+        write_laws(json_path, NESTED_LAWS)
+    elif LAWS_JSON_PATH.exists():
+        json_path = LAWS_JSON_PATH
+    else:
+        pytest.skip("법률 데이터 JSON 없음")
+    normalizer = make_normalizer(json_path, cache_dir)
+    
+    inputs = build_inputs(normalizer) + NESTED_INPUTS
+    for text in inputs:
+        assert normalizer.normalize_law_name(text) == legacy_normalize_law_name(normalizer, text), text
+        assert normalizer.find_best_match(text) == legacy_find_best_match(normalizer, text), text
+    
+    if laws == 'nested':
+        assert normalizer.normalize_law_name('구 상호저축은행법') == '은행법'  # 삽입 순서상 가장 앞선 항목
+        assert normalizer.find_best_match('구 상호저축은행법') == '저축은행법'  # 가장 긴 매칭
+
+
+if __name__ == "__main__":
+    for test in (
+        test_cache_hit_skips_rebuild,
+        test_cache_invalidated_on_source_or_version_change,
+        test_corrupt_cache_falls_back_to_rebuild,
+    ):
+        with law_files() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
+    
+    test_aho_corasick_matches_brute_force()
+    print(f"✅ {test_aho_corasick_matches_brute_force.__name__}")
+    for laws in ('nested', 'archive'):
+        with law_files() as context:
+            test_partial_matching_matches_legacy(context, laws)
+        print(f"✅ {test_partial_matching_matches_legacy.__name__}[{laws}]")
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+LLM 입력 컨텍스트 구성 테스트
+- 문서 머리, 조치내용, 근거법규, 위반사실만 포함하고 의안개요/검토의견은 제외 ((중략) 표시)
+- 예산이 모자라면 우선순위가 낮은 섹션(위반사실 → 근거법규 → 조치내용)부터 생략
+- 섹션을 찾지 못한 문서는 전문을 예산 내로 사용
+- 토큰 계산 함수 주입
+(Gemini 호출 없음)
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_context_builder import GAP_MARKER, LLMContextBuilder, estimate_tokens
+
+BACKGROUND = "회사는 1990년에 설립되어 전자부품을 제조하고 있으며 주요 거래처는 국내 대기업이다.\n" * 60
+REVIEW = "증권선물위원회는 위반 동기와 결과를 고려하여 조치 수준을 검토하였다.\n" * 60
+
+DOCUMENT = f"""금융위원회 의결서
+의안번호 제 2025-101 호
+안 건 명 ㈜가나산업의 사업보고서 등에 대한 조사·감리결과 조치안
+의안개요
+{BACKGROUND}조치내용
+ㅇ ㈜가나산업 : 과징금 1,200백만원
+ㅇ 前 대표이사 甲 : 과징금 249백만원
+위반사실
+회사는 2023년 매출을 과대계상하였다.
+관련법령
+「자본시장과 금융투자업에 관한 법률」 제429조 제3항
+검토의견
+{REVIEW}"""
+
+ACTIONS = "ㅇ 前 대표이사 甲 : 과징금 249백만원"
+VIOLATION = "회사는 2023년 매출을 과대계상하였다."
+LAW = "「자본시장과 금융투자업에 관한 법률」 제429조 제3항"
+
+
+def test_selects_relevant_sections():
+    """머리와 조치/위반/법규 섹션만 포함, 배경 설명과 검토의견은 제외"""
+    report = LLMContextBuilder(token_budget=6000, header_chars=120).build(DOCUMENT)
+    text = report['text']
+    
+    assert text.startswith('금융위원회 의결서\n의안번호 제 2025-101 호')
+    assert GAP_MARKER in text
+    assert all(part in text for part in (ACTIONS, VIOLATION, LAW))
+    assert '검토의견' not in text and text.count('전자부품') == 1
+    
+    assert report['sections'] == ['머리', '조치내용', '근거법규', '위반사실']
+    assert not report['truncated'] and not report['fallback']
+    assert report['original_tokens'] == estimate_tokens(DOCUMENT)
+    assert report['context_tokens'] == estimate_tokens(text)
+    assert report['saved_tokens'] == report['original_tokens'] - report['context_tokens']
+    assert report['saved_ratio'] > 0.9
+
+
+def test_budget_drops_lowest_priority_first():
+    """예산이 줄면 위반사실, 근거법규, 조치내용 순으로 잘림 (머리는 마지막까지 유지)"""
+    def build(budget):
+        return LLMContextBuilder(token_budget=budget, header_chars=120).build(DOCUMENT)
+    
+    report = build(100)
+    assert report['truncated'] and report['context_tokens'] <= 100 + 5  # (중략) 표시와 구간별 반올림 오차
+    assert ACTIONS in report['text'] and LAW in report['text']
+    assert VIOLATION not in report['text']
+    
+    report = build(60)
+    assert report['sections'] == ['머리', '조치내용']
+    assert '관련법령' not in report['text']
+    
+    report = build(40)
+    assert report['sections'] == ['머리']
+    assert '조치내용' not in report['text']
+
+
+def test_fallback_uses_budgeted_full_text():
+    """섹션이 없는 문서는 전문 앞부분을 예산만큼 사용"""
+    text = "섹션 제목이 없는 통지문 본문입니다.\n" * 2000
+    report = LLMContextBuilder(token_budget=500, header_chars=120).build(text)
+    
+    assert report['fallback'] and report['truncated']
+    assert report['sections'] == ['전문']
+    assert text.startswith(report['text'])
+    assert 450 <= report['context_tokens'] <= 500
+
+
+def test_injected_token_counter():
+    """주입한 토큰 계산 함수로 예산과 절감량 계산"""
+    report = LLMContextBuilder(token_budget=200, header_chars=50, token_counter=len).build(DOCUMENT)
+    
+    assert report['original_tokens'] == len(DOCUMENT)
+    assert report['context_tokens'] == len(report['text'])
+    assert len(report['text'].replace(GAP_MARKER, '')) <= 200
+
+
+if __name__ == "__main__":
+    for test in (
+        test_selects_relevant_sections,
+        test_budget_drops_lowest_priority_first,
+        test_fallback_uses_budgeted_full_text,
+        test_injected_token_counter,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+스캔 PDF OCR 폴백 테스트 (OCR 엔진은 스텁으로 대체, poppler/tesseract 불필요)
+- 저텍스트 판정: 의미 있는 문자 수 기준, 깨진 텍스트 레이어(의미 있는 문자 비율) 기준
+- 저텍스트 페이지만 OCR, 같은 내용의 페이지는 문서 내 1회만 OCR
+- 페이지 지문 기준 디스크 캐시 (다른 파일명/바이트 입력도 캐시 사용), OCR 실패 결과는 캐시하지 않음
+- OCR 도구가 없으면 원래 텍스트 그대로 반환
+"""
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import ocr_fallback
+from app.services.ocr_fallback import OCRFallback, is_low_text_page
+from tests.pdf_samples import make_pdf
+
+TEXT_PAGE = 'Financial Services Commission decision text layer with enough characters'
+
+# 1, 3페이지는 텍스트 레이어 없음 (같은 내용), 4페이지는 깨진 텍스트 레이어
+# (깨진 레이어: 의미 있는 문자 26개, 기호 80개 → 비율 0.25)
+PAGES = [TEXT_PAGE, '', TEXT_PAGE, '', 'a1b2c3d4e5f6g7h8i9j0k1l2m3 ' + '@#$%' * 20]
+
+
+class StubOCREngine:
+    """_ocr_page 대체 (호출 페이지 기록, fail_pages는 OCR 실패)"""
+    
+    def __init__(self, fail_pages=()):
+        self.fail_pages = set(fail_pages)
+        self.calls = []
+    
+    def __call__(self, pdf_path, page_number, dpi, lang):
+        self.calls.append(page_number)
+        if page_number in self.fail_pages:
+            raise RuntimeError("tesseract 오류")
+        return f'OCR 텍스트 p{page_number}', 1.5, 2.5
+
+
+@contextmanager
+def ocr_workspace(available: bool = True):
+    """임시 PDF/캐시 디렉토리와 OCR 도구 설치 여부 → (PDF 경로, 캐시 디렉토리, 스텁 설치 함수)"""
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(OCRFallback, 'available', staticmethod(lambda: available))
+        pdf_path = Path(directory) / 'scanned.pdf'
+        pdf_path.write_bytes(make_pdf(PAGES))
+        
+        def install(engine: StubOCREngine) -> StubOCREngine:
+            patcher.setattr(ocr_fallback, '_ocr_page', engine)
+            return engine
+        
+        yield str(pdf_path), str(Path(directory) / 'ocr_cache'), install
+
+
+@pytest.fixture
+def workspace():
+    with ocr_workspace() as context:
+        yield context
+
+
+def make_fallback(cache_dir: str, **kwargs) -> OCRFallback:
+    return OCRFallback(enabled=True, min_chars=20, workers=1, cache_dir=cache_dir, **kwargs)
+
+
+def test_low_text_threshold():
+    """의미 있는 문자 수가 기준 미만이거나 기호 비율이 높은 페이지만 저텍스트로 판단"""
+    assert is_low_text_page('', 20)
+    assert is_low_text_page('   \n  ', 20)
+    assert is_low_text_page('금융위원회 의결서', 20)
+    assert not is_low_text_page('금융위원회 의결서', 5)
+    assert not is_low_text_page(TEXT_PAGE, 20)
+    assert is_low_text_page(PAGES[4], 20)  # 문자 수는 충분하지만 비율 미달
+    assert not is_low_text_page(PAGES[4][:27] + '@#$%' * 10, 20)
+
+
+def test_only_low_text_pages_are_replaced(workspace):
+    """저텍스트 페이지만 OCR로 교체, 같은 내용의 페이지는 1회만 OCR, 보고는 페이지 순"""
+    pdf_path, cache_dir, install = workspace
+    engine = install(StubOCREngine())
+    fallback = make_fallback(cache_dir)
+    
+    texts, reports = fallback.apply(pdf_path, [TEXT_PAGE, '', TEXT_PAGE, '', PAGES[4]])
+    
+    assert sorted(engine.calls) == [1, 4]
+    assert texts == [TEXT_PAGE, 'OCR 텍스트 p1', TEXT_PAGE, 'OCR 텍스트 p1', 'OCR 텍스트 p4']
+    assert [(report['page'], report['source']) for report in reports] == [(1, 'ocr'), (3, 'ocr'), (4, 'ocr')]
+    assert reports[0]['rasterize_ms'] == 1.5 and reports[0]['ocr_ms'] == 2.5
+    assert reports[0]['chars'] == len('OCR 텍스트 p1')
+    
+    # 모든 페이지에 텍스트가 충분하거나 OCR을 끈 경우 그대로 반환
+    assert fallback.apply(pdf_path, [TEXT_PAGE] * 5) == ([TEXT_PAGE] * 5, [])
+    assert OCRFallback(enabled=False).apply(pdf_path, ['']) == ([''], [])
+
+
+def test_cache_reuses_page_results(workspace):
+    """OCR 결과는 페이지 지문으로 캐시되어 다른 인스턴스/바이트 입력에서도 재사용, 실패는 캐시하지 않음"""
+    pdf_path, cache_dir, install = workspace
+    engine = install(StubOCREngine(fail_pages=[4]))
+    first_texts, first_reports = make_fallback(cache_dir).apply(pdf_path, PAGES)
+    assert sorted(engine.calls) == [1, 4]
+    assert first_texts[4] == PAGES[4]
+    assert first_reports[-1]['source'] == 'error' and first_reports[-1]['error'] == 'tesseract 오류'
+    
+    engine = install(StubOCREngine())
+    data = Path(pdf_path).read_bytes()
+    texts, reports = make_fallback(cache_dir).apply(data, PAGES, name='copy.pdf')
+    assert engine.calls == [4]  # 실패했던 페이지만 다시 OCR
+    assert texts[1] == texts[3] == first_texts[1]
+    assert [(report['page'], report['source']) for report in reports] == [(1, 'cache'), (3, 'cache'), (4, 'ocr')]
+    
+    # DPI/언어가 다르면 다른 캐시 키
+    engine = install(StubOCREngine())
+    make_fallback(cache_dir, dpi=150).apply(pdf_path, PAGES)
+    assert sorted(engine.calls) == [1, 4]
+
+
+def test_missing_ocr_tool_keeps_text():
+    """OCR 라이브러리나 실행 파일(pdftoppm/tesseract)이 없으면 사용 불가, OCR 없이 원래 텍스트 반환"""
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(ocr_fallback, 'convert_from_path', None)
+        assert not OCRFallback.available()
+        
+        patcher.setattr(ocr_fallback, 'convert_from_path', object())
+        patcher.setattr(ocr_fallback, 'pytesseract', SimpleNamespace(pytesseract=SimpleNamespace(tesseract_cmd='tesseract')))
+        patcher.setattr(ocr_fallback.shutil, 'which', lambda command: None)
+        assert not OCRFallback.available()
+    
+    with ocr_workspace(available=False) as (pdf_path, cache_dir, install):
+        engine = install(StubOCREngine())
+        fallback = make_fallback(cache_dir)
+        assert fallback.apply(pdf_path, PAGES) == (PAGES, [])
+        assert fallback.apply(pdf_path, PAGES) == (PAGES, [])
+        assert engine.calls == []
+        assert not Path(cache_dir).exists()
+
+
+if __name__ == "__main__":
+    test_low_text_threshold()
+    print(f"✅ {test_low_text_threshold.__name__}")
+    for test in (
+        test_only_low_text_pages_are_replaced,
+        test_cache_reuses_page_results,
+    ):
+        with ocr_workspace() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
+    test_missing_ocr_tool_keeps_text()
+    print(f"✅ {test_missing_ocr_tool_keeps_text.__name__}")
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+PDF 텍스트 추출 백엔드 테스트
+- 백엔드 선택: 이름(대소문자 무시), 미등록/미설치 백엔드는 pypdf2로 폴백, 사용자 백엔드 등록
+- 페이지 병렬 추출 결과가 순차 추출과 같은 페이지 순서 (경로/바이트 입력), 풀 오류 시 순차 폴백
+- 페이지 병렬 워커 수 자동 설정: 작은 풀, 워커 프로세스 안에서는 순차
+"""
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import pdf_backends
+from app.services.pdf_backends import (
+    DEFAULT_PAGE_WORKERS, PDFTextBackend, PyPDF2Backend, available_backends, extract_pdf_pages,
+    get_pdf_backend, register_backend, resolve_page_workers, shutdown_page_pool
+)
+from tests.pdf_samples import make_pdf
+
+PAGES = [f'Page {number:02d} of the sample decision document' for number in range(12)]
+
+
+class MissingBackend(PDFTextBackend):
+    """설치되지 않은 백엔드"""
+    
+    name = 'missing'
+    
+    @classmethod
+    def available(cls) -> bool:
+        return False
+
+
+class RecordingBackend(PyPDF2Backend):
+    """호출된 페이지 구간을 기록하는 사용자 백엔드"""
+    
+    name = 'recording'
+    
+    def __init__(self):
+        self.calls = []
+    
+    def extract_pages(self, pdf_path, page_numbers):
+        self.calls.append(list(page_numbers))
+        return super().extract_pages(pdf_path, page_numbers)
+
+
+@contextmanager
+def sample_pdf():
+    """12페이지 PDF 파일 → (경로, 바이트), 백엔드 레지스트리와 워커 표시는 종료 시 복원"""
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(pdf_backends, 'PDF_BACKENDS', dict(pdf_backends.PDF_BACKENDS))
+        patcher.setattr(pdf_backends, '_backend_instances', {})
+        patcher.setattr(pdf_backends, '_worker_process', False)
+        data = make_pdf(PAGES)
+        path = Path(directory) / 'sample.pdf'
+        path.write_bytes(data)
+        try:
+            yield str(path), data
+        finally:
+            shutdown_page_pool()
+
+
+@pytest.fixture
+def pdf():
+    with sample_pdf() as context:
+        yield context
+
+
+def test_backend_selection_and_fallback(pdf):
+    """이름으로 선택, 미등록/미설치 백엔드는 pypdf2로 폴백, 등록한 백엔드는 이름으로 사용"""
+    assert get_pdf_backend('pypdf2') is get_pdf_backend('PyPDF2')
+    assert isinstance(get_pdf_backend('unknown'), PyPDF2Backend)
+    
+    register_backend(MissingBackend)
+    assert 'missing' not in available_backends() and 'pypdf2' in available_backends()
+    assert isinstance(get_pdf_backend('missing'), PyPDF2Backend)
+    
+    register_backend(RecordingBackend)
+    backend = get_pdf_backend('recording')
+    assert isinstance(backend, RecordingBackend) and 'recording' in available_backends()
+    
+    # 페이지 수가 기준 미만이면 현재 프로세스에서 전체 페이지를 한 번에 추출
+    path, _ = pdf
+    assert extract_pdf_pages(path, backend, workers=4, min_parallel_pages=100) == PAGES
+    assert backend.calls == [list(range(12))]
+
+
+def test_parallel_pages_keep_serial_order(pdf):
+    """구간별 병렬 추출 결과가 순차 추출과 같은 페이지 순서 (경로/바이트 입력, 구간이 고르지 않은 경우 포함)"""
+    path, data = pdf
+    backend = get_pdf_backend('pypdf2')
+    serial = extract_pdf_pages(path, backend, workers=1)
+    assert serial == PAGES
+    
+    for workers in (2, 5):
+        assert extract_pdf_pages(path, backend, workers=workers, min_parallel_pages=2) == serial
+        assert extract_pdf_pages(data, backend, workers=workers, min_parallel_pages=2) == serial
+    assert pdf_backends._page_pool is not None
+
+
+def test_pool_failure_falls_back_to_serial(pdf):
+    """병렬 추출 풀 오류 시 순차 추출 결과 반환"""
+    path, _ = pdf
+    
+    def broken_pool(workers):
+        raise OSError("프로세스를 만들 수 없음")
+    
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(pdf_backends, '_get_page_pool', broken_pool)
+        assert extract_pdf_pages(path, get_pdf_backend('pypdf2'), workers=3, min_parallel_pages=2) == PAGES
+
+
+def test_page_workers_default(pdf):
+    """0(자동)은 작은 풀, 워커 프로세스 안(표시된 워커, 프로세스 풀 자식)에서는 순차, 명시한 값은 그대로"""
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(pdf_backends.os, 'cpu_count', lambda: 64)
+        assert resolve_page_workers(0) == DEFAULT_PAGE_WORKERS
+        patcher.setattr(pdf_backends.os, 'cpu_count', lambda: 2)
+        assert resolve_page_workers(0) == 2
+    assert resolve_page_workers(3) == 3
+    
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(resolve_page_workers, 0).result() == 1
+        assert executor.submit(resolve_page_workers, 3).result() == 3
+    
+    pdf_backends.mark_worker_process()
+    assert resolve_page_workers(0) == 1
+    assert resolve_page_workers(2) == 2
+
+
+if __name__ == "__main__":
+    for test in (
+        test_backend_selection_and_fallback,
+        test_parallel_pages_keep_serial_order,
+        test_pool_failure_falls_back_to_serial,
+        test_page_workers_default,
+    ):
+        with sample_pdf() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
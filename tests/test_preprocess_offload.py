@@ -0,0 +1,88 @@
+"""
+PDF 전처리 스레드 실행 테스트
+process_single_pdf의 전처리(텍스트 추출, OCR 결과 대기)가 이벤트 루프를 막지 않는지 확인
+(실제 PDF/OCR/Gemini 없이 블로킹 전처리만 흉내냄)
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.pdf_processor_v2 import PDFProcessorV2
+
+PREPROCESS_SECONDS = 0.3
+
+
+class BlockingPreprocessor:
+    """OCR 풀 결과를 기다리는 것처럼 호출 스레드를 막는 전처리기"""
+    
+    def __init__(self):
+        self.threads = []
+    
+    def preprocess_pdf(self, pdf_path, data=None):
+        self.threads.append(threading.current_thread())
+        time.sleep(PREPROCESS_SECONDS)
+        return {'raw_text': '본문', 'markdown_text': '본문', 'sections': [], 'metadata': {}}
+
+
+class FakeDecision:
+    def model_dump(self):
+        return {}
+
+
+class FakeRouter:
+    """LLM 호출 없이 Rule-based 결과로 끝나는 라우터"""
+    
+    async def route(self, text, metadata, llm_extract, filename):
+        return FakeDecision(), {'route': 'rule_only', 'score': 1.0, 'missing': [], 'llm_called': False}
+
+
+def make_processor() -> PDFProcessorV2:
+    """DB/Gemini 초기화 없이 전처리/라우팅/저장만 대체한 프로세서"""
+    processor = PDFProcessorV2.__new__(PDFProcessorV2)
+    processor.preprocessor = BlockingPreprocessor()
+    processor.router = FakeRouter()
+    
+    async def persist_decision(decision_data, pdf_path, extraction_route=None):
+        return {'success': True}
+    
+    processor.persist_decision = persist_decision
+    return processor
+
+
+def test_preprocess_runs_off_event_loop(monkeypatch):
+    """전처리 중에도 같은 루프의 다른 코루틴이 계속 실행됨"""
+    monkeypatch.setattr(settings, 'HYBRID_ROUTING_ENABLED', True)
+    processor = make_processor()
+    
+    async def main():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+        
+        task = asyncio.create_task(ticker())
+        result = await processor.process_single_pdf('/tmp/pdf/1.pdf')
+        task.cancel()
+        return result, ticks
+    
+    result, ticks = asyncio.run(main())
+    assert result['success'], result
+    assert ticks >= 5, ticks
+    assert processor.preprocessor.threads and processor.preprocessor.threads[0] is not threading.main_thread()
+
+
+if __name__ == "__main__":
+    import pytest
+    
+    with pytest.MonkeyPatch.context() as patcher:
+        test_preprocess_runs_off_event_loop(patcher)
+    print("✅ test_preprocess_runs_off_event_loop")
\ No newline at end of file
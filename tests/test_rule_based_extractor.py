@@ -0,0 +1,237 @@
+"""
+Rule-based 추출기 회귀 테스트
+- 대표 의결서 유형(복수 조치, 원안/수정안 표, 제재대상/제재조치 표, 단일 조치)의
+  extract_full_document_structure 결과를 고정된 기대값으로 검증
+  (기대값은 단일 스캔 분할기 도입 전 구현의 출력과 같음)
+- extract_many: 워커 2개 프로세스 풀 결과가 순차 추출과 같고 입력 순서 유지, 워커 초기화, 단일 프로세스 처리
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services import rule_based_extractor
+from app.services.rule_based_extractor import RuleBasedExtractor
+from tests.pdf_samples import make_pdf
+from utils import law_normalizer
+
+FILLER = (
+    "피조치자는 내부통제기준을 마련하지 아니하고 고객의 투자자금을 부적절하게 운용하였으며, "
+    "관련 보고 의무를 이행하지 않은 사실이 확인되었다. "
+)
+BODY = f"   1) {FILLER}\n   2) {FILLER}"
+
+DOCUMENTS = {
+    'multiple': f"""금융위원회 의결서
+의안번호 제2025-101호
+1. 조치대상자의 인적사항
+ 기  관 ㈜OO증권
+ 임직원 ㈜OO증권 前 상무보대우 甲
+2. 조치내용
+ ㅇ ㈜OO증권
+   - 과징금 12억 3,456 만원
+ ㅇ 前 대표이사 甲
+   - 과징금 249백만원
+3. 조치이유
+ 가. 지적사항
+{BODY}
+ 나. 근거법규
+ 「자본시장과 금융투자업에 관한 법률」 제178조제1항 및 제2항, 제429조제3항
+ 「금융회사의 지배구조에 관한 법률」 제24조
+4. 기타
+""",
+    'revision': f"""금융위원회 의결서
+의안번호 제2025-102호
+1. 조치대상자의 인적사항
+ 기  관 ㈜OO은행
+2. 조치내용
+ 제재조치
+ 원안 수정안
+ 기관경고 과태료 249 백만원 과태료 120 백만원
+ 업무 일부정지 3개월
+3. 조치이유
+ 가. 지적사항
+{BODY}
+ 나. 근거법규
+ 「은행법」 제34조제2항제3호 및 제4호
+""",
+    'table': f"""금융위원회 의결서
+의안번호 제2025-103호
+제재대상 제재조치
+ 기  관 OO증권㈜ 과태료 249 백만원
+ 前 영업이사 G1 과태료 120백만원
+ㅇ(금감원 검사결과)
+ 가. 지적사항
+{BODY}
+ 다. 근거법규 「신용정보의 이용 및 보호에 관한 법률」 제19조제1항제2호
+""",
+    'single': f"""금융위원회 의결서
+의안번호 제2025-104호
+㈜OO증권에 대한 조치
+ 가. 지적사항
+{BODY}
+ 나. 근거법규
+ 「보험업법」 제95조의2, 제97조제1항
+ 과태료 249백만원을 부과한다.
+""",
+}
+
+EXPECTED = {
+    'multiple': {
+        'decision': (2025, 101, '제101호'),
+        'laws': [
+            ('자본시장법', '자본시장법', '제178조 제1항'),
+            ('자본시장법', '자본시장법', '제178조 제2항'),
+            ('자본시장법', '자본시장법', '제429조 제3항'),
+            ('금융사지배구조법', '지배구조법', '제24조'),
+        ],
+        'action': ('㈜OO증권 외 1인', '금융투자', '과징금', 1_483_560_000),
+        'targets': [('㈜OO증권', '기관', 1_234_560_000), ('前 대표이사 甲', '임직원', 249_000_000)],
+    },
+    'revision': {
+        'decision': (2025, 102, '제102호'),
+        'laws': [
+            ('은행법', '은행법', '제34조 제2항 제3호'),
+            ('은행법', '은행법', '제34조 제1항 제4호'),
+        ],
+        'action': ('조치대상자 외 1인', '은행', '경고', 120_000_000),
+        'targets': [('조치대상자', '기타', 0), ('조치대상자', '기타', 120_000_000)],
+    },
+    'table': {
+        'decision': (2025, 103, '제103호'),
+        'laws': [('신용정보법', '신용정보법', '제19조 제1항 제2호')],
+        'action': ('고객', '금융투자', '과태료', 249_000_000),
+        'targets': [],
+    },
+    'single': {
+        'decision': (2025, 104, '제104호'),
+        'laws': [
+            ('보험업법', '보험법', '제95조의 2'),
+            ('보험업법', '보험법', '제97조 제1항'),
+        ],
+        'action': ('㈜OO증권', '보험', '과태료', 249_000_000),
+        'targets': [],
+    },
+}
+
+
+def summarize(result):
+    """비교용 요약 (의결서 번호, 법률/조항, 통합 조치, 조치대상자)"""
+    decision = result['decision']
+    action = result['actions'][0]
+    targets = action['target_details']['targets']
+    return {
+        'decision': (decision['decision_year'], decision['decision_id'], decision['agenda_no']),
+        'laws': [(law['law_short_name'], law['law_category'], law['article_details']) for law in result['laws']],
+        'action': (action['entity_name'], action['industry_sector'], action['action_type'], action['fine_amount']),
+        'targets': [(target['entity_name'], target['entity_type'], target['fine_amount']) for target in targets],
+    }
+
+
+@pytest.mark.parametrize('name', list(DOCUMENTS))
+def test_full_document_structure_is_pinned(name):
+    """문서 유형별 추출 결과가 고정된 기대값과 같음"""
+    filename = f'금융위 의결서(제2025-{EXPECTED[name]["decision"][1]}호)_{name}.pdf'
+    result = RuleBasedExtractor().extract_full_document_structure(DOCUMENTS[name], filename)
+    
+    assert summarize(result) == EXPECTED[name]
+    assert result['decision']['title'] == name
+    assert result['extraction_method'] == 'rule_based'
+    assert len(result['actions']) == 1
+    
+    action = result['actions'][0]
+    assert action['laws_cited'] == result['laws']
+    assert action['violation_full_text'].startswith('지적사항\n   1) 피조치자는 내부통제기준을 마련하지 아니하고')
+    assert action['fine_basis_amount'] is None and action['sanction_period'] == ''
+
+
+def test_repeated_extraction_is_stable():
+    """같은 추출기로 여러 문서를 번갈아 처리해도 결과가 같음 (문서별 분할 결과 재사용 오류 없음)"""
+    extractor = RuleBasedExtractor()
+    first = {name: extractor.extract_full_document_structure(text, f'{name}.pdf') for name, text in DOCUMENTS.items()}
+    for name, text in reversed(list(DOCUMENTS.items())):
+        assert extractor.extract_full_document_structure(text, f'{name}.pdf') == first[name]
+
+
+def write_pdfs(directory: Path):
+    """의결서 번호가 다른 PDF 4건 + 읽을 수 없는 PDF 1건 경로 (입력 순서는 번호 순이 아님)"""
+    paths = []
+    for number in (3, 1, 4, 2):
+        path = directory / f'금융위 의결서(제2025-{number}호)_테스트.pdf'
+        path.write_bytes(make_pdf([f'Decision {number} page {page} sanction summary text' for page in range(3)]))
+        paths.append(str(path))
+    broken = directory / '금융위 의결서(제2025-5호)_손상.pdf'
+    broken.write_bytes(b'%PDF-1.4 broken')
+    paths.insert(2, str(broken))
+    return paths
+
+
+def without_timing(results):
+    return [{key: value for key, value in result.items() if key != 'elapsed_ms'} for result in results]
+
+
+def test_extract_many_matches_serial():
+    """워커 2개 결과가 순차 추출과 같고 입력 순서 유지 (실패는 결과 항목으로), 완료 순서 모드도 같은 결과 집합"""
+    extractor = RuleBasedExtractor()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_pdfs(Path(directory))
+        serial = without_timing(extractor.extract_many(paths, workers=1))
+        parallel = without_timing(extractor.extract_many(paths, workers=2))
+        unordered = without_timing(extractor.extract_many(paths, workers=2, ordered=False))
+    
+    assert parallel == serial
+    assert [result['pdf_path'] for result in parallel] == paths
+    assert [result['success'] for result in parallel] == [True, True, False, True, True]
+    assert [result['result']['decision']['decision_id'] for result in parallel if result['success']] == [3, 1, 4, 2]
+    assert sorted(unordered, key=lambda result: paths.index(result['pdf_path'])) == serial
+
+
+def test_worker_initializer():
+    """워커 초기화는 추출기/법률 사전을 준비하고, 파일 단위 병렬이므로 페이지/OCR 병렬은 끔"""
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(rule_based_extractor, '_worker_extractor', None)
+        patcher.setattr(rule_based_extractor, '_worker_preprocessor', None)
+        patcher.setattr(law_normalizer, '_normalizer_instance', None)
+        paths = write_pdfs(Path(directory))
+        
+        rule_based_extractor._init_extract_worker()
+        preprocessor = rule_based_extractor._worker_preprocessor
+        assert preprocessor.page_workers == 1 and preprocessor.ocr.workers == 1
+        assert isinstance(rule_based_extractor._worker_extractor, RuleBasedExtractor)
+        assert law_normalizer._normalizer_instance is not None
+        
+        result = rule_based_extractor._extract_in_worker(paths[0])
+        expected = RuleBasedExtractor().extract_pdf(paths[0])
+        assert without_timing([result]) == without_timing([expected])
+
+
+def test_single_worker_runs_in_process():
+    """워커 1개 이하이거나 파일이 1건이면 프로세스 풀 없이 현재 프로세스에서 처리"""
+    def no_pool(*args, **kwargs):
+        raise AssertionError("프로세스 풀을 만들면 안 됨")
+    
+    extractor = RuleBasedExtractor()
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(rule_based_extractor, 'ProcessPoolExecutor', no_pool)
+        paths = write_pdfs(Path(directory))
+        assert len(list(extractor.extract_many(paths, workers=1))) == 5
+        assert len(list(extractor.extract_many(paths[:1], workers=4))) == 1
+        assert list(extractor.extract_many([], workers=4)) == []
+
+
+if __name__ == "__main__":
+    for name in DOCUMENTS:
+        test_full_document_structure_is_pinned(name)
+        print(f"✅ {test_full_document_structure_is_pinned.__name__}[{name}]")
+    for test in (
+        test_repeated_extraction_is_stable,
+        test_extract_many_matches_serial,
+        test_worker_initializer,
+        test_single_worker_runs_in_process,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+유사 의결서 인덱스 테스트
+- 희소 TF-IDF 점수가 직접 계산한 코사인 유사도와 같은지 확인
+- 저장된 인덱스를 다른 인스턴스가 memory-map으로 로드
+- 다른 엔진(다른 프로세스 역할)으로 저장한 의결서는 다음 조회에서 증분 추가 (전체 재구축과 같은 점수)
+- LSA 모드: 같은 주제의 의결서를 상위로, 신규 문서는 fold-in
+"""
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionV2, DecisionV2
+from app.services.similarity_service import SimilarityIndex, char_ngrams
+
+DOCUMENTS = [
+    # (목적, 위반 요약)
+    ('사업보고서 허위 기재에 대한 조사감리 결과 조치', '매출 과대계상 및 재고자산 허위 계상'),
+    ('감사보고서 회계처리 기준 위반 조치', '매출 과대계상 및 대손충당금 과소 설정'),
+    ('보험회사 정기검사 결과 조치', '보험금 부당 지급 거절 및 설명의무 위반'),
+    ('보험대리점 검사 결과 조치', '보험 모집 과정 설명의무 위반 및 부당 권유'),
+    ('은행 고객확인의무 검사 결과 조치', '자금세탁방지 고객확인 의무 위반'),
+]
+
+NEW_DOCUMENT = ('손해보험사 검사 결과 조치', '보험금 지급 지연 및 설명의무 위반')
+
+
+def add_decision(session, decision_id: int, purpose: str, summary: str) -> int:
+    decision = DecisionV2(
+        decision_year=2025, decision_id=decision_id, title=f'의결 {decision_id}',
+        stated_purpose=purpose, full_text='본문'
+    )
+    decision.actions.append(ActionV2(entity_name='기관', violation_summary=summary, action_type='과태료'))
+    session.add(decision)
+    session.commit()
+    return decision.decision_pk
+
+
+@contextmanager
+def similarity_database():
+    """의결서 5건이 있는 임시 DB → (인덱스 생성 함수, 다른 엔진의 쓰기용 세션)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        make_session = sessionmaker(bind=engine)
+        
+        # 다른 프로세스(스크립트/Celery persist 워커) 역할의 별도 엔진
+        writer_engine = create_engine(f"sqlite:///{work_dir}/test.sqlite")
+        session = sessionmaker(bind=writer_engine)()
+        for decision_id, (purpose, summary) in enumerate(DOCUMENTS, start=1):
+            add_decision(session, decision_id, purpose, summary)
+        
+        def make_index(name: str = 'index') -> SimilarityIndex:
+            return SimilarityIndex(index_dir=f"{work_dir}/{name}", session_factory=make_session)
+        
+        try:
+            yield make_index, session
+        finally:
+            session.close()
+            writer_engine.dispose()
+            engine.dispose()
+
+
+@pytest.fixture
+def database():
+    with similarity_database() as context:
+        yield context
+
+
+def reference_scores(texts, row: int) -> np.ndarray:
+    """n-gram TF-IDF(1 + log tf, 평활 idf) 코사인 유사도를 밀집 행렬로 직접 계산"""
+    grams = [char_ngrams(text) for text in texts]
+    vocab = sorted(set().union(*grams))
+    tf = np.array([[grams[i].get(gram, 0) for gram in vocab] for i in range(len(texts))], dtype=np.float64)
+    weights = np.where(tf > 0, 1.0 + np.log(np.maximum(tf, 1)), 0.0)
+    df = (tf > 0).sum(axis=0)
+    weights *= np.log((1.0 + len(texts)) / (1.0 + df)) + 1.0
+    weights /= np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights @ weights[row]
+
+
+def test_sparse_scores_match_reference(database):
+    """희소 TF-IDF 유사도가 직접 계산한 코사인 값/순위와 같음"""
+    make_index, _ = database
+    index = make_index()
+    assert index.build(svd_components=0) == 5
+    
+    results = index.similar(1, limit=4)
+    expected = reference_scores([f'{purpose} {summary}' for purpose, summary in DOCUMENTS], 0)
+    assert [pk for pk, _ in results] == [int(i) + 1 for i in np.argsort(-expected)[1:5] if expected[i] > 0]
+    for pk, score in results:
+        assert score == pytest.approx(expected[pk - 1], abs=1e-3)
+    assert results[0][0] == 2  # 같은 회계 위반 의결서
+    
+    assert index.similar(999) is None
+
+
+def test_saved_index_loads_in_another_instance(database):
+    """저장된 인덱스를 다른 인스턴스가 memory-map으로 로드해 같은 결과 반환, 인덱스가 없으면 오류"""
+    make_index, _ = database
+    built = make_index()
+    built.build(svd_components=0)
+    
+    loaded = make_index()
+    assert loaded.load() and loaded.size == 5
+    assert isinstance(loaded.indices, np.memmap)
+    assert loaded.similar(3) == built.similar(3)
+    
+    with pytest.raises(RuntimeError):
+        make_index('missing').similar(1)
+
+
+def test_incremental_add_matches_rebuild(database):
+    """다른 엔진으로 저장한 의결서는 다음 조회에서 증분 반영, 점수는 전체 재구축과 같음"""
+    make_index, session = database
+    index = make_index()
+    index.build(svd_components=0)
+    
+    new_pk = add_decision(session, 6, *NEW_DOCUMENT)
+    assert index.similar(1, limit=1)[0][0] == 2
+    assert index.size == 6
+    incremental = index.similar(new_pk)
+    assert [pk for pk, _ in incremental[:2]] == [3, 4]  # 보험 검사 의결서
+    
+    rebuilt = make_index('rebuilt')
+    rebuilt.build(svd_components=0)
+    assert rebuilt.similar(new_pk) == incremental
+    assert index.add_decisions([new_pk]) == 0
+
+
+def test_lsa_groups_topics_and_folds_in(database):
+    """LSA 밀집 벡터로도 같은 주제 의결서가 상위, 신규 문서는 재구축 없이 기존 공간에 투영"""
+    make_index, session = database
+    index = make_index()
+    index.build(svd_components=3)
+    assert index.doc_vectors.shape == (5, 3)
+    
+    assert index.similar(4, limit=1)[0][0] == 3
+    
+    new_pk = add_decision(session, 6, *NEW_DOCUMENT)
+    assert index.add_decisions([new_pk]) == 1
+    assert index.doc_vectors.shape == (6, 3)
+    assert index.similar(new_pk, limit=2)[0][0] in (3, 4)
+
+
+if __name__ == "__main__":
+    for test in (
+        test_sparse_scores_match_reference,
+        test_saved_index_loads_in_another_instance,
+        test_incremental_add_matches_rebuild,
+        test_lsa_groups_topics_and_folds_in,
+    ):
+        with similarity_database() as context:
+            test(context)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+동시 요청 병합(SingleFlight) 테스트
+- 같은 키의 동시 요청은 한 번만 실행하고 결과/예외를 공유
+- NL2SQL: 정규화한 질의가 같으면 Gemini 변환 1회, 같은 SQL은 실행 1회 (실제 Gemini 호출 없음)
+"""
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import Base
+from app.models.fsc_models_v2 import ActionV2, DecisionV2
+from app.services.ai_only_nl2sql_engine_v2 import AIOnlyNL2SQLEngineV2
+from app.services.search_service_v2 import SearchServiceV2
+from app.services.singleflight import SingleFlight, freeze_criteria, normalize_query
+
+
+def test_concurrent_calls_share_one_execution():
+    """같은 키는 1회 실행, 다른 키는 따로 실행, 완료 후에는 다시 실행"""
+    flight = SingleFlight('test')
+    calls = []
+    
+    async def work(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return {'key': key}
+    
+    async def scenario():
+        results = await asyncio.gather(
+            *(flight.do('a', lambda: work('a')) for _ in range(5)),
+            flight.do('b', lambda: work('b'))
+        )
+        assert flight.in_flight() == 0
+        again = await flight.do('a', lambda: work('a'))
+        return results, again
+    
+    results, again = asyncio.run(scenario())
+    assert calls == ['a', 'b', 'a']
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] == {'key': 'b'} and again == {'key': 'a'}
+    assert flight.stats == {'executed': 3, 'shared': 4}
+
+
+def test_errors_are_shared():
+    """진행 중 작업의 예외는 대기자 모두에게 전달"""
+    flight = SingleFlight('test_error')
+    calls = []
+    
+    async def broken():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError('실패')
+    
+    async def scenario():
+        return await asyncio.gather(*(flight.do('k', broken) for _ in range(3)), return_exceptions=True)
+    
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_keys():
+    """질의 정규화와 검색 조건 키"""
+    assert normalize_query('  2025년   의결서를 보여주세요? ') == normalize_query('2025년 의결서를 보여주세요')
+    assert normalize_query('ＡＢＣ 은행') == normalize_query('abc 은행')
+    assert normalize_query('은행 제재') != normalize_query('보험 제재')
+    assert freeze_criteria({'decision_year': 2025, 'category_1': '제재', 'keyword': None}) == \
+        freeze_criteria({'category_1': '제재', 'decision_year': 2025})
+
+
+class FakeGeminiService:
+    """지연 후 고정 SQL을 돌려주는 Gemini 대역"""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    async def _make_api_request_with_rate_limit(self, prompt):
+        self.prompts.append(prompt)
+        await asyncio.sleep(0.05)
+        return '{"sql": "SELECT decision_pk, decision_year FROM decisions", "query_type": "list", "description": "의결서 목록"}'
+
+
+def test_nl2sql_coalesces_translation_and_execution():
+    """표기만 다른 같은 질의 5건 → Gemini 변환 1회, SQL 실행 1회, 결과는 모두 동일"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE decisions (decision_pk INTEGER, decision_year INTEGER)"))
+            conn.execute(text("INSERT INTO decisions VALUES (1, 2025), (2, 2025)"))
+        
+        session = sessionmaker(bind=engine)()
+        try:
+            nl2sql = AIOnlyNL2SQLEngineV2.__new__(AIOnlyNL2SQLEngineV2)
+            nl2sql.db = session
+            nl2sql.gemini_service = FakeGeminiService()
+            
+            executions = []
+            execute_sql = nl2sql.execute_sql
+            
+            def counting_execute_sql(sql_query, db=None):
+                executions.append((threading.current_thread().name, db))
+                return execute_sql(sql_query, db)
+            
+            nl2sql.execute_sql = counting_execute_sql
+            
+            queries = ['2025년 의결서를 보여주세요', ' 2025년  의결서를 보여주세요? '] * 2 + ['2025년 의결서를 보여주세요.']
+            
+            async def scenario():
+                return await asyncio.gather(*(nl2sql.process_natural_query(query) for query in queries))
+            
+            results = asyncio.run(scenario())
+        finally:
+            session.close()
+            engine.dispose()
+    
+    assert len(nl2sql.gemini_service.prompts) == 1
+    assert len(executions) == 1 and executions[0][0] != threading.main_thread().name
+    # 공유 실행은 요청 세션이 아닌 전용 세션 사용
+    assert executions[0][1] is not None and executions[0][1] is not session
+    assert all(result['success'] for result in results)
+    assert all(result['results'] == results[0]['results'] for result in results)
+    assert [row['decision_pk'] for row in results[0]['results']] == [1, 2]
+
+
+def test_search_flight_survives_first_caller_disconnect():
+    """첫 호출자가 끊겨 요청 세션이 닫혀도 병합된 검색은 전용 세션으로 끝까지 실행"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = create_engine(f"sqlite:///{work_dir}/test.sqlite", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        make_session = sessionmaker(bind=engine)
+        
+        setup = make_session()
+        decision = DecisionV2(decision_year=2025, decision_id=1, title='은행 제재', full_text='본문')
+        decision.actions.append(ActionV2(entity_name='가나은행', violation_summary='내부통제 위반', action_type='과태료'))
+        setup.add(decision)
+        setup.commit()
+        setup.close()
+        
+        first_session, second_session = make_session(), make_session()
+        sessions_used = []
+        
+        def make_service(session):
+            service = SearchServiceV2.__new__(SearchServiceV2)
+            service.db = session
+            return service
+        
+        first, second = make_service(first_session), make_service(second_session)
+        text_search = SearchServiceV2._text_search
+        
+        def slow_text_search(self, db, text, limit):
+            sessions_used.append(db)
+            time.sleep(0.1)
+            return text_search(self, db, text, limit)
+        
+        async def scenario():
+            SearchServiceV2._text_search = slow_text_search
+            try:
+                first_task = asyncio.create_task(first.text_search('은행', 10))
+                second_task = asyncio.create_task(second.text_search('은행', 10))
+                await asyncio.sleep(0.02)
+                # 첫 요청 연결 종료: 요청 취소 후 get_db가 세션을 닫음
+                first_task.cancel()
+                first_session.close()
+                return await second_task
+            finally:
+                SearchServiceV2._text_search = text_search
+        
+        try:
+            result = asyncio.run(scenario())
+        finally:
+            second_session.close()
+            engine.dispose()
+    
+    assert len(sessions_used) == 1
+    assert sessions_used[0] not in (first_session, second_session)
+    assert result['method'] == 'text_search_v2'
+    assert [row['entity_name'] for row in result['results']] == ['가나은행']
+
+
+if __name__ == "__main__":
+    for test in (
+        test_concurrent_calls_share_one_execution,
+        test_errors_are_shared,
+        test_keys,
+        test_nl2sql_coalesces_translation_and_execution,
+        test_search_flight_survives_first_caller_disconnect,
+    ):
+        test()
+        print(f"✅ {test.__name__}")
\ No newline at end of file
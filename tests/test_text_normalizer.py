@@ -0,0 +1,107 @@
+"""
+텍스트 정규화기 골든 출력 테스트
+결합 정규식 정규화기(TextNormalizer)가 기존 PDFPreprocessor 다중 패스 정제와 동일한 결과를 내는지 검증
+"""
+import random
+import re
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.text_normalizer import TextNormalizer
+
+
+# 기존 구현 (PDFPreprocessor._clean_page_text / _final_cleanup)
+LEGACY_HEADER_PATTERNS = [
+    r'금융위원회\s*\d{4}-\d+호',
+    r'의\s*결\s*서',
+    r'금\s*융\s*위\s*원\s*회',
+    r'Financial Services Commission',
+    r'페이지\s*\d+\s*/\s*\d+',
+    r'- \d+ -',
+]
+
+
+def legacy_clean_page_text(text: str) -> str:
+    for pattern in LEGACY_HEADER_PATTERNS:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def legacy_final_cleanup(text: str) -> str:
+    text = re.sub(r'[^\w\s\d가-힣.,;:!?()[\]{}""''`~@#$%^&*+=/<>|\\-]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\.\s+', '. ', text)
+    text = re.sub(r',\s+', ', ', text)
+    return text.strip()
+
+
+def legacy_normalize_pages(pages) -> str:
+    pages_text = []
+    for page_text in pages:
+        cleaned_text = legacy_clean_page_text(page_text)
+        if cleaned_text.strip():
+            pages_text.append(cleaned_text)
+    return legacy_final_cleanup("\n\n".join(pages_text))
+
+
+# 골든 샘플 (머리글/바닥글, 표 문자, 특수 기호, 다양한 공백 포함)
+GOLDEN_DOCUMENTS = [
+    [
+        "금융위원회 2024-123호\n\n의 결 서\n\n1. 조치대상자의 인적사항\n  기  관  ㈜OO증권\n\n- 1 -",
+        "2. 조치내용\n\t① 과징금 12억 3,400만원 ※ 추후 확정\n페이지 2 / 5\n",
+        "   \n\n  ",
+        "3. 조치이유\n 가. 지적사항 ... 'A' 및 \"B\" 위반 ◦ 내부통제\n\n\n\n 나. 근거법규\n 「자본시장과 금융투자업에 관한 법률」 제178조",
+    ],
+    [
+        "FINANCIAL SERVICES COMMISSION\r\n금 융 위 원 회\r\n│ 구분 │ 조치 │\r\n├────┼────┤\r\n│ 기관 │ 경고 │",
+        "financial services commission 의결서 — 2025. 3. 14.  ,  ,　전각공백 nbsp",
+        "",
+        "금융위원회2025-7호 이메일 test_user@example.com, 50% ≥ 30% → 과태료 (1.5) [참고] {비고} <표> `code` ~끝~",
+    ],
+    [
+        "- 12 - 본문만 있는 페이지\x0c",
+        "의\n결\n서 분리된 머리글과 페이지 3 / 10 바닥글",
+    ],
+    [],
+]
+
+
+def test_golden_documents():
+    """골든 샘플에서 기존 구현과 출력 일치"""
+    normalizer = TextNormalizer()
+    for pages in GOLDEN_DOCUMENTS:
+        assert normalizer.normalize_pages(pages) == legacy_normalize_pages(pages), pages
+
+
+def test_random_documents():
+    """무작위 조합 문서에서 기존 구현과 출력 일치"""
+    # 머리글 제거 후 새 머리글이 생기는 조합(예: '금 의결서 융위원회')은 제외한 조각들
+    fragments = [
+        '금융위원회 2024-1호', '의 결 서', '금융위원회', 'Financial Services Commission',
+        '페이지 1 / 3', '- 7 -', '과징금', '12억', '3,400만원', '「은행법」', '제34조제2항',
+        '㈜OO은행', '※', '◦', '·', '─', '│', '(주)', "'", '"', '—', '…', '%', '_', 'ABC', 'abc',
+        '1.', '가.', '2025.', ',', '.', '　', ' ', '\x0c',
+    ]
+    separators = ['', ' ', '  ', '\n', '\n\n\n', '\t', '\r\n']
+    normalizer = TextNormalizer()
+    rng = random.Random(37)
+    for _ in range(2000):
+        pages = []
+        for _ in range(rng.randint(0, 4)):
+            parts = []
+            for _ in range(rng.randint(0, 12)):
+                parts.append(rng.choice(fragments))
+                parts.append(rng.choice(separators[1:]))
+            pages.append(rng.choice(separators).join(parts))
+        assert normalizer.normalize_pages(pages) == legacy_normalize_pages(pages), pages
+
+
+if __name__ == "__main__":
+    test_golden_documents()
+    test_random_documents()
+    print("텍스트 정규화기 골든 테스트 통과")
\ No newline at end of file
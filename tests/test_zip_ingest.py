@@ -0,0 +1,244 @@
+"""
+ZIP 스트리밍 수집 테스트
+- 본문 PDF는 ZIP에서 읽은 바이트 그대로 처리기에 전달, 보관 파일은 저장소 객체의 하드링크
+- 보조 문서(의결N.pdf)는 본문 처리 전에 디스크에 보관
+- 압축 해제 원장을 FSCCrawler와 공유 (같은 내용의 ZIP은 한 번만 처리)
+- ingest_zips 결과 집계, 손상된 ZIP은 원장에 기록하지 않음
+- ZIP 멤버 읽기/보관은 이벤트 루프 밖에서 수행, 처리 중 예외가 나도 비동기 보관 완료를 기다리고 보관 오류를 보고
+(실제 PDF/Gemini 없이 process_single_pdf 결과 형식만 흉내냄)
+"""
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services import zip_ingest
+from app.services.fsc_crawler import FSCCrawler
+from app.services.zip_ingest import ZipStreamIngestor
+
+DOCUMENT_NAME = '금융위 의결서(제2025-{number}호)_테스트.pdf'
+COMPANION_NAME = '의결{number}.pdf'
+
+
+def pdf_bytes(name: str) -> bytes:
+    return f'%PDF-1.4\n%{name}\n'.encode()
+
+
+def write_zip(path: Path, numbers, companions=True):
+    with zipfile.ZipFile(path, 'w') as zf:
+        for number in numbers:
+            for name in (DOCUMENT_NAME.format(number=number), COMPANION_NAME.format(number=number)):
+                if companions or name.startswith('금융위'):
+                    zf.writestr(f'의결서/{name}', pdf_bytes(name))
+        zf.writestr('의결서/안내문.hwp', b'not a pdf')
+
+
+class RecordingProcessor:
+    """전달받은 경로/바이트와 그 시점의 보조 문서 보관 여부를 기록 (fail_numbers 의결서는 추출 실패)"""
+    
+    def __init__(self, fail_numbers=(), raise_numbers=()):
+        self.fail_numbers = set(fail_numbers)
+        self.raise_numbers = set(raise_numbers)
+        self.calls = []
+    
+    async def process_single_pdf(self, pdf_path, data=None):
+        number = int(os.path.basename(pdf_path).split('-')[1].split('호')[0])
+        companion = os.path.join(os.path.dirname(pdf_path), COMPANION_NAME.format(number=number))
+        self.calls.append({'path': pdf_path, 'data': data, 'companion_on_disk': os.path.exists(companion)})
+        if number in self.raise_numbers:
+            raise RuntimeError(f"처리기 오류 {number}")
+        if number in self.fail_numbers:
+            return {'success': False, 'pdf_path': pdf_path, 'error': '데이터 추출 실패'}
+        return {
+            'success': True,
+            'pdf_path': pdf_path,
+            'decision_data': {'decision_year': 2025, 'decision_id': number},
+            'db_result': {'success': True, 'actions_saved': [number]},
+            'routing': {'route': 'rule_only', 'score': 1.0, 'missing': [], 'llm_called': False}
+        }
+
+
+@contextmanager
+def ingest_dirs():
+    """임시 작업 디렉토리 (저장소 위치는 FSCCrawler 기본값과 공유)"""
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(settings, 'CONTENT_STORE_DIR', os.path.join(directory, 'content_store'))
+        work_dir = Path(directory)
+        (work_dir / 'raw_zip').mkdir()
+        yield work_dir
+
+
+@pytest.fixture
+def work_dir():
+    with ingest_dirs() as directory:
+        yield directory
+
+
+def make_ingestor(work_dir: Path, processor, archive_async: bool = True) -> ZipStreamIngestor:
+    return ZipStreamIngestor(
+        processor=processor, processed_pdf_dir=str(work_dir / 'processed_pdf'), archive_async=archive_async
+    )
+
+
+def test_streams_members_without_extracting(work_dir):
+    """본문은 ZIP 바이트로 처리, 보조 문서는 먼저 보관, 보관 파일은 저장소 하드링크 (동기/비동기 보관 모두)"""
+    for archive_async, numbers in ((True, [1, 2]), (False, [11, 12])):
+        processor = RecordingProcessor()
+        ingestor = make_ingestor(work_dir, processor, archive_async=archive_async)
+        zip_path = work_dir / 'raw_zip' / f'2025년 제{numbers[0]}차 의결서.zip'
+        write_zip(zip_path, numbers)
+        
+        results = asyncio.run(ingestor.ingest_zip(str(zip_path)))
+        assert [result['success'] for result in results] == [True, True]
+        
+        year_dir = work_dir / 'processed_pdf' / '2025'
+        assert [call['path'] for call in processor.calls] == \
+            [str(year_dir / DOCUMENT_NAME.format(number=number)) for number in numbers]
+        for call in processor.calls:
+            assert call['data'] == pdf_bytes(os.path.basename(call['path']))
+            assert call['companion_on_disk']
+        
+        archived = [
+            year_dir / name.format(number=number) for number in numbers for name in (DOCUMENT_NAME, COMPANION_NAME)
+        ]
+        for path in archived:
+            assert path.read_bytes() == pdf_bytes(path.name)
+            assert os.stat(path).st_nlink == 2
+        assert not list((work_dir / 'processed_pdf').rglob('*.hwp'))
+        
+        assert ingestor.stats['pdfs'] == 2 and ingestor.stats['zips'] == 1
+        assert ingestor.stats['archived_bytes'] == sum(len(pdf_bytes(path.name)) for path in archived)
+
+
+def test_ledger_shared_with_crawler(work_dir):
+    """스트리밍으로 처리한 ZIP(사본 포함)은 다시 처리하지 않고, 크롤러도 압축 해제하지 않음 (반대 방향도 동일)"""
+    processor = RecordingProcessor()
+    ingestor = make_ingestor(work_dir, processor)
+    zip_path = work_dir / 'raw_zip' / '2025년 제1차 의결서.zip'
+    write_zip(zip_path, [1])
+    asyncio.run(ingestor.ingest_zip(str(zip_path)))
+    
+    shutil.copy(zip_path, work_dir / 'raw_zip' / '사본_2025년 제1차 의결서.zip')
+    assert asyncio.run(ingestor.ingest_zip(str(work_dir / 'raw_zip' / '사본_2025년 제1차 의결서.zip'))) == []
+    assert ingestor.stats['skipped_zips'] == 1 and len(processor.calls) == 1
+    
+    crawler = FSCCrawler(raw_zip_dir=str(work_dir / 'raw_zip'), processed_pdf_dir=str(work_dir / 'processed_pdf'))
+    assert crawler.extract_zip_files() == []
+    
+    # 크롤러가 먼저 압축 해제한 ZIP은 다른 수집기 인스턴스도 건너뜀
+    write_zip(work_dir / 'raw_zip' / '2025년 제2차 의결서.zip', [2])
+    assert len(crawler.extract_zip_files(['2025년 제2차 의결서.zip'])) == 2
+    other = make_ingestor(work_dir, processor)
+    assert asyncio.run(other.ingest_zip(str(work_dir / 'raw_zip' / '2025년 제2차 의결서.zip'))) == []
+    assert len(processor.calls) == 1
+
+
+def test_ingest_zips_summary(work_dir):
+    """process_batch와 같은 형식으로 성공/실패 집계, 손상된 ZIP은 실패로 세고 원장에 기록하지 않음"""
+    processor = RecordingProcessor(fail_numbers=[3])
+    ingestor = make_ingestor(work_dir, processor)
+    write_zip(work_dir / 'raw_zip' / '2025년 제1차 의결서.zip', [1, 2, 3], companions=False)
+    broken = work_dir / 'raw_zip' / '2025년 제2차 의결서.zip'
+    broken.write_bytes(b'PK\x03\x04 broken')
+    
+    results = asyncio.run(ingestor.ingest_zips([
+        str(work_dir / 'raw_zip' / '2025년 제1차 의결서.zip'), str(broken)
+    ]))
+    
+    assert results['total'] == results['processed'] == 3
+    assert [result['decision_id'] for result in results['success']] == [1, 2]
+    assert results['success'][0]['saved'] and results['success'][0]['actions_saved'] == [1]
+    assert [result['error'] for result in results['failed']] == ['데이터 추출 실패']
+    assert results['zips']['zips'] == 1 and results['zips']['failed_zips'] == 1
+    assert len(ingestor.ledger.zips) == 1
+    
+    # 처리에 실패한 의결서도 보관 파일은 남음 (process_batch로 재처리)
+    assert (work_dir / 'processed_pdf' / '2025' / DOCUMENT_NAME.format(number=3)).exists()
+
+
+def test_blocking_io_runs_off_event_loop(work_dir):
+    """ZIP 멤버 읽기와 보관 기록은 이벤트 루프 스레드가 아닌 executor에서 수행 (동기/비동기 보관 모두)"""
+    threads = {'read': [], 'archive': []}
+    original_read = zipfile.ZipFile.read
+    
+    def recording_read(self, name, pwd=None):
+        threads['read'].append(threading.get_ident())
+        return original_read(self, name, pwd)
+    
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(zipfile.ZipFile, 'read', recording_read)
+        for archive_async, numbers in ((True, [1, 2]), (False, [11, 12])):
+            ingestor = make_ingestor(work_dir, RecordingProcessor(), archive_async=archive_async)
+            original_archive = ingestor._archive
+            
+            def recording_archive(data, dest, original_archive=original_archive):
+                threads['archive'].append(threading.get_ident())
+                return original_archive(data, dest)
+            
+            ingestor._archive = recording_archive
+            zip_path = work_dir / 'raw_zip' / f'2025년 제{numbers[0]}차 의결서.zip'
+            write_zip(zip_path, numbers)
+            assert len(asyncio.run(ingestor.ingest_zip(str(zip_path)))) == 2
+    
+    loop_thread = threading.get_ident()  # asyncio.run은 현재 스레드에서 루프 실행
+    assert len(threads['read']) == len(threads['archive']) == 8
+    assert loop_thread not in threads['read'] + threads['archive']
+
+
+def test_archive_awaited_when_processing_raises(work_dir):
+    """처리기가 예외를 내도 진행 중인 보관은 완료된 뒤 반환, 보관 오류는 처리 오류 대신 보고"""
+    errors = []
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(zip_ingest.logger, 'error', errors.append)
+        
+        ingestor = make_ingestor(work_dir, RecordingProcessor(raise_numbers=[2]))
+        original_archive = ingestor._archive
+        
+        def slow_archive(data, dest):
+            time.sleep(0.2)
+            return original_archive(data, dest)
+        
+        ingestor._archive = slow_archive
+        write_zip(work_dir / 'raw_zip' / '2025년 제1차 의결서.zip', [1, 2], companions=False)
+        results = asyncio.run(ingestor.ingest_zip(str(work_dir / 'raw_zip' / '2025년 제1차 의결서.zip')))
+        
+        assert [result['decision_data']['decision_id'] for result in results] == [1]
+        assert (work_dir / 'processed_pdf' / '2025' / DOCUMENT_NAME.format(number=2)).exists()
+        assert ingestor.stats['failed_zips'] == 1 and not ingestor.ledger.zips
+        assert '처리기 오류 2' in errors[-1]
+        
+        # 보관도 실패하면 보관 오류가 보고됨
+        def failing_archive(data, dest):
+            time.sleep(0.2)
+            raise OSError("디스크 공간 부족")
+        
+        ingestor = make_ingestor(work_dir, RecordingProcessor(raise_numbers=[3]))
+        ingestor._archive = failing_archive
+        write_zip(work_dir / 'raw_zip' / '2025년 제2차 의결서.zip', [3], companions=False)
+        assert asyncio.run(ingestor.ingest_zip(str(work_dir / 'raw_zip' / '2025년 제2차 의결서.zip'))) == []
+        assert '디스크 공간 부족' in errors[-1]
+
+
+if __name__ == "__main__":
+    for test in (
+        test_streams_members_without_extracting,
+        test_ledger_shared_with_crawler,
+        test_ingest_zips_summary,
+        test_blocking_io_runs_off_event_loop,
+        test_archive_awaited_when_processing_raises,
+    ):
+        with ingest_dirs() as directory:
+            test(directory)
+        print(f"✅ {test.__name__}")
\ No newline at end of file
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+법률명 정규화 벤치마크
+Aho-Corasick 기반 부분 매칭과 기존 선형 탐색 구현의 결과 일치 여부 및 속도 비교
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.law_normalizer import LawNormalizer
+
+LAWS_JSON_PATH = Path(__file__).parent.parent / 'archive' / 'fsc_laws_with_abbreviations.json'
+
+
+def legacy_normalize_law_name(normalizer: LawNormalizer, law_name: str) -> str:
+    """기존 normalize_law_name (선형 부분 매칭)"""
+    if not law_name:
+        return law_name
+    law_name = normalizer._normalize_spaces(law_name)
+    if law_name in normalizer.abbr_to_name:
+        return law_name
+    if law_name in normalizer.name_to_abbr:
+        abbr = normalizer.name_to_abbr[law_name]
+        if abbr:
+            return abbr
+    for full_name, abbr in normalizer.name_to_abbr.items():
+        if full_name in law_name or law_name in full_name:
+            if abbr:
+                return abbr
+    if '자본시장과금융투자업에관한법률' in law_name.replace(' ', ''):
+        return '자본시장법'
+    elif '금융회사의지배구조에관한법률' in law_name.replace(' ', ''):
+        return '금융사지배구조법'
+    elif '신용정보의이용및보호에관한법률' in law_name.replace(' ', ''):
+        return '신용정보법'
+    return law_name
+
+
+def legacy_find_best_match(normalizer: LawNormalizer, law_name: str):
+    """기존 find_best_match (선형 양방향 포함 검사)"""
+    if not law_name:
+        return None
+    law_name = normalizer._normalize_spaces(law_name)
+    if law_name in normalizer.name_to_abbr:
+        return normalizer.name_to_abbr[law_name]
+    no_space_name = law_name.replace(' ', '')
+    if no_space_name in normalizer.name_to_abbr:
+        return normalizer.name_to_abbr[no_space_name]
+    best_match = None
+    max_match_length = 0
+    for full_name, abbr in normalizer.name_to_abbr.items():
+        full_name_clean = full_name.replace(' ', '').lower()
+        law_name_clean = law_name.replace(' ', '').lower()
+        if (full_name_clean in law_name_clean or law_name_clean in full_name_clean):
+            match_length = min(len(full_name_clean), len(law_name_clean))
+            if match_length > max_match_length:
+                max_match_length = match_length
+                best_match = abbr
+    return best_match
+
+
+def build_inputs(normalizer: LawNormalizer, seed: int = 42):
+    """실제 문서에 등장하는 형태를 흉내낸 입력 생성"""
+    rng = random.Random(seed)
+    inputs = []
+    
+    for law in normalizer.laws_data.get('laws', []):
+        name = law['law_name']
+        short_name = law.get('law_short_name_api') or law.get('law_short_name') or ''
+        inputs.extend([
+            name,
+            name.replace(' ', ''),
+            f"구 {name}",
+            f"{name} 제{rng.randint(1, 200)}조 제{rng.randint(1, 5)}항",
+            f"「{name}」 위반",
+            name[:rng.randint(2, len(name))],
+            name[rng.randint(0, len(name) - 2):],
+        ])
+        if short_name:
+            inputs.extend([short_name, f"{short_name} 제{rng.randint(1, 200)}조"])
+    
+    inputs.extend(['', '   ', '민법', '형법 제347조', '존재하지 않는 법률', '법', '시행령'])
+    return inputs
+
+
+def benchmark(func, normalizer, inputs, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in inputs:
+            func(normalizer, text)
+    return time.perf_counter() - start
+
+
+def main():
+    normalizer = LawNormalizer(str(LAWS_JSON_PATH))
+    inputs = build_inputs(normalizer)
+    
+    print("=== 법률명 정규화 벤치마크 ===")
+    print(f"법률 수: {len(normalizer.laws_data.get('laws', []))}")
+    print(f"매칭 항목 수 (변형 포함): {len(normalizer.name_to_abbr)}")
+    print(f"입력 수: {len(inputs)}")
+    
+    # 결과 일치 검증
+    mismatches = 0
+    for text in inputs:
+        for legacy, current in (
+            (legacy_normalize_law_name, LawNormalizer.normalize_law_name),
+            (legacy_find_best_match, LawNormalizer.find_best_match),
+        ):
+            expected = legacy(normalizer, text)
+            actual = current(normalizer, text)
+            if expected != actual:
+                mismatches += 1
+                print(f"  불일치 ({current.__name__}): {text!r} -> 기존 {expected!r}, 신규 {actual!r}")
+    print(f"결과 불일치: {mismatches}건")
+    
+    repeat = 20
+    for name, legacy, current in (
+        ('normalize_law_name', legacy_normalize_law_name, LawNormalizer.normalize_law_name),
+        ('find_best_match', legacy_find_best_match, LawNormalizer.find_best_match),
+    ):
+        legacy_time = benchmark(legacy, normalizer, inputs, repeat)
+        current_time = benchmark(current, normalizer, inputs, repeat)
+        calls = repeat * len(inputs)
+        print(f"\n[{name}] {calls}회 호출")
+        print(f"  기존 (선형 탐색):   {legacy_time * 1e6 / calls:8.2f} us/call")
+        print(f"  신규 (Aho-Corasick): {current_time * 1e6 / calls:8.2f} us/call")
+        print(f"  속도 향상: {legacy_time / current_time:.1f}x")
+    
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+LLM 입력 컨텍스트 절감 리포트
+문서별로 전문 대비 섹션 선별 컨텍스트의 입력 토큰(추정치)과 절감률을 출력
+
+사용법:
+    python utils/benchmark_llm_context.py                      # 합성 문서
+    python utils/benchmark_llm_context.py data/processed_pdf/2025 --budget 4000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_context_builder import LLMContextBuilder
+from app.services.preprocessing import PDFPreprocessor
+from benchmark_rule_extractor import build_documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LLM 입력 컨텍스트 절감 리포트')
+    parser.add_argument('pdf_dir', nargs='?', default=None, help='PDF 디렉토리 (미지정 시 합성 문서)')
+    parser.add_argument('--budget', type=int, default=None, help='문서당 토큰 예산 (기본값: LLM_CONTEXT_TOKEN_BUDGET)')
+    parser.add_argument('--limit', type=int, default=50, help='최대 PDF 수')
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    
+    preprocessor = PDFPreprocessor()
+    builder = LLMContextBuilder(token_budget=args.budget, preprocessor=preprocessor)
+    
+    if args.pdf_dir:
+        documents = []
+        for pdf_path in sorted(Path(args.pdf_dir).glob('*.pdf'))[:args.limit]:
+            try:
+                documents.append((pdf_path.name, preprocessor.extract_text_from_pdf(str(pdf_path))))
+            except Exception as e:
+                print(f"  PDF 읽기 실패 {pdf_path.name}: {e}")
+    else:
+        documents = build_documents()
+    
+    print("=== LLM 입력 컨텍스트 절감 리포트 ===")
+    print(f"문서 수: {len(documents)}, 토큰 예산: {builder.token_budget}")
+    print(f"\n{'문서':<28}{'원문 토큰':>10}{'입력 토큰':>10}{'절감률':>8}{'구성(ms)':>10}  섹션")
+    
+    total_original = total_context = 0
+    for name, text in documents:
+        start = time.perf_counter()
+        context = builder.build(text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        total_original += context['original_tokens']
+        total_context += context['context_tokens']
+        sections = ', '.join(context['sections'])
+        if context['fallback']:
+            sections += ' (섹션 없음)'
+        if context['truncated']:
+            sections += ' (예산 초과)'
+        print(
+            f"{name[:26]:<28}{context['original_tokens']:>10}{context['context_tokens']:>10}"
+            f"{context['saved_ratio'] * 100:>7.1f}%{elapsed_ms:>10.2f}  {sections}"
+        )
+    
+    if total_original:
+        saved = total_original - total_context
+        print(f"\n합계: {total_original} → {total_context} 토큰 ({saved / total_original * 100:.1f}% 절감)")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
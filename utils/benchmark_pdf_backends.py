@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+PDF 텍스트 추출 백엔드 벤치마크
+로컬 PDF 샘플 코퍼스에 대해 백엔드별/모드별(순차, 페이지 병렬) 처리량, 메모리, 텍스트 정확도 비교
+- 처리량: 초당 페이지 수
+- 메모리: 순차 모드는 tracemalloc 최대 할당량, 병렬 모드는 워커 프로세스 최대 RSS
+- 정확도: 같은 이름의 .txt 정답 파일이 있으면 그것과, 없으면 기준 백엔드(순차) 결과와의 단어 단위 유사도
+
+사용법:
+    python utils/benchmark_pdf_backends.py data/processed_pdf/2025 --limit 20 --workers 4
+"""
+
+import argparse
+import difflib
+import logging
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.pdf_backends import available_backends, extract_pdf_pages, get_pdf_backend, shutdown_page_pool
+
+
+def text_similarity(expected: str, actual: str) -> float:
+    """공백 정규화 후 단어 단위 유사도 (0~1)"""
+    expected_words = expected.split()
+    actual_words = actual.split()
+    if expected_words == actual_words:
+        return 1.0
+    return difflib.SequenceMatcher(None, expected_words, actual_words).ratio()
+
+
+def extract_corpus(pdf_files, backend, workers: int):
+    """코퍼스 전체 추출 → (파일별 텍스트, 총 페이지 수, 실패 수)"""
+    texts = {}
+    pages = failures = 0
+    for pdf_file in pdf_files:
+        try:
+            page_texts = extract_pdf_pages(str(pdf_file), backend, workers=workers, min_parallel_pages=1)
+        except Exception as e:
+            print(f"  추출 실패 [{backend.name}] {pdf_file.name}: {e}")
+            failures += 1
+            continue
+        texts[pdf_file] = '\n'.join(page_texts)
+        pages += len(page_texts)
+    return texts, pages, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PDF 텍스트 추출 백엔드 벤치마크')
+    parser.add_argument('corpus', nargs='?', default=settings.PROCESSED_PDF_DIR, help='PDF 샘플 디렉토리 (하위 포함)')
+    parser.add_argument('--limit', type=int, default=20, help='사용할 최대 PDF 수')
+    parser.add_argument('--workers', type=int, default=4, help='페이지 병렬 모드 워커 수')
+    parser.add_argument('--reference', default='pypdf2', help='정답 파일이 없을 때 기준 백엔드')
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    
+    pdf_files = sorted(Path(args.corpus).rglob('*.pdf'))[:args.limit]
+    if not pdf_files:
+        print(f"PDF 파일이 없습니다: {args.corpus}")
+        return 1
+    
+    backends = available_backends()
+    print("=== PDF 텍스트 추출 백엔드 벤치마크 ===")
+    print(f"코퍼스: {args.corpus} ({len(pdf_files)}개 파일)")
+    print(f"사용 가능한 백엔드: {', '.join(backends)}")
+    
+    # 정확도 기준 텍스트 (정답 .txt 우선)
+    reference_backend = get_pdf_backend(args.reference)
+    reference_texts, _, _ = extract_corpus(pdf_files, reference_backend, workers=1)
+    for pdf_file in pdf_files:
+        truth_file = pdf_file.with_suffix('.txt')
+        if truth_file.exists():
+            reference_texts[pdf_file] = truth_file.read_text(encoding='utf-8')
+    
+    print(f"\n{'백엔드':<12}{'모드':<10}{'페이지':>8}{'페이지/초':>12}{'메모리(MB)':>12}{'정확도':>10}{'실패':>6}")
+    for name in backends:
+        backend = get_pdf_backend(name)
+        for mode, workers in (('순차', 1), (f'병렬x{args.workers}', args.workers)):
+            start = time.perf_counter()
+            texts, pages, failures = extract_corpus(pdf_files, backend, workers)
+            elapsed = time.perf_counter() - start
+            
+            if workers == 1:
+                # 시간 측정과 분리하여 tracemalloc 최대 할당량 측정
+                tracemalloc.start()
+                extract_corpus(pdf_files, backend, workers)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                memory_mb = peak / 1024 / 1024
+            else:
+                # 종료된 자식 프로세스만 집계되므로 워커를 종료한 뒤 측정 (리눅스 ru_maxrss 단위는 KB)
+                shutdown_page_pool()
+                memory_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            
+            scores = [
+                text_similarity(reference_texts[pdf_file], text)
+                for pdf_file, text in texts.items()
+                if pdf_file in reference_texts
+            ]
+            accuracy = sum(scores) / len(scores) if scores else 0.0
+            pages_per_sec = pages / elapsed if elapsed > 0 else 0.0
+            
+            print(f"{name:<12}{mode:<10}{pages:>8}{pages_per_sec:>12.1f}{memory_mb:>12.1f}{accuracy:>10.3f}{failures:>6}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
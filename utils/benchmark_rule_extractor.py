@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Rule-based 추출기 문서별 벤치마크
+- 단일 스캔 분할기(DocumentSegmenter)의 섹션 오프셋이 원래 정규식의 전체 텍스트 검색 결과와 일치하는지 검증
+- 문서별 섹션 탐색 시간 (분할기 vs 섹션별 전체 텍스트 검색) 및 전체 추출 시간 측정
+
+사용법:
+    python utils/benchmark_rule_extractor.py                 # 합성 문서
+    python utils/benchmark_rule_extractor.py data/processed_pdf/2025   # 실제 PDF 포함
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rule_based_extractor import PATTERNS, DocumentSegmenter, RuleBasedExtractor
+
+FILLER = (
+    "피조치자는 내부통제기준을 마련하지 아니하고 고객의 투자자금을 부적절하게 운용하였으며, "
+    "관련 보고 의무를 이행하지 않은 사실이 확인되었다. "
+)
+
+TEMPLATES = {
+    'multiple': """금융위원회 의결서
+의안번호 제{year}-{no}호
+1. 조치대상자의 인적사항
+ 기  관 ㈜OO{sector}
+ 임직원 ㈜OO{sector} 前 상무보대우 甲
+2. 조치내용
+ ㅇ ㈜OO{sector}
+   - 과징금 {eok}억 {man:,} 만원
+ ㅇ 前 대표이사 甲
+   - 과징금 {million}백만원
+3. 조치이유
+ 가. 지적사항
+{body}
+ 나. 근거법규
+ 「자본시장과 금융투자업에 관한 법률」 제178조제1항 및 제2항, 제429조제3항
+ 「금융회사의 지배구조에 관한 법률」 제24조
+4. 기타
+""",
+    'revision': """금융위원회 의결서
+의안번호 제{year}-{no}호
+1. 조치대상자의 인적사항
+ 기  관 ㈜OO{sector}
+2. 조치내용
+ 제재조치
+ 원안 수정안
+ 기관경고 과태료 {million} 백만원 과태료 {revised} 백만원
+ 업무 일부정지 {months}개월
+3. 조치이유
+ 가. 지적사항
+{body}
+ 나. 근거법규
+ 「은행법」 제34조제2항제3호 및 제4호
+""",
+    'table': """금융위원회 의결서
+의안번호 제{year}-{no}호
+제재대상 제재조치
+ 기  관 OO{sector}㈜ 과태료 {million} 백만원
+ 前 영업이사 G1 과태료 {revised}백만원
+ㅇ(금감원 검사결과)
+ 가. 지적사항
+{body}
+ 다. 근거법규 「신용정보의 이용 및 보호에 관한 법률」 제19조제1항제2호
+""",
+    'single': """금융위원회 의결서
+의안번호 제{year}-{no}호
+㈜OO{sector}에 대한 조치
+ 가. 지적사항
+{body}
+ 나. 근거법규
+ 「보험업법」 제95조의2, 제97조제1항
+ 과태료 {million}백만원을 부과한다.
+""",
+}
+
+
+def build_documents(sizes=(1, 10, 50), seed: int = 7):
+    """템플릿별, 본문 길이별 합성 의결서"""
+    rng = random.Random(seed)
+    documents = []
+    for name, template in TEMPLATES.items():
+        for size in sizes:
+            body = '\n'.join(f"   {i + 1}) {FILLER * rng.randint(1, 3)}" for i in range(size))
+            text = template.format(
+                year=2025,
+                no=rng.randint(1, 200),
+                sector=rng.choice(['증권', '은행', '생명보험', '자산운용']),
+                eok=rng.randint(1, 99),
+                man=rng.randint(1, 9999),
+                million=rng.randint(10, 999),
+                revised=rng.randint(10, 999),
+                months=rng.randint(1, 6),
+                body=body,
+            )
+            documents.append((f"{name}-{size}", text))
+    return documents
+
+
+def load_pdf_documents(pdf_dir: Path):
+    """디렉토리의 PDF 텍스트 (PyPDF2)"""
+    import PyPDF2
+    
+    documents = []
+    for pdf_path in sorted(pdf_dir.glob('*.pdf')):
+        try:
+            reader = PyPDF2.PdfReader(str(pdf_path))
+            text = ''.join(page.extract_text() or '' for page in reader.pages)
+        except Exception as e:
+            print(f"  PDF 읽기 실패 {pdf_path.name}: {e}")
+            continue
+        documents.append((pdf_path.name, text))
+    return documents
+
+
+def legacy_sections(text: str):
+    """섹션별로 원래 정규식을 전체 텍스트에 검색 (분할기 도입 전 방식)"""
+    def group_span(pattern, flags=0):
+        match = re.search(pattern.pattern, text, flags or pattern.flags)
+        return match.span(1) if match else None
+    
+    def full_span(pattern):
+        match = re.search(pattern.pattern, text, pattern.flags)
+        return match.span() if match else None
+    
+    has_tables = '제재대상' in text and '제재조치' in text
+    return {
+        'law_section': group_span(PATTERNS['law_section']),
+        'target_info_section': group_span(PATTERNS['target_info_section']),
+        'violation_sections': [group_span(pattern) for pattern in PATTERNS['violation_section']],
+        'violation_fallback': group_span(PATTERNS['violation_fallback']),
+        'action_section': group_span(PATTERNS['action_section']),
+        'action_section_detect': group_span(PATTERNS['action_section_detect']),
+        'sanction_table': full_span(PATTERNS['sanction_table']) if has_tables else None,
+        'sanction_table_detect': full_span(PATTERNS['sanction_table_detect']) if has_tables else None,
+        'summary_table': group_span(PATTERNS['summary_table']),
+        'has_revision_table': re.search(PATTERNS['revision_table'].pattern, text) is not None,
+        'revision_window': (lambda m: m.group(0) if m else None)(re.search(r'수정안[\s\S]{0,500}', text)),
+    }
+
+
+def segment_sections(segmenter: DocumentSegmenter, text: str):
+    segments = segmenter.segment(text)
+    return {
+        'law_section': segments.law_section,
+        'target_info_section': segments.target_info_section,
+        'violation_sections': segments.violation_sections,
+        'violation_fallback': segments.violation_fallback,
+        'action_section': segments.action_section,
+        'action_section_detect': segments.action_section_detect,
+        'sanction_table': segments.sanction_table,
+        'sanction_table_detect': segments.sanction_table_detect,
+        'summary_table': segments.summary_table,
+        'has_revision_table': segments.has_revision_table,
+        'revision_window': segments.revision_window(500),
+    }
+
+
+def timed(func, repeat: int) -> float:
+    """1회 평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    
+    documents = build_documents()
+    if len(sys.argv) > 1:
+        documents.extend(load_pdf_documents(Path(sys.argv[1])))
+    
+    segmenter = DocumentSegmenter()
+    
+    print("=== Rule-based 추출기 문서별 벤치마크 ===")
+    print(f"문서 수: {len(documents)}")
+    
+    # 섹션 오프셋 일치 검증
+    mismatches = 0
+    for name, text in documents:
+        expected = legacy_sections(text)
+        actual = segment_sections(segmenter, text)
+        for key in expected:
+            if expected[key] != actual[key]:
+                mismatches += 1
+                print(f"  불일치 [{name}] {key}: 기존 {expected[key]!r}, 분할기 {actual[key]!r}")
+    print(f"섹션 불일치: {mismatches}건")
+    
+    repeat = 20
+    print(f"\n{'문서':<28}{'글자 수':>8}{'전체검색(ms)':>14}{'분할기(ms)':>12}{'전체추출(ms)':>14}")
+    total_legacy = total_segment = total_extract = 0.0
+    for name, text in documents:
+        legacy_ms = timed(lambda: legacy_sections(text), repeat)
+        segment_ms = timed(lambda: segmenter.segment(text), repeat)
+        # 문서마다 새 추출기 (섹션 캐시 없이 1회 분할 포함)
+        extract_ms = timed(lambda: RuleBasedExtractor().extract_full_document_structure(text, f"{name}.pdf"), repeat)
+        total_legacy += legacy_ms
+        total_segment += segment_ms
+        total_extract += extract_ms
+        print(f"{name[:26]:<28}{len(text):>8}{legacy_ms:>14.3f}{segment_ms:>12.3f}{extract_ms:>14.3f}")
+    
+    print(f"\n합계: 전체검색 {total_legacy:.3f}ms, 분할기 {total_segment:.3f}ms, 전체추출 {total_extract:.3f}ms")
+    if total_segment:
+        print(f"섹션 탐색 속도 향상: {total_legacy / total_segment:.1f}x")
+    
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+PDF 텍스트 정규화 벤치마크
+기존 다중 패스 정제(페이지당 머리글 6회 + 공백 2회, 전체 5회 치환)와 결합 정규식 정규화기 비교
+- 출력 일치 여부 및 문서별 처리 시간, 처리량(MB/s)
+
+사용법:
+    python utils/benchmark_text_normalizer.py                 # 합성 문서
+    python utils/benchmark_text_normalizer.py data/processed_pdf/2025   # 실제 PDF 포함
+"""
+
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tests'))
+
+from app.services.text_normalizer import TextNormalizer
+from test_text_normalizer import GOLDEN_DOCUMENTS, legacy_normalize_pages
+
+PAGE_TEMPLATE = """금융위원회 {year}-{no}호
+의 결 서
+{body}
+페이지 {page} / {pages}
+- {page} -
+"""
+
+BODY_LINES = [
+    "  가. 지적사항 : ㈜OO{sector}은 내부통제기준을 마련하지 아니하고 고객의 투자자금을 부적절하게 운용하였음 ※ 세부내역 별첨",
+    "│ 구분 │ 조치대상 │ 조치내용 │",
+    "├────┼────┼────┤",
+    "│ 기관 │ ㈜OO{sector} │ 과징금 {eok}억 {man:,}만원 │",
+    "  나. 근거법규 : 「자본시장과 금융투자업에 관한 법률」 제178조제1항 및 제2항, 제429조제3항",
+    "   ◦ 'A' 및 \"B\" 위반 — 2025. 3. 14.   결정",
+]
+
+
+def build_documents(page_counts=(1, 10, 50), seed: int = 37):
+    """페이지 수별 합성 의결서 (페이지 텍스트 목록)"""
+    rng = random.Random(seed)
+    documents = []
+    for pages in page_counts:
+        page_texts = []
+        for page in range(1, pages + 1):
+            body = '\n'.join(
+                rng.choice(BODY_LINES).format(
+                    sector=rng.choice(['증권', '은행', '생명보험']),
+                    eok=rng.randint(1, 99),
+                    man=rng.randint(1, 9999)
+                )
+                for _ in range(40)
+            )
+            page_texts.append(PAGE_TEMPLATE.format(year=2025, no=rng.randint(1, 200), body=body, page=page, pages=pages))
+        documents.append((f"synthetic-{pages}p", page_texts))
+    return documents
+
+
+def load_pdf_documents(pdf_dir: Path):
+    """디렉토리의 PDF 페이지 텍스트 (기본 추출 백엔드, 순차)"""
+    from app.services.pdf_backends import extract_pdf_pages
+    
+    documents = []
+    for pdf_path in sorted(pdf_dir.glob('*.pdf')):
+        try:
+            documents.append((pdf_path.name, extract_pdf_pages(str(pdf_path), workers=1)))
+        except Exception as e:
+            print(f"  PDF 읽기 실패 {pdf_path.name}: {e}")
+    return documents
+
+
+def timed(func, repeat: int) -> float:
+    """1회 평균 실행 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    logging.disable(logging.WARNING)
+    
+    documents = build_documents() + [(f"golden-{i}", pages) for i, pages in enumerate(GOLDEN_DOCUMENTS)]
+    if len(sys.argv) > 1:
+        documents.extend(load_pdf_documents(Path(sys.argv[1])))
+    
+    normalizer = TextNormalizer()
+    
+    print("=== PDF 텍스트 정규화 벤치마크 ===")
+    print(f"문서 수: {len(documents)}")
+    
+    mismatches = 0
+    for name, pages in documents:
+        if normalizer.normalize_pages(pages) != legacy_normalize_pages(pages):
+            mismatches += 1
+            print(f"  출력 불일치: {name}")
+    print(f"출력 불일치: {mismatches}건")
+    
+    repeat = 20
+    print(f"\n{'문서':<28}{'글자 수':>10}{'기존(ms)':>12}{'결합(ms)':>12}{'향상':>8}")
+    total_bytes = 0
+    total_legacy = total_fused = 0.0
+    for name, pages in documents:
+        chars = sum(len(page) for page in pages)
+        total_bytes += sum(len(page.encode('utf-8')) for page in pages)
+        legacy_ms = timed(lambda: legacy_normalize_pages(pages), repeat)
+        fused_ms = timed(lambda: normalizer.normalize_pages(pages), repeat)
+        total_legacy += legacy_ms
+        total_fused += fused_ms
+        speedup = legacy_ms / fused_ms if fused_ms else 0.0
+        print(f"{name[:26]:<28}{chars:>10}{legacy_ms:>12.3f}{fused_ms:>12.3f}{speedup:>7.1f}x")
+    
+    megabytes = total_bytes / 1024 / 1024
+    print(f"\n합계: 기존 {total_legacy:.3f}ms, 결합 {total_fused:.3f}ms")
+    if total_legacy and total_fused:
+        print(f"처리량: 기존 {megabytes / (total_legacy / 1000):.1f}MB/s, 결합 {megabytes / (total_fused / 1000):.1f}MB/s")
+        print(f"속도 향상: {total_legacy / total_fused:.1f}x")
+    
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+ZIP 수집 방식 벤치마크
+의결서 ZIP 코퍼스에 대해 기존 방식(압축 해제 후 디스크에서 전처리)과 스트리밍 방식(메모리 바이트로 전처리 + 저장소에 한 번 기록) 비교
+- 시간: 전처리까지 포함한 전체 처리 시간 (DB 저장/LLM 호출은 제외)
+- 디스크 I/O: /proc/self/io의 rchar/wchar (리눅스에서만, 페이지 캐시 포함 시스템 콜 단위 바이트)
+
+사용법:
+    python utils/benchmark_zip_ingest.py data/raw_zip --limit 10
+"""
+
+import argparse
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.content_store import ContentStore
+from app.services.fsc_crawler import is_decision_pdf_member
+from app.services.preprocessing import PDFPreprocessor
+
+
+def read_io_counters() -> dict:
+    """현재 프로세스 I/O 바이트 (지원하지 않으면 빈 dict)"""
+    try:
+        with open('/proc/self/io') as f:
+            return {key: int(value) for key, value in (line.split(':') for line in f)}
+    except OSError:
+        return {}
+
+
+def preprocess(preprocessor, dest: Path, data=None) -> bool:
+    try:
+        preprocessor.preprocess_pdf(str(dest), data)
+        return True
+    except Exception as e:
+        print(f"  전처리 실패 {dest.name}: {e}")
+        return False
+
+
+def run_extract(zip_files, preprocessor, work_dir: Path):
+    """기존 방식: 의결 PDF를 디스크에 압축 해제한 뒤 파일 경로로 전처리 → (문서 수, 실패 수)"""
+    documents = failures = 0
+    for zip_file in zip_files:
+        with zipfile.ZipFile(zip_file) as zip_ref:
+            for member in zip_ref.infolist():
+                if not is_decision_pdf_member(member.filename):
+                    continue
+                dest = work_dir / os.path.basename(member.filename)
+                with zip_ref.open(member) as source, open(dest, 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                failures += not preprocess(preprocessor, dest)
+                documents += 1
+    return documents, failures
+
+
+def run_stream(zip_files, preprocessor, work_dir: Path):
+    """스트리밍 방식: 메모리 바이트로 전처리하고 보관용 PDF는 저장소에 한 번만 기록 → (문서 수, 실패 수)"""
+    store = ContentStore(str(work_dir / 'store'))
+    documents = failures = 0
+    for zip_file in zip_files:
+        with zipfile.ZipFile(zip_file) as zip_ref:
+            for member in zip_ref.infolist():
+                if not is_decision_pdf_member(member.filename):
+                    continue
+                data = zip_ref.read(member)
+                dest = work_dir / os.path.basename(member.filename)
+                failures += not preprocess(preprocessor, dest, data)
+                sha256, _, _ = store.put_stream(io.BytesIO(data), '.pdf')
+                store.link(sha256, '.pdf', dest)
+                documents += 1
+    return documents, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ZIP 수집 방식 벤치마크')
+    parser.add_argument('corpus', nargs='?', default=settings.RAW_ZIP_DIR, help='ZIP 파일 디렉토리')
+    parser.add_argument('--limit', type=int, default=10, help='사용할 최대 ZIP 수')
+    args = parser.parse_args()
+    
+    logging.disable(logging.ERROR)
+    
+    zip_files = sorted(Path(args.corpus).glob('*.zip'))[:args.limit]
+    if not zip_files:
+        print(f"ZIP 파일이 없습니다: {args.corpus}")
+        return 1
+    
+    preprocessor = PDFPreprocessor()
+    print("=== ZIP 수집 방식 벤치마크 ===")
+    print(f"코퍼스: {args.corpus} ({len(zip_files)}개 ZIP)")
+    print(f"\n{'방식':<12}{'문서':>6}{'시간(초)':>10}{'문서/초':>10}{'읽기(MB)':>10}{'쓰기(MB)':>10}{'실패':>6}")
+    
+    for name, run in (('압축 해제', run_extract), ('스트리밍', run_stream)):
+        with tempfile.TemporaryDirectory() as work_dir:
+            before = read_io_counters()
+            start = time.perf_counter()
+            documents, failures = run(zip_files, preprocessor, Path(work_dir))
+            elapsed = time.perf_counter() - start
+            after = read_io_counters()
+        
+        read_mb = (after.get('rchar', 0) - before.get('rchar', 0)) / 1024 / 1024
+        write_mb = (after.get('wchar', 0) - before.get('wchar', 0)) / 1024 / 1024
+        docs_per_sec = documents / elapsed if elapsed > 0 else 0.0
+        print(f"{name:<12}{documents:>6}{elapsed:>10.2f}{docs_per_sec:>10.1f}{read_mb:>10.1f}{write_mb:>10.1f}{failures:>6}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
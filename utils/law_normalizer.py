@@ -3,22 +3,172 @@
 법률명 정규화 모듈
 FSC 법률 데이터베이스를 활용한 법률명 표준화
 """
+import hashlib
 import json
+import os
+import pickle
 import re
-from typing import Dict, List, Optional
+import uuid
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 import logging
 
+from app.core.metrics import record_startup_metric, startup_timer
+
 logger = logging.getLogger(__name__)
 
+# 프로젝트 루트 (실행 위치와 무관하게 법률 데이터 탐색)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LAWS_JSON_FILENAME = 'fsc_laws_with_abbreviations.json'
+
+# 컴파일된 법률 사전 캐시 (구조 변경 시 버전 증가)
+LAW_CACHE_VERSION = 1
+LAW_CACHE_FILENAME = 'law_dictionary.pkl'
+
+# 역방향 포함 검사용 구분자 (법률명에 등장하지 않는 문자)
+_SEPARATOR = '\x00'
+
+
+class AhoCorasick:
+    """다중 패턴 부분 문자열 검색 (Aho-Corasick 오토마톤)"""
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        
+        for pattern_id, pattern in enumerate(patterns):
+            if pattern:
+                self._add(pattern, pattern_id)
+        self._build_failure_links()
+    
+    def _add(self, pattern: str, pattern_id: int):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+    
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # 접미사 상태의 출력 병합
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def iter_matches(self, text: str) -> Iterator[int]:
+        """text에 포함된 패턴 id를 생성 (중복 가능)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield from output[state]
+
+
+def resolve_laws_json_path(laws_json_path: Optional[str] = None) -> Path:
+    """법률 데이터 JSON 경로 (인자 > FSC_LAWS_JSON_PATH 환경변수 > 프로젝트 루트 > archive/)"""
+    explicit = laws_json_path or os.environ.get('FSC_LAWS_JSON_PATH')
+    if explicit:
+        return Path(explicit)
+    
+    for candidate in (PROJECT_ROOT / LAWS_JSON_FILENAME, PROJECT_ROOT / 'archive' / LAWS_JSON_FILENAME):
+        if candidate.exists():
+            return candidate
+    return PROJECT_ROOT / LAWS_JSON_FILENAME
+
+
 class LawNormalizer:
     """법률명 정규화 클래스"""
     
-    def __init__(self, laws_json_path: str = './fsc_laws_with_abbreviations.json'):
-        """초기화"""
-        self.laws_data = self._load_laws_data(laws_json_path)
-        self.name_to_abbr = {}
-        self.abbr_to_name = {}
-        self._build_lookup_tables()
+    # 캐시에 저장되는 조회 테이블/매칭 인덱스 속성
+    _CACHED_ATTRIBUTES = (
+        'laws_data', 'name_to_abbr', 'abbr_to_name',
+        '_full_names', '_abbrs', '_raw_matcher', '_raw_haystack', '_raw_offsets',
+        '_clean_patterns', '_clean_first_index', '_clean_matcher', '_clean_haystack', '_clean_offsets',
+    )
+    
+    def __init__(self, laws_json_path: Optional[str] = None, cache_dir: Optional[str] = None):
+        """초기화 (JSON 내용이 바뀌지 않았으면 컴파일된 캐시 사용)"""
+        self.laws_json_path = resolve_laws_json_path(laws_json_path)
+        self.cache_dir = Path(cache_dir or os.environ.get('LAW_CACHE_DIR') or PROJECT_ROOT / 'data' / 'cache')
+        
+        with startup_timer('law_normalizer_load'):
+            source_hash = self._hash_file(self.laws_json_path)
+            cache_hit = source_hash is not None and self._load_cache(source_hash)
+            
+            if not cache_hit:
+                self.laws_data = self._load_laws_data(str(self.laws_json_path))
+                self.name_to_abbr = {}
+                self.abbr_to_name = {}
+                self._build_lookup_tables()
+                if source_hash is not None:
+                    self._save_cache(source_hash)
+        
+        record_startup_metric('law_normalizer_cache_hit', cache_hit)
+        record_startup_metric('law_normalizer_laws', len(self.laws_data.get('laws', [])))
+    
+    @staticmethod
+    def _hash_file(path: Path) -> Optional[str]:
+        """파일 내용 SHA-256 (파일이 없으면 None)"""
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+    
+    def _load_cache(self, source_hash: str) -> bool:
+        """캐시가 현재 JSON과 일치하면 로드"""
+        cache_path = self.cache_dir / LAW_CACHE_FILENAME
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"법률 사전 캐시 로드 실패, 재생성합니다: {e}")
+            return False
+        
+        if cached.get('version') != LAW_CACHE_VERSION or cached.get('source_hash') != source_hash:
+            return False
+        
+        for name in self._CACHED_ATTRIBUTES:
+            setattr(self, name, cached['state'][name])
+        return True
+    
+    def _save_cache(self, source_hash: str):
+        """컴파일된 법률 사전 저장 (저장하는 프로세스별 임시 파일 후 교체)"""
+        cache_path = self.cache_dir / LAW_CACHE_FILENAME
+        temp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump({
+                    'version': LAW_CACHE_VERSION,
+                    'source_hash': source_hash,
+                    'state': {name: getattr(self, name) for name in self._CACHED_ATTRIBUTES}
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"법률 사전 캐시 저장 실패: {e}")
+        finally:
+            temp_path.unlink(missing_ok=True)
         
     def _load_laws_data(self, json_path: str) -> Dict:
         """법률 데이터 로드"""
@@ -57,6 +207,50 @@ class LawNormalizer:
                 if no_space_name != law_name:
                     self.name_to_abbr[no_space_name] = preferred_short_name
                 
+        self._build_match_index()
+    
+    def _build_match_index(self):
+        """부분 매칭용 다중 패턴 인덱스 구축 (name_to_abbr 삽입 순서 유지)"""
+        self._full_names = list(self.name_to_abbr)
+        self._abbrs = [self.name_to_abbr[name] for name in self._full_names]
+        
+        # normalize_law_name: 원문 그대로 비교
+        self._raw_matcher = AhoCorasick(self._full_names)
+        self._raw_haystack = _SEPARATOR.join(self._full_names)
+        self._raw_offsets = self._offsets(self._full_names)
+        
+        # find_best_match: 공백 제거 + 소문자 비교 (같은 패턴은 가장 앞선 항목만 유지)
+        first_index: Dict[str, int] = {}
+        for index, full_name in enumerate(self._full_names):
+            first_index.setdefault(full_name.replace(' ', '').lower(), index)
+        self._clean_patterns = list(first_index)
+        self._clean_first_index = list(first_index.values())
+        self._clean_matcher = AhoCorasick(self._clean_patterns)
+        self._clean_haystack = _SEPARATOR.join(self._clean_patterns)
+        self._clean_offsets = self._offsets(self._clean_patterns)
+    
+    @staticmethod
+    def _offsets(names: List[str]) -> List[int]:
+        """구분자로 연결한 문자열에서 각 이름의 시작 위치"""
+        offsets = []
+        position = 0
+        for name in names:
+            offsets.append(position)
+            position += len(name) + len(_SEPARATOR)
+        return offsets
+    
+    @staticmethod
+    def _first_containing(haystack: str, offsets: List[int], text: str) -> Optional[int]:
+        """text를 포함하는 첫 번째 이름의 인덱스 (연결 문자열에서 한 번의 find)"""
+        if not offsets:
+            return None
+        if not text:
+            return 0
+        position = haystack.find(text)
+        if position < 0:
+            return None
+        return bisect_right(offsets, position) - 1
+    
     def _normalize_spaces(self, text: str) -> str:
         """공백 정규화"""
         # 연속된 공백을 하나로
@@ -91,12 +285,17 @@ class LawNormalizer:
             if abbr:  # 약칭이 있는 경우만 변환
                 return abbr
                 
-        # 부분 매칭 시도
-        for full_name, abbr in self.name_to_abbr.items():
-            if full_name in law_name or law_name in full_name:
-                if abbr:  # 약칭이 있는 경우만 변환
-                    logger.debug(f"부분 매칭: {law_name} -> {abbr}")
-                    return abbr
+        # 부분 매칭 시도 (양방향 포함 관계 중 가장 앞선 항목)
+        candidates = list(self._raw_matcher.iter_matches(law_name))
+        reverse_index = self._first_containing(self._raw_haystack, self._raw_offsets, law_name)
+        if reverse_index is not None:
+            candidates.append(reverse_index)
+        
+        if candidates:
+            abbr = self._abbrs[min(candidates)]
+            if abbr:  # 약칭이 있는 경우만 변환
+                logger.debug(f"부분 매칭: {law_name} -> {abbr}")
+                return abbr
                     
         # 특수 케이스 처리 (API에서 약칭이 없는 경우 대비)
         if '자본시장과금융투자업에관한법률' in law_name.replace(' ', ''):
@@ -135,21 +334,24 @@ class LawNormalizer:
         if no_space_name in self.name_to_abbr:
             return self.name_to_abbr[no_space_name]
         
-        # 3. 포함 관계 매칭 (더 정확한 버전)
+        # 3. 포함 관계 매칭 (더 긴 매칭 우선, 같으면 앞선 항목)
         best_match = None
-        max_match_length = 0
+        law_name_clean = no_space_name.lower()
         
-        for full_name, abbr in self.name_to_abbr.items():
-            full_name_clean = full_name.replace(' ', '').lower()
-            law_name_clean = law_name.replace(' ', '').lower()
-            
-            # 양방향 포함 검사
-            if (full_name_clean in law_name_clean or law_name_clean in full_name_clean):
-                # 더 긴 매칭을 우선으로
-                match_length = min(len(full_name_clean), len(law_name_clean))
-                if match_length > max_match_length:
-                    max_match_length = match_length
-                    best_match = abbr
+        # 입력이 법률명에 포함되는 경우 매칭 길이는 입력 전체 길이로 최대
+        reverse_index = self._first_containing(self._clean_haystack, self._clean_offsets, law_name_clean)
+        if reverse_index is not None:
+            if law_name_clean:
+                best_match = self._abbrs[self._clean_first_index[reverse_index]]
+        else:
+            # 법률명이 입력에 포함되는 경우 가장 긴 법률명
+            best_key = None
+            for pattern_id in self._clean_matcher.iter_matches(law_name_clean):
+                key = (len(self._clean_patterns[pattern_id]), -self._clean_first_index[pattern_id])
+                if best_key is None or key > best_key:
+                    best_key = key
+            if best_key is not None:
+                best_match = self._abbrs[-best_key[1]]
         
         if best_match:
             logger.debug(f"부분 매칭 성공: {law_name} -> {best_match}")
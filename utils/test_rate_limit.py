@@ -37,7 +37,7 @@ async def test_rate_limit():
     
     print("=== Rate Limit 처리 로직 테스트 시작 ===")
     print(f"테스트할 요청 수: {len(test_prompts)}개")
-    print(f"Rate limit: {gemini_service.rate_limit_requests_per_minute}회/분")
+    print(f"동시성 한도 (AIMD): {gemini_service.limiter.snapshot()['limit']}")
     print()
     
     start_time = asyncio.get_event_loop().time()
@@ -50,7 +50,7 @@ async def test_rate_limit():
             response = await gemini_service._make_api_request_with_rate_limit(prompt)
             
             print(f"✅ 응답 받음: {response[:50]}...")
-            print(f"현재 요청 기록 수: {len(gemini_service.request_timestamps)}")
+            print(f"현재 동시성 한도: {gemini_service.limiter.snapshot()['limit']}")
             print()
             
         except Exception as e: